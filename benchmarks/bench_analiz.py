@@ -0,0 +1,79 @@
+# ew_platformasi/benchmarks/bench_analiz.py
+#
+# Senaryo sonuç analizini ölçer: teknik x radar başarı sayılarının tüm senaryolardan kurulması, kategori x bant gibi
+# kaba kırılımların NumPy ile gruplanması ve tek senaryo değiştiğinde artımlı güncelleme; karşılaştırma için her
+# sorguda senaryoları dolaşıp sözlükte sayan Python döngüsü. Projenin kök dizininden çalıştırın:
+#   python -m benchmarks.bench_analiz --senaryo 200000
+
+import argparse
+import collections
+import copy
+
+from core.data_manager import DataManager
+from core.data_models import Radar, Senaryo, Teknik, SONUC_NITEL
+from benchmarks.olcum import olc
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+
+def _dongu_ile_matris(dm, satir_alani, sutun_alani):
+    teknik_map, radar_map = dm.item_map(Teknik), dm.item_map(Radar)
+    sayilar = collections.defaultdict(collections.Counter)
+    for senaryo in dm.get_items(Senaryo):
+        radar = radar_map.get(senaryo.radar_id)
+        if radar is None: continue
+        for teknik_id in {uygulama.teknik_id for uygulama in senaryo.uygulanan_teknikler}:
+            teknik = teknik_map.get(teknik_id)
+            if teknik is not None:
+                sayilar[(getattr(teknik, satir_alani), getattr(radar, sutun_alani))][senaryo.sonuc_nitel] += 1
+    return sayilar
+
+
+def _ayni_mi(matris, sayilar):
+    bulunan = {}
+    for i, satir in enumerate(matris.row_labels):
+        for j, sutun in enumerate(matris.column_labels):
+            if matris.counts[i, j].any():
+                bulunan[(satir, sutun)] = {SONUC_NITEL[k]: int(sayi) for k, sayi in enumerate(matris.counts[i, j])
+                                           if sayi}
+    return bulunan == {anahtar: dict(sayac) for anahtar, sayac in sayilar.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--senaryo", type=int, default=200_000, help="Senaryo sayısı")
+    parser.add_argument("--guncelleme", type=int, default=1000, help="Artımlı güncellenen senaryo sayısı")
+    args = parser.parse_args()
+
+    platformlar, radarlar, teknikler, senaryolar, _ = sentetik_veri_seti(args.senaryo)
+    dm = DataManager()
+    dm.et_platformlar, dm.radarlar, dm.teknikler, dm.senaryolar = platformlar, radarlar, teknikler, senaryolar
+    analiz = dm.scenario_analytics()
+    print(f"{len(senaryolar)} senaryo, {len(radarlar)} radar, {len(teknikler)} teknik")
+    print(f"{'':<40}{'süre':>12}")
+
+    sure_kurulum, matris = olc(lambda: analiz.matrix("teknik", "radar"))
+    sure_dongu, sayilar = olc(lambda: _dongu_ile_matris(dm, "adi", "adi"))
+    assert _ayni_mi(matris, sayilar), "Teknik x radar matrisi döngüyle uyuşmuyor"
+    print(f"{'teknik x radar, Python döngüsü':<40}{sure_dongu * 1000:>10.1f}ms")
+    print(f"{'teknik x radar, ilk kurulum':<40}{sure_kurulum * 1000:>10.1f}ms")
+
+    for satir, sutun, satir_alani, sutun_alani in [("teknik", "radar", "adi", "adi"),
+                                                   ("kategori", "frekans_bandi", "kategori", "frekans_bandi"),
+                                                   ("kategori", "gorev_tipi", "kategori", "gorev_tipi")]:
+        sure_sorgu, matris = olc(lambda: analiz.matrix(satir, sutun))
+        assert _ayni_mi(matris, _dongu_ile_matris(dm, satir_alani, sutun_alani)), f"{satir} x {sutun} uyuşmuyor"
+        print(f"{f'{satir} x {sutun}, sorgu':<40}{sure_sorgu * 1000:>10.1f}ms")
+
+    def guncelle():
+        for senaryo in dm.get_items(Senaryo)[:args.guncelleme]:
+            kopya = copy.copy(senaryo)
+            kopya.sonuc_nitel = SONUC_NITEL[(SONUC_NITEL.index(senaryo.sonuc_nitel) + 1) % len(SONUC_NITEL)]
+            dm.save_item(kopya)
+
+    sure_guncelleme, _ = olc(guncelle)
+    assert _ayni_mi(analiz.matrix("teknik", "radar"), _dongu_ile_matris(dm, "adi", "adi")), "Artımlı güncelleme hatalı"
+    print(f"{'tek senaryo güncellemesi (kayıt dahil)':<40}{sure_guncelleme / args.guncelleme * 1e6:>10.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# ew_platformasi/benchmarks/bench_bellek.py
+#
+# Kayıtların bellekte kapladığı yeri ölçer: __dict__'li düz dataclass'lar (önceki hal) ile __slots__'lu, id'leri
+# tekilleştirilmiş ve katalog değerlerini paylaşan sınıflar. Her metin, dosyadan okunduğunda olduğu gibi
+# ayrı bir str nesnesi olarak verilir.
+# Projenin kök dizininden çalıştırın:  python -m benchmarks.bench_bellek --senaryo 20000 --zincir 50
+
+import argparse
+import gc
+import random
+import tracemalloc
+from dataclasses import MISSING, field, fields, is_dataclass, make_dataclass
+
+from core.data_models import (
+    ETPlatformu, Radar, Teknik, Senaryo, Gorev, TeknikUygulama, BaseTeknikParametreleri, GurultuKaristirmaParams,
+    MenzilAldatmaParams, AlmacGondermecAyarParametreleri, KaynakUretecAyarParametreleri
+)
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+_SINIFLAR = (ETPlatformu, Radar, Teknik, Senaryo, Gorev, TeknikUygulama, BaseTeknikParametreleri,
+             GurultuKaristirmaParams, MenzilAldatmaParams, AlmacGondermecAyarParametreleri,
+             KaynakUretecAyarParametreleri)
+
+
+def _eski_sinif(cls):
+    """Aynı alanlara sahip, __slots__'suz ve __post_init__'siz düz dataclass (önceki hal)."""
+    alanlar = []
+    for alan in fields(cls):
+        if alan.default is not MISSING:
+            alanlar.append((alan.name, alan.type, field(default=alan.default)))
+        elif alan.default_factory is not MISSING:
+            alanlar.append((alan.name, alan.type, field(default_factory=alan.default_factory)))
+        else:
+            alanlar.append((alan.name, alan.type))
+    return make_dataclass(cls.__name__, alanlar)
+
+
+def _kopya(deger, siniflar):
+    if type(deger) is str:
+        # XML/SQLite okumasında olduğu gibi her metin ayrı bir nesnedir.
+        return deger.encode().decode()
+    if type(deger) is list:
+        return [_kopya(eleman, siniflar) for eleman in deger]
+    if is_dataclass(deger):
+        return _kur(deger, siniflar)
+    return deger
+
+
+def _kur(kayit, siniflar):
+    return siniflar[type(kayit)](**{alan.name: _kopya(getattr(kayit, alan.name), siniflar) for alan in fields(kayit)})
+
+
+def _bellek(kayitlar, siniflar):
+    """Kayıtlar verilen sınıflarla yeniden kurulduğunda tutulan bellek (bayt)."""
+    gc.collect()
+    tracemalloc.start()
+    baslangic = tracemalloc.get_traced_memory()[0]
+    kurulan = [_kur(kayit, siniflar) for kayit in kayitlar]
+    gc.collect()
+    boyut = tracemalloc.get_traced_memory()[0] - baslangic
+    tracemalloc.stop()
+    del kurulan
+    return boyut
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--senaryo", type=int, default=20_000, help="Üretilecek senaryo sayısı")
+    parser.add_argument("--zincir", type=int, default=50, help="Senaryo başına uygulanan teknik sayısı")
+    args = parser.parse_args()
+
+    platformlar, radarlar, teknikler, senaryolar, gorevler = sentetik_veri_seti(args.senaryo)
+    rnd = random.Random(3)
+    for senaryo in senaryolar:
+        senaryo.uygulanan_teknikler = [TeknikUygulama(sira=sira, teknik_id=rnd.choice(teknikler).teknik_id,
+                                                      sure_sn=float(rnd.randint(5, 180)))
+                                       for sira in range(1, args.zincir + 1)]
+    uygulama_sayisi = args.senaryo * args.zincir
+    print(f"{args.senaryo} senaryo, {uygulama_sayisi} TeknikUygulama, {len(radarlar)} radar, {len(teknikler)} teknik")
+
+    eski_siniflar = {cls: _eski_sinif(cls) for cls in _SINIFLAR}
+    yeni_siniflar = {cls: cls for cls in _SINIFLAR}
+    gruplar = (("senaryolar (zincirlerle)", senaryolar), ("radarlar", radarlar), ("teknikler", teknikler),
+               ("görevler", gorevler), ("platformlar", platformlar))
+
+    print(f"{'':<26}{'önceki':>12}{'slotlu':>12}{'oran':>8}")
+    toplam_eski = toplam_yeni = 0
+    for ad, kayitlar in gruplar:
+        eski = _bellek(kayitlar, eski_siniflar)
+        yeni = _bellek(kayitlar, yeni_siniflar)
+        toplam_eski += eski
+        toplam_yeni += yeni
+        print(f"{ad:<26}{eski / 2**20:>10.1f}MB{yeni / 2**20:>10.1f}MB{eski / yeni:>7.1f}x")
+    print(f"{'toplam':<26}{toplam_eski / 2**20:>10.1f}MB{toplam_yeni / 2**20:>10.1f}MB{toplam_eski / toplam_yeni:>7.1f}x")
+
+    ornek = senaryolar[:1000]
+    eski_uygulama = _bellek(ornek, eski_siniflar) / (len(ornek) * args.zincir)
+    yeni_uygulama = _bellek(ornek, yeni_siniflar) / (len(ornek) * args.zincir)
+    print(f"TeknikUygulama başına (senaryo payı dahil): {eski_uygulama:.0f} B -> {yeni_uygulama:.0f} B")
+
+
+if __name__ == "__main__":
+    main()
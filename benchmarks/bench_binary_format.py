@@ -0,0 +1,70 @@
+# ew_platformasi/benchmarks/bench_binary_format.py
+#
+# XML ve ikili sütun (.ewb) veri seti biçimlerini kaydetme/açma süresi ve dosya boyutu açısından karşılaştırır.
+# Projenin kök dizininden çalıştırın:  python -m benchmarks.bench_binary_format --senaryo 1000000
+#
+# 1M senaryoluk set bellekte yaklaşık 3 GB yer kaplar; daha küçük makinelerde --senaryo ile küçültün.
+
+import argparse
+import os
+import tempfile
+from dataclasses import asdict
+
+from core.data_manager import DataManager
+from core.data_models import ETPlatformu, Radar, Teknik, Senaryo, Gorev
+from benchmarks.olcum import olc
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+_TIPLER = (ETPlatformu, Radar, Teknik, Senaryo, Gorev)
+
+
+def _ornek_kayitlar(dm: DataManager, adet: int = 2000):
+    """Karşılaştırma için her tipten ilk ve son kayıtları döndürür (tüm seti iki kez asdict'e çevirmemek için)."""
+    ornekler = []
+    for tip in _TIPLER:
+        kayitlar = dm.get_items(tip)
+        ornekler.extend(asdict(k) for k in kayitlar[:adet] + kayitlar[-adet:])
+    return ornekler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--senaryo", type=int, default=1_000_000, help="Üretilecek senaryo sayısı")
+    args = parser.parse_args()
+
+    dm = DataManager()
+    dm.et_platformlar, dm.radarlar, dm.teknikler, dm.senaryolar, dm.gorevler = sentetik_veri_seti(args.senaryo)
+    kayit_sayisi = sum(len(dm.get_items(tip)) for tip in _TIPLER)
+    print(f"{kayit_sayisi} kayıt ({args.senaryo} senaryo)")
+    beklenen = _ornek_kayitlar(dm)
+
+    with tempfile.TemporaryDirectory() as klasor:
+        xml_yol, ikili_yol = os.path.join(klasor, "veri.xml"), os.path.join(klasor, "veri.ewb")
+        sure_xml_kaydet, _ = olc(lambda: dm.write_workspace(xml_yol, dm.workspace_sections()))
+        sure_ikili_kaydet, _ = olc(lambda: dm.write_workspace(ikili_yol, dm.workspace_sections()))
+        boyut_xml, boyut_ikili = os.path.getsize(xml_yol), os.path.getsize(ikili_yol)
+
+        # Kaynak kayıtlar bırakılır; açma ölçümleri aynı bellek koşullarında yapılır.
+        dm.new_workspace()
+
+        sure_xml_ac, _ = olc(lambda: dm.open_workspace(xml_yol))
+        assert _ornek_kayitlar(dm) == beklenen, "XML'den okunan kayıtlar kaynaktan farklı"
+        dm.new_workspace()
+
+        sure_ikili_ac, _ = olc(lambda: dm.open_workspace(ikili_yol))
+        assert _ornek_kayitlar(dm) == beklenen, "İkili dosyadan okunan kayıtlar kaynaktan farklı"
+        assert len(dm.senaryolar) == args.senaryo
+
+    satirlar = [
+        ("kaydetme", sure_xml_kaydet, sure_ikili_kaydet),
+        ("açma", sure_xml_ac, sure_ikili_ac),
+    ]
+    print(f"{'':<12}{'XML':>12}{'ikili':>12}{'hızlanma':>10}")
+    for ad, xml_suresi, ikili_suresi in satirlar:
+        print(f"{ad:<12}{xml_suresi:>11.3f}s{ikili_suresi:>11.3f}s{xml_suresi / ikili_suresi:>9.1f}x")
+    print(f"{'dosya boyutu':<12}{boyut_xml / 2 ** 20:>10.1f}MB{boyut_ikili / 2 ** 20:>10.1f}MB"
+          f"{boyut_xml / boyut_ikili:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# ew_platformasi/benchmarks/bench_dalga_formu.py
+#
+# Kaynak üreteç dalga formu sentezinin verimini (örnek/s) ölçer: her dalga formu tipi için IQ örnekleri sabit
+# boyutlu parçalar halinde bellekte üretilir ve bellek eşlemeli .npy / ham sc16 dosyalarına yazılır. Karşılaştırma
+# için örnek örnek ilerleyen Python döngüsü (bir alt kümede ölçülüp örnek sayısına oranlanır); döngünün ürettiği
+# örnekler NumPy çıktısıyla karşılaştırılır. Projenin kök dizininden çalıştırın:
+#   python -m benchmarks.bench_dalga_formu --ornek 50000000
+
+import argparse
+import math
+import os
+import tempfile
+
+import numpy as np
+
+from core.data_models import KaynakUretecAyarParametreleri
+from core.waveform_generator import DALGA_FORMLARI, DEFAULT_CHUNK_SAMPLES, WaveformGenerator, generate, write_waveform
+from benchmarks.olcum import olc
+
+# Python döngüsü bu kadar örnekle ölçülür.
+_DONGU_ORNEK = 200_000
+
+
+def _parametreler(dalga_formu, gurultulu=True):
+    return KaynakUretecAyarParametreleri(dalga_formu_tipi=dalga_formu, baslangic_frekansi_mhz=9000.0,
+                                         bitis_frekansi_mhz=9500.0, tarama_suresi_ms=1.0, darbe_genisligi_us=1.0,
+                                         darbe_tekrarlama_araligi_us=100.0 if dalga_formu == "Darbe" else None,
+                                         faz_gurultusu_dbc_hz=-120.0 if gurultulu else None, harmonik_baski_db=40.0)
+
+
+def _dongu_ile_uret(uretec, ornek_sayisi):
+    """Gürültüsüz örnekler, örnek başına Python aritmetiğiyle."""
+    fs, f0 = uretec.sample_rate_hz, uretec.start_hz
+    egim = (uretec.end_hz - f0) / uretec.ramp_s
+    donem = uretec.period_s
+    donem_cevrimi = f0 * donem + 0.5 * egim * donem * donem
+    harmonik, lo = uretec.harmonic_amplitude, (uretec.center_mhz or 0.0) * 1e6
+    ornekler = []
+    for n in range(ornek_sayisi):
+        t = n / fs
+        p = math.floor(t / donem)
+        tau = t - p * donem
+        cevrim = p * donem_cevrimi + tau * (f0 + 0.5 * egim * tau)
+        faz = 2 * math.pi * (cevrim - math.floor(cevrim))
+        if uretec.waveform == "Kare":
+            ornek = complex(math.copysign(math.sqrt(0.5), math.cos(faz)), math.copysign(math.sqrt(0.5), math.sin(faz)))
+        elif uretec.waveform == "Testere Dişi":
+            kesir = faz / (2 * math.pi)
+            ornek = math.sqrt(1.5) * complex(2 * (kesir % 1) - 1, 2 * ((kesir - 0.25) % 1) - 1)
+        else:
+            ornek = complex(math.cos(faz), math.sin(faz))
+            for k, _ in uretec.harmonics:
+                # Örnekleme bandına düşen harmonik: taban bantta n·f_RF - LO, faz mutlak taşıyıcıdan.
+                harmonik_faz = k * faz + 2 * math.pi * ((k - 1) * lo * t % 1)
+                ornek += harmonik * complex(math.cos(harmonik_faz), math.sin(harmonik_faz))
+        if uretec.pulse_width_s is not None and t % uretec.pri_s >= uretec.pulse_width_s:
+            ornek = 0j
+        ornekler.append(ornek)
+    return ornekler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ornek", type=int, default=50_000_000, help="Dalga formu başına örnek sayısı")
+    parser.add_argument("--parca", type=int, default=DEFAULT_CHUNK_SAMPLES, help="Parça başına örnek sayısı")
+    args = parser.parse_args()
+
+    print(f"{args.ornek:,} örnek/dalga formu, {args.parca:,} örneklik parçalar")
+    print(f"{'':<28}{'döngü (tah.)':>16}{'bellekte':>16}{'.npy':>16}{'ham sc16':>16}   örnek/s")
+    with tempfile.TemporaryDirectory() as klasor:
+        for dalga_formu in DALGA_FORMLARI:
+            # Döngü gürültüsüz üretir; doğruluk denetimi gürültüsüz NumPy çıktısıyla yapılır.
+            gurultusuz = WaveformGenerator(_parametreler(dalga_formu, gurultulu=False))
+            sure_dongu, eski = olc(lambda: _dongu_ile_uret(gurultusuz, _DONGU_ORNEK))
+            yeni = generate(gurultusuz, _DONGU_ORNEK)
+            # Karşılaştırma float32 hassasiyetindedir; Kare ve Testere Dişi'nde işaret/kesir sınırına düşen birkaç
+            # örnek farklı tarafa yuvarlanabilir.
+            farkli = np.abs(np.array(eski, dtype=np.complex128) - yeni) > 1e-3
+            assert farkli.mean() < 1e-3, f"{dalga_formu}: döngü ve NumPy çıktıları farklı"
+
+            uretec = WaveformGenerator(_parametreler(dalga_formu))
+            sure_bellek, toplam = olc(lambda: sum(len(parca) for parca in uretec.iter_chunks(args.ornek, args.parca)))
+            assert toplam == args.ornek
+            npy_yol, ham_yol = os.path.join(klasor, "dalga.npy"), os.path.join(klasor, "dalga.sc16")
+            sure_npy, _ = olc(lambda: write_waveform(npy_yol, uretec, args.ornek, args.parca))
+            sure_ham, _ = olc(lambda: write_waveform(ham_yol, uretec, args.ornek, args.parca, raw_format="sc16"))
+            # Dosyanın başı (ilk parça sınırı dahil) bellekte tek parça olarak üretilenle aynı olmalı.
+            bas = min(2 * args.parca, args.ornek)
+            assert np.array_equal(np.load(npy_yol, mmap_mode="r")[:bas], next(uretec.iter_chunks(bas, bas))), \
+                f"{dalga_formu}: dosya parça sınırında farklı"
+            os.remove(npy_yol)
+            os.remove(ham_yol)
+
+            hizlar = [_DONGU_ORNEK / sure_dongu] + [args.ornek / sure for sure in (sure_bellek, sure_npy, sure_ham)]
+            print(f"{dalga_formu:<28}" + "".join(f"{hiz:>16,.0f}" for hiz in hizlar))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# ew_platformasi/benchmarks/bench_gorev_detay.py
+#
+# Görev merkezi detay tablosunun (GorevSenaryoTableModel) tekrar çizim maliyetini ölçer: her çizimde teknik zincirini
+# sıralayıp metni yeniden kuran eski data() ile satır başına önbellekten okuyan yeni model karşılaştırılır.
+# Projenin kök dizininden çalıştırın:  python -m benchmarks.bench_gorev_detay --zincir 60 --profil
+
+import argparse
+import cProfile
+import pstats
+import random
+
+from PySide6.QtCore import Qt
+
+from core.data_models import TeknikUygulama
+from core.models import GorevSenaryoTableModel
+from benchmarks.olcum import olc
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+# Görünür satır sayısı ve ölçülen tekrar çizim sayısı (fareyle gezinme, yeniden boyutlandırma)
+_GORUNUR_SATIR = 40
+_CIZIM_SAYISI = 300
+
+
+class EskiGorevSenaryoTableModel(GorevSenaryoTableModel):
+    """Karşılaştırma için önbelleksiz data(); modelin önceki halinden aynen alınmıştır."""
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            senaryo = self._data[index.row()]
+            col = index.column()
+            if col == 0:
+                return senaryo.adi
+            if col == 1:
+                return self._radar_map.get(senaryo.radar_id, "Bilinmiyor")
+            if col == 2:
+                teknik_strings = []
+                sorted_uygulamalar = sorted(senaryo.uygulanan_teknikler, key=lambda u: u.sira)
+                for uygulama in sorted_uygulamalar:
+                    teknik_adi = self._teknik_map.get(uygulama.teknik_id, "Bilinmeyen Teknik")
+                    teknik_strings.append(f"{uygulama.sira}. {teknik_adi} ({uygulama.sure_sn}sn)")
+                return ", ".join(teknik_strings) if teknik_strings else "Teknik Yok"
+            if col == 3:
+                return senaryo.sonuc_nitel
+        return None
+
+
+def _ciz(model, cizim_sayisi: int):
+    """Görünümün yaptığı gibi görünür satırların tüm hücrelerini tekrar tekrar sorar."""
+    indeksler = [model.index(satir, sutun) for satir in range(min(_GORUNUR_SATIR, model.rowCount()))
+                 for sutun in range(model.columnCount())]
+    data = model.data
+    for _ in range(cizim_sayisi):
+        for indeks in indeksler:
+            data(indeks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--zincir", type=int, default=60, help="Senaryo başına uygulanan teknik sayısı")
+    parser.add_argument("--senaryo", type=int, default=200, help="Görevdeki senaryo sayısı")
+    parser.add_argument("--profil", action="store_true", help="İki modelin cProfile çıktısını da yazdır")
+    args = parser.parse_args()
+
+    _, radarlar, teknikler, senaryolar, _ = sentetik_veri_seti(args.senaryo)
+    rnd = random.Random(7)
+    for senaryo in senaryolar:
+        # Zincir karışık sırayla kurulur; model her çizimde sıraya göre dizmek zorundadır.
+        siralar = list(range(1, args.zincir + 1))
+        rnd.shuffle(siralar)
+        senaryo.uygulanan_teknikler = [TeknikUygulama(sira=sira, teknik_id=rnd.choice(teknikler).teknik_id,
+                                                      sure_sn=float(rnd.randint(5, 180))) for sira in siralar]
+    radar_map = {r.radar_id: r.adi for r in radarlar}
+    teknik_map = {t.teknik_id: t.adi for t in teknikler}
+    print(f"{args.senaryo} senaryolu görev, senaryo başına {args.zincir} teknik, "
+          f"{_GORUNUR_SATIR} görünür satır x {_CIZIM_SAYISI} çizim")
+
+    eski = EskiGorevSenaryoTableModel()
+    eski.refresh_data(senaryolar, radar_map, teknik_map)
+    yeni = GorevSenaryoTableModel()
+    yeni.refresh_data(senaryolar, radar_map, teknik_map)
+    for satir in range(min(_GORUNUR_SATIR, len(senaryolar))):
+        for sutun in range(4):
+            assert eski.data(eski.index(satir, sutun)) == yeni.data(yeni.index(satir, sutun)), "Önbellek farklı metin üretti"
+
+    # Yeni model için ilk çizim (önbelleğin dolması) ayrıca ölçülür.
+    yeni.refresh_data(senaryolar, radar_map, teknik_map)
+    ilk_cizim, _ = olc(lambda: _ciz(yeni, 1))
+    sure_eski, _ = olc(lambda: _ciz(eski, _CIZIM_SAYISI))
+    sure_yeni, _ = olc(lambda: _ciz(yeni, _CIZIM_SAYISI))
+
+    print(f"{'':<22}{'eski':>12}{'önbellekli':>14}{'hızlanma':>10}")
+    eski_cizim, yeni_cizim = sure_eski / _CIZIM_SAYISI, sure_yeni / _CIZIM_SAYISI
+    print(f"{'çizim başına':<22}{eski_cizim * 1000:>10.2f}ms{yeni_cizim * 1000:>12.3f}ms{eski_cizim / yeni_cizim:>9.1f}x")
+    print(f"ilk çizim (önbellek dolarken): {ilk_cizim * 1000:.2f} ms")
+
+    if args.profil:
+        for ad, model in (("eski", eski), ("önbellekli", yeni)):
+            print(f"\n--- {ad} model, {_CIZIM_SAYISI} çizim ---")
+            profil = cProfile.Profile()
+            profil.runcall(_ciz, model, _CIZIM_SAYISI)
+            pstats.Stats(profil).sort_stats("cumulative").print_stats(8)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# ew_platformasi/benchmarks/bench_js_hesabi.py
+#
+# Senaryoların J/S ve yanma menzili hesabını ölçer: senaryo senaryo ilerleyen Python döngüsü ile JammingCalculator'ın
+# tek NumPy hesabı. Önbellekten okuma ve bir radarın ERP'si değiştikten sonraki kısmi yeniden hesap da raporlanır.
+# Projenin kök dizininden çalıştırın:  python -m benchmarks.bench_js_hesabi --senaryo 200000
+
+import argparse
+import copy
+import math
+
+from core.data_manager import DataManager
+from core.data_models import GurultuKaristirmaParams, Radar
+from core.jamming_calculator import DEFAULT_RCS_M2
+from benchmarks.olcum import olc
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+
+def _dongu_ile_hesapla(senaryolar, radar_map, teknik_map):
+    sonuclar = []
+    for senaryo in senaryolar:
+        radar = radar_map.get(senaryo.radar_id)
+        en_iyi = None
+        if radar is not None and radar.erp_dbw is not None and senaryo.mesafe_km:
+            for uygulama in senaryo.uygulanan_teknikler:
+                teknik = teknik_map.get(uygulama.teknik_id)
+                if teknik is None or not isinstance(teknik.parametreler, GurultuKaristirmaParams): continue
+                params = teknik.parametreler
+                if params.guc_erp_dbw is None: continue
+                kayip = 0.0
+                if params.bant_genisligi_mhz and radar.pw_us:
+                    kayip = max(0.0, 10 * math.log10(params.bant_genisligi_mhz * radar.pw_us))
+                js = (params.guc_erp_dbw - radar.erp_dbw + 10 * math.log10(4 * math.pi)
+                      + 20 * math.log10(senaryo.mesafe_km * 1000) - 10 * math.log10(DEFAULT_RCS_M2) - kayip)
+                if en_iyi is None or js > en_iyi:
+                    en_iyi = js
+        sonuclar.append((en_iyi, None if en_iyi is None else senaryo.mesafe_km * 10 ** (-en_iyi / 20)))
+    return sonuclar
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--senaryo", type=int, default=200_000, help="Senaryo sayısı")
+    args = parser.parse_args()
+
+    dm = DataManager()
+    platformlar, radarlar, teknikler, senaryolar, _ = sentetik_veri_seti(args.senaryo)
+    dm.et_platformlar, dm.radarlar, dm.teknikler, dm.senaryolar = platformlar, radarlar, teknikler, senaryolar
+    hesaplayici = dm.jamming_calculator()
+    print(f"{len(senaryolar)} senaryo, {len(radarlar)} radar, {len(teknikler)} teknik")
+
+    sure_eski, eski = olc(lambda: _dongu_ile_hesapla(senaryolar, dm.item_map(Radar), {t.teknik_id: t for t in teknikler}))
+    sure_yeni, _ = olc(lambda: hesaplayici.result(senaryolar[0].senaryo_id))
+    sure_okuma, yeni = olc(lambda: [hesaplayici.result(senaryo.senaryo_id) for senaryo in senaryolar])
+    for (js, menzil), sonuc in zip(eski, yeni):
+        assert (js is None) == (sonuc.js_db is None), "Toplu hesap farklı sonuç verdi"
+        assert js is None or (abs(js - sonuc.js_db) < 1e-9 and abs(menzil - sonuc.burn_through_km) <= 1e-9 * menzil)
+    hesaplanan = sum(sonuc.js_db is not None for sonuc in yeni)
+
+    # Bir radarın ERP'si değişir: yalnızca o radara bağlı senaryolar yeniden hesaplanır.
+    radar = copy.deepcopy(radarlar[0])
+    radar.erp_dbw = (radar.erp_dbw or 60.0) + 3.0
+    dm.save_item(radar)
+    etkilenen = [senaryo.senaryo_id for senaryo in senaryolar if senaryo.radar_id == radar.radar_id]
+    sure_kismi, _ = olc(lambda: hesaplayici.results(etkilenen))
+
+    print(f"{'':<34}{'süre':>10}{'senaryo/s':>14}")
+    print(f"{'Python döngüsü':<34}{sure_eski:>9.2f}s{len(senaryolar) / sure_eski:>14,.0f}")
+    print(f"{'NumPy toplu hesap':<34}{sure_yeni:>9.2f}s{len(senaryolar) / sure_yeni:>14,.0f}")
+    print(f"{'önbellekten okuma':<34}{sure_okuma:>9.2f}s{len(senaryolar) / sure_okuma:>14,.0f}")
+    print(f"hızlanma {sure_eski / sure_yeni:.1f}x; J/S hesaplanabilen senaryo {hesaplanan}; radar değişikliği sonrası "
+          f"{len(etkilenen)} senaryonun yeniden hesabı {sure_kismi * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# ew_platformasi/benchmarks/bench_pdw_isleme.py
+#
+# PDW işleme hattının verimini (darbe/s) ölçer: iç içe geçmiş sentetik darbe dizileri ikili (.pdw) ve CSV dosyalarına
+# yazılır, PdwIngestor ile parça parça okunup radar kütüphanesiyle eşleştirilir. Radar başına sayılan darbeler
+# gerçek kaynaklarla karşılaştırılır.
+# Projenin kök dizininden çalıştırın:  python -m benchmarks.bench_pdw_isleme --yayici 20 --sure 10
+
+import argparse
+import collections
+import os
+import tempfile
+
+import numpy as np
+
+from core.data_manager import DataManager
+from core.pdw_ingest import PdwIngestor, write_pdw_file
+from benchmarks.sentetik_veri import sentetik_veri_seti, sentetik_pdw
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--radar", type=int, default=200, help="Kütüphanedeki radar sayısı")
+    parser.add_argument("--yayici", type=int, default=20, help="Ortamdaki (kayıttaki) yayıcı sayısı")
+    parser.add_argument("--sure", type=float, default=10.0, help="Kayıt süresi (s)")
+    parser.add_argument("--parca", type=int, default=1_000_000, help="Parça başına darbe sayısı")
+    args = parser.parse_args()
+
+    dm = DataManager()
+    platformlar, radarlar, teknikler, _, _ = sentetik_veri_seti(0, radar_sayisi=args.radar)
+    dm.et_platformlar, dm.radarlar, dm.teknikler = platformlar, radarlar, teknikler
+    pdws, kaynaklar = sentetik_pdw(radarlar, yayici_sayisi=args.yayici, sure_s=args.sure)
+    print(f"{len(radarlar)} radarlık kütüphane, {args.yayici} yayıcı, {args.sure:g} s kayıt: {len(pdws)} darbe")
+
+    with tempfile.TemporaryDirectory() as klasor:
+        ikili_yol = os.path.join(klasor, "kayit.pdw")
+        csv_yol = os.path.join(klasor, "kayit.csv")
+        write_pdw_file(ikili_yol, pdws)
+        np.savetxt(csv_yol, np.column_stack([pdws[ad] for ad in pdws.dtype.names]), delimiter=",",
+                   fmt=["%.3f", "%.3f", "%.4f", "%.2f", "%.2f"], header=",".join(pdws.dtype.names), comments="")
+
+        print(f"{'':<10}{'dosya':>10}{'süre':>10}{'darbe/s':>14}{'eşleşen':>10}")
+        for ad, yol in (("ikili", ikili_yol), ("CSV", csv_yol)):
+            isleyici = PdwIngestor(dm.emitter_matcher())
+            isleyici.ingest_file(yol, args.parca)
+            boyut = os.path.getsize(yol) / 2**20
+            print(f"{ad:<10}{boyut:>8.1f}MB{isleyici.elapsed_s:>9.2f}s{isleyici.pulses_per_second:>14,.0f}"
+                  f"{isleyici.matched_count * 100 / isleyici.pulse_count:>9.1f}%")
+
+    # Radar başına: eşleşen darbe sayısı / gerçek darbe sayısı (son çalıştırma)
+    gercek = collections.Counter(kaynaklar)
+    ozetler = {ozet.radar_id: ozet for ozet in isleyici.summaries()}
+    bulunan = sum(1 for radar_id, sayi in gercek.items()
+                  if radar_id in ozetler and ozetler[radar_id].pulse_count >= sayi / 2)
+    yanlis = sum(ozet.pulse_count for radar_id, ozet in ozetler.items() if radar_id not in gercek)
+    print(f"darbelerinin en az yarısıyla bulunan yayıcı: {bulunan}/{len(gercek)}; "
+          f"ortamda olmayan radarlara atanan darbe: %{yanlis * 100 / len(pdws):.1f}")
+
+
+if __name__ == "__main__":
+    main()
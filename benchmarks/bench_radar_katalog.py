@@ -0,0 +1,57 @@
+# ew_platformasi/benchmarks/bench_radar_katalog.py
+#
+# Parametrik radar sorgularını karşılaştırır: kayıtlar üzerinde Python döngüsü ile RadarCatalog'un NumPy sütunları.
+# Projenin kök dizininden çalıştırın:  python -m benchmarks.bench_radar_katalog --radar 1000000
+
+import argparse
+
+from core.data_manager import DataManager
+from core.data_models import Radar
+from benchmarks.olcum import olc
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+# (açıklama, RadarCatalog.query ölçütleri, aynı sorgunun Python karşılığı)
+_SORGULAR = [
+    ("X bandı, PRF 2-8 kHz, ERP >= 75 dBW",
+     dict(frekans_bandi="X", prf_hz=(2000, 8000), erp_dbw=(75, None)),
+     lambda r: (r.frekans_bandi == "X" and r.prf_hz is not None and 2000 <= r.prf_hz <= 8000
+                and r.erp_dbw is not None and r.erp_dbw >= 75)),
+    ("PW 1-5 µs, AESA ya da PESA",
+     dict(pw_us=(1, 5), anten_tipi=["AESA", "PESA"]),
+     lambda r: r.pw_us is not None and 1 <= r.pw_us <= 5 and r.anten_tipi in ("AESA", "PESA")),
+    ("görev çevrimi (PW/PRI) > %1",
+     dict(predicate=lambda c: c["pw_us"] / c["pri_us"] > 0.01),
+     lambda r: r.pw_us is not None and r.pri_us and r.pw_us / r.pri_us > 0.01),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--radar", type=int, default=1_000_000, help="Üretilecek radar sayısı")
+    args = parser.parse_args()
+
+    dm = DataManager()
+    platformlar, radarlar, teknikler, _, _ = sentetik_veri_seti(0, radar_sayisi=args.radar)
+    dm.et_platformlar, dm.radarlar, dm.teknikler = platformlar, radarlar, teknikler
+    kurulum, katalog = olc(dm.radar_catalog)
+    print(f"{len(katalog)} radar, katalog kurulumu {kurulum:.2f} s")
+
+    print(f"{'':<38}{'Python':>10}{'NumPy':>10}{'hızlanma':>10}{'sonuç':>9}")
+    for aciklama, olcutler, kosul in _SORGULAR:
+        sure_eski, eski = olc(lambda: [r.radar_id for r in dm.radarlar if kosul(r)])
+        sure_yeni, yeni = olc(lambda: katalog.query(**olcutler), tekrar=10)
+        assert sorted(eski) == sorted(yeni), f"Katalog farklı sonuç verdi: {aciklama}"
+        print(f"{aciklama:<38}{sure_eski * 1000:>8.0f}ms{sure_yeni * 1000:>8.1f}ms{sure_eski / sure_yeni:>9.0f}x"
+              f"{len(yeni):>9}")
+
+    # Tek kayıt değişikliği sütunlara O(1) işlenir.
+    radar = dm.get_items(Radar)[0]
+    radar.prf_hz = 5000.0
+    dm.save_item(radar)  # DataManager'ın id -> satır tablosu ilk kaydetmede bir kez kurulur; ölçüme katılmaz.
+    guncelleme, _ = olc(lambda: dm.save_item(radar))
+    silme, _ = olc(lambda: dm.delete_item_by_id(radar.radar_id, Radar))
+    print(f"kaydetme {guncelleme * 1000:.2f} ms, silme {silme * 1000:.2f} ms (katalog güncellemesi dahil)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# ew_platformasi/benchmarks/bench_search_index.py
+#
+# Senaryo tablosunda arama kutusuna harf harf yazmanın tuş başına süresini ölçer:
+# QSortFilterProxyModel'in tüm sütunları tarayan filtresi ile arama dizinine dayanan LazySortFilterProxyModel.
+# Projenin kök dizininden çalıştırın:  python -m benchmarks.bench_search_index --senaryo 100000
+
+import argparse
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QModelIndex, QSortFilterProxyModel, Qt
+from PySide6.QtWidgets import QApplication
+
+from core.data_manager import DataManager
+from core.data_models import Senaryo
+from core.models import SenaryoTableModel
+from viewmodels.scenario_vm import ScenarioViewModel
+from benchmarks.olcum import olc
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+_SORGU = "radar-1"
+
+
+def _tus_sureleri(filtrele, sorgu: str, eslesme_sayisi):
+    """Sorgu harf harf yazılır, sonra silinir; her tuşun süresini ve tam sorgunun eşleşme sayısını döndürür."""
+    sureler = []
+    adimlar = [sorgu[:i] for i in range(1, len(sorgu) + 1)] + [sorgu[:i] for i in range(len(sorgu) - 1, -1, -1)]
+    eslesen = None
+    for metin in adimlar:
+        sure, _ = olc(lambda: filtrele(metin))
+        sureler.append(sure)
+        if metin == sorgu:
+            eslesen = eslesme_sayisi()
+    return sureler, eslesen
+
+
+def _tum_satirlar(proxy) -> int:
+    while proxy.canFetchMore(QModelIndex()):
+        proxy.fetchMore(QModelIndex())
+    return proxy.rowCount()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--senaryo", type=int, default=100_000, help="Üretilecek senaryo sayısı")
+    args = parser.parse_args()
+
+    app = QApplication([])
+    dm = DataManager()
+    dm.et_platformlar, dm.radarlar, dm.teknikler, dm.senaryolar, dm.gorevler = sentetik_veri_seti(args.senaryo)
+    print(f"{args.senaryo} senaryo, sorgu '{_SORGU}'")
+
+    # Eski düzen: tüm liste modelde, filtre QSortFilterProxyModel'de.
+    eski_model = SenaryoTableModel()
+    eski_model.update_extra_args([], platform_map={p.platform_id: p.adi for p in dm.et_platformlar},
+                                 radar_map={r.radar_id: r.adi for r in dm.radarlar})
+    eski_model.refresh_data(dm.get_items(Senaryo))
+    eski_proxy = QSortFilterProxyModel()
+    eski_proxy.setSourceModel(eski_model)
+    eski_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+    eski_proxy.setFilterKeyColumn(-1)
+    eski_sureler, eski_eslesen = _tus_sureleri(eski_proxy.setFilterFixedString, _SORGU, eski_proxy.rowCount)
+
+    vm = ScenarioViewModel(dm)
+    # Proxy arama kutusu için filtreyi geciktirip arka planda hesaplar; tuş maliyeti modelin eşzamanlı
+    # filtresiyle ölçülür.
+    model = vm.proxy_model.sourceModel()
+    # Dizin ilk aramada kurulur; bu tek seferlik maliyet ayrıca gösterilir.
+    kurulum_suresi, _ = olc(lambda: model.set_filter(_SORGU[0]))
+    model.set_filter("")
+    # Yeni model eşleşmeleri sayfa sayfa bulur; sayım için (ölçüm dışında) tüm sayfalar yüklenir.
+    yeni_sureler, yeni_eslesen = _tus_sureleri(model.set_filter, _SORGU, lambda: _tum_satirlar(vm.proxy_model))
+
+    print(f"dizin kurulumu (ilk tuş): {kurulum_suresi * 1000:.1f} ms")
+    print(f"{'':<22}{'QSortFilterProxy':>18}{'arama dizini':>14}{'hızlanma':>10}")
+    for ad, secim in (("ortalama tuş", lambda s: sum(s) / len(s)), ("en yavaş tuş", max)):
+        eski, yeni = secim(eski_sureler), secim(yeni_sureler)
+        print(f"{ad:<22}{eski * 1000:>16.1f}ms{yeni * 1000:>12.1f}ms{eski / yeni:>9.1f}x")
+    print(f"eşleşen satır: {eski_eslesen} / {yeni_eslesen}")
+    assert eski_eslesen == yeni_eslesen, "Arama dizini farklı sayıda satır buldu"
+    del app
+
+
+if __name__ == "__main__":
+    main()
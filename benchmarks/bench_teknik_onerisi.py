@@ -0,0 +1,74 @@
+# ew_platformasi/benchmarks/bench_teknik_onerisi.py
+#
+# Teknik önerisini ölçer: TeknikSecimDialog'un açılışında hedef radar için platform teknikleri geçmiş senaryo
+# sonuçlarına göre sıralanır. Karşılaştırma için her açılışta tüm senaryoları dolaşıp sayan Python döngüsü; öneri
+# servisi ise bir kez kurulan (ve senaryo değiştikçe artımlı güncellenen) (teknik, radar) sayılarından okur.
+# Projenin kök dizininden çalıştırın:  python -m benchmarks.bench_teknik_onerisi --senaryo 1000000
+
+import argparse
+import collections
+import copy
+
+from core.data_manager import DataManager
+from core.data_models import Senaryo, TeknikUygulama
+from core.technique_recommender import BASIS_DIRECT
+from benchmarks.olcum import olc
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+_AGIRLIKLAR = {"Başarılı": 1.0, "Kısmen Başarılı": 0.5, "Başarısız": 0.0, "Değişken": 0.5}
+
+
+def _dongu_ile_oran(senaryolar, radar_id, teknik_idleri):
+    sayilar = collections.defaultdict(lambda: [0, 0.0])
+    for senaryo in senaryolar:
+        if senaryo.radar_id != radar_id or senaryo.sonuc_nitel not in _AGIRLIKLAR: continue
+        for teknik_id in {uygulama.teknik_id for uygulama in senaryo.uygulanan_teknikler}:
+            if teknik_id in teknik_idleri:
+                sayilar[teknik_id][0] += 1
+                sayilar[teknik_id][1] += _AGIRLIKLAR[senaryo.sonuc_nitel]
+    return {teknik_id: basari / sayi for teknik_id, (sayi, basari) in sayilar.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--senaryo", type=int, default=1_000_000, help="Geçmiş senaryo sayısı")
+    parser.add_argument("--acilis", type=int, default=200, help="Ölçülen dialog açılışı (farklı radarlar)")
+    args = parser.parse_args()
+
+    platformlar, radarlar, teknikler, senaryolar, _ = sentetik_veri_seti(args.senaryo)
+    dm = DataManager()
+    dm.et_platformlar, dm.radarlar, dm.teknikler, dm.senaryolar = platformlar, radarlar, teknikler, senaryolar
+    oneri = dm.technique_recommender()
+    platform_id = platformlar[0].platform_id
+    platform_teknikleri = [teknik for teknik in teknikler if teknik.platform_id == platform_id]
+    print(f"{len(senaryolar)} senaryo, {len(radarlar)} radar, platformda {len(platform_teknikleri)} teknik")
+    print(f"{'':<44}{'süre':>12}")
+
+    radar_id = radarlar[0].radar_id
+    sure_dongu, beklenen = olc(lambda: _dongu_ile_oran(senaryolar, radar_id,
+                                                        {teknik.teknik_id for teknik in platform_teknikleri}))
+    print(f"{'açılış başına, Python döngüsü':<44}{sure_dongu * 1000:>10.1f}ms")
+
+    sure_kurulum, sonuc = olc(lambda: oneri.recommend(radar_id, platform_teknikleri))
+    for oneri_sonucu in sonuc:
+        if oneri_sonucu.basis == BASIS_DIRECT:
+            assert abs(oneri_sonucu.success_rate - beklenen[oneri_sonucu.teknik.teknik_id]) < 1e-9, "Oran uyuşmuyor"
+    print(f"{'ilk açılış (istatistik kurulumu dahil)':<44}{sure_kurulum * 1000:>10.1f}ms")
+
+    acilis = min(args.acilis, len(radarlar))
+    sure_yeni, _ = olc(lambda: [oneri.recommend(radar.radar_id, platform_teknikleri) for radar in radarlar[:acilis]])
+    print(f"{'açılış, yeni radar (benzer radarlar dahil)':<44}{sure_yeni / acilis * 1000:>10.2f}ms")
+    sure_tekrar, _ = olc(lambda: [oneri.recommend(radar.radar_id, platform_teknikleri) for radar in radarlar[:acilis]])
+    print(f"{'açılış, aynı radar (önbellekten)':<44}{sure_tekrar / acilis * 1000:>10.3f}ms")
+
+    # Yeni bir senaryo kaydı sayıları artımlı günceller; önbellek düşer, sonraki açılış yeniden hesaplanır.
+    yeni = Senaryo(adi="Yeni", radar_id=radar_id, sonuc_nitel="Başarılı",
+                   uygulanan_teknikler=[TeknikUygulama(teknik_id=platform_teknikleri[0].teknik_id)])
+    dm.save_item(copy.copy(yeni))  # DataManager'ın id tablosu ilk kayıtta kurulur; ölçüme katılmaz.
+    sure_kayit, _ = olc(lambda: dm.save_item(copy.copy(yeni)))
+    sure_sonraki, _ = olc(lambda: oneri.recommend(radar_id, platform_teknikleri))
+    print(f"{'senaryo kaydı + sonraki açılış':<44}{(sure_kayit + sure_sonraki) * 1000:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# ew_platformasi/benchmarks/bench_toplu_degerlendirme.py
+#
+# Toplu senaryo değerlendirmesinin işçi sayısıyla ölçeklenmesini ölçer: aynı senaryolar havuzsuz (tek işlem) ve
+# farklı işçi sayılarıyla değerlendirilir, sonuçların birebir aynı olduğu denetlenir. İşçilere giden parçanın boyutu
+# senaryo nesnelerinin pickle boyutuyla karşılaştırılır; ana işlemde yapılan (paralelleşmeyen) parça hazırlama
+# süresinin payı ölçeklenmenin üst sınırını gösterir. Projenin kök dizininden çalıştırın:
+#   python -m benchmarks.bench_toplu_degerlendirme --senaryo 200000 --isci 1,2,4,8
+
+import argparse
+import os
+import pickle
+
+import numpy as np
+
+from core.batch_evaluator import DEFAULT_CHUNK_SCENARIOS, ScenarioEncoder, evaluate_chunk, evaluate_scenarios
+from benchmarks.olcum import olc
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--senaryo", type=int, default=200_000, help="Senaryo sayısı")
+    parser.add_argument("--isci", default="1,2,4,8", help="Denenecek işçi sayıları (virgülle)")
+    parser.add_argument("--parca", type=int, default=DEFAULT_CHUNK_SCENARIOS, help="Parça başına senaryo sayısı")
+    args = parser.parse_args()
+
+    _, radarlar, teknikler, senaryolar, _ = sentetik_veri_seti(args.senaryo)
+    print(f"{len(senaryolar)} senaryo, {args.parca} senaryoluk parçalar, {os.cpu_count()} işlemci")
+
+    encoder = ScenarioEncoder(radarlar, teknikler)
+    ornek = senaryolar[:args.parca]
+    parca = encoder.encode(ornek)
+    print(f"işçiye giden parça: {len(pickle.dumps(parca)) / len(ornek):.0f} bayt/senaryo "
+          f"(senaryo nesneleri: {len(pickle.dumps(ornek)) / len(ornek):.0f} bayt/senaryo)")
+    sure_hazirlama, parcalar = olc(lambda: [encoder.encode(senaryolar[i:i + args.parca], i)
+                                            for i in range(0, len(senaryolar), args.parca)])
+    sure_hesap, _ = olc(lambda: [evaluate_chunk(parca, encoder.tables) for parca in parcalar])
+    pay = sure_hazirlama / (sure_hazirlama + sure_hesap)
+    print(f"ana işlemde hazırlama {sure_hazirlama:.2f}s, değerlendirme {sure_hesap:.2f}s: "
+          f"paralelleşmeyen pay %{pay * 100:.1f} (en çok {1 / pay:.1f}x)")
+    del parcalar
+
+    print(f"{'işçi':>6}{'süre':>10}{'senaryo/s':>14}{'hızlanma':>10}{'verim':>8}")
+    temel = None
+    for isci in (int(sayi) for sayi in args.isci.split(",")):
+        sure, sonuc = olc(lambda: evaluate_scenarios(senaryolar, radarlar, teknikler, workers=isci,
+                                                     chunk_scenarios=args.parca))
+        if temel is None:
+            temel_sure, temel = sure, sonuc
+        for ad, sutun in sonuc.columns.items():
+            assert np.array_equal(sutun, temel.columns[ad], equal_nan=True), f"{isci} işçi: '{ad}' sonuçları farklı"
+        hizlanma = temel_sure / sure
+        print(f"{isci:>6}{sure:>9.2f}s{len(senaryolar) / sure:>14,.0f}{hizlanma:>9.2f}x{hizlanma / isci * 100:>7.0f}%")
+
+
+if __name__ == "__main__":
+    main()
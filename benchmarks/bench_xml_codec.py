@@ -0,0 +1,176 @@
+# ew_platformasi/benchmarks/bench_xml_codec.py
+#
+# Derlenmiş XML codec'lerini eski yansıtmalı (fields/get_origin tabanlı) dönüşümle karşılaştırır.
+# Projenin kök dizininden çalıştırın:  python -m benchmarks.bench_xml_codec --senaryo 50000
+
+import argparse
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from dataclasses import fields, is_dataclass, asdict
+from typing import get_origin, get_args, Union
+
+from core.data_models import ETPlatformu, Radar, Teknik, Senaryo, Gorev, TeknikUygulama, BaseTeknikParametreleri
+from core.data_manager import DataManager
+from core.xml_codec import get_codec, id_field_name, PARAM_CLASS_MAP
+from benchmarks.olcum import olc
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+
+# --- Eski yansıtmalı yol (karşılaştırma için DataManager'daki önceki halinden aynen alınmıştır) ---
+def legacy_element_to_dataclass(element, cls):
+    data = {}
+    cls_fields = {f.name for f in fields(cls)}
+
+    for field_info in fields(cls):
+        field_name_pascal = field_info.name.replace('_', ' ').title().replace(' ', '')
+        child_element = element.find(field_name_pascal)
+        if child_element is None: continue
+
+        if field_info.name == "parametreler":
+            if len(child_element) > 0:
+                param_element = child_element[0]
+                param_cls = PARAM_CLASS_MAP.get(param_element.tag, BaseTeknikParametreleri)
+                data[field_info.name] = legacy_element_to_dataclass(param_element, param_cls)
+        elif field_info.name == "senaryo_id_list":
+            data[field_info.name] = [item.text for item in child_element.findall("SenaryoID")]
+        elif field_info.name == "uygulanan_teknikler":
+            data[field_info.name] = [legacy_element_to_dataclass(item, TeknikUygulama)
+                                     for item in child_element.findall("TeknikUygulama")]
+        else:
+            text_val = child_element.text
+            if text_val is not None and text_val != 'None':
+                field_type = field_info.type
+                origin_type = get_origin(field_type)
+                type_args = get_args(field_type)
+
+                try:
+                    if origin_type is Union and type(None) in type_args:
+                        base_type = next(t for t in type_args if t is not type(None))
+                        data[field_info.name] = base_type(text_val)
+                    elif field_type is bool:
+                        data[field_info.name] = text_val.lower() in ('true', '1')
+                    else:
+                        data[field_info.name] = field_type(text_val)
+                except (ValueError, TypeError):
+                    data[field_info.name] = text_val
+
+    id_attr = element.attrib.get("id")
+    id_field_name = f"{cls.__name__.lower().replace('et', 'et_')}_id"
+    if id_field_name == "et_platformu_id": id_field_name = "platform_id"
+    if id_attr and hasattr(cls, id_field_name):
+        data[id_field_name] = id_attr
+
+    try:
+        return cls(**{k: v for k, v in data.items() if k in cls_fields})
+    except TypeError:
+        return None
+
+
+def legacy_dataclass_to_element(instance):
+    class_name = instance.__class__.__name__
+    id_field_name = f"{class_name.lower().replace('et', 'et_')}_id"
+    if id_field_name == "et_platformu_id": id_field_name = "platform_id"
+    attribs = {}
+    if hasattr(instance, id_field_name) and getattr(instance, id_field_name):
+        attribs["id"] = getattr(instance, id_field_name)
+
+    element = ET.Element(class_name, attrib=attribs)
+
+    for field_info in fields(instance):
+        if field_info.name == id_field_name: continue
+
+        field_name_pascal = field_info.name.replace('_', ' ').title().replace(' ', '')
+        child_element = ET.SubElement(element, field_name_pascal)
+        value = getattr(instance, field_info.name)
+
+        if is_dataclass(value):
+            child_element.append(legacy_dataclass_to_element(value))
+        elif isinstance(value, list):
+            if field_info.name == "senaryo_id_list":
+                for item in value: ET.SubElement(child_element, "SenaryoID").text = str(item)
+            elif field_info.name == "uygulanan_teknikler":
+                for item in value:
+                    child_element.append(legacy_dataclass_to_element(item))
+        elif value is not None:
+            child_element.text = str(value)
+    return element
+
+
+def legacy_save_workspace(collections, path):
+    root = ET.Element("EWVeriSeti")
+    for tag, data_list in zip(["ETPlatformlar", "Radarlar", "Teknikler", "Senaryolar", "Gorevler"], collections):
+        sub_root = ET.SubElement(root, tag)
+        for item in data_list:
+            sub_root.append(legacy_dataclass_to_element(item))
+    tree = ET.ElementTree(root)
+    ET.indent(tree, space="  ", level=0)
+    tree.write(path, encoding="utf-8", xml_declaration=True)
+
+
+def legacy_open_workspace(path):
+    root = ET.parse(path).getroot()
+    return [[legacy_element_to_dataclass(elem, cls) for elem in root.findall(path_str)]
+            for path_str, cls in [("ETPlatformlar/ETPlatformu", ETPlatformu), ("Radarlar/Radar", Radar),
+                                  ("Teknikler/Teknik", Teknik), ("Senaryolar/Senaryo", Senaryo),
+                                  ("Gorevler/Gorev", Gorev)]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--senaryo", type=int, default=50_000, help="Üretilecek senaryo sayısı")
+    args = parser.parse_args()
+
+    platformlar, radarlar, teknikler, senaryolar, gorevler = sentetik_veri_seti(args.senaryo)
+    kayitlar = platformlar + radarlar + teknikler + senaryolar + gorevler
+    print(f"{len(kayitlar)} kayıt ({args.senaryo} senaryo)")
+
+    sure_eski_yaz, eski_elemanlar = olc(lambda: [legacy_dataclass_to_element(k) for k in kayitlar])
+    sure_yeni_yaz, yeni_elemanlar = olc(lambda: [get_codec(type(k)).encode(k) for k in kayitlar])
+    for eski, yeni in zip(eski_elemanlar, yeni_elemanlar):
+        assert ET.tostring(eski) == ET.tostring(yeni), "Codec çıktısı eski yoldan farklı"
+
+    sinif_listesi = [type(k) for k in kayitlar]
+    sure_eski_oku, eski_kayitlar = olc(
+        lambda: [legacy_element_to_dataclass(e, c) for e, c in zip(yeni_elemanlar, sinif_listesi)])
+    sure_yeni_oku, yeni_kayitlar = olc(
+        lambda: [get_codec(c).decode(e) for e, c in zip(yeni_elemanlar, sinif_listesi)])
+
+    for kaynak, eski, yeni in zip(kayitlar, eski_kayitlar, yeni_kayitlar):
+        assert asdict(yeni) == asdict(kaynak), "Codec ile okunan kayıt kaynağından farklı"
+        # Eski yol id özniteliğini hiçbir zaman uygulamıyordu; kimlikler hariç alanlar aynı olmalı.
+        alan = id_field_name(type(kaynak))
+        if alan:
+            setattr(eski, alan, getattr(kaynak, alan))
+        assert asdict(eski) == asdict(yeni), "Codec ile okunan kayıt eski yoldan farklı"
+
+    del eski_elemanlar, yeni_elemanlar, eski_kayitlar, yeni_kayitlar
+
+    # Uçtan uca: eski ağaç tabanlı kaydetme/yükleme ile DataManager'ın akışlı yolu.
+    dm = DataManager()
+    dm.et_platformlar, dm.radarlar, dm.teknikler, dm.senaryolar, dm.gorevler = (
+        platformlar, radarlar, teknikler, senaryolar, gorevler)
+    with tempfile.TemporaryDirectory() as klasor:
+        eski_yol, yeni_yol = os.path.join(klasor, "eski.xml"), os.path.join(klasor, "yeni.xml")
+        sure_eski_kaydet, _ = olc(lambda: legacy_save_workspace(
+            [platformlar, radarlar, teknikler, senaryolar, gorevler], eski_yol))
+        sure_yeni_kaydet, _ = olc(lambda: dm.save_workspace(yeni_yol))
+        with open(eski_yol, "rb") as f1, open(yeni_yol, "rb") as f2:
+            assert f1.read() == f2.read(), "Kaydedilen dosyalar bayt bayt aynı değil"
+        sure_eski_ac, _ = olc(lambda: legacy_open_workspace(eski_yol))
+        sure_yeni_ac, _ = olc(lambda: dm.open_workspace(yeni_yol))
+        assert len(dm.senaryolar) == len(senaryolar)
+
+    satirlar = [
+        ("dataclass -> Element", sure_eski_yaz, sure_yeni_yaz),
+        ("Element -> dataclass", sure_eski_oku, sure_yeni_oku),
+        ("save_workspace", sure_eski_kaydet, sure_yeni_kaydet),
+        ("open_workspace", sure_eski_ac, sure_yeni_ac),
+    ]
+    print(f"{'':<22}{'yansıtmalı':>12}{'codec':>12}{'hızlanma':>10}")
+    for ad, eski, yeni in satirlar:
+        print(f"{ad:<22}{eski:>11.3f}s{yeni:>11.3f}s{eski / yeni:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# ew_platformasi/benchmarks/bench_zaman_cizelgesi.py
+#
+# Teknik zinciri zaman çizelgesini ölçer: senaryolar toplu olarak örneklenir (etkin teknik, güç, bant, anlık frekans)
+# ve görevlerdeki eşzamanlı senaryoların çakışmaları çıkarılır. Karşılaştırma için örnek örnek ilerleyen Python
+# döngüsü (bir alt kümede ölçülüp örnek sayısına oranlanır). Projenin kök dizininden çalıştırın:
+#   python -m benchmarks.bench_zaman_cizelgesi --senaryo 5000 --aralik 0.1
+
+import argparse
+import math
+
+import numpy as np
+
+from core.timeline_simulator import find_conflicts, simulate, technique_state
+from benchmarks.olcum import olc
+from benchmarks.sentetik_veri import sentetik_veri_seti
+
+# Python döngüsü bu kadar senaryoyla ölçülür.
+_DONGU_ORNEK = 100
+
+
+def _dongu_ile_ornekle(senaryolar, teknik_map, aralik):
+    ornekler = []
+    for senaryo in senaryolar:
+        zincir = sorted(senaryo.uygulanan_teknikler, key=lambda u: u.sira)
+        toplam = sum(max(uygulama.sure_sn, 0.0) for uygulama in zincir)
+        for k in range(math.ceil(toplam / aralik - 1e-9)):
+            t, baslangic = k * aralik, 0.0
+            for uygulama in zincir:
+                if t < baslangic + uygulama.sure_sn: break
+                baslangic += uygulama.sure_sn
+            guc, alt, ust, _, tarama = technique_state(teknik_map.get(uygulama.teknik_id))
+            faz = ((t - baslangic) * 1000.0 % tarama) / tarama if tarama > 0 else 0.5
+            ornekler.append((t, uygulama.teknik_id, guc, alt + (ust - alt) * faz))
+    return ornekler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--senaryo", type=int, default=5000, help="Senaryo sayısı")
+    parser.add_argument("--aralik", type=float, default=0.1, help="Örnekleme aralığı (s)")
+    args = parser.parse_args()
+
+    platformlar, _, teknikler, senaryolar, gorevler = sentetik_veri_seti(args.senaryo)
+    teknik_map = {teknik.teknik_id: teknik for teknik in teknikler}
+
+    ornek = senaryolar[:_DONGU_ORNEK]
+    sure_ornek, eski = olc(lambda: _dongu_ile_ornekle(ornek, teknik_map, args.aralik))
+    yeni = simulate(ornek, teknik_map, args.aralik)
+    assert len(eski) == len(yeni), "Örnek sayıları farklı"
+    assert all(teknik_id == (yeni.teknik_ids[kod] if kod >= 0 else teknik_id)
+               for (_, teknik_id, _, _), kod in zip(eski, yeni.teknik.tolist())), "Etkin teknikler farklı"
+
+    sure, zaman_cizelgesi = olc(lambda: simulate(senaryolar, teknik_map, args.aralik))
+    sure_eski = sure_ornek / len(eski) * len(zaman_cizelgesi)
+    print(f"{len(senaryolar)} senaryo, {args.aralik:g} s aralık: {len(zaman_cizelgesi):,} örnek")
+    print(f"{'':<34}{'süre':>10}{'örnek/s':>16}")
+    print(f"{'örnekleme, Python döngüsü (tah.)':<34}{sure_eski:>9.1f}s{len(zaman_cizelgesi) / sure_eski:>16,.0f}")
+    print(f"{'örnekleme, NumPy toplu':<34}{sure:>9.2f}s{len(zaman_cizelgesi) / sure:>16,.0f}")
+
+    # Her görevin senaryoları aynı anda başlar; görevler tek toplu işte örneklenip birlikte çözümlenir.
+    senaryo_map = {senaryo.senaryo_id: senaryo for senaryo in senaryolar}
+    platform_kodlari = {platform.platform_id: kod for kod, platform in enumerate(platformlar)}
+    toplu, gruplar = [], []
+    for grup, gorev in enumerate(gorevler):
+        for senaryo_id in gorev.senaryo_id_list:
+            if senaryo_id in senaryo_map:
+                toplu.append(senaryo_map[senaryo_id])
+                gruplar.append(grup)
+    platformlar_ = np.array([platform_kodlari.get(senaryo.et_platformu_id, -1) for senaryo in toplu])
+
+    def cakismalar():
+        return find_conflicts(simulate(toplu, teknik_map, args.aralik), np.array(gruplar), platformlar_)
+
+    sure_cakisma, rapor = olc(cakismalar)
+    print(f"{'görev çakışmaları':<34}{sure_cakisma:>9.2f}s  ({len(gorevler)} görev, {len(toplu)} senaryo)")
+    print(f"eşzamanlı {len(rapor) * args.aralik:,.0f} s; frekans çakışması "
+          f"{rapor.frequency_conflict.sum() * args.aralik:,.0f} s, platform çakışması "
+          f"{rapor.platform_conflict.sum() * args.aralik:,.0f} s")
+
+
+if __name__ == "__main__":
+    main()
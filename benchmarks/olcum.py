@@ -0,0 +1,15 @@
+# ew_platformasi/benchmarks/olcum.py
+#
+# Karşılaştırma betiklerinin ortak süre ölçümü.
+
+import gc
+import time
+
+
+def olc(fonksiyon, tekrar: int = 1):
+    """fonksiyon'u tekrar kez çalıştırır; (çağrı başına ortalama süre (s), son sonuç) döndürür."""
+    gc.collect()
+    baslangic = time.perf_counter()
+    for _ in range(tekrar):
+        sonuc = fonksiyon()
+    return (time.perf_counter() - baslangic) / tekrar, sonuc
@@ -0,0 +1,117 @@
+# ew_platformasi/benchmarks/sentetik_veri.py
+
+import random
+import uuid
+
+import numpy as np
+
+from core.data_models import (
+    ETPlatformu, Radar, Teknik, Senaryo, Gorev, TeknikUygulama,
+    GurultuKaristirmaParams, MenzilAldatmaParams, AlmacGondermecAyarParametreleri, KaynakUretecAyarParametreleri,
+    BaseTeknikParametreleri, FREKANS_BANDLARI, GOREV_TIPLERI, ANTEN_TIPLERI, TEKNIK_KATEGORILERI, SONUC_NITEL,
+    DARBE_MODULASYONLARI
+)
+from core.pdw_ingest import PDW_DTYPE
+
+# PDW üretiminde taşıyıcı frekansların seçildiği bant aralıkları (MHz)
+_BANT_ARALIKLARI_MHZ = {"VHF": (30, 300), "UHF": (300, 1000), "L": (1000, 2000), "S": (2000, 4000),
+                        "C": (4000, 8000), "X": (8000, 12000), "Ku": (12000, 18000), "K": (18000, 27000),
+                        "Ka": (27000, 40000)}
+
+
+def sentetik_veri_seti(senaryo_sayisi: int, radar_sayisi: int = 200, teknik_sayisi: int = 60,
+                       platform_sayisi: int = 8, gorev_sayisi: int = 50, seed: int = 42):
+    """Ölçüm betikleri için tekrarlanabilir (sabit tohumlu) bir veri seti üretir.
+
+    (platformlar, radarlar, teknikler, senaryolar, gorevler) demeti döndürür.
+    """
+    rnd = random.Random(seed)
+
+    def yeni_id():
+        return str(uuid.UUID(int=rnd.getrandbits(128), version=4))
+
+    platformlar = [ETPlatformu(platform_id=yeni_id(), adi=f"Platform-{i}", aciklama="Sentetik platform")
+                   for i in range(platform_sayisi)]
+
+    radarlar = []
+    for i in range(radar_sayisi):
+        prf_hz = rnd.uniform(200.0, 20000.0)
+        radarlar.append(Radar(
+            radar_id=yeni_id(), adi=f"Radar-{i}", elnot=f"E{i:05d}", uretici=f"Üretici-{i % 17}",
+            frekans_bandi=rnd.choice(FREKANS_BANDLARI), gorev_tipi=rnd.choice(GOREV_TIPLERI),
+            anten_tipi=rnd.choice(ANTEN_TIPLERI), pw_us=round(rnd.uniform(0.1, 250.0), 2), prf_hz=round(prf_hz, 2),
+            pri_us=round(1_000_000 / prf_hz, 3), erp_dbw=round(rnd.uniform(50.0, 100.0), 1),
+            darbe_modulasyonu=rnd.choice(DARBE_MODULASYONLARI), darbe_entegrasyonu="16-pulse coherent",
+            notlar="Sentetik radar kaydı"))
+
+    param_uretecleri = [
+        lambda: GurultuKaristirmaParams(tur=rnd.choice(["Barrage", "Spot", "Swept", "DRFM Noise"]),
+                                        bant_genisligi_mhz=round(rnd.uniform(5.0, 500.0), 1),
+                                        guc_erp_dbw=round(rnd.uniform(40.0, 80.0), 1)),
+        lambda: MenzilAldatmaParams(teknik_tipi=rnd.choice(["RGPO", "RGPI"]),
+                                    cekme_hizi_mps=round(rnd.uniform(100.0, 3000.0), 1),
+                                    sahte_hedef_sayisi=rnd.randint(1, 20)),
+        lambda: AlmacGondermecAyarParametreleri(rf_kazanc_db=round(rnd.uniform(0.0, 40.0), 1),
+                                                otomatik_kazanc_kontrolu_aktif=rnd.random() < 0.5),
+        lambda: KaynakUretecAyarParametreleri(dalga_formu_tipi=rnd.choice(["Sinus", "Kare", "Testere Dişi", "Darbe"]),
+                                              baslangic_frekansi_mhz=9000.0, bitis_frekansi_mhz=9500.0,
+                                              tarama_suresi_ms=round(rnd.uniform(0.1, 10.0), 2),
+                                              darbe_genisligi_us=1.0, darbe_tekrarlama_araligi_us=100.0),
+        lambda: BaseTeknikParametreleri(),
+    ]
+    teknikler = []
+    for i in range(teknik_sayisi):
+        kategori_index = i % len(param_uretecleri)
+        teknikler.append(Teknik(
+            teknik_id=yeni_id(), adi=f"Teknik-{i}", kategori=TEKNIK_KATEGORILERI[kategori_index],
+            aciklama="Sentetik teknik", platform_id=rnd.choice(platformlar).platform_id,
+            parametreler=param_uretecleri[kategori_index]()))
+
+    senaryolar = []
+    for i in range(senaryo_sayisi):
+        zincir = [TeknikUygulama(sira=sira, teknik_id=rnd.choice(teknikler).teknik_id,
+                                 sure_sn=float(rnd.randint(5, 180)))
+                  for sira in range(1, rnd.randint(1, 5) + 1)]
+        senaryolar.append(Senaryo(
+            senaryo_id=yeni_id(), adi=f"Senaryo-{i}", tarih_iso=f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            konum=f"Bölge-{i % 40}", amac="Sentetik senaryo", et_platformu_id=rnd.choice(platformlar).platform_id,
+            manevra=rnd.random() < 0.3, radar_id=rnd.choice(radarlar).radar_id, uygulanan_teknikler=zincir,
+            sonuc_nitel=rnd.choice(SONUC_NITEL), mesafe_km=round(rnd.uniform(5.0, 300.0), 1),
+            notlar="Sentetik senaryo notu"))
+
+    gorevler = []
+    for i in range(gorev_sayisi):
+        secilenler = rnd.sample(senaryolar, min(len(senaryolar), 10))
+        gorevler.append(Gorev(gorev_id=yeni_id(), adi=f"Görev-{i}", sorumlu_personel=f"Personel-{i % 9}",
+                              aciklama="Sentetik görev", senaryo_id_list=[s.senaryo_id for s in secilenler]))
+
+    return platformlar, radarlar, teknikler, senaryolar, gorevler
+
+
+def sentetik_pdw(radarlar, yayici_sayisi: int = 20, sure_s: float = 10.0, pri_sapma: float = 0.002,
+                 pw_sapma: float = 0.02, seed: int = 7):
+    """Kütüphaneden seçilen yayıcıların iç içe geçmiş darbe dizileri (TOA'ya göre sıralı).
+
+    (PDW_DTYPE dizisi, darbe başına gerçek radar_id dizisi) demeti döndürür. PRI sapması darbe başına TOA
+    titreşimi, PW sapması düzgün dağılımlı ölçüm hatasıdır (ikisi de göreli).
+    """
+    rng = np.random.default_rng(seed)
+    adaylar = [radar for radar in radarlar if radar.frekans_bandi in _BANT_ARALIKLARI_MHZ and radar.pri_us
+               and radar.pw_us]
+    secilenler = rng.choice(len(adaylar), size=min(yayici_sayisi, len(adaylar)), replace=False)
+    parcalar, kaynaklar = [], []
+    for i in secilenler:
+        radar = adaylar[i]
+        sayi = int(sure_s * 1_000_000 / radar.pri_us)
+        pdws = np.zeros(sayi, dtype=PDW_DTYPE)
+        pdws["toa_us"] = (rng.uniform(0, radar.pri_us) + np.arange(sayi) * radar.pri_us
+                          + rng.normal(0, radar.pri_us * pri_sapma, sayi))
+        pdws["freq_mhz"] = rng.uniform(*_BANT_ARALIKLARI_MHZ[radar.frekans_bandi]) + rng.normal(0, 0.5, sayi)
+        pdws["pw_us"] = radar.pw_us * rng.uniform(1 - pw_sapma, 1 + pw_sapma, sayi)
+        pdws["amp_dbm"] = rng.uniform(-80, -30) + rng.normal(0, 1.0, sayi)
+        pdws["aoa_deg"] = (rng.uniform(0, 360) + rng.normal(0, 1.0, sayi)) % 360
+        parcalar.append(pdws)
+        kaynaklar.append(np.full(sayi, radar.radar_id, dtype=object))
+    pdws, kaynaklar = np.concatenate(parcalar), np.concatenate(kaynaklar)
+    sira = np.argsort(pdws["toa_us"], kind="stable")
+    return pdws[sira], kaynaklar[sira]
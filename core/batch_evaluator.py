@@ -0,0 +1,315 @@
+# ew_platformasi/core/batch_evaluator.py
+#
+# Senaryoların toplu değerlendirmesi: her senaryo için J/S ve yanma menzili (jamming_calculator), teknik zincirinin
+# zaman çizelgesinden türetilen ölçüler (timeline_simulator) ve sonuç puanı hesaplanır. Senaryolar parçalara bölünüp
+# bir işlem havuzunda (ProcessPoolExecutor) değerlendirilir.
+#
+# İşçilere dataclass nesneleri gönderilmez: ana işlem her parçayı sütunlara döker (radar kodu, mesafe, sonuç kodu ve
+# düzleştirilmiş zincir: adım sayısı, teknik kodu, süre). Pickle edilen parça yalnızca NumPy dizilerinden oluşur.
+# Radar ve teknik tabloları (EvaluationTables) her işçiye havuz açılırken bir kez gönderilir. İşçiler sonuçları
+# sütunlar halinde döndürür; ana işlem bunları parçanın satırlarına yazar ve sonuçlara senaryo_id ile erişilir.
+#
+# Parçalar sırayla hazırlanıp gönderilir; işçi başına en çok birkaç parça kuyrukta bekler, böylece milyonlarca
+# senaryoda bile bellekte yalnızca işlenmekte olan parçalar bulunur.
+#
+# Zaman çizelgesi ölçüleri:
+#   karıştırma süresi: gücü bilinen bir tekniğin etkin olduğu süre (s)
+#   bant kapsaması: anlık frekansı hedef radarın frekans bandında olan örneklerin oranı (bilinmiyorsa None)
+
+import concurrent.futures
+import csv
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional
+
+import numpy as np
+
+from core.data_models import FREKANS_BANDI_KODLARI, SONUC_NITEL_KODLARI, Radar, Senaryo, Teknik
+from core.jamming_calculator import DEFAULT_RCS_M2, DEFAULT_REQUIRED_JS_DB, best_jamming, noise_params
+from core.pdw_ingest import frequency_band_codes
+from core.scenario_analytics import OUTCOME_WEIGHTS
+from core.timeline_simulator import simulate_steps, steps_from_chains, technique_states
+
+DEFAULT_CHUNK_SCENARIOS = 2000
+# Toplu değerlendirmede zaman çizelgesi örnekleme aralığı (s); görünümdekinden kaba, ölçüler için yeterli.
+DEFAULT_STEP_S = 1.0
+# İşçi başına kuyrukta bekleyebilecek parça sayısı
+_IN_FLIGHT_PER_WORKER = 2
+
+RESULT_COLUMNS = ("js_db", "burn_through_km", "best_teknik", "duration_s", "jamming_s", "band_coverage",
+                  "outcome_score")
+
+
+@dataclass
+class EvaluationTables:
+    """Parçalardan bağımsız tablolar; radar ve teknik dizilerinin son satırı bilinmeyen (-1 kodlu) kayıt içindir."""
+    radar_erp_dbw: np.ndarray
+    radar_pw_us: np.ndarray
+    radar_band: np.ndarray
+    # Gücü bilinen gürültü karıştırma tekniklerinde ERP ve bant genişliği; diğer tekniklerde NaN
+    jammer_erp_dbw: np.ndarray
+    jammer_bandwidth_mhz: np.ndarray
+    # technique_states tablosu
+    states: np.ndarray
+    rcs_m2: float
+    required_js_db: float
+    step_s: float
+
+
+@dataclass
+class ScenarioChunk:
+    """Bir parçadaki senaryoların sütunları; start, parçanın toplu işteki ilk satırıdır."""
+    start: int
+    radar: np.ndarray
+    distance_km: np.ndarray
+    outcome: np.ndarray
+    # Düzleştirilmiş zincirler: senaryo başına adım sayısı; sıraya dizili adımların teknik kodu ve süresi
+    chain_lengths: np.ndarray
+    chain_teknik: np.ndarray
+    chain_duration_s: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.radar)
+
+
+class ScenarioEvaluation(NamedTuple):
+    js_db: Optional[float]
+    burn_through_km: Optional[float]
+    # En yüksek J/S'yi veren teknik; hesaplanamadıysa None
+    teknik_id: Optional[str]
+    duration_s: float
+    jamming_s: float
+    band_coverage: Optional[float]
+    # Sonucun başarı ağırlığı (OUTCOME_WEIGHTS); sonuç bilinmiyorsa None
+    outcome_score: Optional[float]
+
+
+class ScenarioEncoder:
+    """Radar/teknik kütüphanesinden değerlendirme tablolarını kurar ve senaryo parçalarını sütunlara döker."""
+
+    def __init__(self, radarlar: List[Radar], teknikler: List[Teknik], step_s: float = DEFAULT_STEP_S,
+                 rcs_m2: float = DEFAULT_RCS_M2, required_js_db: float = DEFAULT_REQUIRED_JS_DB):
+        if step_s <= 0:
+            raise ValueError("Örnekleme aralığı pozitif olmalı")
+        if rcs_m2 <= 0:
+            raise ValueError("Radar kesit alanı sıfırdan büyük olmalıdır.")
+        self._radar_codes = {radar.radar_id: code for code, radar in enumerate(radarlar)}
+        self._teknik_codes = {teknik.teknik_id: code for code, teknik in enumerate(teknikler)}
+        self.teknik_ids = [teknik.teknik_id for teknik in teknikler]
+
+        nan = float("nan")
+        jammers = [noise_params(teknik) or (nan, nan) for teknik in teknikler]
+        self.tables = EvaluationTables(
+            radar_erp_dbw=_optional_column([radar.erp_dbw for radar in radarlar]),
+            radar_pw_us=_optional_column([radar.pw_us for radar in radarlar]),
+            radar_band=np.array([FREKANS_BANDI_KODLARI.get(radar.frekans_bandi, 0) for radar in radarlar] + [0],
+                                dtype=np.int16),
+            jammer_erp_dbw=_optional_column([erp for erp, _ in jammers]),
+            jammer_bandwidth_mhz=_optional_column([bandwidth for _, bandwidth in jammers]),
+            states=technique_states(teknikler), rcs_m2=rcs_m2, required_js_db=required_js_db, step_s=step_s)
+
+    def encode(self, senaryolar: List[Senaryo], start: int = 0) -> ScenarioChunk:
+        count = len(senaryolar)
+        chains = [sorted(senaryo.uygulanan_teknikler, key=lambda u: u.sira) for senaryo in senaryolar]
+        lengths = np.fromiter(map(len, chains), dtype=np.int32, count=count)
+        total = int(lengths.sum())
+        teknik_code = self._teknik_codes.get
+        return ScenarioChunk(
+            start=start,
+            radar=np.fromiter((self._radar_codes.get(senaryo.radar_id, -1) for senaryo in senaryolar), dtype=np.int32,
+                              count=count),
+            distance_km=np.array([senaryo.mesafe_km for senaryo in senaryolar], dtype=float).reshape(count),
+            outcome=np.fromiter((SONUC_NITEL_KODLARI.get(senaryo.sonuc_nitel, 0) for senaryo in senaryolar),
+                                dtype=np.int8, count=count),
+            chain_lengths=lengths,
+            chain_teknik=np.fromiter((teknik_code(uygulama.teknik_id, -1) for chain in chains for uygulama in chain),
+                                     dtype=np.int32, count=total),
+            chain_duration_s=np.fromiter((uygulama.sure_sn or 0.0 for chain in chains for uygulama in chain),
+                                         dtype=float, count=total))
+
+
+def evaluate_chunk(chunk: ScenarioChunk, tables: EvaluationTables) -> Dict[str, np.ndarray]:
+    """Parçanın sonuç sütunları (RESULT_COLUMNS); best_teknik teknik kodudur (-1: yok)."""
+    count = len(chunk)
+    codes = chunk.chain_teknik.astype(np.int64)
+    rows = np.repeat(np.arange(count), chunk.chain_lengths)
+    radar = chunk.radar.astype(np.int64)
+
+    # Bilinmeyen (-1) teknik koduna NaN satırı düşer; J/S'ye yalnızca gücü bilinen gürültü teknikleri girer.
+    jammers = ~np.isnan(tables.jammer_erp_dbw[codes])
+    js, burn_through, best_code = best_jamming(count, rows[jammers], codes[jammers], tables.jammer_erp_dbw,
+                                               tables.jammer_bandwidth_mhz, tables.radar_erp_dbw[radar],
+                                               tables.radar_pw_us[radar], chunk.distance_km, tables.rcs_m2,
+                                               tables.required_js_db)
+
+    timeline = simulate_steps(steps_from_chains(chunk.chain_lengths, chunk.chain_duration_s, codes), tables.states,
+                              count, tables.step_s)
+    samples = np.bincount(timeline.scenario, minlength=count)
+    band = tables.radar_band[radar][timeline.scenario]
+    # Frekansı bant aralığı dışındaki örnekler -1 alır, hiçbir radar bandına uymaz; bandı "Bilinmiyor" (0) radarda
+    # kapsama hep 0'dır.
+    in_band = (frequency_band_codes(timeline.frequency_mhz) == band) & (band > 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        coverage = np.bincount(timeline.scenario, weights=in_band, minlength=count) / samples
+    jamming = np.bincount(timeline.scenario, weights=~np.isnan(timeline.power_dbw), minlength=count) * tables.step_s
+
+    return {"js_db": js, "burn_through_km": burn_through, "best_teknik": best_code.astype(np.int32),
+            "duration_s": timeline.durations_s, "jamming_s": jamming, "band_coverage": coverage,
+            "outcome_score": OUTCOME_WEIGHTS[chunk.outcome]}
+
+
+class BatchResults:
+    """Toplu değerlendirmenin sonuçları; senaryo sırasıyla sütunlar halinde tutulur, senaryo_id ile okunur."""
+
+    def __init__(self, senaryo_ids: List[str], teknik_ids: List[str]):
+        self.senaryo_ids = senaryo_ids
+        self.teknik_ids = teknik_ids
+        count = len(senaryo_ids)
+        self.columns = {name: np.full(count, np.nan) for name in RESULT_COLUMNS}
+        self.columns["best_teknik"] = np.full(count, -1, dtype=np.int32)
+        self.elapsed_s = 0.0
+        self._row_of: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.senaryo_ids)
+
+    def merge(self, start: int, columns: Dict[str, np.ndarray]):
+        """Bir parçanın sonuç sütunlarını start satırından itibaren yazar."""
+        for name, values in columns.items():
+            self.columns[name][start:start + len(values)] = values
+
+    def result(self, senaryo_id: str) -> Optional[ScenarioEvaluation]:
+        if self._row_of is None:
+            self._row_of = {senaryo_id: row for row, senaryo_id in enumerate(self.senaryo_ids)}
+        row = self._row_of.get(senaryo_id)
+        return None if row is None else self._evaluation(row)
+
+    def as_dict(self) -> Dict[str, ScenarioEvaluation]:
+        return {senaryo_id: self._evaluation(row) for row, senaryo_id in enumerate(self.senaryo_ids)}
+
+    @property
+    def scenarios_per_second(self) -> float:
+        return len(self) / self.elapsed_s if self.elapsed_s else 0.0
+
+    def _evaluation(self, row: int) -> ScenarioEvaluation:
+        values = {name: column.item(row) for name, column in self.columns.items()}
+        code = values.pop("best_teknik")
+        return ScenarioEvaluation(
+            js_db=_optional(values["js_db"]), burn_through_km=_optional(values["burn_through_km"]),
+            teknik_id=self.teknik_ids[code] if code >= 0 else None, duration_s=values["duration_s"],
+            jamming_s=values["jamming_s"], band_coverage=_optional(values["band_coverage"]),
+            outcome_score=_optional(values["outcome_score"]))
+
+
+def evaluate_scenarios(senaryolar: List[Senaryo], radarlar: List[Radar], teknikler: List[Teknik],
+                       workers: Optional[int] = None, chunk_scenarios: int = DEFAULT_CHUNK_SCENARIOS,
+                       step_s: float = DEFAULT_STEP_S, rcs_m2: float = DEFAULT_RCS_M2,
+                       required_js_db: float = DEFAULT_REQUIRED_JS_DB,
+                       progress: Optional[Callable[[int], None]] = None) -> BatchResults:
+    """Senaryoları parçalar halinde değerlendirir (bkz. modül açıklaması).
+
+    workers verilmezse işlemci sayısı kadar işçi açılır; 1 ise havuz açılmadan bu işlemde çalışılır. progress her
+    birleştirilen parçadan sonra biten senaryo sayısıyla çağrılır.
+    """
+    if chunk_scenarios <= 0:
+        raise ValueError("Parça boyutu pozitif olmalı")
+    started = time.perf_counter()
+    encoder = ScenarioEncoder(radarlar, teknikler, step_s, rcs_m2, required_js_db)
+    results = BatchResults([senaryo.senaryo_id for senaryo in senaryolar], encoder.teknik_ids)
+    starts = range(0, len(senaryolar), chunk_scenarios)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(starts)))
+    done = 0
+
+    def merge(start: int, columns: Dict[str, np.ndarray]):
+        nonlocal done
+        results.merge(start, columns)
+        done += len(columns["js_db"])
+        if progress is not None:
+            progress(done)
+
+    if workers == 1:
+        for start in starts:
+            merge(start, evaluate_chunk(encoder.encode(senaryolar[start:start + chunk_scenarios], start),
+                                        encoder.tables))
+    else:
+        # İşçiler ayrı süreç olarak başlatılır (spawn): Qt nesnelerinin durumu çatallanmaz, Windows'ta da aynı
+        # davranır. Tablolar işçi başına bir kez, başlatıcıyla gider.
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                    mp_context=multiprocessing.get_context("spawn"),
+                                                    initializer=_init_worker, initargs=(encoder.tables,)) as pool:
+            pending = {}
+            try:
+                for start in starts:
+                    # Yeni parça hazırlanmadan önce kuyruk dolu ise biten parçalar birleştirilir.
+                    while len(pending) >= workers * _IN_FLIGHT_PER_WORKER:
+                        _merge_finished(pending, merge)
+                    chunk = encoder.encode(senaryolar[start:start + chunk_scenarios], start)
+                    pending[pool.submit(_evaluate_in_worker, chunk)] = start
+                while pending:
+                    _merge_finished(pending, merge)
+            except BaseException:
+                # Hata ya da kesmede kuyruktaki parçalar başlatılmaz; havuz yalnızca çalışanları bekleyip kapanır.
+                for future in pending:
+                    future.cancel()
+                raise
+    results.elapsed_s = time.perf_counter() - started
+    return results
+
+
+def write_evaluation_csv(path: str, results: BatchResults, senaryo_map: Mapping[str, Senaryo],
+                         teknik_map: Mapping[str, Teknik]):
+    """Sonuçları senaryo_id'ye bağlı CSV olarak yazar; senaryo ve teknik adları okunabilirlik için eklenir."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["senaryo_id", "senaryo_adi", "js_db", "yanma_menzili_km", "en_iyi_teknik", "sure_s",
+                         "karistirma_s", "bant_kapsami", "sonuc_puani"])
+        columns = {name: column.tolist() for name, column in results.columns.items()}
+        for row, senaryo_id in enumerate(results.senaryo_ids):
+            senaryo = senaryo_map.get(senaryo_id)
+            code = columns["best_teknik"][row]
+            teknik = teknik_map.get(results.teknik_ids[code]) if code >= 0 else None
+            writer.writerow([senaryo_id, senaryo.adi if senaryo else "", _format(columns["js_db"][row], 2),
+                             _format(columns["burn_through_km"][row], 3), teknik.adi if teknik else "",
+                             _format(columns["duration_s"][row], 1), _format(columns["jamming_s"][row], 1),
+                             _format(columns["band_coverage"][row], 3), _format(columns["outcome_score"][row], 2)])
+
+
+# --- İşçi tarafı ---
+
+# İşçi sürecinde başlatıcının kurduğu tablolar
+_worker_tables: Optional[EvaluationTables] = None
+
+
+def _init_worker(tables: EvaluationTables):
+    global _worker_tables
+    _worker_tables = tables
+
+
+def _evaluate_in_worker(chunk: ScenarioChunk) -> Dict[str, np.ndarray]:
+    return evaluate_chunk(chunk, _worker_tables)
+
+
+def _merge_finished(pending: Dict[concurrent.futures.Future, int], merge: Callable):
+    finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+    for future in finished:
+        # İşçideki hata burada yeniden fırlatılır.
+        merge(pending.pop(future), future.result())
+
+
+# --- Yardımcılar ---
+
+def _optional_column(values: List[Optional[float]]) -> np.ndarray:
+    """Değer listesi + bilinmeyen kayıt için sondaki NaN; None değerler NaN olur."""
+    return np.array(values + [None], dtype=float).reshape(len(values) + 1)
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if value != value else value
+
+
+def _format(value: float, digits: int) -> str:
+    return "" if value != value else f"{value:.{digits}f}"
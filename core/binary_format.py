@@ -0,0 +1,301 @@
+# ew_platformasi/core/binary_format.py
+#
+# İkili, sütun tabanlı veri seti biçimi (.ewb). XML'e göre çok daha hızlı okunur/yazılır ve diskte daha küçüktür.
+#
+# Dosya düzeni (tüm tamsayılar little-endian):
+#   "EWBIN" + sürüm (u8) + bölüm sayısı (u32)
+#   her bölüm: bölüm etiketi, sınıf adı, tablo
+#   tablo: satır sayısı (u64), sütun sayısı (u32), her sütun için alan adı + sütun
+#   sütun: tür (u8) + türe özgü veri; dizi/metin blokları uzunluk önekli (u64) ham baytlardır.
+#
+# Sütun türü değerlere bakılarak seçilir; böylece dataclass alanına tip dışı bir değer yazılmış olsa da
+# (ör. XML'den dönüştürülemeyip metin olarak kalan bir sayı) veri kayıpsız geri okunur.
+
+import json
+import struct
+from dataclasses import fields, is_dataclass
+from operator import attrgetter
+
+import numpy as np
+
+from core.data_models import ETPlatformu, Teknik, Radar, Senaryo, Gorev, TeknikUygulama
+from core.xml_codec import PARAM_CLASS_MAP
+
+MAGIC = b"EWBIN"
+FORMAT_VERSION = 1
+BINARY_EXTENSION = ".ewb"
+
+# Sütun türleri
+_FLOAT, _INT, _BOOL, _STR, _JSON, _LIST, _OBJECTS = range(1, 8)
+
+_CLASSES = {cls.__name__: cls for cls in (ETPlatformu, Teknik, Radar, Senaryo, Gorev, TeknikUygulama,
+                                          *PARAM_CLASS_MAP.values())}
+_NONE_TYPE = type(None)
+
+
+def is_binary_workspace(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+# --- Yazma ---
+
+def write_binary_workspace(f, sections, progress=None):
+    """(etiket, sınıf, kayıt listesi) bölümlerini ikili dosyaya yazar. progress(etiket, kayıt sayısı) her bölümden sonra çağrılır."""
+    f.write(MAGIC)
+    f.write(struct.pack("<BI", FORMAT_VERSION, len(sections)))
+    for tag, cls, items in sections:
+        # Sütunlar kayıtlar üzerinden ayrı ayrı geçer; tembel bölümler (ör. SQLiteSection) bir kez okunur.
+        items = items if isinstance(items, list) else list(items)
+        _write_blob(f, tag.encode("utf-8"))
+        _write_blob(f, cls.__name__.encode("utf-8"))
+        _write_table(f, cls, items)
+        if progress:
+            progress(tag, len(items))
+
+
+def _write_blob(f, data: bytes):
+    f.write(struct.pack("<Q", len(data)))
+    f.write(data)
+
+
+def _write_array(f, array: np.ndarray):
+    _write_blob(f, np.ascontiguousarray(array).tobytes())
+
+
+def _write_table(f, cls, items):
+    names = [field_info.name for field_info in fields(cls)]
+    f.write(struct.pack("<QI", len(items), len(names)))
+    for name in names:
+        _write_blob(f, name.encode("utf-8"))
+        _write_column(f, list(map(attrgetter(name), items)))
+
+
+def _write_column(f, values: list):
+    value_types = set(map(type, values))
+    has_null = _NONE_TYPE in value_types
+    value_types.discard(_NONE_TYPE)
+
+    if not value_types or value_types == {str}:
+        _write_str_column(f, values)
+    elif value_types == {float}:
+        _write_numeric_column(f, _FLOAT, values, np.float64, has_null)
+    elif value_types == {int} and _fits_int64(values):
+        _write_numeric_column(f, _INT, values, np.int64, has_null)
+    elif value_types == {bool} and not has_null:
+        f.write(bytes([_BOOL]))
+        _write_array(f, np.array(values, dtype=np.uint8))
+    elif value_types == {list}:
+        _write_list_column(f, values, has_null)
+    elif all(value_type.__name__ in _CLASSES and is_dataclass(value_type) for value_type in value_types):
+        _write_objects_column(f, values, value_types, has_null)
+    else:
+        # Karışık tipler: değerler JSON ile olduğu gibi saklanır (str/int/float/bool/None kayıpsızdır).
+        f.write(bytes([_JSON]))
+        _write_blob(f, json.dumps(values, ensure_ascii=False).encode("utf-8", "surrogatepass"))
+
+
+def _fits_int64(values: list) -> bool:
+    return all(-2 ** 63 <= value < 2 ** 63 for value in values if value is not None)
+
+
+def _write_numeric_column(f, kind: int, values: list, dtype, has_null: bool):
+    f.write(bytes([kind, has_null]))
+    if has_null:
+        _write_array(f, np.array([0 if value is None else value for value in values], dtype=dtype))
+        _write_array(f, np.fromiter((value is None for value in values), dtype=np.uint8, count=len(values)))
+    else:
+        _write_array(f, np.array(values, dtype=dtype))
+
+
+def _write_str_column(f, values: list):
+    """Metinler sözlükle kodlanır: her farklı değer bir kez yazılır, satırlar int32 kod tutar."""
+    index = dict.fromkeys(values)
+    for code, value in enumerate(index):
+        index[value] = code
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.int32, count=len(values))
+    dictionary = ["" if value is None else value for value in index]
+    null_code = index.get(None, -1)
+
+    # Sözlük tek blok halinde yazılır; NUL içermeyen metinler (her zaman geçerli XML metni) ayraçla birleştirilir.
+    use_separator = not any("\0" in value for value in dictionary)
+    f.write(bytes([_STR]))
+    f.write(struct.pack("<qQB", null_code, len(dictionary), use_separator))
+    if use_separator:
+        _write_blob(f, "\0".join(dictionary).encode("utf-8", "surrogatepass"))
+    else:
+        encoded = [value.encode("utf-8", "surrogatepass") for value in dictionary]
+        _write_array(f, np.array([len(value) for value in encoded], dtype=np.int64))
+        _write_blob(f, b"".join(encoded))
+    _write_array(f, codes)
+
+
+def _write_list_column(f, values: list, has_null: bool):
+    f.write(bytes([_LIST, has_null]))
+    _write_array(f, np.fromiter((0 if value is None else len(value) for value in values),
+                                dtype=np.int64, count=len(values)))
+    if has_null:
+        _write_array(f, np.fromiter((value is None for value in values), dtype=np.uint8, count=len(values)))
+    _write_column(f, [item for value in values if value is not None for item in value])
+
+
+def _write_objects_column(f, values: list, value_types: set, has_null: bool):
+    """Dataclass değerleri (ör. Teknik.parametreler) sınıf adı sütunu + sınıf başına bir alt tablo olarak yazılır."""
+    f.write(bytes([_OBJECTS]))
+    class_names = [None if value is None else type(value).__name__ for value in values]
+    _write_str_column(f, class_names)
+
+    if len(value_types) == 1 and not has_null:
+        groups = {next(iter(value_types)): values}
+    else:
+        groups = {}
+        for value in values:
+            if value is not None:
+                groups.setdefault(type(value), []).append(value)
+    f.write(struct.pack("<I", len(groups)))
+    for cls, items in groups.items():
+        _write_blob(f, cls.__name__.encode("utf-8"))
+        _write_table(f, cls, items)
+
+
+# --- Okuma ---
+
+def read_binary_workspace(data: bytes):
+    """read_binary_workspace(dosya içeriği) -> (etiket, sınıf, kayıt listesi) üreteci."""
+    reader = _Reader(data)
+    if reader.take(len(MAGIC)) != MAGIC:
+        raise ValueError("Geçerli bir ikili veri seti dosyası değil.")
+    version, section_count = reader.unpack("<BI")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Desteklenmeyen ikili veri seti sürümü: {version}")
+
+    for _ in range(section_count):
+        tag = reader.blob().decode("utf-8")
+        cls = _class_by_name(reader.blob().decode("utf-8"))
+        yield tag, cls, _read_table(reader, cls)
+
+
+def _class_by_name(name: str):
+    cls = _CLASSES.get(name)
+    if cls is None:
+        raise ValueError(f"Bilinmeyen kayıt sınıfı: {name}")
+    return cls
+
+
+class _Reader:
+    """Bellekteki dosya içeriği üzerinde ileri yönlü okuyucu; diziler kopyalanmadan np.frombuffer ile okunur."""
+
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._offset = 0
+
+    def take(self, size: int) -> memoryview:
+        start = self._offset
+        self._offset += size
+        if self._offset > len(self._data):
+            raise ValueError("İkili veri seti dosyası eksik veya bozuk.")
+        return self._data[start:self._offset]
+
+    def unpack(self, fmt: str):
+        return struct.unpack(fmt, self.take(struct.calcsize(fmt)))
+
+    def blob(self) -> bytes:
+        size, = self.unpack("<Q")
+        return bytes(self.take(size))
+
+    def array(self, dtype) -> np.ndarray:
+        size, = self.unpack("<Q")
+        return np.frombuffer(self.take(size), dtype=dtype)
+
+
+def _read_table(reader: _Reader, cls) -> list:
+    row_count, column_count = reader.unpack("<QI")
+    columns = {}
+    for _ in range(column_count):
+        name = reader.blob().decode("utf-8")
+        columns[name] = _read_column(reader, row_count)
+
+    field_names = [field_info.name for field_info in fields(cls) if field_info.init]
+    if not columns or not field_names:
+        return [cls() for _ in range(row_count)]
+    if list(columns) == field_names:
+        # Dosyadaki sütunlar sınıfın alanlarıyla birebir aynı: kayıtlar konumsal argümanlarla kurulur.
+        return list(map(cls, *columns.values()))
+
+    # Sınıf dosya yazıldıktan sonra değişmiş: yalnızca hâlâ var olan alanlar aktarılır, yeniler varsayılanını alır.
+    known = {name: values for name, values in columns.items() if name in field_names}
+    if not known:
+        return [cls() for _ in range(row_count)]
+    names = list(known)
+    return [cls(**dict(zip(names, row))) for row in zip(*known.values())]
+
+
+def _read_column(reader: _Reader, row_count: int) -> list:
+    kind, = reader.unpack("<B")
+    if kind == _STR:
+        return _read_str_column(reader)
+    if kind == _FLOAT or kind == _INT:
+        has_null, = reader.unpack("<B")
+        array = reader.array(np.float64 if kind == _FLOAT else np.int64)
+        if not has_null:
+            return array.tolist()
+        values = array.astype(object)
+        values[reader.array(np.uint8).astype(bool)] = None
+        return values.tolist()
+    if kind == _BOOL:
+        return reader.array(np.uint8).astype(bool).tolist()
+    if kind == _LIST:
+        return _read_list_column(reader, row_count)
+    if kind == _OBJECTS:
+        return _read_objects_column(reader, row_count)
+    if kind == _JSON:
+        return json.loads(reader.blob().decode("utf-8", "surrogatepass"))
+    raise ValueError(f"Bilinmeyen sütun türü: {kind}")
+
+
+def _read_str_column(reader: _Reader) -> list:
+    null_code, dictionary_size, use_separator = reader.unpack("<qQB")
+    if use_separator:
+        blob = reader.blob().decode("utf-8", "surrogatepass")
+        dictionary = blob.split("\0") if dictionary_size else []
+    else:
+        lengths = reader.array(np.int64).tolist()
+        blob = reader.blob()
+        dictionary, offset = [], 0
+        for length in lengths:
+            dictionary.append(blob[offset:offset + length].decode("utf-8", "surrogatepass"))
+            offset += length
+    if null_code >= 0:
+        dictionary[null_code] = None
+
+    lookup = np.empty(len(dictionary), dtype=object)
+    lookup[:] = dictionary
+    return lookup[reader.array(np.int32)].tolist()
+
+
+def _read_list_column(reader: _Reader, row_count: int) -> list:
+    has_null, = reader.unpack("<B")
+    lengths = reader.array(np.int64)
+    null_mask = reader.array(np.uint8).tolist() if has_null else None
+    flat = _read_column(reader, int(lengths.sum()))
+
+    ends = np.cumsum(lengths).tolist()
+    starts = [0] + ends[:-1]
+    rows = [flat[start:end] for start, end in zip(starts, ends)]
+    if null_mask:
+        rows = [None if is_null else row for row, is_null in zip(rows, null_mask)]
+    return rows
+
+
+def _read_objects_column(reader: _Reader, row_count: int) -> list:
+    class_names = _read_column(reader, row_count)
+    group_count, = reader.unpack("<I")
+    groups = {}
+    for _ in range(group_count):
+        cls = _class_by_name(reader.blob().decode("utf-8"))
+        groups[cls.__name__] = _read_table(reader, cls)
+
+    if len(groups) == 1 and None not in class_names:
+        return next(iter(groups.values()))
+    iterators = {name: iter(items) for name, items in groups.items()}
+    return [None if name is None else next(iterators[name]) for name in class_names]
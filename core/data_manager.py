@@ -1,23 +1,71 @@
 # ew_platformasi/core/data_manager.py
+from __future__ import annotations
 
 import os
 import uuid
 import copy
+from contextlib import contextmanager
 import xml.etree.ElementTree as ET
-from dataclasses import fields, is_dataclass
-from typing import List, Type, TypeVar, get_origin, get_args, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Type, TypeVar
 from lxml import etree
 from PySide6.QtCore import QObject, Signal
 
 from core.data_models import (
-    ETPlatformu, Teknik, Radar, Senaryo, Gorev, BaseTeknikParametreleri, GurultuKaristirmaParams, MenzilAldatmaParams,
-    AlmacGondermecAyarParametreleri, KaynakUretecAyarParametreleri, TeknikUygulama,
+    ETPlatformu, Teknik, Radar, Senaryo, Gorev,
     PLATFORMLAR_XML, TEKNIKLER_XML, RADARLAR_XML, SENARYOLAR_XML, GOREVLER_XML,
     TEKNIKLER_XSD, RADARLAR_XSD, SENARYOLAR_XSD, GOREVLER_XSD, DATA_DIR
 )
+from core.xml_codec import get_codec
+from core.binary_format import BINARY_EXTENSION, is_binary_workspace, read_binary_workspace, write_binary_workspace
+from core.sqlite_store import SQLITE_EXTENSION, SQLiteStore, is_sqlite_workspace
+from core.radar_catalog import RadarCatalog
+from core.rank_index import SlotIndex
+from core.emitter_matcher import EmitterMatcher
+from core.jamming_calculator import JammingCalculator
+from core.scenario_analytics import ScenarioAnalytics
+from core.technique_recommender import TechniqueRecommender
 
 T = TypeVar('T')
 
+# Bir batch içinde tip başına tek tek yayılacak en fazla satır değişikliği; fazlası tek bir items_reset olur.
+_BATCH_ROW_SIGNAL_LIMIT = 64
+# Arka plan açma/kaydetme işlemlerinde ilerleme bildirimi ve iptal kontrolü kaç kayıtta bir yapılır.
+_PROGRESS_INTERVAL = 1000
+
+
+# Veri seti dosyasındaki bölümler ve kayıt tipleri (kayıt sırası).
+_WORKSPACE_SECTION_TYPES = {
+    "ETPlatformlar": ETPlatformu,
+    "Radarlar": Radar,
+    "Teknikler": Teknik,
+    "Senaryolar": Senaryo,
+    "Gorevler": Gorev
+}
+
+
+class OperationCancelledError(Exception):
+    """Uzun süren bir okuma/yazma işlemi kullanıcı tarafından iptal edildi."""
+
+
+class _KayitListesi:
+    """Bir varlık tipinin sıralı id -> kayıt deposunu DataManager üzerinde liste olarak sunar.
+
+    Liste depo değiştikten sonraki ilk okumada bir kez üretilir ve bir sonraki değişikliğe kadar aynı nesne döner.
+    Dönen liste salt okunur kabul edilir; değişiklikler save_item / delete_item_by_id ile yapılır.
+    Atama (dm.radarlar = [...]) depoyu verilen listeyle yeniden kurar.
+    """
+
+    def __init__(self, item_type: type):
+        self.item_type = item_type
+
+    def __get__(self, instance, owner=None):
+        if instance is None: return self
+        return instance._list_snapshot(self.item_type)
+
+    def __set__(self, instance, items):
+        instance._replace_items(self.item_type, items)
+
 
 class DataManager(QObject):
     # GÜNCELLEME: platformlar_changed sinyali eklendi
@@ -28,17 +76,48 @@ class DataManager(QObject):
     gorevler_changed = Signal()
     status_updated = Signal(str)
 
+    # Satır düzeyinde değişiklik sinyalleri: (kayıt tipi, kayıt id'si, listedeki satır).
+    # Her birinin ardından ilgili *_changed sinyali de yayılır; tabloları tutan modeller yalnızca bunları,
+    # tipe bağımlı eşleme tabloları (ör. id -> ad) ise *_changed sinyallerini dinler.
+    item_inserted = Signal(object, str, int)
+    item_updated = Signal(object, str, int)
+    item_removed = Signal(object, str, int)
+    # Listenin tamamı değişti (yeni/açılan veri seti, büyük batch): modeller baştan kurulmalı.
+    items_reset = Signal(object)
+
+    # Kayıtlar tip başına ekleme sırasını koruyan id -> kayıt sözlüklerinde tutulur;
+    # arama, ekleme/güncelleme ve silme O(1)'dir. Aşağıdaki özellikler bu depoları liste olarak sunar.
+    et_platformlar = _KayitListesi(ETPlatformu)
+    radarlar = _KayitListesi(Radar)
+    teknikler = _KayitListesi(Teknik)
+    senaryolar = _KayitListesi(Senaryo)
+    gorevler = _KayitListesi(Gorev)
+
     def __init__(self):
         super().__init__()
-        self._param_class_map = {
-            "GurultuKaristirmaParams": GurultuKaristirmaParams,
-            "MenzilAldatmaParams": MenzilAldatmaParams,
-            "AlmacGondermecAyarParametreleri": AlmacGondermecAyarParametreleri,
-            "KaynakUretecAyarParametreleri": KaynakUretecAyarParametreleri,
-            "BaseTeknikParametreleri": BaseTeknikParametreleri
-        }
         self._ensure_data_files_exist()
 
+        self._stores = {item_type: {} for item_type in (ETPlatformu, Radar, Teknik, Senaryo, Gorev)}
+        self._snapshots = {}
+        self._positions = {}
+        # Tip başına id -> ad tabloları (bkz. name_map); ilk istendiğinde kurulur, kayıt değişikliklerinde yerinde güncellenir.
+        self._name_maps = {}
+        # Radarların NumPy sütun görünümü ve onun üzerindeki yayın eşleştirici; ilk kullanımda kurulur.
+        self._radar_catalog = None
+        self._emitter_matcher = None
+        # Senaryoların J/S ve yanma menzili önbelleği; ilk kullanımda kurulur.
+        self._jamming_calculator = None
+        # Senaryo sonuçlarının teknik/radar kırılımındaki sayıları; ilk kullanımda kurulur.
+        self._scenario_analytics = None
+        self._technique_recommender = None
+        # Açık bir .ewdb veri seti varsa depolar onun tablolarıdır; kayıtlar gerektikçe okunur ve her değişiklik hemen yazılır.
+        self._database = None
+
+        # Toplu işlem (batch) durumu: iç içe batch sayısı ve tip başına commit'te yayılacak satır değişiklikleri.
+        # Değeri None olan tip commit'te items_reset ile bildirilir.
+        self._batch_depth = 0
+        self._pending_changes = {}
+
         # GÜNCELLEME: et_platformlar listesi eklendi
         self.et_platformlar: List[ETPlatformu] = []
         self.radarlar: List[Radar] = []
@@ -46,74 +125,342 @@ class DataManager(QObject):
         self.senaryolar: List[Senaryo] = []
         self.gorevler: List[Gorev] = []
 
+    @contextmanager
+    def batch(self):
+        """Blok içindeki değişikliklerin *_changed sinyallerini biriktirir; blok bitince her sinyal en fazla bir kez yayılır.
+
+        İç içe kullanılabilir; sinyaller yalnızca en dıştaki blok kapanırken yayılır.
+        Blok hata ile çıksa da o ana kadar yapılan değişiklikler bildirilir.
+        """
+        self._batch_depth += 1
+        try:
+            if self._database is not None:
+                # Veritabanına bağlıyken batch tek bir işlemdir: hata çıkarsa bloktaki tüm yazmalar geri alınır.
+                try:
+                    with self._database.transaction():
+                        yield self
+                except BaseException:
+                    # Geri alınan yazmalar yerinde güncellenmiş ad tablolarında kalmasın.
+                    self._name_maps.clear()
+                    raise
+            else:
+                yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_pending_changes()
+
+    def _notify_item(self, row_signal, item_type: type, item_id: str, row: int):
+        """Tek bir satırın değiştiğini bildirir; batch içindeyse commit'e ertelenir."""
+        if self._batch_depth > 0:
+            if item_type not in self._pending_changes:
+                self._pending_changes[item_type] = []
+            changes = self._pending_changes[item_type]
+            if changes is not None:
+                if len(changes) < _BATCH_ROW_SIGNAL_LIMIT:
+                    changes.append((row_signal, item_id, row))
+                else:
+                    self._pending_changes[item_type] = None
+            return
+        row_signal.emit(item_type, item_id, row)
+        self._get_store_ref(item_type)[1].emit()
+
+    def _row_signals_dropped(self, item_type: type) -> bool:
+        """Batch içinde tipin satır sinyalleri commit'te items_reset'e dönüşecekse True; satırı hesaplamaya gerek yoktur."""
+        if self._batch_depth == 0:
+            return False
+        changes = self._pending_changes.get(item_type, ())
+        return changes is None or len(changes) >= _BATCH_ROW_SIGNAL_LIMIT
+
+    def _notify_reset(self, item_type: type):
+        """Tipin tüm listesinin değiştiğini bildirir; batch içindeyse commit'e ertelenir."""
+        if self._batch_depth > 0:
+            self._pending_changes[item_type] = None
+            return
+        self.items_reset.emit(item_type)
+        self._get_store_ref(item_type)[1].emit()
+
+    def _flush_pending_changes(self):
+        pending, self._pending_changes = self._pending_changes, {}
+        # Sinyaller her zaman aynı (bağımlılık) sırasıyla yayılır: platform, radar, teknik, senaryo, görev.
+        for item_type in self._stores:
+            if item_type not in pending:
+                continue
+            changes = pending[item_type]
+            store = self._stores[item_type]
+            # Az sayıdaki satır değişikliği sırasıyla tekrar oynatılır; batch içinde eklenip silinen
+            # kayıtlar gibi artık depoda olmayan id'lere ekleme/güncelleme varsa model baştan kurulur.
+            if changes is None or any(
+                    row_signal is not self.item_removed and item_id not in store
+                    for row_signal, item_id, _ in changes):
+                self.items_reset.emit(item_type)
+            else:
+                for row_signal, item_id, row in changes:
+                    row_signal.emit(item_type, item_id, row)
+            self._get_store_ref(item_type)[1].emit()
+
     def new_workspace(self):
         """Tüm mevcut veriyi temizler ve yeni bir çalışma alanı başlatır."""
-        self.et_platformlar.clear()
-        self.radarlar.clear()
-        self.teknikler.clear()
-        self.senaryolar.clear()
-        self.gorevler.clear()
+        self._clear_stores()
         self._emit_all_changed_signals()
         self.status_updated.emit("Yeni veri seti oluşturuldu. Alanlar temizlendi.")
 
-    def save_workspace(self, path: str):
+    def _clear_stores(self):
+        if self._database is not None:
+            # Açık veritabanı kapatılır (dosya silinmez); yeni veri seti yine bellekte tutulur.
+            self._database.close()
+            self._database = None
+            self._stores = {item_type: {} for item_type in self._stores}
+        for item_type, store in self._stores.items():
+            store.clear()
+            self._snapshots[item_type] = None
+            self._positions[item_type] = None
+        self._name_maps.clear()
+
+    @property
+    def database_path(self):
+        """Bağlı .ewdb veritabanının yolu; veri bellekteyse None."""
+        return self._database.path if self._database is not None else None
+
+    def _attach_database(self, database: SQLiteStore):
+        """Depoları veritabanı tablolarıyla değiştirir; kayıtlar belleğe yüklenmez."""
+        self._clear_stores()
+        self._database = database
+        for item_type in self._stores:
+            self._stores[item_type] = database.tables[item_type]
+
+    def save_workspace(self, path: str, pretty: bool = True):
         """Mevcut tüm veriyi tek bir XML dosyasına kaydeder."""
         try:
-            root = ET.Element("EWVeriSeti")
-            # GÜNCELLEME: Platformlar kaydetme listesine eklendi
-            for tag, data_list in [
-                ("ETPlatformlar", self.et_platformlar),
-                ("Radarlar", self.radarlar),
-                ("Teknikler", self.teknikler),
-                ("Senaryolar", self.senaryolar),
-                ("Gorevler", self.gorevler)
-            ]:
-                sub_root = ET.SubElement(root, tag)
-                for item in data_list:
-                    sub_root.append(self._dataclass_to_element(item))
-
-            tree = ET.ElementTree(root)
-            ET.indent(tree, space="  ", level=0)
-            tree.write(path, encoding="utf-8", xml_declaration=True)
+            self.write_workspace(path, self.workspace_sections(), pretty=pretty)
             self.status_updated.emit(f"Veri seti başarıyla '{os.path.basename(path)}' dosyasına kaydedildi.")
         except Exception as e:
             self.status_updated.emit(f"Hata: Veri seti kaydedilemedi - {e}")
 
-    def open_workspace(self, path: str):
-        """Bir XML dosyasından tüm veri setini yükler. Mevcut veri silinir."""
-        try:
-            self.new_workspace()
-            root = ET.parse(path).getroot()
+    def workspace_sections(self):
+        """Kaydedilecek bölümleri (etiket, kayıt listesi) olarak döndürür.
+
+        Listeler o anki anlık görüntülerdir; sonraki değişikliklerden etkilenmezler ve arka planda yazılabilirler.
+        Veritabanına bağlıyken bölümler belleğe alınmaz; yazıcı kayıtları kendi bağlantısıyla sayfa sayfa okur
+        (bkz. SQLiteSection).
+        """
+        if self._database is not None:
+            return [(tag, self._stores[item_type].section()) for tag, item_type in _WORKSPACE_SECTION_TYPES.items()]
+        # GÜNCELLEME: Platformlar kaydetme listesine eklendi
+        return [
+            ("ETPlatformlar", self.et_platformlar),
+            ("Radarlar", self.radarlar),
+            ("Teknikler", self.teknikler),
+            ("Senaryolar", self.senaryolar),
+            ("Gorevler", self.gorevler)
+        ]
+
+    def write_workspace(self, path: str, sections, pretty: bool = True, progress=None, is_cancelled=None):
+        """Bölümleri EWVeriSeti dosyası olarak yazar. Sinyal yaymaz; GUI iş parçacığı dışında çalıştırılabilir.
+
+        Uzantısı .ewb olan yollar ikili sütun biçiminde, .ewdb olanlar SQLite veritabanı olarak, diğerleri XML olarak yazılır.
+        progress(bölüm, kayıt sayısı, yüzde) ilerlemeyi bildirir; is_cancelled() True dönerse
+        OperationCancelledError fırlatılır ve mevcut dosyaya dokunulmaz.
+        """
+        total = sum(len(data_list) for _, data_list in sections) or 1
+        if path.lower().endswith(BINARY_EXTENSION):
+            self._write_binary_workspace(path, sections, total, progress, is_cancelled)
+            return
+        if path.lower().endswith(SQLITE_EXTENSION):
+            self._write_sqlite_workspace(path, sections, total, progress, is_cancelled)
+            return
+
+        written = 0
+        with self._open_xml_writer(path) as f:
+            f.write("<EWVeriSeti>")
+            for tag, data_list in sections:
+                if pretty:
+                    f.write("\n  ")
+                section_progress = None
+                if progress or is_cancelled:
+                    def section_progress(count, tag=tag, offset=written):
+                        if is_cancelled and is_cancelled():
+                            raise OperationCancelledError()
+                        if progress:
+                            progress(tag, count, (offset + count) * 100 // total)
+                self._write_xml_section(f, tag, data_list, level=1, pretty=pretty, progress=section_progress)
+                written += len(data_list)
+            if pretty:
+                f.write("\n")
+            f.write("</EWVeriSeti>")
 
-            # GÜNCELLEME: Platformlar yükleme listesine eklendi
-            item_map = {
-                "ETPlatformlar/ETPlatformu": (ETPlatformu, self.et_platformlar),
-                "Radarlar/Radar": (Radar, self.radarlar),
-                "Teknikler/Teknik": (Teknik, self.teknikler),
-                "Senaryolar/Senaryo": (Senaryo, self.senaryolar),
-                "Gorevler/Gorev": (Gorev, self.gorevler)
-            }
-
-            for path_str, (cls, data_list) in item_map.items():
-                for elem in root.findall(path_str):
-                    item = self._element_to_dataclass(elem, cls)
-                    if item:
-                        data_list.append(item)
+    def open_workspace(self, path: str):
+        """Bir XML dosyasından tüm veri setini yükler. Mevcut veri silinir.
 
-            self._emit_all_changed_signals()
-            self.status_updated.emit(f"'{os.path.basename(path)}' veri seti başarıyla yüklendi.")
+        .ewdb veritabanları yüklenmez, bağlanır: kayıtlar görünümler istedikçe sayfa sayfa okunur.
+        """
+        try:
+            if is_sqlite_workspace(path):
+                self.attach_workspace_database(path)
+                return
+            items_by_type = self.load_workspace_items(path)
         except Exception as e:
-            self.new_workspace()
             self.status_updated.emit(f"Hata: Veri seti yüklenemedi - {e}")
+            return
+        self.apply_workspace(items_by_type, path)
+
+    def load_workspace_items(self, path: str, progress=None, is_cancelled=None):
+        """Dosyadaki kayıtları tip -> liste sözlüğü olarak okur. Mevcut veriye ve sinyallere dokunmaz;
+        GUI iş parçacığı dışında çalıştırılabilir.
+
+        progress(bölüm, kayıt sayısı, yüzde) ilerlemeyi bildirir; is_cancelled() True dönerse
+        OperationCancelledError fırlatılır.
+        """
+        if is_binary_workspace(path):
+            return self._load_binary_workspace_items(path, progress, is_cancelled)
+        if is_sqlite_workspace(path):
+            return self._load_sqlite_workspace_items(path, progress, is_cancelled)
+
+        items_by_type = {item_type: [] for item_type in self._stores}
+        counts = {}
+        file_size = os.path.getsize(path) or 1
+        with open(path, "rb") as f:
+            # Kayıtlar artımlı okunur; bellekte aynı anda yalnızca tek bir kaydın ağacı tutulur.
+            for section_tag, item in self._iter_workspace_items(f):
+                items_by_type[type(item)].append(item)
+                count = counts[section_tag] = counts.get(section_tag, 0) + 1
+                if count % _PROGRESS_INTERVAL == 0:
+                    if is_cancelled and is_cancelled():
+                        raise OperationCancelledError()
+                    if progress:
+                        progress(section_tag, count, f.tell() * 100 // file_size)
+        if progress:
+            for section_tag, count in counts.items():
+                progress(section_tag, count, 100)
+        return items_by_type
+
+    def _write_binary_workspace(self, path: str, sections, total: int, progress, is_cancelled):
+        written = 0
+
+        def section_progress(tag, count):
+            nonlocal written
+            written += count
+            if is_cancelled and is_cancelled():
+                raise OperationCancelledError()
+            if progress:
+                progress(tag, count, written * 100 // total)
+
+        binary_sections = [(tag, _WORKSPACE_SECTION_TYPES[tag], data_list) for tag, data_list in sections]
+        with self._open_atomic_writer(path, binary=True) as f:
+            write_binary_workspace(f, binary_sections, progress=section_progress)
+
+    def _load_binary_workspace_items(self, path: str, progress, is_cancelled):
+        with open(path, "rb") as f:
+            data = f.read()
+        items_by_type = {item_type: [] for item_type in self._stores}
+        for section_number, (tag, cls, items) in enumerate(read_binary_workspace(data), 1):
+            if is_cancelled and is_cancelled():
+                raise OperationCancelledError()
+            # Bilinmeyen ya da tipi uyuşmayan bölümler XML okuyucusunda olduğu gibi atlanır.
+            if _WORKSPACE_SECTION_TYPES.get(tag) is cls:
+                items_by_type[cls].extend(items)
+            if progress:
+                progress(tag, len(items), section_number * 100 // len(_WORKSPACE_SECTION_TYPES))
+        return items_by_type
+
+    def attach_workspace_database(self, path: str):
+        """Bir .ewdb veritabanını mevcut verinin yerine bağlar. Sonraki kaydetme ve silmeler doğrudan dosyaya yazılır."""
+        database = SQLiteStore(path)
+        with self.batch():
+            self._attach_database(database)
+            self._emit_all_changed_signals()
+        self.status_updated.emit(f"'{os.path.basename(path)}' veritabanı açıldı.")
+
+    def _write_sqlite_workspace(self, path: str, sections, total: int, progress, is_cancelled):
+        if self._database is not None and os.path.abspath(path) == os.path.abspath(self._database.path):
+            # Açık veritabanı zaten güncel: her değişiklik yapıldığı anda yazıldı.
+            return
+        written = 0
+
+        def section_progress(item_type, count):
+            nonlocal written
+            written += count
+            if is_cancelled and is_cancelled():
+                raise OperationCancelledError()
+            if progress:
+                progress(item_type.__name__, count, written * 100 // total)
+
+        # Yeni dosya geçici yolda kurulur ve tamamlanınca yerine taşınır; iptal ya da hata mevcut dosyayı bozmaz.
+        temp_path = f"{path}.tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        database = SQLiteStore(temp_path)
+        try:
+            database.write_all([(_WORKSPACE_SECTION_TYPES[tag], data_list) for tag, data_list in sections],
+                               progress=section_progress)
+            database.close()
+            os.replace(temp_path, path)
+        except BaseException:
+            database.close()
+            os.remove(temp_path)
+            raise
+
+    def _load_sqlite_workspace_items(self, path: str, progress, is_cancelled):
+        database = SQLiteStore(path)
+        try:
+            items_by_type = {}
+            for section_number, (tag, item_type) in enumerate(_WORKSPACE_SECTION_TYPES.items(), 1):
+                if is_cancelled and is_cancelled():
+                    raise OperationCancelledError()
+                # Kayıtlar belleğe yükleneceği için (apply_workspace) tablo burada tamamen okunur.
+                items_by_type[item_type] = list(database.tables[item_type].values())
+                if progress:
+                    progress(tag, len(items_by_type[item_type]), section_number * 100 // len(_WORKSPACE_SECTION_TYPES))
+            return items_by_type
+        finally:
+            database.close()
+
+    def apply_workspace(self, items_by_type, path: str):
+        """load_workspace_items sonucunu mevcut verinin yerine tek seferde koyar. GUI iş parçacığında çağrılmalıdır."""
+        # Temizleme ve yükleme tek batch'tir: görünümler her tip için yalnızca bir kez yenilenir.
+        with self.batch():
+            self._clear_stores()
+            for items in items_by_type.values():
+                for item in items:
+                    self._store_item(item)
+            self._emit_all_changed_signals()
+        self.status_updated.emit(f"'{os.path.basename(path)}' veri seti başarıyla yüklendi.")
+
+    def _iter_workspace_items(self, source):
+        """EWVeriSeti dosyasını iterparse ile dolaşır; her kayıt kapanış etiketi gelir gelmez (bölüm, dataclass) olarak üretilir."""
+        # GÜNCELLEME: Platformlar yükleme listesine eklendi
+        section_map = {
+            "ETPlatformlar": ("ETPlatformu", ETPlatformu),
+            "Radarlar": ("Radar", Radar),
+            "Teknikler": ("Teknik", Teknik),
+            "Senaryolar": ("Senaryo", Senaryo),
+            "Gorevler": ("Gorev", Gorev)
+        }
+
+        stack = []
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if len(stack) != 2:
+                continue
+
+            # Kök > Bölüm > Kayıt seviyesindeyiz.
+            section = stack[1]
+            record = section_map.get(section.tag)
+            if record and elem.tag == record[0]:
+                item = self._element_to_dataclass(elem, record[1])
+                if item:
+                    yield section.tag, item
+            # Tamamlanan kayıt ağaçtan koparılır; böylece bölüm elemanı büyümez.
+            section.remove(elem)
 
     def export_teknikler_to_xml(self, teknikler: List[Teknik], path: str):
         try:
-            root = ET.Element("Teknikler")
-            for item in teknikler:
-                root.append(self._dataclass_to_element(item))
-            tree = ET.ElementTree(root)
-            ET.indent(tree, space="  ", level=0)
-            tree.write(path, encoding="utf-8", xml_declaration=True)
+            with self._open_xml_writer(path) as f:
+                self._write_xml_section(f, "Teknikler", teknikler, level=0, pretty=True)
             self.status_updated.emit(
                 f"{len(teknikler)} teknik başarıyla '{os.path.basename(path)}' dosyasına aktarıldı.")
         except Exception as e:
@@ -132,22 +479,21 @@ class DataManager(QObject):
                 if item:
                     imported_teknikler.append(item)
 
-            existing_ids = {t.teknik_id for t in self.teknikler}
             new_teknikler = []
             updated_count = 0
 
-            for teknik in imported_teknikler:
-                if teknik.teknik_id in existing_ids:
-                    self.save_item(teknik)
-                    updated_count += 1
-                else:
-                    new_teknikler.append(teknik)
+            with self.batch():
+                for teknik in imported_teknikler:
+                    if self.item_exists(teknik.teknik_id, Teknik):
+                        self.save_item(teknik)
+                        updated_count += 1
+                    else:
+                        new_teknikler.append(teknik)
 
-            if new_teknikler:
-                self.teknikler.extend(new_teknikler)
+                for teknik in new_teknikler:
+                    self.save_item(teknik)
 
             if new_teknikler or updated_count > 0:
-                self.teknikler_changed.emit()
                 self.status_updated.emit(
                     f"'{os.path.basename(path)}' dosyasından {len(new_teknikler)} yeni teknik eklendi, {updated_count} teknik güncellendi.")
 
@@ -156,149 +502,244 @@ class DataManager(QObject):
             self.status_updated.emit(f"Hata: Teknikler içe aktarılamadı - {e}")
             return []
 
+    @contextmanager
+    def _open_xml_writer(self, path: str):
+        """XML bildirimi yazılmış bir dosya tanıtıcısı verir."""
+        with self._open_atomic_writer(path) as f:
+            f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            yield f
+
+    @contextmanager
+    def _open_atomic_writer(self, path: str, binary: bool = False):
+        """Çıktı önce geçici bir dosyaya yazılır ve yalnızca başarıyla tamamlanırsa hedefin yerine geçer;
+        yarıda kalan bir kayıt mevcut veri setini bozmaz.
+        """
+        tmp_path = f"{path}.tmp"
+        try:
+            if binary:
+                with open(tmp_path, "wb") as f:
+                    yield f
+            else:
+                # ElementTree.write ile aynı açma seçenekleri: çıktı bayt bayt aynı kalır.
+                with open(tmp_path, "w", encoding="utf-8", errors="xmlcharrefreplace") as f:
+                    yield f
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _write_xml_section(self, f, tag: str, items, level: int, pretty: bool, progress=None):
+        """Bir liste elemanını, kayıtları tek tek serileştirerek doğrudan dosyaya yazar.
+
+        Girinti, tüm ağaç üzerinde çalışan ET.indent çıktısıyla birebir aynıdır.
+        progress verilirse her _PROGRESS_INTERVAL kayıtta yazılan kayıt sayısıyla çağrılır.
+        """
+        if not items:
+            f.write(f"<{tag} />")
+            return
+
+        indent = "\n" + "  " * level if pretty else ""
+        child_indent = indent + "  " if pretty else ""
+        f.write(f"<{tag}>")
+        for count, item in enumerate(items, 1):
+            f.write(child_indent)
+            f.write(get_codec(type(item)).serialize(item, level=level + 1, pretty=pretty))
+            if progress and count % _PROGRESS_INTERVAL == 0:
+                progress(count)
+        if progress:
+            progress(len(items))
+        f.write(indent)
+        f.write(f"</{tag}>")
+
     def _emit_all_changed_signals(self):
-        self.platformlar_changed.emit()
-        self.radarlar_changed.emit()
-        self.teknikler_changed.emit()
-        self.senaryolar_changed.emit()
-        self.gorevler_changed.emit()
+        for item_type in self._stores:
+            self._notify_reset(item_type)
 
     def _element_to_dataclass(self, element: ET.Element, cls: Type[T]) -> T:
-        data = {}
-        cls_fields = {f.name for f in fields(cls)}
-
-        for field_info in fields(cls):
-            field_name_pascal = field_info.name.replace('_', ' ').title().replace(' ', '')
-            child_element = element.find(field_name_pascal)
-            if child_element is None: continue
-
-            if field_info.name == "parametreler":
-                if len(child_element) > 0:
-                    param_element = child_element[0]
-                    param_cls_name = param_element.tag
-                    param_cls = self._param_class_map.get(param_cls_name, BaseTeknikParametreleri)
-                    data[field_info.name] = self._element_to_dataclass(param_element, param_cls)
-            elif field_info.name == "senaryo_id_list":
-                data[field_info.name] = [item.text for item in child_element.findall("SenaryoID")]
-            elif field_info.name == "uygulanan_teknikler":
-                data[field_info.name] = [self._element_to_dataclass(item, TeknikUygulama)
-                                         for item in child_element.findall("TeknikUygulama")]
-            else:
-                text_val = child_element.text
-                if text_val is not None and text_val != 'None':
-                    field_type = field_info.type
-                    origin_type = get_origin(field_type)
-                    type_args = get_args(field_type)
-
-                    try:
-                        if origin_type is Union and type(None) in type_args:
-                            base_type = next(t for t in type_args if t is not type(None))
-                            data[field_info.name] = base_type(text_val)
-                        elif field_type is bool:
-                            data[field_info.name] = text_val.lower() in ('true', '1')
-                        else:
-                            data[field_info.name] = field_type(text_val)
-                    except (ValueError, TypeError):
-                        data[field_info.name] = text_val
-
-        id_attr = element.attrib.get("id")
-        id_field_name = f"{cls.__name__.lower().replace('et', 'et_')}_id" # ETPlatformu için özel durum
-        if id_field_name == "et_platformu_id": id_field_name = "platform_id"
-        if id_attr and hasattr(cls, id_field_name):
-            data[id_field_name] = id_attr
-
-        try:
-            return cls(**{k: v for k, v in data.items() if k in cls_fields})
-        except TypeError:
-            # print(f"Hata: {cls.__name__} oluşturulamadı. Gelen veri: {data}")
-            return None
+        return get_codec(cls).decode(element)
 
     def _dataclass_to_element(self, instance) -> ET.Element:
-        class_name = instance.__class__.__name__
-        id_field_name = f"{class_name.lower().replace('et', 'et_')}_id"
-        if id_field_name == "et_platformu_id": id_field_name = "platform_id"
-        attribs = {}
-        if hasattr(instance, id_field_name) and getattr(instance, id_field_name):
-            attribs["id"] = getattr(instance, id_field_name)
-
-        element = ET.Element(class_name, attrib=attribs)
-
-        for field_info in fields(instance):
-            if field_info.name == id_field_name: continue
-
-            field_name_pascal = field_info.name.replace('_', ' ').title().replace(' ', '')
-            child_element = ET.SubElement(element, field_name_pascal)
-            value = getattr(instance, field_info.name)
-
-            if is_dataclass(value):
-                child_element.append(self._dataclass_to_element(value))
-            elif isinstance(value, list):
-                if field_info.name == "senaryo_id_list":
-                    for item in value: ET.SubElement(child_element, "SenaryoID").text = str(item)
-                elif field_info.name == "uygulanan_teknikler":
-                    for item in value:
-                        child_element.append(self._dataclass_to_element(item))
-            elif value is not None:
-                child_element.text = str(value)
-        return element
-
-    def _get_list_ref(self, item_type: Type[T]):
+        return get_codec(type(instance)).encode(instance)
+
+    def _get_store_ref(self, item_type: Type[T]):
         if item_type is ETPlatformu:
-            return self.et_platformlar, self.platformlar_changed
+            return self._stores[ETPlatformu], self.platformlar_changed
         if item_type is Radar:
-            return self.radarlar, self.radarlar_changed
+            return self._stores[Radar], self.radarlar_changed
         elif item_type is Teknik:
-            return self.teknikler, self.teknikler_changed
+            return self._stores[Teknik], self.teknikler_changed
         elif item_type is Senaryo:
-            return self.senaryolar, self.senaryolar_changed
+            return self._stores[Senaryo], self.senaryolar_changed
         elif item_type is Gorev:
-            return self.gorevler, self.gorevler_changed
+            return self._stores[Gorev], self.gorevler_changed
         return None, None
 
-    def save_item(self, item):
-        list_ref, signal = self._get_list_ref(type(item))
-        if list_ref is None: return
-
-        id_field_name = f"{type(item).__name__.lower().replace('et', 'et_')}_id"
-        if id_field_name == "et_platformu_id": id_field_name = "platform_id"
-
+    def _list_snapshot(self, item_type: Type[T]) -> List[T]:
+        snapshot = self._snapshots.get(item_type)
+        if snapshot is None:
+            store = self._stores[item_type]
+            # Veritabanına bağlıyken liste belleğe alınmaz: kayıtlar erişildikçe sayfa sayfa okunur.
+            snapshot = store.records() if self._database is not None else list(store.values())
+            self._snapshots[item_type] = snapshot
+        return snapshot
+
+    def _replace_items(self, item_type: Type[T], items: List[T]):
+        with self.batch():
+            self._stores[item_type].clear()
+            self._snapshots[item_type] = None
+            self._positions[item_type] = None
+            self._name_maps.pop(item_type, None)
+            for item in items:
+                self._store_item(item)
+
+    def _store_item(self, item):
+        """Kaydı sinyal yaymadan depoya yazar: mevcut id yerinde güncellenir, yeni id sona eklenir."""
+        item_type = type(item)
+        id_field_name = get_codec(item_type).id_field
         item_id = getattr(item, id_field_name, None)
+        if not item_id:
+            item_id = str(uuid.uuid4())
+            setattr(item, id_field_name, item_id)
+        store = self._stores[item_type]
+        if item_id not in store:
+            positions = self._positions.get(item_type)
+            if positions is not None:
+                positions.append(item_id)
+        store[item_id] = item
+        self._snapshots[item_type] = None
+        names = self._name_maps.get(item_type)
+        if names is not None:
+            names[item_id] = item.adi
+        return item
+
+    def _row_of(self, item_type: type, item_id: str) -> int:
+        """Kaydın listedeki satırını döndürür; satır dizini ilk sorguda kurulur, ekleme/silmede O(log n) güncellenir."""
+        if self._database is not None:
+            return self._stores[item_type].position(item_id)
+        positions = self._positions.get(item_type)
+        if positions is None:
+            positions = self._positions[item_type] = SlotIndex(self._stores[item_type])
+        return positions.row(item_id)
 
-        if not item_id or not self.item_exists(item_id, type(item)):
-            if not item_id:
-                setattr(item, id_field_name, str(uuid.uuid4()))
-            list_ref.append(item)
+    def save_item(self, item):
+        item_type = type(item)
+        store, _ = self._get_store_ref(item_type)
+        if store is None: return
+
+        id_field_name = get_codec(item_type).id_field
+        is_new = getattr(item, id_field_name, None) not in store
+        self._store_item(item)
+        item_id = getattr(item, id_field_name)
+        if self._row_signals_dropped(item_type):
+            row = -1
+        elif is_new:
+            # Yeni kayıt her iki depoda da sona eklenir; .ewdb'de sıra sorgusu tabloyu saydığından kullanılmaz.
+            row = len(store) - 1
         else:
-            idx = next((i for i, x in enumerate(list_ref) if getattr(x, id_field_name) == item_id), None)
-            if idx is not None:
-                list_ref[idx] = item
-        signal.emit()
+            row = self._row_of(item_type, item_id)
+        row_signal = self.item_inserted if is_new else self.item_updated
+        self._notify_item(row_signal, item_type, item_id, row)
         return item
 
+    def get_items(self, item_type: Type[T]) -> List[T]:
+        store, _ = self._get_store_ref(item_type)
+        if store is None: return []
+        return self._list_snapshot(item_type)
+
+    def item_count(self, item_type: Type[T]) -> int:
+        store, _ = self._get_store_ref(item_type)
+        if store is None: return 0
+        return len(store)
+
+    def get_items_page(self, item_type: Type[T], offset: int, limit: int) -> List[T]:
+        """Listenin [offset, offset + limit) aralığını döndürür; veritabanına bağlıyken yalnızca bu aralık okunur."""
+        store, _ = self._get_store_ref(item_type)
+        if store is None: return []
+        return self._list_snapshot(item_type)[offset:offset + limit]
+
+    def get_item(self, item_id: str, item_type: Type[T]) -> T | None:
+        store, _ = self._get_store_ref(item_type)
+        if store is None: return None
+        return store.get(item_id)
+
+    def name_map(self, item_type: Type[T]) -> Dict[str, str]:
+        """Tipin id -> ad tablosu. Tüm görünüm modelleri aynı sözlüğü paylaşır; sözlük salt okunur kabul edilir.
+
+        Tablo ilk istendiğinde bir kez kurulur, sonra kayıt eklenip silindikçe yerinde güncellenir;
+        yalnızca tipin tüm listesi değiştiğinde (yeni/açılan veri seti, liste ataması) yeniden kurulur.
+        """
+        store, _ = self._get_store_ref(item_type)
+        if store is None: return {}
+        names = self._name_maps.get(item_type)
+        if names is None:
+            if self._database is not None:
+                names = store.names()
+            else:
+                names = {key: item.adi for key, item in store.items()}
+            self._name_maps[item_type] = names
+        return names
+
+    def item_map(self, item_type: Type[T]) -> Mapping[str, T]:
+        """Tipin id -> kayıt eşlemesi (deponun salt okunur görünümü); her arama O(1)'dir, kopya üretilmez."""
+        store, _ = self._get_store_ref(item_type)
+        if store is None: return MappingProxyType({})
+        return MappingProxyType(store) if isinstance(store, dict) else store
+
+    def radar_catalog(self) -> RadarCatalog:
+        """Radar parametrelerinin sütunsal görünümü; vektörel aralık/koşul sorguları için (bkz. RadarCatalog.query)."""
+        if self._radar_catalog is None:
+            self._radar_catalog = RadarCatalog(self)
+        return self._radar_catalog
+
+    def emitter_matcher(self) -> EmitterMatcher:
+        """Yakalanan yayınları (PRI/PW/bant) radar kütüphanesiyle eşleştiren motor (bkz. EmitterMatcher.match)."""
+        if self._emitter_matcher is None:
+            self._emitter_matcher = EmitterMatcher(self.radar_catalog())
+        return self._emitter_matcher
+
+    def jamming_calculator(self) -> JammingCalculator:
+        """Senaryoların J/S ve yanma menzili sonuçları; kayıtlar değiştikçe ilgili sonuçlar düşer (bkz. JammingCalculator)."""
+        if self._jamming_calculator is None:
+            self._jamming_calculator = JammingCalculator(self)
+        return self._jamming_calculator
+
+    def scenario_analytics(self) -> ScenarioAnalytics:
+        """Tekniklerin radarlara (bant, görev tipi) karşı başarı matrisleri; senaryo değiştikçe artımlı güncellenir."""
+        if self._scenario_analytics is None:
+            self._scenario_analytics = ScenarioAnalytics(self)
+        return self._scenario_analytics
+
+    def technique_recommender(self) -> TechniqueRecommender:
+        """Hedef radara karşı teknikleri geçmiş senaryo sonuçlarına göre sıralayan servis (bkz. TechniqueRecommender)."""
+        if self._technique_recommender is None:
+            self._technique_recommender = TechniqueRecommender(self.scenario_analytics(), self.radar_catalog())
+        return self._technique_recommender
+
     def item_exists(self, item_id: str, item_type: Type[T]) -> bool:
-        list_ref, _ = self._get_list_ref(item_type)
-        if list_ref is None: return False
-        id_field_name = f"{item_type.__name__.lower().replace('et', 'et_')}_id"
-        if id_field_name == "et_platformu_id": id_field_name = "platform_id"
-        return any(getattr(item, id_field_name) == item_id for item in list_ref)
+        store, _ = self._get_store_ref(item_type)
+        if store is None: return False
+        return item_id in store
 
     def delete_item_by_id(self, item_id: str, item_type: Type[T]):
-        list_ref, signal = self._get_list_ref(item_type)
-        if list_ref is None: return
-        id_field_name = f"{item_type.__name__.lower().replace('et', 'et_')}_id"
-        if id_field_name == "et_platformu_id": id_field_name = "platform_id"
-        original_len = len(list_ref)
-        list_ref[:] = [item for item in list_ref if getattr(item, id_field_name) != item_id]
-        if len(list_ref) < original_len:
-            signal.emit()
+        store, _ = self._get_store_ref(item_type)
+        if store is None: return
+        if item_id not in store: return
+
+        row = -1 if self._row_signals_dropped(item_type) else self._row_of(item_type, item_id)
+        del store[item_id]
+        self._snapshots[item_type] = None
+        positions = self._positions.get(item_type)
+        if positions is not None:
+            positions.remove(item_id)
+        names = self._name_maps.get(item_type)
+        if names is not None:
+            names.pop(item_id, None)
+        self._notify_item(self.item_removed, item_type, item_id, row)
 
     def duplicate_item(self, item):
         try:
             new_item = copy.deepcopy(item)
-            item_type = type(item)
-            id_field_name = f"{item_type.__name__.lower().replace('et', 'et_')}_id"
-            if id_field_name == "et_platformu_id": id_field_name = "platform_id"
-            setattr(new_item, id_field_name, str(uuid.uuid4()))
+            setattr(new_item, get_codec(type(item)).id_field, str(uuid.uuid4()))
             new_item.adi = f"{new_item.adi} (Kopya)"
             self.save_item(new_item)
             self.status_updated.emit(f"'{item.adi}' kopyalandı ve '{new_item.adi}' olarak kaydedildi.")
@@ -1,8 +1,9 @@
 # ew_platformasi/core/data_models.py
 
 import os
+import sys
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Optional, Literal, Union
 from datetime import date
 
@@ -14,6 +15,47 @@ TEKNIK_KATEGORILERI = ["Gürültü Karıştırma", "Menzil Aldatma", "Alıcı/G
 SONUC_NITEL = ["Bilinmiyor", "Başarılı", "Kısmen Başarılı", "Başarısız", "Değişken"]
 DARBE_MODULASYONLARI = ["Bilinmiyor", "Normal Darbe (CW)", "Lineer Frekans Mod. (LFM/Chirp)", "Doğrusal Olmayan FM", "Faz Kodlu (Barker, Frank vb.)", "Frekans Atlamalı (FH)"]
 
+# Katalog değerlerinin küçük tamsayı kodları (değer -> katalogdaki sırası)
+def _kod_tablosu(katalog: List[str]) -> dict:
+    return {deger: kod for kod, deger in enumerate(katalog)}
+
+FREKANS_BANDI_KODLARI = _kod_tablosu(FREKANS_BANDLARI)
+GOREV_TIPI_KODLARI = _kod_tablosu(GOREV_TIPLERI)
+ANTEN_TIPI_KODLARI = _kod_tablosu(ANTEN_TIPLERI)
+TEKNIK_KATEGORI_KODLARI = _kod_tablosu(TEKNIK_KATEGORILERI)
+SONUC_NITEL_KODLARI = _kod_tablosu(SONUC_NITEL)
+DARBE_MODULASYONU_KODLARI = _kod_tablosu(DARBE_MODULASYONLARI)
+
+
+def _katalog_degeri(kodlar: dict, katalog: List[str], deger):
+    """Katalogdaki değerler için katalog listesindeki tek str nesnesini döndürür; katalog dışı değer aynen kalır.
+
+    Dosyadan okunan her metin ayrı bir nesnedir; kayıtlar böylece kodun gösterdiği ortak nesneyi paylaşır.
+    """
+    kod = kodlar.get(deger)
+    return deger if kod is None else katalog[kod]
+
+
+def _intern_id(deger):
+    """Kimlikleri tekilleştirir: senaryodaki radar_id, görevdeki senaryo id'leri vb. kaydın kendi id'siyle aynı nesnedir."""
+    return sys.intern(deger) if type(deger) is str else deger
+
+
+def _slotted(cls):
+    """dataclass(slots=True)'nun Python 3.9 karşılığı: sınıfı, alanları __slots__'ta tutulan (__dict__'siz) olarak yeniden kurar.
+
+    Varsayılan değerler üretilen __init__'te saklandığından sınıf özniteliklerinden kaldırılabilir.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls) if f.name not in getattr(cls.__base__, "__slots__", ()))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
 # --- Depo Dosya Yolları ---
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(os.path.dirname(APP_DIR), "data")
@@ -33,22 +75,26 @@ SENARYOLAR_XSD = os.path.join(SCHEMA_DIR, "senaryo_schema.xsd")
 GOREVLER_XSD = os.path.join(SCHEMA_DIR, "gorev_schema.xsd")
 
 # --- Detaylı Teknik Parametre Sınıfları ---
+@_slotted
 @dataclass
 class BaseTeknikParametreleri:
     pass
 
+@_slotted
 @dataclass
 class GurultuKaristirmaParams(BaseTeknikParametreleri):
     tur: Literal["Barrage", "Spot", "Swept", "DRFM Noise"] = "Barrage"
     bant_genisligi_mhz: Optional[float] = None
     guc_erp_dbw: Optional[float] = None
 
+@_slotted
 @dataclass
 class MenzilAldatmaParams(BaseTeknikParametreleri):
     teknik_tipi: Literal["RGPO", "RGPI"] = "RGPO"
     cekme_hizi_mps: Optional[float] = None
     sahte_hedef_sayisi: Optional[int] = None
 
+@_slotted
 @dataclass
 class AlmacGondermecAyarParametreleri(BaseTeknikParametreleri):
     on_ornekleme_frekansi_ghz: Optional[float] = None
@@ -60,6 +106,7 @@ class AlmacGondermecAyarParametreleri(BaseTeknikParametreleri):
     modulasyon_tipi: str = "QPSK"
     veri_hizi_mbps: Optional[float] = None
 
+@_slotted
 @dataclass
 class KaynakUretecAyarParametreleri(BaseTeknikParametreleri):
     dalga_formu_tipi: str = "Sinus"
@@ -75,12 +122,17 @@ class KaynakUretecAyarParametreleri(BaseTeknikParametreleri):
 # --- Ana Veri Sınıfları ---
 
 # GÜNCELLEME: Yeni ETPlatformu sınıfı eklendi
+@_slotted
 @dataclass
 class ETPlatformu:
     platform_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     adi: str = "Yeni Platform"
     aciklama: str = ""
 
+    def __post_init__(self):
+        self.platform_id = _intern_id(self.platform_id)
+
+@_slotted
 @dataclass
 class Teknik:
     teknik_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -97,6 +149,12 @@ class Teknik:
         BaseTeknikParametreleri
     ] = field(default_factory=BaseTeknikParametreleri)
 
+    def __post_init__(self):
+        self.teknik_id = _intern_id(self.teknik_id)
+        self.platform_id = _intern_id(self.platform_id)
+        self.kategori = _katalog_degeri(TEKNIK_KATEGORI_KODLARI, TEKNIK_KATEGORILERI, self.kategori)
+
+@_slotted
 @dataclass
 class Radar:
     radar_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -114,12 +172,26 @@ class Radar:
     darbe_entegrasyonu: str = ""
     notlar: str = ""
 
+    def __post_init__(self):
+        self.radar_id = _intern_id(self.radar_id)
+        self.frekans_bandi = _katalog_degeri(FREKANS_BANDI_KODLARI, FREKANS_BANDLARI, self.frekans_bandi)
+        self.gorev_tipi = _katalog_degeri(GOREV_TIPI_KODLARI, GOREV_TIPLERI, self.gorev_tipi)
+        self.anten_tipi = _katalog_degeri(ANTEN_TIPI_KODLARI, ANTEN_TIPLERI, self.anten_tipi)
+        self.darbe_modulasyonu = _katalog_degeri(DARBE_MODULASYONU_KODLARI, DARBE_MODULASYONLARI,
+                                                 self.darbe_modulasyonu)
+
+@_slotted
 @dataclass
 class TeknikUygulama:
     sira: int = 1
     teknik_id: str = ""
     sure_sn: float = 0.0
 
+    def __post_init__(self):
+        # Milyonlarca olabilir: aynı tekniği kullanan tüm uygulamalar tek id nesnesini paylaşır.
+        self.teknik_id = _intern_id(self.teknik_id)
+
+@_slotted
 @dataclass
 class Senaryo:
     senaryo_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -136,6 +208,13 @@ class Senaryo:
     mesafe_km: Optional[float] = None
     notlar: str = ""
 
+    def __post_init__(self):
+        self.senaryo_id = _intern_id(self.senaryo_id)
+        self.et_platformu_id = _intern_id(self.et_platformu_id)
+        self.radar_id = _intern_id(self.radar_id)
+        self.sonuc_nitel = _katalog_degeri(SONUC_NITEL_KODLARI, SONUC_NITEL, self.sonuc_nitel)
+
+@_slotted
 @dataclass
 class Gorev:
     gorev_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -144,4 +223,8 @@ class Gorev:
     gorev_tarihi_iso: str = field(default_factory=lambda: date.today().isoformat())
     sorumlu_personel: str = ""
     aciklama: str = ""
-    senaryo_id_list: List[str] = field(default_factory=list)
\ No newline at end of file
+    senaryo_id_list: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.gorev_id = _intern_id(self.gorev_id)
+        self.senaryo_id_list[:] = [_intern_id(senaryo_id) for senaryo_id in self.senaryo_id_list]
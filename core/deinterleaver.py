@@ -0,0 +1,264 @@
+# ew_platformasi/core/deinterleaver.py
+#
+# Darbe dizilerinin PRI'ye göre ayrıştırılması (deinterleaving). İç içe geçmiş darbelerin varış zamanlarından (TOA)
+# CDIF/SDIF yöntemiyle fark histogramları çıkarılır: 1..max_level darbe arayla alınan TOA farkları logaritmik PRI
+# kovalarına sayılır; rastgele varışlardan beklenen sayıyı aşan ve iki katında da tepe veren kova PRI adayı olur.
+# Adayın darbe dizisi dizi aramasıyla ayıklanır ve kalan darbelerle işlem tekrarlanır.
+#
+# Fark histogramları parça parça biriktirilir; milyonlarca darbede de aday bulmanın bellek kullanımı kova sayısı ve
+# parça boyutuyla sınırlıdır. Frekans verilirse darbeler önce frekans bandına göre ayrılır (ön sınıflandırma).
+
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from core.data_models import Radar, FREKANS_BANDLARI
+from core.pdw_ingest import frequency_band_codes
+
+DEFAULT_PRI_RANGE_US = (2.0, 20_000.0)
+# Kova genişliği ve dizi aramasında bir sonraki darbenin arandığı pencere (ikisi de PRI'ye göre göreli)
+DEFAULT_BIN_WIDTH = 0.01
+DEFAULT_PRI_TOLERANCE = 0.01
+# Dizideki ardışık darbelerin PW'leri arasında izin verilen göreli fark
+DEFAULT_PW_TOLERANCE = 0.10
+DEFAULT_MAX_LEVEL = 32
+DEFAULT_MIN_PULSES = 50
+# Tepe, rastgele varışlardan beklenen fark sayısının bu katını aşmalıdır. Yoğun gruplarda gerçek PRI'lerde bile oran
+# 2 civarındadır; yanlış tepeler dizi aramasında elenir.
+_THRESHOLD_FACTOR = 1.5
+_HISTOGRAM_CHUNK = 1_000_000
+# Bir bant grubunda aranacak en çok yayıcı sayısı
+_MAX_EMITTERS_PER_GROUP = 64
+# Dizi aramasında PRI penceresindeki ilk kaç darbeye bakılacağı
+_LOOKAHEAD = 4
+
+
+@dataclass
+class EmitterCandidate:
+    pri_us: float
+    pulse_count: int
+    pw_us: Optional[float]
+    frekans_bandi: str
+    first_toa_us: float
+    last_toa_us: float
+
+    @property
+    def prf_hz(self) -> float:
+        return 1_000_000 / self.pri_us
+
+    def to_radar(self, adi: str) -> Radar:
+        """Adayı kütüphaneye kaydedilebilecek bir Radar kaydına çevirir (bkz. DataManager.save_item)."""
+        return Radar(adi=adi, frekans_bandi=self.frekans_bandi,
+                     pw_us=None if self.pw_us is None else round(self.pw_us, 3),
+                     pri_us=round(self.pri_us, 3), prf_hz=round(self.prf_hz, 2),
+                     notlar=f"PDW ayrıştırmasından: {self.pulse_count} darbe, "
+                            f"TOA {self.first_toa_us:.0f}-{self.last_toa_us:.0f} µs")
+
+
+class PriHistogram:
+    """Logaritmik PRI kovaları; her kova bir öncekinden (1 + bin_width) kat geniştir."""
+
+    def __init__(self, pri_range_us: Tuple[float, float] = DEFAULT_PRI_RANGE_US,
+                 bin_width: float = DEFAULT_BIN_WIDTH):
+        self.low_us, high_us = pri_range_us
+        self._log_step = np.log1p(bin_width)
+        self.bins = int(np.ceil(np.log(high_us / self.low_us) / self._log_step))
+        self.edges = self.low_us * np.exp(self._log_step * np.arange(self.bins + 1))
+        # 2τ kovası τ kovasından sabit sayıda kova ötededir.
+        self.double_shift = int(round(np.log(2) / self._log_step))
+
+    def bin_of(self, values: np.ndarray) -> np.ndarray:
+        """Değerlerin kova indeksleri; aralık dışındakiler -1."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            index = np.floor(np.log(values / self.low_us) / self._log_step)
+        return np.where((index >= 0) & (index < self.bins), index, -1).astype(np.int64)
+
+    def level_differences(self, toa: np.ndarray, level: int,
+                          chunk: int = _HISTOGRAM_CHUNK) -> Tuple[np.ndarray, np.ndarray]:
+        """SDIF histogramının bir seviyesi: level darbe arayla alınan TOA farklarının (kova sayıları, kova toplamları).
+
+        Farklar parça parça hesaplanır; bellek kullanımı toa boyutundan bağımsız olarak parça boyutuyla sınırlıdır.
+        """
+        counts = np.zeros(self.bins, dtype=np.int64)
+        sums = np.zeros(self.bins)
+        for start in range(0, len(toa) - level, chunk):
+            stop = min(start + chunk, len(toa) - level)
+            differences = toa[start + level:stop + level] - toa[start:stop]
+            index = self.bin_of(differences)
+            inside = index >= 0
+            counts += np.bincount(index[inside], minlength=self.bins)
+            sums += np.bincount(index[inside], weights=differences[inside], minlength=self.bins)
+        return counts, sums
+
+    def random_expectation(self, pulse_count: int, duration_us: float, max_level: int) -> np.ndarray:
+        """Aynı hızdaki rastgele (Poisson) varışlarda kovaya düşmesi beklenen fark sayısı, (max_level, kova) boyutlu.
+
+        c darbe arayla alınan farklar Gamma(c, λ) dağılımlıdır.
+        """
+        rate = (pulse_count - 1) / duration_us if duration_us > 0 else 0.0
+        x = rate * self.edges
+        term = np.ones_like(x)
+        partial = np.zeros_like(x)
+        expected = np.zeros((max_level, self.bins))
+        with np.errstate(over="ignore", invalid="ignore"):
+            log_decay = -x
+            for level in range(1, max_level + 1):
+                # Tamsayı c için Gamma CDF: 1 - e^(-x) * Σ_{k<c} x^k / k!
+                partial += term
+                term = term * x / level
+                cdf = 1.0 - np.exp(log_decay + np.log(partial))
+                expected[level - 1] = max(pulse_count - level, 0) * np.diff(np.nan_to_num(cdf, nan=1.0))
+        return expected
+
+
+def _pri_candidates(histogram: PriHistogram, toa: np.ndarray, max_level: int,
+                    min_pulses: int) -> Iterator[Tuple[float, int]]:
+    """CDIF: seviyeler birer birer biriktirilir; her seviyede eşiği ve 2τ kovasında da eşiği aşan tepeler (PRI, kova)
+    olarak, tercih sırasıyla verilir.
+
+    Tercih: beklenene oranı en güçlü tepeninkinin yarısını aşanlar arasında en küçük PRI (harmonikler yerine temel PRI), sonra güç sırası.
+    Verilen bir kova bir daha verilmez. Yoğun iç içe geçmelerde bir yayıcının kendi farkları ancak PRI × darbe hızı
+    kadar seviye sonra görünür; seviyeler bu yüzden aday çıkana kadar artırılır.
+    """
+    window = np.ones(3)
+    expected = histogram.random_expectation(len(toa), toa[-1] - toa[0], max_level)
+    cumulative_counts = np.zeros(histogram.bins)
+    cumulative_sums = np.zeros(histogram.bins)
+    cumulative_expected = np.zeros(histogram.bins)
+    offered = set()
+    for level in range(1, max_level + 1):
+        counts, sums = histogram.level_differences(toa, level)
+        cumulative_counts += counts
+        cumulative_sums += sums
+        cumulative_expected += expected[level - 1]
+        # Titreşim bir tepeyi komşu kovalara bölebilir; sayılar üçlü pencereyle toplanır.
+        smoothed = np.convolve(cumulative_counts, window, mode="same")
+        smoothed_expected = np.convolve(cumulative_expected, window, mode="same")
+        threshold = np.maximum(_THRESHOLD_FACTOR * smoothed_expected, min_pulses / 2)
+        # Büyük PRI'lerde beklenen sayı da büyüdüğünden tepeler beklenene oranla karşılaştırılır.
+        ratio = smoothed / np.maximum(smoothed_expected, 1.0)
+        above = smoothed > threshold
+        peaks = above & (smoothed >= np.roll(smoothed, 1)) & (smoothed >= np.roll(smoothed, -1))
+        accepted = []
+        for b in np.flatnonzero(peaks):
+            if b in offered: continue
+            double = b + histogram.double_shift
+            if double + 1 < histogram.bins and not above[double - 1:double + 2].any(): continue
+            accepted.append(int(b))
+        if not accepted: continue
+        strongest = max(ratio[b] for b in accepted)
+        first = min(b for b in accepted if ratio[b] >= strongest / 2)
+        for b in [first] + sorted((b for b in accepted if b != first), key=lambda b: -ratio[b]):
+            offered.add(b)
+            # Yakın iki tepe düzleştirmede birleşebilir; PRI, pencerenin en kalabalık ham kovasından alınır.
+            peak = max(range(max(b - 1, 0), min(b + 2, histogram.bins)), key=lambda i: cumulative_counts[i])
+            yield float(cumulative_sums[peak] / cumulative_counts[peak]), b
+
+
+def _sequence_search(toa: np.ndarray, pw: Optional[np.ndarray], pri_us: float, pri_tolerance: float,
+                     pw_tolerance: float) -> Tuple[np.ndarray, float]:
+    """PRI aralıklı darbe dizisine ait darbelerin maskesi ve dizideki ardışık farkların ortalaması.
+
+    Her darbe, PRI kadar ötesindeki (tolerans içinde) ve PW'si kendisininkine uyan ilk darbeye bağlanır; pencerede
+    birden çok darbe varsa ilk _LOOKAHEAD tanesine bakılır. Rastgele çakışmaları elemek için yalnızca en az üç
+    darbelik zincirlerdeki darbeler alınır.
+    """
+    count = len(toa)
+    window_start = np.searchsorted(toa, toa + pri_us * (1 - pri_tolerance), side="left")
+    window_end = toa + pri_us * (1 + pri_tolerance)
+    following = np.full(count, -1)
+    for offset in range(_LOOKAHEAD):
+        candidate = window_start + offset
+        open_ = (following < 0) & (candidate < count)
+        candidate_safe = np.where(open_, candidate, 0)
+        fits = open_ & (toa[candidate_safe] <= window_end)
+        if pw is not None:
+            fits &= ~(np.abs(pw[candidate_safe] - pw) > pw * pw_tolerance)
+        following[fits] = candidate[fits]
+    has_next = following >= 0
+    # Aynı darbeye iki darbe bağlanabilir; her ikisi de zincirde sayılır.
+    previous = np.full(count, -1)
+    previous[following[has_next]] = np.flatnonzero(has_next)
+    has_previous = previous >= 0
+
+    middle = has_next & has_previous
+    # Zincirin başı ya da sonu: bir komşusu zincirin ortasındadır.
+    head = has_next & middle[np.where(has_next, following, 0)]
+    tail = has_previous & middle[np.where(has_previous, previous, 0)]
+    members = middle | head | tail
+    linked = has_next & members & members[np.where(has_next, following, 0)]
+    mean_pri = float(np.mean(toa[following[linked]] - toa[linked])) if linked.any() else pri_us
+    return members, mean_pri
+
+
+def _dominant_pw(members: np.ndarray, pw: np.ndarray, pw_tolerance: float) -> np.ndarray:
+    """Aynı PRI'deki farklı PW'li diziler ayrı yayıcılardır: üyelerden yalnızca en kalabalık PW kümesi bırakılır."""
+    member_pw = pw[members]
+    valid = np.isfinite(member_pw) & (member_pw > 0)
+    if not valid.any(): return members
+    buckets = np.floor(np.log(member_pw[valid]) / np.log1p(pw_tolerance)).astype(np.int64)
+    mode = np.argmax(np.bincount(buckets - buckets.min())) + buckets.min()
+    center = np.median(member_pw[valid][buckets == mode])
+    kept = members.copy()
+    kept[members] = np.abs(member_pw - center) <= center * pw_tolerance
+    return kept
+
+
+def deinterleave(toa_us, pw_us=None, freq_mhz=None, pri_range_us: Tuple[float, float] = DEFAULT_PRI_RANGE_US,
+                 bin_width: float = DEFAULT_BIN_WIDTH, pri_tolerance: float = DEFAULT_PRI_TOLERANCE,
+                 pw_tolerance: float = DEFAULT_PW_TOLERANCE, max_level: int = DEFAULT_MAX_LEVEL,
+                 min_pulses: int = DEFAULT_MIN_PULSES) -> Tuple[List[EmitterCandidate], np.ndarray]:
+    """Darbeleri yayıcılara ayırır; (adaylar, darbe başına aday indeksi; atanamayanlar -1) döndürür.
+
+    pw_us verilirse dizi aramasında PW tutarlılığı da aranır ve adayın PW'si darbelerin medyanı olur. freq_mhz
+    verilirse her frekans bandı ayrı ayrıştırılır ve aday o bandı taşır; verilmezse bant "Bilinmiyor" olur.
+    """
+    toa = np.asarray(toa_us, dtype=float)
+    count = len(toa)
+    order = np.argsort(toa, kind="stable")
+    sorted_toa = toa[order]
+    sorted_pw = None if pw_us is None else np.asarray(pw_us, dtype=float)[order]
+    if freq_mhz is None:
+        bands = np.zeros(count, dtype=np.int16)
+    else:
+        # Aralık dışı frekanslar (UNKNOWN_BAND_CODE) adayın etiketinde "Bilinmiyor" (0) bandına toplanır.
+        bands = np.maximum(frequency_band_codes(np.asarray(freq_mhz, dtype=float)[order]), 0)
+
+    histogram = PriHistogram(pri_range_us, bin_width)
+    candidates = []
+    sorted_labels = np.full(count, -1, dtype=np.int64)
+    for band in np.unique(bands):
+        remaining = np.flatnonzero(bands == band)
+        for _ in range(_MAX_EMITTERS_PER_GROUP):
+            if len(remaining) < min_pulses: break
+            group_toa = sorted_toa[remaining]
+            group_pw = None if sorted_pw is None else sorted_pw[remaining]
+            found = None
+            for pri_us, _bin in _pri_candidates(histogram, group_toa, max_level, min_pulses):
+                members, mean_pri = _sequence_search(group_toa, group_pw, pri_us, pri_tolerance, pw_tolerance)
+                # Kova ortalaması komşu dizilerle kayabilir; arama ölçülen ortalama PRI ile bir kez tekrarlanır.
+                if members.any():
+                    members, mean_pri = _sequence_search(group_toa, group_pw, mean_pri, pri_tolerance, pw_tolerance)
+                if group_pw is not None:
+                    members = _dominant_pw(members, group_pw, pw_tolerance)
+                # Dizi vermeyen tepe atlanır; aynı histogramda sıradaki aday denenir.
+                if members.sum() >= min_pulses:
+                    found = members, mean_pri
+                    break
+            if found is None: break
+            members, mean_pri = found
+            pulses = remaining[members]
+            sorted_labels[pulses] = len(candidates)
+            pw = None
+            if group_pw is not None:
+                pw_values = group_pw[members]
+                pw_values = pw_values[np.isfinite(pw_values)]
+                pw = float(np.median(pw_values)) if len(pw_values) else None
+            candidates.append(EmitterCandidate(mean_pri, int(len(pulses)), pw, FREKANS_BANDLARI[int(band)],
+                                               float(sorted_toa[pulses[0]]), float(sorted_toa[pulses[-1]])))
+            remaining = remaining[~members]
+
+    labels = np.empty(count, dtype=np.int64)
+    labels[order] = sorted_labels
+    return candidates, labels
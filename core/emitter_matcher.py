@@ -0,0 +1,224 @@
+# ew_platformasi/core/emitter_matcher.py
+#
+# Yakalanan yayınların (ölçülen PRI/PW/frekans bandı) radar kütüphanesiyle eşleştirilmesi. Kütüphane frekans bandına
+# ayrılıp her bant içinde PRI'ye göre sıralı tutulur; her yakalamanın tolerans penceresi iki ikili aramayla
+# (np.searchsorted) bulunur ve yalnızca penceredeki adaylar PW için sınanır. Binlerce yakalama tek seferde, vektörel olarak eşleştirilir.
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from core.data_models import FREKANS_BANDI_KODLARI
+from core.radar_catalog import RadarCatalog
+
+# Varsayılan göreli toleranslar: ölçülen değerin ±%5'i (PRI) ve ±%10'u (PW; darbe genişliği ölçümü daha gürültülü)
+DEFAULT_PRI_TOLERANCE = 0.05
+DEFAULT_PW_TOLERANCE = 0.10
+# Bir parçada birlikte değerlendirilen (yakalama, aday) çifti üst sınırı; bellek kullanımını sınırlar.
+_MAX_PAIRS_PER_CHUNK = 2_000_000
+_UNKNOWN_BAND = -1
+# Katalogdaki "Bilinmiyor" bandı (kod 0) bant bilgisi yok demektir; her iki tarafta da _UNKNOWN_BAND gibi ele alınır.
+_BILINMIYOR_BAND = FREKANS_BANDI_KODLARI["Bilinmiyor"]
+
+
+def _known_band(codes: np.ndarray) -> np.ndarray:
+    """Bant kodları; "Bilinmiyor" (kod 0) _UNKNOWN_BAND olur. Girdi dizisi değiştirilmez."""
+    return np.where(codes == _BILINMIYOR_BAND, _UNKNOWN_BAND, codes).astype(np.int16, copy=False)
+
+
+@dataclass
+class MatchCandidate:
+    radar_id: str
+    # 1.0 tam eşleşme; tolerans penceresinin kenarına doğru 0'a iner.
+    score: float
+    # Kütüphane değerinin ölçülen değerden göreli sapması (%); PW ölçülmemişse ya da kütüphanede yoksa None.
+    pri_deviation: float
+    pw_deviation: Optional[float]
+
+
+class EmitterMatcher:
+    """RadarCatalog üzerinde PRI-sıralı indeksle yakalama -> radar eşleştirmesi.
+
+    Bir yakalamaya aday olan radarlar: PRI'si tolerans penceresinde olanlar; PW ölçülmüşse PW'si de pencerede
+    olanlar; bant biliniyorsa aynı banttakiler ile bandı bilinmeyenler ("Bilinmiyor" ya da katalog dışı). Kütüphanede
+    PRI yoksa PRF'den türetilir, o da yoksa radar eşleştirmeye girmez. İndeks katalog değiştiğinde bir sonraki
+    sorguda yeniden kurulur.
+    """
+
+    def __init__(self, catalog: RadarCatalog, pri_tolerance: float = DEFAULT_PRI_TOLERANCE,
+                 pw_tolerance: float = DEFAULT_PW_TOLERANCE):
+        self._catalog = catalog
+        self.pri_tolerance = pri_tolerance
+        self.pw_tolerance = pw_tolerance
+        self._index_revision = None
+        # İndeks: kayıtlar önce banda, bant içinde PRI'ye göre sıralıdır (konum uzayı). Her sorgu bandının aday
+        # kümesi PRI sırasıyla _lookup'ta ardışık bir bölümdür: _windows bant kodu -> (bölümün başı, PRI'leri).
+        # _UNKNOWN_BAND bölümü tüm kayıtlardır; diğer bantlarınki o banttakiler ile bandı bilinmeyenlerdir.
+        self._sorted_pri = np.empty(0)
+        self._sorted_pw = np.empty(0)
+        self._sorted_ids = np.empty(0, dtype=object)
+        self._lookup = np.empty(0, dtype=np.int64)
+        self._windows = {_UNKNOWN_BAND: (0, np.empty(0))}
+
+    def _ensure_index(self):
+        if self._index_revision == self._catalog.revision: return
+        columns = self._catalog.columns()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pri = np.where(np.isnan(columns["pri_us"]), 1_000_000 / columns["prf_hz"], columns["pri_us"])
+        rows = np.flatnonzero(np.isfinite(pri) & (pri > 0))
+        band = _known_band(columns["frekans_bandi"][rows])
+        order = np.lexsort((pri[rows], band))
+        rows, band = rows[order], band[order]
+        self._sorted_pri = pri[rows]
+        self._sorted_pw = columns["pw_us"][rows]
+        self._sorted_ids = columns["radar_id"][rows]
+
+        all_order = np.argsort(self._sorted_pri, kind="stable")
+        parts, windows, offset = [all_order], {_UNKNOWN_BAND: (0, self._sorted_pri[all_order])}, len(rows)
+        unknown = np.flatnonzero(band == _UNKNOWN_BAND)
+        for code in set(FREKANS_BANDI_KODLARI.values()) - {_BILINMIYOR_BAND}:
+            # Bant bölümü ve bilinmeyen bölüm ayrı ayrı PRI sıralıdır; birleşim yeniden sıralanır.
+            members = np.concatenate((np.flatnonzero(band == code), unknown))
+            members = members[np.argsort(self._sorted_pri[members], kind="stable")]
+            windows[code] = (offset, self._sorted_pri[members])
+            parts.append(members)
+            offset += len(members)
+        self._lookup = np.concatenate(parts)
+        self._windows = windows
+        self._index_revision = self._catalog.revision
+
+    def match_batch(self, pri_us, pw_us=None, frekans_bandi: Union[str, Iterable[str], None] = None,
+                    top_k: int = 5, pri_tolerance: float = None,
+                    pw_tolerance: float = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Yakalama dizilerini eşleştirir; (radar_id'ler, skorlar) döndürür, ikisi de (yakalama sayısı, top_k) boyutlu.
+
+        Her satır en iyi adaydan başlayarak sıralıdır; boş kalan yerlerde id None, skor NaN'dır. pw_us ve
+        frekans_bandi verilmeyebilir ya da tek tek eksik olabilir (NaN / katalog dışı bant): o ölçüt o yakalama için
+        aranmaz. frekans_bandi tek bir değerse tüm yakalamalara uygulanır.
+        """
+        positions, scores = self.match_positions(pri_us, pw_us, frekans_bandi, top_k, pri_tolerance, pw_tolerance)
+        result_ids = np.full(positions.shape, None, dtype=object)
+        found = positions >= 0
+        result_ids[found] = self._sorted_ids[positions[found]]
+        return result_ids, scores
+
+    def index_ids(self) -> np.ndarray:
+        """İndeksteki radar_id'ler; match_positions'ın döndürdüğü konumlar bu diziye göredir."""
+        self._ensure_index()
+        return self._sorted_ids
+
+    def match_positions(self, pri_us, pw_us=None, frekans_bandi=None, top_k: int = 5,
+                        pri_tolerance: Optional[float] = None,
+                        pw_tolerance: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """match_batch gibidir, ancak adayları index_ids() içindeki konumlarıyla (-1: aday yok) döndürür.
+
+        Konumlar kütüphane değişene kadar geçerlidir; çok sayıda yakalamayı radar başına toplamak (np.bincount) için
+        id dizisinden daha uygundur. frekans_bandi burada katalog kodu dizisi (FREKANS_BANDI_KODLARI) de olabilir.
+        """
+        pri_tolerance = self.pri_tolerance if pri_tolerance is None else pri_tolerance
+        pw_tolerance = self.pw_tolerance if pw_tolerance is None else pw_tolerance
+        if pri_tolerance <= 0 or pw_tolerance <= 0:
+            raise ValueError("Eşleştirme toleransları sıfırdan büyük olmalıdır.")
+        self._ensure_index()
+
+        pri = np.atleast_1d(np.asarray(pri_us, dtype=float))
+        count = len(pri)
+        pw = np.full(count, np.nan) if pw_us is None else np.broadcast_to(np.asarray(pw_us, dtype=float), (count,))
+        with np.errstate(invalid="ignore"):
+            # Sıfır ya da negatif PW ölçülmemiş sayılır.
+            pw = np.where(pw > 0, pw, np.nan)
+        if frekans_bandi is None:
+            band = np.full(count, _UNKNOWN_BAND, dtype=np.int16)
+        elif isinstance(frekans_bandi, np.ndarray) and frekans_bandi.dtype.kind in "iu":
+            band = frekans_bandi.astype(np.int16, copy=False)
+        elif isinstance(frekans_bandi, str):
+            band = np.full(count, FREKANS_BANDI_KODLARI.get(frekans_bandi, _UNKNOWN_BAND), dtype=np.int16)
+        else:
+            band = np.array([FREKANS_BANDI_KODLARI.get(value, _UNKNOWN_BAND) for value in frekans_bandi],
+                            dtype=np.int16)
+
+        result_positions = np.full((count, max(top_k, 0)), -1, dtype=np.int64)
+        result_scores = np.full((count, max(top_k, 0)), np.nan)
+        if count == 0 or len(self._sorted_pri) == 0 or top_k <= 0:
+            return result_positions, result_scores
+
+        # Her yakalamanın PRI penceresi _lookup'ta [start, stop) aralığıdır: bandının bölümünde (bandı bilinmiyorsa ya da
+        # katalog dışıysa tüm kayıtların bölümünde) iki ikili aramayla bulunur.
+        band = _known_band(band)
+        with np.errstate(invalid="ignore"):
+            valid = np.isfinite(pri) & (pri > 0)
+        safe_pri = np.where(valid, pri, 0.0)
+        low, high = safe_pri * (1 - pri_tolerance), safe_pri * (1 + pri_tolerance)
+        start = np.zeros(count, dtype=np.int64)
+        stop = np.zeros(count, dtype=np.int64)
+        lookup = self._lookup
+        for code in np.unique(band):
+            selected = band == code
+            first, window_pri = self._windows.get(int(code), self._windows[_UNKNOWN_BAND])
+            start[selected] = first + np.searchsorted(window_pri, low[selected], side="left")
+            stop[selected] = first + np.searchsorted(window_pri, high[selected], side="right")
+        pair_counts = np.where(valid, stop - start, 0)
+
+        # Yakalamalar, çift sayısı sınırı aşılmayacak parçalar halinde işlenir.
+        cumulative = np.cumsum(pair_counts)
+        chunk_start = 0
+        while chunk_start < count:
+            done = cumulative[chunk_start - 1] if chunk_start else 0
+            chunk_stop = max(int(np.searchsorted(cumulative, done + _MAX_PAIRS_PER_CHUNK, side="right")),
+                             chunk_start + 1)
+            self._match_chunk(slice(chunk_start, chunk_stop), lookup, start, pair_counts, safe_pri, pw,
+                              pri_tolerance, pw_tolerance, result_positions, result_scores)
+            chunk_start = chunk_stop
+        return result_positions, result_scores
+
+    def _match_chunk(self, chunk: slice, lookup, start, pair_counts, pri, pw, pri_tolerance: float,
+                     pw_tolerance: float, result_positions: np.ndarray, result_scores: np.ndarray):
+        counts = pair_counts[chunk]
+        total = int(counts.sum())
+        if total == 0: return
+        top_k = result_positions.shape[1]
+        # Her (yakalama, aday) çifti için yakalama indeksi ve indeks dizilerindeki aday konumu
+        intercept = np.repeat(np.arange(chunk.start, chunk.stop), counts)
+        first_pair = np.cumsum(counts) - counts
+        candidate = lookup[start[intercept] + (np.arange(total) - np.repeat(first_pair, counts))]
+
+        measured_pri = pri[intercept]
+        pri_error = np.abs(self._sorted_pri[candidate] - measured_pri) / (measured_pri * pri_tolerance)
+
+        measured_pw = pw[intercept]
+        library_pw = self._sorted_pw[candidate]
+        with np.errstate(invalid="ignore"):
+            pw_error = np.abs(library_pw - measured_pw) / (measured_pw * pw_tolerance)
+        # PW ölçülmemişse hata 0; ölçülmüş ama kütüphanede yoksa adaya en kötü PW hatası (1) verilir.
+        pw_error = np.where(np.isnan(measured_pw), 0.0, np.where(np.isnan(library_pw), 1.0, pw_error))
+
+        keep = pw_error <= 1.0
+        intercept, candidate = intercept[keep], candidate[keep]
+        score = 1.0 - np.sqrt((pri_error[keep] ** 2 + pw_error[keep] ** 2) / 2)
+
+        # Yakalama içinde skora göre azalan sıra; ilk top_k aday yazılır. Skor [0, 1] aralığında olduğundan
+        # "yakalama + (1 - skor)" tek anahtarıyla sıralamak np.lexsort'tan kat kat hızlıdır (çiftler zaten yakalamaya göre sıralı).
+        order = np.argsort(intercept + (1.0 - score) * 0.999, kind="stable")
+        intercept, candidate, score = intercept[order], candidate[order], score[order]
+        group_start = np.searchsorted(intercept, intercept, side="left")
+        rank = np.arange(len(intercept)) - group_start
+        top = rank < top_k
+        result_positions[intercept[top], rank[top]] = candidate[top]
+        result_scores[intercept[top], rank[top]] = score[top]
+
+    def match(self, pri_us: float, pw_us: Optional[float] = None, frekans_bandi: Optional[str] = None,
+              top_k: int = 10, pri_tolerance: float = None, pw_tolerance: float = None) -> List[MatchCandidate]:
+        """Tek bir yakalamanın aday radarları, en iyi eşleşmeden başlayarak."""
+        positions, scores = self.match_positions([pri_us], None if pw_us is None else [pw_us], frekans_bandi,
+                                                  top_k, pri_tolerance, pw_tolerance)
+        candidates = []
+        for position, score in zip(positions[0], scores[0]):
+            if position < 0: break
+            library_pw = self._sorted_pw[position]
+            pw_deviation = None
+            if pw_us is not None and pw_us > 0 and not np.isnan(library_pw):
+                pw_deviation = float((library_pw - pw_us) / pw_us * 100)
+            pri_deviation = float((self._sorted_pri[position] - pri_us) / pri_us * 100)
+            candidates.append(MatchCandidate(self._sorted_ids[position], float(score), pri_deviation, pw_deviation))
+        return candidates
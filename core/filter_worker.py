@@ -0,0 +1,125 @@
+# ew_platformasi/core/filter_worker.py
+
+import threading
+from itertools import repeat
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from core.search_index import TextScanner, normalize_search_text
+
+# Son tuş vuruşundan sonra filtrenin başlatılması için beklenen süre (ms)
+FILTER_DEBOUNCE_MS = 150
+# Tarama bu kadar eşleşmede bir iptal edilip edilmediğine bakar.
+_CANCEL_CHECK_INTERVAL = 4096
+
+# Filtreler uzun süren veri seti açma/kaydetme işlerinin arkasında beklemesin diye ayrı, tek iş parçacıklı havuz.
+_filter_pool = None
+
+
+def _get_filter_pool() -> QThreadPool:
+    global _filter_pool
+    if _filter_pool is None:
+        _filter_pool = QThreadPool()
+        _filter_pool.setMaxThreadCount(1)
+    return _filter_pool
+
+
+class FilterTaskSignals(QObject):
+    # kuşak, sorgu, model revizyonu, eşleşme maskesi, görevde kurulan (metinler, yeni metinler, tarayıcı) ya da None
+    finished = Signal(int, str, int, object, object)
+
+
+class FilterTask(QRunnable):
+    """Bir TextScanner'ın tüm satırlarında sorguyu arar ve eşleşme maskesini (bool listesi) üretir.
+
+    Tarayıcı hazır değilse satır metinleri ve tarayıcı da burada, modelin anlık görüntüsünden kurulur (bkz.
+    LazyTableModel.search_snapshot). GUI iş parçacığındaki kayıt değişiklikleri taramayı etkilemez, model revizyonu
+    sonucun hâlâ geçerli olup olmadığını söyler.
+    """
+
+    def __init__(self, generation: int, query: str, revision: int, scanner, build_texts):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = FilterTaskSignals()
+        self._generation = generation
+        self._query = query
+        self._revision = revision
+        self._scanner = scanner
+        self._build_texts = build_texts
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def run(self):
+        scanner, built = self._scanner, None
+        if scanner is None:
+            texts = self._build_texts(self._cancel_event.is_set)
+            if texts is None:
+                return
+            scanner = TextScanner(texts[0])
+            built = (*texts, scanner)
+        row_count = scanner.row_count
+        mask = list(repeat(False, row_count))
+        row = 0
+        while row < row_count:
+            if self._cancel_event.is_set():
+                return
+            rows, row = scanner.scan(self._query, row, _CANCEL_CHECK_INTERVAL)
+            for matched_row in rows:
+                mask[matched_row] = True
+        if not self._cancel_event.is_set():
+            self.signals.finished.emit(self._generation, self._query, self._revision, mask, built)
+
+
+class DebouncedFilter(QObject):
+    """Arama kutusu ile LazyTableModel arasındaki filtre hattı.
+
+    Metin değiştikçe zamanlayıcı yeniden kurulur; yazma durunca eşleşmeler arka planda hesaplanır ve model
+    tek seferde güncellenir. Yeni bir metin gelince süren tarama iptal edilir, eski sonuçlar uygulanmaz.
+    """
+
+    def __init__(self, model, interval: int = FILTER_DEBOUNCE_MS, parent: QObject = None):
+        super().__init__(parent)
+        self._model = model
+        self._text = ""
+        self._generation = 0
+        self._task = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._start)
+
+    def set_text(self, text: str):
+        self._text = text
+        self._cancel_task()
+        if not normalize_search_text(text):
+            # Filtreyi kaldırmak tarama gerektirmez; hemen uygulanır.
+            self._timer.stop()
+            self._model.set_filter("")
+            return
+        self._timer.start()
+
+    def _cancel_task(self):
+        self._generation += 1
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _start(self):
+        snapshot = self._model.search_snapshot(self._text)
+        if snapshot is None:
+            return
+        query, revision, scanner, build_texts = snapshot
+        self._cancel_task()
+        self._task = FilterTask(self._generation, query, revision, scanner, build_texts)
+        self._task.signals.finished.connect(self._on_finished)
+        _get_filter_pool().start(self._task)
+
+    def _on_finished(self, generation: int, query: str, revision: int, mask, built):
+        if generation != self._generation:
+            return
+        self._task = None
+        if not self._model.apply_filter_result(query, revision, mask, built):
+            # Tarama sürerken kayıtlar değişti; güncel metinlerle yeniden başlatılır.
+            self._start()
@@ -0,0 +1,312 @@
+# ew_platformasi/core/jamming_calculator.py
+#
+# Senaryoların karıştırma etkinliği: karıştırıcı/sinyal oranı (J/S) ve yanma (burn-through) menzili. Kendini koruma
+# karıştırması varsayılır: karıştırıcı hedef platformdadır, radarın aldığı sinyal R⁴, karıştırma R² ile zayıflar.
+#
+#   J/S (dB) = ERP_j - ERP_r + 10·log10(4π) + 20·log10(R) - 10·log10(σ) - bant genişliği kaybı
+#
+# Bant genişliği kaybı, karıştırıcı bandı radar alıcısının bandından (≈ 1/PW) genişse 10·log10(B_j / B_r)'dir.
+# J/S, R² ile değiştiğinden gereken J/S'ye indiği menzil R · 10^((gereken - J/S) / 20) olur.
+# Senaryodaki gücü bilinen gürültü karıştırma tekniklerinden en yüksek J/S'yi vereni sonucu belirler.
+
+import collections
+import math
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+from core.data_models import GurultuKaristirmaParams, Radar, Senaryo, Teknik
+
+# Hedefin radar kesit alanı (m²); senaryolarda tutulmadığından tüm senaryolar için aynı kabul edilir.
+DEFAULT_RCS_M2 = 10.0
+# Radarın hedefi karıştırmaya rağmen gördüğü J/S sınırı (dB); yanma menzili bu değere göre hesaplanır.
+DEFAULT_REQUIRED_JS_DB = 0.0
+_FOUR_PI_DB = 10 * math.log10(4 * math.pi)
+
+
+class JammingResult(NamedTuple):
+    js_db: Optional[float]
+    burn_through_km: Optional[float]
+    # En yüksek J/S'yi veren teknik; hesaplanamadıysa None
+    teknik_id: Optional[str]
+
+
+def jamming_to_signal_db(jammer_erp_dbw, jammer_bandwidth_mhz, radar_erp_dbw, radar_pw_us, distance_km,
+                         rcs_m2: float = DEFAULT_RCS_M2) -> np.ndarray:
+    """Kendini koruma karıştırmasında J/S (dB); tüm girdiler dizi olabilir.
+
+    Bant genişliği ya da PW'si bilinmeyenlerde bant genişliği kaybı uygulanmaz; diğer eksik değerler NaN verir.
+    """
+    jammer_erp = np.asarray(jammer_erp_dbw, dtype=float)
+    jammer_bandwidth = np.asarray(jammer_bandwidth_mhz, dtype=float)
+    radar_pw = np.asarray(radar_pw_us, dtype=float)
+    distance_m = np.asarray(distance_km, dtype=float) * 1000.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # PW (µs) ile alıcı bandı (MHz) çarpımı ~1: B_j / B_r = B_j · PW
+        bandwidth_loss = 10 * np.log10(jammer_bandwidth * radar_pw)
+        bandwidth_loss = np.where(bandwidth_loss > 0, bandwidth_loss, 0.0)
+        spreading = 20 * np.log10(np.where(distance_m > 0, distance_m, np.nan))
+    return (jammer_erp - np.asarray(radar_erp_dbw, dtype=float) + _FOUR_PI_DB + spreading
+            - 10 * math.log10(rcs_m2) - bandwidth_loss)
+
+
+def burn_through_range_km(js_db, distance_km, required_js_db: float = DEFAULT_REQUIRED_JS_DB) -> np.ndarray:
+    """J/S'nin gereken değere indiği menzil (km): J/S, R² ile değişir."""
+    return np.asarray(distance_km, dtype=float) * 10 ** ((required_js_db - np.asarray(js_db, dtype=float)) / 20)
+
+
+def best_jamming(count: int, rows: np.ndarray, codes: np.ndarray, jammer_erp_dbw: np.ndarray,
+                 jammer_bandwidth_mhz: np.ndarray, radar_erp_dbw: np.ndarray, radar_pw_us: np.ndarray,
+                 distance_km: np.ndarray, rcs_m2: float = DEFAULT_RCS_M2,
+                 required_js_db: float = DEFAULT_REQUIRED_JS_DB):
+    """Uygulama tablosundan (senaryo satırı, karıştırıcı kodu) senaryo başına en yüksek J/S, yanma menzili ve J/S'yi
+    veren ilk uygulamanın kodu (-1: hesaplanamadı).
+
+    Karıştırıcı dizileri koda, radar ve mesafe dizileri senaryo satırına göre dizilidir.
+    """
+    js = jamming_to_signal_db(jammer_erp_dbw[codes], jammer_bandwidth_mhz[codes], radar_erp_dbw[rows],
+                              radar_pw_us[rows], distance_km[rows], rcs_m2)
+    best = np.full(count, -np.inf)
+    # fmax NaN'ları (eksik girdili uygulamaları) yok sayar.
+    np.fmax.at(best, rows, js)
+    best[np.isinf(best)] = np.nan
+    # Her senaryoda en yüksek J/S'yi veren ilk uygulama
+    winners = np.flatnonzero(js == best[rows])
+    winner_rows, first = np.unique(rows[winners], return_index=True)
+    best_code = np.full(count, -1)
+    best_code[winner_rows] = codes[winners[first]]
+    return best, burn_through_range_km(best, distance_km, required_js_db), best_code
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+class JammingResultView:
+    """Hesaplayıcının sonuçlarının belirli bir andaki salt okunur görünümü (bkz. JammingCalculator.result_view).
+
+    Hesaplayıcıyı değiştirmediğinden başka iş parçacığında okunabilir. Sonradan değişen senaryolar için eski sonucu
+    verebilir; kullanan, sonucun geçerliliğini kendi revizyonuyla denetler.
+    """
+
+    def __init__(self, row_of: Dict[str, int], js: np.ndarray, burn_through: np.ndarray, teknik: np.ndarray):
+        self._row_of = row_of
+        self._js, self._burn_through, self._teknik = js, burn_through, teknik
+
+    def result(self, senaryo_id: str) -> Optional[JammingResult]:
+        row = self._row_of.get(senaryo_id)
+        if row is None or row >= len(self._js): return None
+        return _result_at(self._js, self._burn_through, self._teknik, row)
+
+
+def _result_at(js: np.ndarray, burn_through: np.ndarray, teknik: np.ndarray, row: int) -> JammingResult:
+    js_db, burn_through_km = js.item(row), burn_through.item(row)
+    # NaN kendisine eşit değildir: hesaplanamayan değerler None olur.
+    return JammingResult(js_db if js_db == js_db else None,
+                         burn_through_km if burn_through_km == burn_through_km else None, teknik[row])
+
+
+def noise_params(teknik: Optional[Teknik]):
+    """Tekniğin J/S'ye giren parametreleri (ERP, bant genişliği); gücü bilinen gürültü karıştırması değilse None."""
+    if teknik is None or not isinstance(teknik.parametreler, GurultuKaristirmaParams): return None
+    if teknik.parametreler.guc_erp_dbw is None: return None
+    return teknik.parametreler.guc_erp_dbw, teknik.parametreler.bant_genisligi_mhz
+
+
+class JammingCalculator(QObject):
+    """Senaryoların J/S ve yanma menzili sonuçları; sonuçlar senaryo başına önbelleklenir.
+
+    Önbellekte olmayan ilk sonuç istendiğinde tüm senaryolar tek NumPy hesabıyla hesaplanır; sonra yalnızca değişen
+    senaryolar ve hedef radarı ya da uygulanan tekniği değişenler birlikte yeniden hesaplanır. Sonuçlar senaryo
+    satırlarıyla hizalı dizilerde tutulur; JammingResult yalnızca istenen senaryo için üretilir.
+    """
+
+    # Radar ya da teknik değişikliği başka senaryoların sonuçlarını düşürdü; tablolar ilgili sütunları yeniler.
+    results_invalidated = Signal()
+
+    def __init__(self, data_manager, rcs_m2: float = DEFAULT_RCS_M2, required_js_db: float = DEFAULT_REQUIRED_JS_DB):
+        # DataManager'ın çocuğu olarak yaşar; sinyal bağlantıları onunla birlikte kopar.
+        super().__init__(data_manager)
+        if rcs_m2 <= 0:
+            raise ValueError("Radar kesit alanı sıfırdan büyük olmalıdır.")
+        self._data_manager = data_manager
+        # Radar ERP/PW sütunları katalogdan okunur. Katalog önce kurulur ki radar değişikliğinde onun sütunları
+        # bu nesnenin yeniden hesabından önce güncellensin.
+        self._catalog = data_manager.radar_catalog()
+        self.rcs_m2 = rcs_m2
+        self.required_js_db = required_js_db
+        # Son results_invalidated ile sonucu düşen senaryolar; tüm sonuçlar düştüyse None.
+        self._invalidated = None
+        self._clear()
+        data_manager.item_inserted.connect(self._on_item_changed)
+        data_manager.item_updated.connect(self._on_item_changed)
+        data_manager.item_removed.connect(self._on_item_changed)
+        data_manager.items_reset.connect(self._on_items_reset)
+
+    def result(self, senaryo_id: str) -> Optional[JammingResult]:
+        """Senaryonun sonucu; senaryo yoksa None. Hesaplanamayan alanlar (eksik girdi) None'dır."""
+        row = self._row_of.get(senaryo_id)
+        if row is None or senaryo_id in self._dirty:
+            self._fill_missing(senaryo_id)
+            row = self._row_of.get(senaryo_id)
+            if row is None: return None
+        return _result_at(self._js, self._burn_through, self._teknik, row)
+
+    def result_view(self) -> JammingResultView:
+        """Eksik sonuçları hesaplar ve tüm sonuçların salt okunur görünümünü döndürür."""
+        if not self._complete or self._dirty:
+            self._fill_missing()
+        # Diziler büyürken yenileriyle değiştirilir, satır tablosuna ise yalnızca yeni senaryolar eklenir: görünümdeki
+        # senaryoların satırları geçerli kalır.
+        return JammingResultView(self._row_of, self._js, self._burn_through, self._teknik)
+
+    def invalidated_ids(self) -> Optional[Set[str]]:
+        """Son results_invalidated sinyaliyle sonucu düşen senaryolar; tüm sonuçlar düştüyse None."""
+        return self._invalidated
+
+    def results(self, senaryo_ids: Iterable[str]) -> Dict[str, JammingResult]:
+        """Verilen senaryoların sonuçları (bulunmayan senaryolar atlanır)."""
+        found = {}
+        for senaryo_id in senaryo_ids:
+            cached = self.result(senaryo_id)
+            if cached is not None:
+                found[senaryo_id] = cached
+        return found
+
+    def evaluate(self, senaryolar: List[Senaryo]) -> List[JammingResult]:
+        """Senaryoların sonuçlarını önbelleğe bakmadan tek seferde hesaplar (kaydedilmemiş senaryolar da olabilir)."""
+        js, burn_through, teknik_ids = self._compute(senaryolar, self._noise_table())
+        return [JammingResult(_optional(js_db), _optional(range_km), teknik_id)
+                for js_db, range_km, teknik_id in zip(js.tolist(), burn_through.tolist(), teknik_ids.tolist())]
+
+    def _noise_table(self) -> Dict[str, tuple]:
+        """Gücü bilinen gürültü karıştırma teknikleri: teknik_id -> (ERP, bant genişliği)."""
+        table = {}
+        for teknik in self._data_manager.get_items(Teknik):
+            params = noise_params(teknik)
+            if params is not None:
+                table[teknik.teknik_id] = params
+        return table
+
+    def _compute(self, senaryolar: List[Senaryo], noise: Dict[str, tuple]):
+        """(J/S, yanma menzili, en iyi teknik_id) dizileri; girdiler kayıtlardan bir kez okunup dizilere dökülür."""
+        count = len(senaryolar)
+        columns = self._catalog.columns()
+        radar_row = {radar_id: row for row, radar_id in enumerate(columns["radar_id"].tolist())}
+        # Dizilerin sonuna NaN eklenir: bulunamayan radar/teknik (-1) NaN girdi verir.
+        radar_erp = np.append(columns["erp_dbw"], np.nan)
+        radar_pw = np.append(columns["pw_us"], np.nan)
+        radars = np.fromiter((radar_row.get(senaryo.radar_id, -1) for senaryo in senaryolar), dtype=np.int64,
+                             count=count)
+        distance = np.array([senaryo.mesafe_km for senaryo in senaryolar], dtype=float)
+
+        noise_ids = np.array(list(noise) + [None], dtype=object)
+        # Gürültü tekniği olmayan ya da kütüphanede bulunmayan teknikler -1 kodunu alır.
+        noise_code = collections.defaultdict(lambda: -1, ((teknik_id, code) for code, teknik_id in enumerate(noise)))
+        noise_erp = np.array([params[0] for params in noise.values()] + [np.nan], dtype=float)
+        noise_bandwidth = np.array([params[1] for params in noise.values()] + [np.nan], dtype=float)
+
+        # Uygulamalar düzleştirilir: (senaryo satırı, gürültü tekniği kodu)
+        chains = [senaryo.uygulanan_teknikler for senaryo in senaryolar]
+        lengths = np.fromiter(map(len, chains), dtype=np.int64, count=count)
+        codes = np.fromiter(map(noise_code.__getitem__, [uygulama.teknik_id for chain in chains for uygulama in chain]),
+                            dtype=np.int64, count=int(lengths.sum()))
+        rows = np.repeat(np.arange(count), lengths)
+        noise_applied = codes >= 0
+        rows, codes = rows[noise_applied], codes[noise_applied]
+
+        best, burn_through, best_code = best_jamming(count, rows, codes, noise_erp, noise_bandwidth, radar_erp[radars],
+                                                     radar_pw[radars], distance, self.rcs_m2, self.required_js_db)
+        return best, burn_through, noise_ids[best_code]
+
+    # --- Önbellek ---
+
+    def _fill_missing(self, requested_id: Optional[str] = None):
+        """Eksik sonuçları tek seferde hesaplar: ilk çağrıda tüm senaryolar, sonra yalnızca düşürülenler."""
+        if self._complete:
+            senaryo_map = self._data_manager.item_map(Senaryo)
+            senaryolar = [senaryo for senaryo in map(senaryo_map.get, self._dirty | {requested_id})
+                          if senaryo is not None]
+            rows = []
+            for senaryo in senaryolar:
+                row = self._row_of.get(senaryo.senaryo_id)
+                if row is None:
+                    row = self._row_of[senaryo.senaryo_id] = self._append_row()
+                rows.append(row)
+            rows = np.array(rows, dtype=np.int64)
+        else:
+            senaryolar = self._data_manager.get_items(Senaryo)
+            self._allocate(len(senaryolar))
+            self._row_of = {senaryo.senaryo_id: row for row, senaryo in enumerate(senaryolar)}
+            rows = slice(0, len(senaryolar))
+        # Teknik değişikliğinin sonucu etkileyip etkilemediği bu tabloyla karşılaştırılarak anlaşılır.
+        self._noise = self._noise_table()
+        self._js[rows], self._burn_through[rows], self._teknik[rows] = self._compute(senaryolar, self._noise)
+        self._senaryo_ids[rows] = [senaryo.senaryo_id for senaryo in senaryolar]
+        self._radar[rows] = [senaryo.radar_id for senaryo in senaryolar]
+        self._complete = True
+        self._dirty.clear()
+
+    def _allocate(self, count: int):
+        capacity = max(count, 16)
+        self._count = count
+        self._js = np.full(capacity, np.nan)
+        self._burn_through = np.full(capacity, np.nan)
+        self._teknik = np.empty(capacity, dtype=object)
+        self._senaryo_ids = np.empty(capacity, dtype=object)
+        # Sonucun hesaplandığı anki hedef radar; radar değişince bağlı satırlar buradan bulunur.
+        self._radar = np.empty(capacity, dtype=object)
+
+    def _append_row(self) -> int:
+        if self._count == len(self._js):
+            capacity = 2 * len(self._js)
+            self._js = np.append(self._js, np.full(capacity - self._count, np.nan))
+            self._burn_through = np.append(self._burn_through, np.full(capacity - self._count, np.nan))
+            self._teknik = np.append(self._teknik, np.empty(capacity - self._count, dtype=object))
+            self._senaryo_ids = np.append(self._senaryo_ids, np.empty(capacity - self._count, dtype=object))
+            self._radar = np.append(self._radar, np.empty(capacity - self._count, dtype=object))
+        self._count += 1
+        return self._count - 1
+
+    def _clear(self):
+        self._row_of: Dict[str, int] = {}
+        # Önbellek tüm senaryoları kapsıyorsa eksik sonuçlar yalnızca _dirty'dekilerdir.
+        self._complete = False
+        self._dirty = set()
+        self._noise = {}
+        self._allocate(0)
+
+    def _on_item_changed(self, item_type: type, item_id: str, row: int):
+        if item_type is Senaryo:
+            if not self._complete: return
+            # Yeni ya da değişen senaryo bir sonraki toplu hesaba girer. Silinen senaryonun satırı boş kalır.
+            if self._data_manager.item_exists(item_id, Senaryo):
+                self._dirty.add(item_id)
+            else:
+                old_row = self._row_of.pop(item_id, None)
+                if old_row is not None:
+                    self._senaryo_ids[old_row] = self._radar[old_row] = None
+                self._dirty.discard(item_id)
+        elif item_type is Radar and self._complete:
+            # Silinmiş senaryoların satırlarında radar None'dır; eşleşmezler.
+            dependents = np.flatnonzero(self._radar[:self._count] == item_id)
+            if len(dependents) == 0: return
+            self._invalidated = set(self._senaryo_ids[dependents].tolist())
+            self._dirty.update(self._invalidated)
+            self.results_invalidated.emit()
+        elif item_type is Teknik and self._complete:
+            # Yalnızca gürültü karıştırma parametreleri sonucu etkiler; ad/açıklama değişikliği yeniden hesap gerektirmez.
+            if noise_params(self._data_manager.get_item(item_id, Teknik)) == self._noise.get(item_id): return
+            self._clear()
+            self._invalidated = None
+            self.results_invalidated.emit()
+
+    def _on_items_reset(self, item_type: type):
+        if item_type not in (Senaryo, Radar, Teknik): return
+        had_results = self._complete
+        self._clear()
+        # Senaryo listesi baştan kurulduğunda tablolar zaten yeniden çizilir.
+        if had_results and item_type is not Senaryo:
+            self._invalidated = None
+            self.results_invalidated.emit()
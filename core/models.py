@@ -1,9 +1,32 @@
 # ew_platformasi/core/models.py
 from __future__ import annotations
 
-from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
-from typing import List, Any, Dict
-from core.data_models import ETPlatformu, Teknik, Radar, Senaryo, Gorev
+from collections import OrderedDict
+from functools import partial
+from itertools import compress, repeat
+from operator import attrgetter
+from PySide6.QtCore import QAbstractTableModel, QSortFilterProxyModel, Qt, QModelIndex
+from PySide6.QtGui import QColor
+from typing import List, Any, Callable, Dict, Set, Tuple
+from core.data_models import ETPlatformu, Teknik, Radar, Senaryo, Gorev, SONUC_NITEL
+from core.xml_codec import id_field_name
+from core.search_index import SearchIndex, TextScanner, normalize_search_text
+from core.filter_worker import DebouncedFilter
+from core.rank_index import FlagList
+from core.scenario_analytics import EffectivenessMatrix
+
+# DataManager'a bağlı modellerin bir seferde yüklediği kayıt sayısı
+_PAGE_SIZE = 1000
+# LazyTableModel'in hazır metinlerini tuttuğu satır sayısı (görünür satırlar + filtre/sıralama taramaları)
+_RENDER_CACHE_SIZE = 20000
+
+
+def _jamming_texts(calculator, senaryo_id: str) -> Tuple[str, str]:
+    """Senaryonun J/S (dB) ve yanma menzili (km) sütun metinleri; hesaplanamayanlar '-'."""
+    result = calculator.result(senaryo_id) if calculator is not None else None
+    if result is None: return "-", "-"
+    return ("-" if result.js_db is None else f"{result.js_db:.1f}",
+            "-" if result.burn_through_km is None else f"{result.burn_through_km:.1f}")
 
 
 class BaseTableModel(QAbstractTableModel):
@@ -11,6 +34,10 @@ class BaseTableModel(QAbstractTableModel):
         super().__init__()
         self._data = data or []
         self._headers = []
+        self._data_manager = None
+        self._item_type = None
+        # Bağlı modellerde listedeki toplam kayıt sayısı; _data bunun yüklenmiş ilk kısmıdır.
+        self._total_count = None
 
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
         if role == Qt.ItemDataRole.DisplayRole and index.isValid():
@@ -38,104 +65,710 @@ class BaseTableModel(QAbstractTableModel):
 
     def refresh_data(self, new_data: List[Any], **kwargs):
         self.beginResetModel()
-        self._data = new_data
+        # Modelin kendi kopyası: satır sinyalleri bu listeye uygulanır.
+        self._data = list(new_data)
+        self._total_count = None
         self._handle_extra_args(**kwargs)
         self.endResetModel()
 
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._total_count is not None and len(self._data) < self._total_count
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        """Görünüm listenin sonuna kaydırıldıkça sıradaki sayfayı DataManager'dan okur."""
+        if not self.canFetchMore(parent): return
+        page = self._fetch_page(len(self._data), _PAGE_SIZE)
+        if not page:
+            self._total_count = len(self._data)
+            return
+        first = len(self._data)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._data.extend(page)
+        self.endInsertRows()
+
+    def _fetch_page(self, offset: int, limit: int) -> List[Any]:
+        return self._data_manager.get_items_page(self._item_type, offset, limit)
+
+    def _reload_first_page(self):
+        self.beginResetModel()
+        self._data = self._fetch_page(0, _PAGE_SIZE)
+        self._total_count = self._data_manager.item_count(self._item_type)
+        self.endResetModel()
+
     def _handle_extra_args(self, **kwargs):
         pass # Alt sınıflar override edebilir
 
+    def bind(self, data_manager, item_type: type):
+        """Modeli DataManager'ın verilen tipteki satır sinyallerine bağlar ve mevcut listeyle doldurur.
+
+        Tek bir kaydın eklenmesi, güncellenmesi veya silinmesi modeli sıfırlamaz; seçim, kaydırma ve sıralama korunur.
+        Kayıtlar sayfa sayfa yüklenir (canFetchMore/fetchMore); henüz yüklenmemiş satırlardaki değişiklikler yalnızca sayılır.
+        """
+        self._data_manager = data_manager
+        self._item_type = item_type
+        data_manager.item_inserted.connect(self._on_item_inserted)
+        data_manager.item_updated.connect(self._on_item_updated)
+        data_manager.item_removed.connect(self._on_item_removed)
+        data_manager.items_reset.connect(self._on_items_reset)
+        self._reload_first_page()
+
+    def _on_item_inserted(self, item_type: type, item_id: str, row: int):
+        if item_type is not self._item_type: return
+        self._total_count += 1
+        if row > len(self._data): return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._data.insert(row, self._data_manager.get_item(item_id, item_type))
+        self.endInsertRows()
+
+    def _on_item_updated(self, item_type: type, item_id: str, row: int):
+        if item_type is not self._item_type: return
+        if row >= len(self._data): return
+        self._data[row] = self._data_manager.get_item(item_id, item_type)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def _on_item_removed(self, item_type: type, item_id: str, row: int):
+        if item_type is not self._item_type: return
+        self._total_count -= 1
+        if row >= len(self._data): return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._data[row]
+        self.endRemoveRows()
+
+    def _on_items_reset(self, item_type: type):
+        if item_type is not self._item_type: return
+        self._reload_first_page()
+
+    def update_extra_args(self, columns: List[int], **kwargs):
+        """Eşleme tablolarını (ör. platform_map) modeli sıfırlamadan günceller; yalnızca ilgili sütunlar yeniden çizilir."""
+        self._handle_extra_args(**kwargs)
+        if self._data:
+            last_row = len(self._data) - 1
+            for column in columns:
+                self.dataChanged.emit(self.index(0, column), self.index(last_row, column))
+
+
+class LazyTableModel(BaseTableModel):
+    """Çok büyük listeler için model: satırlar sayfa sayfa yüklenir, her satırın tüm sütun metinleri bir kez
+    üretilip kayıt id'sine göre LRU önbellekte tutulur.
+
+    Alt sınıflar get_display_data yerine render_row'u tanımlar. Görünüm aynı satırı tekrar tekrar sorduğunda
+    hücre başına yeni liste kurulmaz; kayıt güncellenince yalnızca onun satırı düşer.
+
+    Sıralama ve filtre proxy'de değil burada yapılır (bkz. LazySortFilterProxyModel). Sıralıyken tüm kayıtlar sütun
+    metnine göre bir kez sıralanır; filtre, arama dizinindeki (SearchIndex) normalize edilmiş satır metinlerinde aranır.
+    Tek kayıt değişiklikleri bu listelere yerinde uygulanır.
+    """
+
+    # update_extra_args'taki eşleme tablosu -> tablonun anahtarını taşıyan kayıt alanı (ör. radar_map -> radar_id).
+    # Tablonun bir kopyası tutulur; değişiklikte yalnızca adı değişen anahtarlara bağlı satırlar yenilenir.
+    MAP_FIELDS: Dict[str, str] = {}
+
+    def __init__(self, data: List[Any] = None):
+        super().__init__(data)
+        self._render_cache = OrderedDict()
+        self._map_copies = {}
+        self._id_field = None
+        self._search_index = SearchIndex(self.render_row)
+        # Sıralama (sütun, yön); None ise depo sırası. Filtre normalize edilmiş sorgudur; "" ise filtre yok.
+        self._sort_order = None
+        self._filter = ""
+        # İsteğe bağlı id kümesi (ör. radar kataloğu sorgusunun sonucu); metin filtresiyle birlikte uygulanır.
+        self._row_filter = None
+        # Sıralama ya da filtre kullanıldığında tüm kayıtlar görüntülenme sırasıyla _all_items'ta tutulur.
+        # _all_keys (sıralıyken) ve _all_texts (ilk aramadan sonra) bu listeyle hizalıdır; filtre temizlense de
+        # korunur, sonraki aramalar yalnızca eşleştirme yapar.
+        self._all_items = None
+        self._all_keys = None
+        self._key_by_id = {}
+        self._all_texts = None
+        # Filtreliyken _all_items'ın taranmış ilk kısmının eşleşme maskesi (FlagList; görünür satır numarası
+        # önek sayımıyla bulunur). Tarama sayfa sayfa ilerler: bir tuş vuruşu yalnızca ilk sayfayı dolduracak
+        # kadar metne bakar. Bulunan tüm satırlar _data'dadır.
+        self._all_matches = None
+        # _all_texts üzerinde tarayıcı; metinler değişince düşürülür, sonraki taramada yeniden kurulur.
+        self._scanner = None
+        # _all_items ya da _all_texts her değiştiğinde artar; arka planda hesaplanan eşleşme maskesi yalnızca
+        # hesaplandığı revizyonda uygulanır (bkz. DebouncedFilter).
+        self._revision = 0
+
+    def render_row(self, item: Any) -> Tuple[str, ...]:
+        raise NotImplementedError
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rendered(self._data[index.row()])[index.column()]
+        return None
+
+    def get_display_data(self, item: Any, column: int) -> str:
+        return self._rendered(item)[column]
+
+    def _rendered(self, item: Any) -> Tuple[str, ...]:
+        key = getattr(item, self._id_field) if self._id_field else id(item)
+        cache = self._render_cache
+        row = cache.get(key)
+        if row is None:
+            row = cache[key] = self.render_row(item)
+            if len(cache) > _RENDER_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return row
+
+    def bind(self, data_manager, item_type: type):
+        self._id_field = id_field_name(item_type)
+        super().bind(data_manager, item_type)
+
+    def refresh_data(self, new_data: List[Any], **kwargs):
+        self._render_cache.clear()
+        super().refresh_data(new_data, **kwargs)
+
+    # --- Sıralama ve filtre ---
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        if self._data_manager is None: return
+        self._sort_order = (column, order) if column >= 0 else None
+        self._reload_first_page()
+
+    def set_filter(self, text: str):
+        """Satırlardan herhangi bir sütununda metni (büyük/küçük harf ve i/ı farkı gözetmeden) içerenleri gösterir."""
+        if self._data_manager is None: return
+        query = normalize_search_text(text)
+        if query == self._filter: return
+        self._filter = query
+        if self._all_items is None:
+            self._reload_first_page()
+            return
+        # Sıra hazır: yalnızca eşleştirme yeniden başlar.
+        self.beginResetModel()
+        self._apply_filter()
+        self.endResetModel()
+
+    def set_row_filter(self, item_ids: Set[str] | None):
+        """Yalnızca id'si kümede olan kayıtları gösterir; None kısıtı kaldırır. Metin filtresiyle birlikte uygulanır."""
+        if self._data_manager is None: return
+        if item_ids == self._row_filter: return
+        self._row_filter = item_ids
+        if self._all_items is None:
+            self._reload_first_page()
+            return
+        self.beginResetModel()
+        self._apply_filter()
+        self.endResetModel()
+
+    def _is_filtered(self) -> bool:
+        return bool(self._filter) or self._row_filter is not None
+
+    def _matches_at(self, position: int) -> bool:
+        if self._filter and self._filter not in self._all_texts[position]:
+            return False
+        return self._row_filter is None or getattr(self._all_items[position], self._id_field) in self._row_filter
+
+    def search_snapshot(self, text: str) -> Tuple[str, int, TextScanner | None, Callable | None] | None:
+        """Arka plan taraması için (normalize sorgu, revizyon, tarayıcı, metin kurucu); model bağlı değilse None.
+
+        Tarayıcı hazır değilse metin kurucu verilir: listenin kopyası üzerinde çalışan, başka iş parçacığında
+        çağrılacak fonksiyondur (bkz. SearchIndex.build_texts). Metinler ve tarayıcı böylece GUI'yi bekletmez.
+        """
+        if self._data_manager is None: return None
+        if self._all_items is None:
+            # Yüklü satırlar depo sırasının başıdır; tam liste aynı sırayla kurulduğundan model sıfırlanmaz.
+            self._build_all_items()
+        query = normalize_search_text(text)
+        if self._scanner is not None:
+            return query, self._revision, self._scanner, None
+        if self._all_texts is not None:
+            # Metinler kayıt değişikliklerinde yerinde güncel tutulur; yalnızca tarayıcı yeniden kurulur.
+            texts = list(self._all_texts)
+            return query, self._revision, None, lambda cancelled: (texts, {})
+        return query, self._revision, None, partial(self._search_index.build_texts, list(self._all_items),
+                                                    self._id_field, self._search_renderer())
+
+    def _search_renderer(self) -> Callable[[Any], Tuple[str, ...]]:
+        """Arka planda metin kurarken kullanılan render_row; GUI iş parçacığındaki durumu değiştirmemelidir."""
+        return self.render_row
+
+    def apply_filter_result(self, query: str, revision: int, mask: List[bool], built: Tuple | None = None) -> bool:
+        """search_snapshot ile hesaplanmış tam eşleşme maskesini tek sıfırlamayla uygular.
+
+        built, taramada kurulan (metinler, dizine eklenecek yeni metinler, tarayıcı) üçlüsüdür; model onları benimser.
+        Tarama sürerken liste değiştiyse (revizyon farklı) hiçbir şey yapmaz ve False döndürür.
+        """
+        if self._data_manager is None or revision != self._revision: return False
+        if built is not None:
+            self._all_texts, new_texts, self._scanner = built
+            self._search_index.add(new_texts)
+        if self._row_filter is not None:
+            allowed, id_field = self._row_filter, self._id_field
+            mask = [matched and getattr(item, id_field) in allowed for matched, item in zip(mask, self._all_items)]
+        self.beginResetModel()
+        self._filter = query
+        self._all_matches = FlagList(mask)
+        self._data = list(compress(self._all_items, mask))
+        self._total_count = None
+        self.endResetModel()
+        return True
+
+    def _apply_filter(self):
+        if not self._is_filtered():
+            self._all_matches = None
+            self._data = self._all_items[:_PAGE_SIZE]
+            self._total_count = len(self._all_items)
+            return
+        if self._filter and self._all_texts is None:
+            self._all_texts = self._search_index.texts_for(self._all_items, self._id_field)
+        self._all_matches = FlagList()
+        self._data = self._scan_matches(_PAGE_SIZE)
+        self._total_count = None
+
+    def _scan_matches(self, limit: int) -> List[Any]:
+        """Taranmamış kayıtlarda en fazla limit eşleşme bulana ya da liste bitene kadar arar."""
+        if self._filter and self._scanner is None:
+            self._scanner = TextScanner(self._all_texts)
+        matches, items = self._all_matches, self._all_items
+        allowed, id_field = self._row_filter, self._id_field
+        start = next_row = len(matches)
+        found = []
+        while len(found) < limit and next_row < len(items):
+            if self._filter:
+                rows, next_row = self._scanner.scan(self._filter, next_row, limit - len(found))
+            else:
+                rows = range(next_row, min(len(items), next_row + limit))
+                next_row = rows.stop
+            if allowed is not None:
+                rows = [row for row in rows if getattr(items[row], id_field) in allowed]
+            found.extend(rows)
+        matches.extend(repeat(False, next_row - start))
+        for row in found:
+            matches[row] = True
+        return [items[row] for row in found]
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if self._all_matches is not None:
+            return not parent.isValid() and len(self._all_matches) < len(self._all_items)
+        return super().canFetchMore(parent)
+
+    def _sort_key(self, item: Any) -> str:
+        value = self.render_row(item)[self._sort_order[0]]
+        return "" if value is None else str(value)
+
+    def _build_all_items(self):
+        items = self._data_manager.get_items(self._item_type)
+        self._all_texts = self._all_matches = self._scanner = None
+        self._revision += 1
+        if self._sort_order is None:
+            self._all_items, self._all_keys, self._key_by_id = list(items), None, {}
+            return
+        # Kayıtlar sıralama düzeninde erişilir; veritabanı görünümü de bir kez okunup listeye alınır.
+        items = list(items)
+        # Önbelleği doldurmamak için anahtarlar doğrudan render_row ile üretilir.
+        keys = [self._sort_key(item) for item in items]
+        # Python'un sıralaması kararlıdır (reverse=True'da da): eşit anahtarlı kayıtlar depo sırasında kalır.
+        order = sorted(range(len(items)), key=keys.__getitem__,
+                       reverse=self._sort_order[1] == Qt.SortOrder.DescendingOrder)
+        self._all_items = [items[i] for i in order]
+        self._all_keys = [keys[i] for i in order]
+        self._key_by_id = {getattr(item, self._id_field): key for item, key in zip(items, keys)}
+
+    def _bisect(self, key: str, after_equal: bool) -> int:
+        """Anahtarın sıralı listedeki yeri: eşit anahtarların önü ya da (after_equal) arkası."""
+        keys = self._all_keys
+        descending = self._sort_order[1] == Qt.SortOrder.DescendingOrder
+        low, high = 0, len(keys)
+        while low < high:
+            middle = (low + high) // 2
+            current = keys[middle]
+            if descending:
+                goes_before = key > current or (key == current and not after_equal)
+            else:
+                goes_before = key < current or (key == current and not after_equal)
+            if goes_before:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def _position_of(self, item_id: str, store_row: int) -> int | None:
+        """Kaydın _all_items içindeki yeri. Depo sırasında DataManager'ın satırıyla aynıdır."""
+        if self._sort_order is None:
+            return store_row
+        # Kayıt yerinde değiştirilmiş olabilir; listedeki yerini eski anahtarı belirler.
+        key = self._key_by_id.get(item_id)
+        if key is None: return None
+        keys, items = self._all_keys, self._all_items
+        position = self._bisect(key, after_equal=False)
+        while position < len(keys) and keys[position] == key:
+            if getattr(items[position], self._id_field) == item_id:
+                return position
+            position += 1
+        return None
+
+    def _visible_row(self, position: int) -> int | None:
+        """_all_items'taki yerin model satırı; filtreden geçmeyen ya da henüz taranmamış kayıtlar için None."""
+        matches = self._all_matches
+        if matches is None:
+            return position
+        if position >= len(matches) or not matches[position]:
+            return None
+        return matches.rank(position)
+
+    def _insert_at(self, position: int, item: Any, item_id: str):
+        if self._sort_order is not None:
+            key = self._key_by_id[item_id] = self._sort_key(item)
+            self._all_keys.insert(position, key)
+        if self._all_texts is not None:
+            self._all_texts.insert(position, self._search_index.text_of(item_id, item))
+            self._scanner = None
+        self._revision += 1
+        matches = self._all_matches
+        scan_complete = matches is not None and len(matches) == len(self._all_items)
+        self._all_items.insert(position, item)
+        if matches is None:
+            self._total_count += 1
+            self._insert_loaded_row(position, item)
+        elif position < len(matches) or scan_complete:
+            # Taranmış bölgeye düşen kayıt hemen eşleştirilir; ilerisi tarama sırasında bulunur.
+            matches.insert(position, self._matches_at(position))
+            if matches[position]:
+                self._insert_loaded_row(self._visible_row(position), item)
+
+    def _remove_at(self, position: int):
+        row = self._visible_row(position)
+        if self._all_keys is not None:
+            self._key_by_id.pop(getattr(self._all_items[position], self._id_field), None)
+            del self._all_keys[position]
+        del self._all_items[position]
+        if self._all_texts is not None:
+            del self._all_texts[position]
+            self._scanner = None
+        self._revision += 1
+        if self._all_matches is None:
+            self._total_count -= 1
+        elif position < len(self._all_matches):
+            del self._all_matches[position]
+        if row is not None:
+            self._remove_loaded_row(row)
+
+    def _insert_loaded_row(self, row: int, item: Any):
+        if row <= len(self._data):
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._data.insert(row, item)
+            self.endInsertRows()
+
+    def _remove_loaded_row(self, row: int):
+        if row < len(self._data):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._data[row]
+            self.endRemoveRows()
+
+    def _replace_loaded_row(self, row: int, item: Any):
+        if row < len(self._data):
+            self._data[row] = item
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    # --- Sayfalar ve satır sinyalleri ---
+
+    def _fetch_page(self, offset: int, limit: int) -> List[Any]:
+        if self._all_matches is not None:
+            return self._scan_matches(limit)
+        if self._all_items is not None:
+            return self._all_items[offset:offset + limit]
+        return super()._fetch_page(offset, limit)
+
+    def _reload_first_page(self):
+        self._render_cache.clear()
+        if self._sort_order is None and not self._is_filtered():
+            self._all_items = self._all_keys = self._all_texts = self._all_matches = self._scanner = None
+            self._key_by_id = {}
+            self._revision += 1
+            super()._reload_first_page()
+            return
+        self.beginResetModel()
+        self._build_all_items()
+        self._apply_filter()
+        self.endResetModel()
 
-class PlatformTableModel(BaseTableModel):
+    def _on_item_inserted(self, item_type: type, item_id: str, row: int):
+        if item_type is not self._item_type: return
+        if self._all_items is None:
+            super()._on_item_inserted(item_type, item_id, row)
+            return
+        item = self._data_manager.get_item(item_id, item_type)
+        position = row if self._sort_order is None else self._bisect(self._sort_key(item), after_equal=True)
+        self._insert_at(position, item, item_id)
+
+    def _on_item_updated(self, item_type: type, item_id: str, row: int):
+        if item_type is not self._item_type: return
+        position = self._position_of(item_id, row) if self._all_items is not None else None
+        self._render_cache.pop(item_id, None)
+        self._search_index.discard(item_id)
+        if self._all_items is None:
+            super()._on_item_updated(item_type, item_id, row)
+            return
+        if position is None: return
+        item = self._data_manager.get_item(item_id, item_type)
+        if self._sort_order is not None and self._all_keys[position] != self._sort_key(item):
+            # Sıralama anahtarı değişti: kayıt yeni yerine taşınır.
+            self._remove_at(position)
+            self._insert_at(self._bisect(self._sort_key(item), after_equal=True), item, item_id)
+            return
+
+        old_row = self._visible_row(position)
+        self._all_items[position] = item
+        # Arka planda kurulan metinler eski kaydı taşıyabilir; revizyon her güncellemede artar.
+        self._revision += 1
+        if self._all_texts is not None:
+            self._all_texts[position] = self._search_index.text_of(item_id, item)
+            self._scanner = None
+        matches = self._all_matches
+        if matches is not None and position < len(matches):
+            matches[position] = self._matches_at(position)
+        new_row = self._visible_row(position)
+        if old_row is not None and new_row is not None:
+            self._replace_loaded_row(new_row, item)
+        elif old_row is not None:
+            self._remove_loaded_row(old_row)
+        elif new_row is not None:
+            self._insert_loaded_row(new_row, item)
+
+    def _on_item_removed(self, item_type: type, item_id: str, row: int):
+        if item_type is not self._item_type: return
+        position = self._position_of(item_id, row) if self._all_items is not None else None
+        self._render_cache.pop(item_id, None)
+        self._search_index.discard(item_id)
+        if self._all_items is None:
+            super()._on_item_removed(item_type, item_id, row)
+            return
+        if position is not None:
+            self._remove_at(position)
+
+    def _on_items_reset(self, item_type: type):
+        if item_type is not self._item_type: return
+        self._search_index.clear()
+        super()._on_items_reset(item_type)
+
+    def update_extra_args(self, columns: List[int], **kwargs):
+        # Eşleme tablosu değişti: önbellekteki satırlar eski isimleri taşır. Arka planda kurulan metinler de eskidir.
+        self._render_cache.clear()
+        self._revision += 1
+        changed = self._changed_keys(columns, kwargs)
+        for name in kwargs.keys() & self.MAP_FIELDS.keys():
+            self._map_copies[name] = dict(kwargs[name])
+        if self._all_items is None:
+            self._search_index.clear()
+        elif self._sort_order is not None and self._sort_order[0] in columns:
+            # Sıralama anahtarları değişti; liste yeniden kurulur.
+            self._search_index.clear()
+            self._handle_extra_args(**kwargs)
+            self._reload_first_page()
+            return
+        elif changed is None:
+            # Hangi satırların etkilendiği bilinmiyor: metinler düşer, filtre varsa eşleşmeler baştan aranır.
+            self._search_index.clear()
+            self._all_texts = self._scanner = None
+            if self._filter:
+                self._handle_extra_args(**kwargs)
+                self._reload_first_page()
+                return
+        else:
+            self._handle_extra_args(**kwargs)
+            self._refresh_rows(changed)
+        super().update_extra_args(columns, **kwargs)
+
+    def _changed_keys(self, columns: List[int], kwargs: Dict[str, Any]) -> List[Tuple[str, Set]] | None:
+        """update_extra_args'ın etkilediği kayıtlar: (kayıt alanı, adı değişen anahtarlar) listesi; bilinmiyorsa None."""
+        if not kwargs: return None
+        changed = []
+        for name, names in kwargs.items():
+            old = self._map_copies.get(name)
+            if name not in self.MAP_FIELDS or old is None: return None
+            changed.append((self.MAP_FIELDS[name],
+                            {key for key in old.keys() | names.keys() if old.get(key) != names.get(key)}))
+        return changed
+
+    def _refresh_rows(self, changed: List[Tuple[str, Set]]):
+        """Alanı değişen anahtarlardan birini taşıyan kayıtların arama metnini ve eşleşmesini yerinde yeniler."""
+        items = self._all_items
+        positions = set()
+        for field, keys in changed:
+            if keys:
+                positions.update(compress(range(len(items)), map(keys.__contains__, map(attrgetter(field), items))))
+        if not positions: return
+        positions = sorted(positions)
+        id_field, texts, matches = self._id_field, self._all_texts, self._all_matches
+        for position in positions:
+            self._search_index.discard(getattr(items[position], id_field))
+        if texts is None: return
+        for position in positions:
+            item = items[position]
+            texts[position] = self._search_index.text_of(getattr(item, id_field), item)
+        self._scanner = None
+        if not self._filter or matches is None: return
+        for position in positions:
+            if position >= len(matches): break
+            old_row = self._visible_row(position)
+            matches[position] = self._matches_at(position)
+            new_row = self._visible_row(position)
+            if old_row is not None and new_row is None:
+                self._remove_loaded_row(old_row)
+            elif old_row is None and new_row is not None:
+                self._insert_loaded_row(new_row, items[position])
+
+
+class LazySortFilterProxyModel(QSortFilterProxyModel):
+    """LazyTableModel için proxy: sıralama ve filtre isteklerini kaynak modele iletir, kendisi satırları aynen geçirir.
+
+    QSortFilterProxyModel sıralıyken yüklenen her sayfanın satırlarını tek tek sıralı yerine yerleştirir ve
+    filtrede her satırın her sütununu ayrı ayrı sorar; yüz binlerce satırda ikisi de saniyeler sürer.
+    """
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filter_pipeline = None
+
+    def setFilterFixedString(self, pattern: str):
+        # Arama kutuları her tuşta çağırır: filtre beklemeli ve arka planda hesaplanır (bkz. DebouncedFilter).
+        if self._filter_pipeline is None:
+            self._filter_pipeline = DebouncedFilter(self.sourceModel(), parent=self)
+        self._filter_pipeline.set_text(pattern)
+
+
+class PlatformTableModel(LazyTableModel):
     def __init__(self, data: List[ETPlatformu] = None):
         super().__init__(data)
         self._headers = ["Platform Adı", "Açıklama"]
 
-    def get_display_data(self, item: ETPlatformu, column: int) -> str:
-        return [item.adi, item.aciklama][column]
+    def render_row(self, item: ETPlatformu) -> Tuple[str, ...]:
+        return (item.adi, item.aciklama)
 
 
-class RadarTableModel(BaseTableModel):
+class RadarTableModel(LazyTableModel):
     def __init__(self, data: List[Radar] = None):
         super().__init__(data)
         self._headers = ["Adı", "ELNOT", "Üretici", "Bant", "Görev Tipi"]
 
-    def get_display_data(self, item: Radar, column: int) -> str:
-        return [item.adi, item.elnot, item.uretici, item.frekans_bandi, item.gorev_tipi][column]
+    def render_row(self, item: Radar) -> Tuple[str, ...]:
+        return (item.adi, item.elnot, item.uretici, item.frekans_bandi, item.gorev_tipi)
 
 
-class TeknikTableModel(BaseTableModel):
+class TeknikTableModel(LazyTableModel):
+    MAP_FIELDS = {"platform_map": "platform_id"}
+
     def __init__(self, data: List[Teknik] = None):
         super().__init__(data)
         self._headers = ["Adı", "Kategori", "İlişkili Platform"]
         self._platform_map = {}
 
-    def get_display_data(self, item: Teknik, column: int) -> str:
+    def render_row(self, item: Teknik) -> Tuple[str, ...]:
         platform_adi = self._platform_map.get(item.platform_id, "Belirtilmemiş")
-        return [item.adi, item.kategori, platform_adi][column]
+        return (item.adi, item.kategori, platform_adi)
 
     def _handle_extra_args(self, **kwargs):
         if 'platform_map' in kwargs:
             self._platform_map = kwargs['platform_map']
 
 
-class SenaryoTableModel(BaseTableModel):
+class SenaryoTableModel(LazyTableModel):
+    # Sayı olarak sıralanan sütunlar: J/S ve yanma menzili
+    JAMMING_COLUMNS = [5, 6]
+    MAP_FIELDS = {"platform_map": "et_platformu_id", "radar_map": "radar_id"}
+
     def __init__(self, data: List[Senaryo] = None):
         super().__init__(data)
-        self._headers = ["Senaryo Adı", "Tarih", "Platform", "Hedef Radar", "Sonuç"]
+        self._headers = ["Senaryo Adı", "Tarih", "Platform", "Hedef Radar", "Sonuç", "J/S (dB)", "Yanma Menzili (km)"]
         self._platform_map = {}
         self._radar_map = {}
+        self._jamming_calculator = None
 
-    def get_display_data(self, item: Senaryo, column: int) -> str:
+    def render_row(self, item: Senaryo) -> Tuple[str, ...]:
+        return self._render_with(item, self._jamming_calculator)
+
+    def _render_with(self, item: Senaryo, jamming) -> Tuple[str, ...]:
         platform_adi = self._platform_map.get(item.et_platformu_id, "Bilinmiyor")
         radar_adi = self._radar_map.get(item.radar_id, "Bilinmiyor")
-        return [item.adi, item.tarih_iso, platform_adi, radar_adi, item.sonuc_nitel][column]
+        return (item.adi, item.tarih_iso, platform_adi, radar_adi, item.sonuc_nitel,
+                *_jamming_texts(jamming, item.senaryo_id))
+
+    def _search_renderer(self):
+        # Hesaplayıcı eksik sonuçları istendiğinde hesaplar; arka plan iş parçacığı salt okunur görünümü kullanır.
+        if self._jamming_calculator is None:
+            return self.render_row
+        return partial(self._render_with, jamming=self._jamming_calculator.result_view())
+
+    def _sort_key(self, item: Senaryo):
+        column = self._sort_order[0]
+        if column not in self.JAMMING_COLUMNS or self._jamming_calculator is None:
+            return super()._sort_key(item)
+        # Metin sıralaması "10.0"ı "9.0"ın önüne koyar; sayılar değerleriyle sıralanır, hesaplanamayanlar artan
+        # sıralamada sona düşer.
+        result = self._jamming_calculator.result(item.senaryo_id)
+        value = None if result is None else (result.js_db if column == 5 else result.burn_through_km)
+        return (value is None, value or 0.0)
+
+    def _changed_keys(self, columns, kwargs):
+        if kwargs or self._jamming_calculator is None or not set(columns) <= set(self.JAMMING_COLUMNS):
+            return super()._changed_keys(columns, kwargs)
+        # Sonuçlar yenilendi: etkilenen senaryoları hesaplayıcı bilir.
+        invalidated = self._jamming_calculator.invalidated_ids()
+        return None if invalidated is None else [(self._id_field, invalidated)]
 
     def _handle_extra_args(self, **kwargs):
         if 'platform_map' in kwargs:
             self._platform_map = kwargs['platform_map']
         if 'radar_map' in kwargs:
             self._radar_map = kwargs['radar_map']
+        if 'jamming_calculator' in kwargs:
+            self._jamming_calculator = kwargs['jamming_calculator']
 
 
-class GorevTableModel(BaseTableModel):
+class GorevTableModel(LazyTableModel):
     def __init__(self, data: List[Gorev] = None):
         super().__init__(data)
         self._headers = ["Görev Adı", "Görev Tarihi", "Sorumlu Personel", "Senaryo Sayısı"]
 
-    def get_display_data(self, item: Gorev, column: int) -> str:
-        if column == 0: return item.adi
-        if column == 1: return item.gorev_tarihi_iso
-        if column == 2: return item.sorumlu_personel
-        if column == 3: return str(len(item.senaryo_id_list))
-        return ""
+    def render_row(self, item: Gorev) -> Tuple[str, ...]:
+        return (item.adi, item.gorev_tarihi_iso, item.sorumlu_personel, str(len(item.senaryo_id_list)))
 
 
 class GorevSenaryoTableModel(QAbstractTableModel):
-    def __init__(self, data: List[Senaryo] = None, radar_map: Dict = None, teknik_map: Dict = None):
+    """Seçili görevin senaryoları. Satır metinleri ilk çizimde bir kez üretilip satır başına saklanır; tekrar çizim,
+    fareyle gezinme ve yeniden boyutlandırma yalnızca bu listeden okur.
+
+    Senaryolar, radar ya da teknik kayıtları değiştiğinde görünüm modeli refresh_data'yı çağırır ve önbellek boşaltılır.
+    """
+
+    def __init__(self, data: List[Senaryo] = None, radar_map: Dict = None, teknik_map: Dict = None,
+                 jamming_calculator=None):
         super().__init__()
         self._data = data or []
         self._radar_map = radar_map or {}
         self._teknik_map = teknik_map or {}
-        self._headers = ["Senaryo Adı", "Hedef Radar", "Uygulanan EKT'ler (Sıra, Süre)", "Sonuç"]
+        self._jamming_calculator = jamming_calculator
+        self._rendered_rows = [None] * len(self._data)
+        self._headers = ["Senaryo Adı", "Hedef Radar", "Uygulanan EKT'ler (Sıra, Süre)", "Sonuç", "J/S (dB)",
+                         "Yanma Menzili (km)"]
+
+    def render_row(self, senaryo: Senaryo) -> Tuple[str, ...]:
+        teknik_strings = []
+        sorted_uygulamalar = sorted(senaryo.uygulanan_teknikler, key=lambda u: u.sira)
+        for uygulama in sorted_uygulamalar:
+            teknik_adi = self._teknik_map.get(uygulama.teknik_id, "Bilinmeyen Teknik")
+            teknik_strings.append(f"{uygulama.sira}. {teknik_adi} ({uygulama.sure_sn}sn)")
+        return (senaryo.adi,
+                self._radar_map.get(senaryo.radar_id, "Bilinmiyor"),
+                ", ".join(teknik_strings) if teknik_strings else "Teknik Yok",
+                senaryo.sonuc_nitel,
+                *_jamming_texts(self._jamming_calculator, senaryo.senaryo_id))
 
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
         if role == Qt.ItemDataRole.DisplayRole:
-            senaryo = self._data[index.row()]
-            col = index.column()
-            if col == 0:
-                return senaryo.adi
-            if col == 1:
-                return self._radar_map.get(senaryo.radar_id, "Bilinmiyor")
-            if col == 2:
-                teknik_strings = []
-                sorted_uygulamalar = sorted(senaryo.uygulanan_teknikler, key=lambda u: u.sira)
-                for uygulama in sorted_uygulamalar:
-                    teknik_adi = self._teknik_map.get(uygulama.teknik_id, "Bilinmeyen Teknik")
-                    teknik_strings.append(f"{uygulama.sira}. {teknik_adi} ({uygulama.sure_sn}sn)")
-                return ", ".join(teknik_strings) if teknik_strings else "Teknik Yok"
-            if col == 3:
-                return senaryo.sonuc_nitel
+            row = index.row()
+            rendered = self._rendered_rows[row]
+            if rendered is None:
+                rendered = self._rendered_rows[row] = self.render_row(self._data[row])
+            return rendered[index.column()]
         return None
 
     def rowCount(self, index: QModelIndex = QModelIndex()) -> int:
@@ -149,9 +782,85 @@ class GorevSenaryoTableModel(QAbstractTableModel):
             return self._headers[section]
         return None
 
-    def refresh_data(self, new_data: List[Senaryo], radar_map: Dict, teknik_map: Dict):
+    def refresh_data(self, new_data: List[Senaryo], radar_map: Dict, teknik_map: Dict, jamming_calculator=None):
         self.beginResetModel()
         self._data = new_data
         self._radar_map = radar_map
         self._teknik_map = teknik_map
-        self.endResetModel()
\ No newline at end of file
+        self._jamming_calculator = jamming_calculator
+        self._rendered_rows = [None] * len(new_data)
+        self.endResetModel()
+
+
+class EffectivenessMatrixModel(QAbstractTableModel):
+    """Teknik (ya da kategori) x radar kırılımının başarı matrisi; hücre rengi başarı oranına göre kırmızıdan yeşile.
+
+    Hücre metinleri matris her yenilendiğinde bir kez üretilir; gösterim kipi oran ("%75 (8)") ya da gözlem sayısıdır.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._matrix = None
+        self._show_rates = True
+        self._texts: List[List[str]] = []
+        self._colors: List[List[Any]] = []
+
+    def set_matrix(self, matrix: EffectivenessMatrix, show_rates: bool = True):
+        self.beginResetModel()
+        self._matrix = matrix
+        self._show_rates = show_rates
+        self._texts, self._colors = self._render(matrix, show_rates)
+        self.endResetModel()
+
+    @staticmethod
+    def _render(matrix: EffectivenessMatrix, show_rates: bool):
+        rates = matrix.success_rate.tolist()
+        observations = matrix.observations.tolist()
+        texts, colors = [], []
+        for rate_row, observation_row in zip(rates, observations):
+            text_row, color_row = [], []
+            for rate, observation in zip(rate_row, observation_row):
+                if observation == 0:
+                    text_row.append("")
+                    color_row.append(None)
+                    continue
+                if rate != rate:
+                    # Sonucu bilinmeyen gözlemler: oran yok, renk yok
+                    text_row.append(f"- ({observation})" if show_rates else str(observation))
+                    color_row.append(None)
+                    continue
+                text_row.append(f"%{rate * 100:.0f} ({observation})" if show_rates else str(observation))
+                color_row.append(QColor.fromHsvF(rate / 3.0, 0.45, 1.0))
+            texts.append(text_row)
+            colors.append(color_row)
+        return texts, colors
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid(): return None
+        row, column = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[row][column]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._colors[row][column]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.ToolTipRole:
+            counts = self._matrix.counts[row, column]
+            if not counts.any(): return None
+            lines = [f"{self._matrix.row_labels[row]} / {self._matrix.column_labels[column]}"]
+            lines += [f"{sonuc}: {int(sayi)}" for sonuc, sayi in zip(SONUC_NITEL, counts) if sayi]
+            return "\n".join(lines)
+        return None
+
+    def rowCount(self, index: QModelIndex = QModelIndex()) -> int:
+        return len(self._texts)
+
+    def columnCount(self, index: QModelIndex = QModelIndex()) -> int:
+        return len(self._matrix.column_labels) if self._matrix is not None else 0
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and self._matrix is not None:
+            if orientation == Qt.Orientation.Horizontal:
+                return self._matrix.column_labels[section]
+            return self._matrix.row_labels[section]
+        return None
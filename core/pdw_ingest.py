@@ -0,0 +1,252 @@
+# ew_platformasi/core/pdw_ingest.py
+#
+# PDW (pulse descriptor word, darbe tanımlayıcı kelimesi) kayıtlarının akış halinde okunup radar kütüphanesiyle
+# eşleştirilmesi. Dosyalar bellek eşlemeyle (mmap) parça parça okunur; her parça NumPy dizilerine çevrilip
+# EmitterMatcher'a toplu olarak verilir ve sonuçlar radar başına özetlenir. Dosyanın tamamı belleğe alınmaz.
+#
+# Desteklenen biçimler:
+#   İkili (.pdw): "EWPDW" + sürüm (u8) + 2 bayt dolgu, ardından PDW_DTYPE kayıtları (little-endian, sabit uzunluklu)
+#   CSV: ilk satır sütun adları (toa_us, freq_mhz, pw_us zorunlu; amp_dbm, aoa_deg isteğe bağlı), ardından sayılar
+#
+# Darbeler varış zamanına (TOA) göre sıralı kabul edilir.
+
+import csv
+import io
+import mmap
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Mapping, Optional
+
+import numpy as np
+
+from core.data_models import Radar, FREKANS_BANDI_KODLARI
+from core.emitter_matcher import EmitterMatcher
+
+PDW_MAGIC = b"EWPDW"
+PDW_FORMAT_VERSION = 1
+PDW_EXTENSION = ".pdw"
+# Başlık 8 bayta tamamlanır; kayıtlar hizalı başlar.
+_HEADER_SIZE = 8
+PDW_DTYPE = np.dtype([("toa_us", "<f8"), ("freq_mhz", "<f4"), ("pw_us", "<f4"), ("amp_dbm", "<f4"),
+                      ("aoa_deg", "<f4")])
+_REQUIRED_FIELDS = ("toa_us", "freq_mhz", "pw_us")
+DEFAULT_CHUNK_PULSES = 1_000_000
+# PRI kestiriminde PW'si geçersiz darbelerin grup anahtarı
+_NO_GROUP = np.iinfo(np.int64).min
+
+# Bant alt sınırları (MHz, IEEE harf bantları) ve karşılık gelen katalog kodları. 30 MHz altı, 40 GHz üstü ve NaN
+# frekanslar UNKNOWN_BAND_CODE alır (eşleştiricinin "bant yok" değeri); katalog kodu 0 ("Bilinmiyor") yalnızca
+# radar kayıtlarındaki etiket içindir.
+UNKNOWN_BAND_CODE = -1
+_BAND_EDGES_MHZ = np.array([30.0, 300.0, 1000.0, 2000.0, 4000.0, 8000.0, 12000.0, 18000.0, 27000.0, 40000.0])
+_BAND_CODES = np.array([UNKNOWN_BAND_CODE] + [FREKANS_BANDI_KODLARI[band] for band in
+                                              ("VHF", "UHF", "L", "S", "C", "X", "Ku", "K", "Ka")] + [UNKNOWN_BAND_CODE],
+                       dtype=np.int16)
+
+
+def frequency_band_codes(freq_mhz: np.ndarray) -> np.ndarray:
+    """Frekansları (MHz) frekans bandı katalog kodlarına (FREKANS_BANDI_KODLARI) çevirir; aralık dışı: UNKNOWN_BAND_CODE."""
+    return _BAND_CODES[np.searchsorted(_BAND_EDGES_MHZ, freq_mhz, side="right")]
+
+
+# --- Dosya okuma/yazma ---
+
+def is_binary_pdw(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(PDW_MAGIC)) == PDW_MAGIC
+
+
+def write_pdw_file(path: str, pdws: np.ndarray):
+    """PDW_DTYPE dizisini ikili PDW dosyası olarak yazar."""
+    with open(path, "wb") as f:
+        f.write(PDW_MAGIC + bytes([PDW_FORMAT_VERSION]) + b"\0" * (_HEADER_SIZE - len(PDW_MAGIC) - 1))
+        f.write(np.ascontiguousarray(pdws, dtype=PDW_DTYPE).tobytes())
+
+
+def iter_pdw_chunks(path: str, chunk_pulses: int = DEFAULT_CHUNK_PULSES) -> Iterator[np.ndarray]:
+    """Dosyayı en çok chunk_pulses darbelik PDW_DTYPE dizileri halinde okur (ikili ya da CSV)."""
+    if is_binary_pdw(path):
+        yield from _iter_binary_chunks(path, chunk_pulses)
+    else:
+        yield from _iter_csv_chunks(path, chunk_pulses)
+
+
+def _iter_binary_chunks(path: str, chunk_pulses: int) -> Iterator[np.ndarray]:
+    with open(path, "rb") as f:
+        header = f.read(_HEADER_SIZE)
+    if len(header) < _HEADER_SIZE or header[len(PDW_MAGIC)] != PDW_FORMAT_VERSION:
+        raise ValueError("Desteklenmeyen ya da bozuk PDW dosya başlığı.")
+    payload_size = os.path.getsize(path) - _HEADER_SIZE
+    if payload_size % PDW_DTYPE.itemsize:
+        raise ValueError("PDW dosyası yarım bir kayıtla bitiyor; dosya eksik kopyalanmış olabilir.")
+    if payload_size == 0: return
+    pdws = np.memmap(path, dtype=PDW_DTYPE, mode="r", offset=_HEADER_SIZE)
+    try:
+        for start in range(0, len(pdws), chunk_pulses):
+            # Parça kopyalanır; işlenen sayfalar işletim sistemi tarafından bırakılabilir.
+            yield np.array(pdws[start:start + chunk_pulses])
+    finally:
+        del pdws
+
+
+def _iter_csv_chunks(path: str, chunk_pulses: int) -> Iterator[np.ndarray]:
+    if os.path.getsize(path) == 0: return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header_end = mm.find(b"\n")
+        if header_end < 0: return
+        names = [name.strip().lower() for name in mm[:header_end].decode("utf-8-sig").split(",")]
+        missing = [name for name in _REQUIRED_FIELDS if name not in names]
+        if missing:
+            raise ValueError(f"PDW CSV dosyasında eksik sütun(lar): {', '.join(missing)}")
+        fields = [name for name in PDW_DTYPE.names if name in names]
+        columns = [names.index(name) for name in fields]
+
+        # Parça boyutu ilk satırların ortalama uzunluğundan kestirilir; parçalar her zaman satır sonunda kesilir.
+        size = len(mm)
+        position = header_end + 1
+        sample = mm[position:position + 65536]
+        line_length = len(sample) / max(sample.count(b"\n"), 1)
+        chunk_bytes = max(int(line_length * chunk_pulses), 1)
+        while position < size:
+            stop = min(position + chunk_bytes, size)
+            if stop < size:
+                line_end = mm.find(b"\n", stop - 1)
+                stop = size if line_end < 0 else line_end + 1
+            block = mm[position:stop]
+            position = stop
+            if not block.strip(): continue
+            values = np.loadtxt(io.BytesIO(block), delimiter=",", usecols=columns, ndmin=2)
+            pdws = np.zeros(len(values), dtype=PDW_DTYPE)
+            for name in PDW_DTYPE.names:
+                pdws[name] = values[:, fields.index(name)] if name in fields else np.nan
+            yield pdws
+
+
+# --- Eşleştirme ---
+
+@dataclass
+class PdwMatchSummary:
+    radar_id: str
+    pulse_count: int
+    first_toa_us: float
+    last_toa_us: float
+    mean_score: float
+
+
+class PdwIngestor:
+    """PDW parçalarını eşleştirip radar başına darbe sayısı, ilk/son görülme zamanı ve ortalama skoru biriktirir.
+
+    Tek darbede PRI ölçülemez; darbeler frekans bandı ve PW'ye (PW toleransı genişliğinde logaritmik kovalar) göre
+    gruplanır ve PRI, aynı gruptaki bir önceki darbeyle TOA farkı olarak kestirilir. Gruplar parçalar arasında
+    sürdürülür. Aynı bant/PW'de iç içe geçmiş yayınlar bu kestirimi bozar; o darbeler eşleşmeden kalır.
+    """
+
+    def __init__(self, matcher: EmitterMatcher, pri_tolerance: Optional[float] = None,
+                 pw_tolerance: Optional[float] = None):
+        self._matcher = matcher
+        self.pri_tolerance = matcher.pri_tolerance if pri_tolerance is None else pri_tolerance
+        self.pw_tolerance = matcher.pw_tolerance if pw_tolerance is None else pw_tolerance
+        self._radar_ids = matcher.index_ids()
+        size = len(self._radar_ids)
+        self._counts = np.zeros(size, dtype=np.int64)
+        self._score_sums = np.zeros(size)
+        self._first_toa = np.full(size, np.inf)
+        self._last_toa = np.full(size, -np.inf)
+        # Grup anahtarı -> gruptaki son darbenin TOA'sı (parçalar arası PRI kestirimi için)
+        self._last_toa_by_group = {}
+        self.pulse_count = 0
+        self.matched_count = 0
+        self.elapsed_s = 0.0
+
+    @property
+    def pulses_per_second(self) -> float:
+        return self.pulse_count / self.elapsed_s if self.elapsed_s else 0.0
+
+    def ingest_file(self, path: str, chunk_pulses: int = DEFAULT_CHUNK_PULSES,
+                    progress: Callable[[int], None] = None) -> int:
+        """Dosyadaki tüm darbeleri işler; okunan darbe sayısını döndürür. progress(toplam darbe) her parçadan sonra çağrılır."""
+        pulses = 0
+        # Her dosya ayrı bir kayıttır; PRI kestirimi önceki dosyanın darbelerine bağlanmaz.
+        self._last_toa_by_group.clear()
+        started = time.perf_counter()
+        chunks = iter_pdw_chunks(path, chunk_pulses)
+        while True:
+            # Okuma süresi de verim ölçümüne dahildir.
+            chunk = next(chunks, None)
+            if chunk is None: break
+            self.elapsed_s += time.perf_counter() - started
+            pulses += self.feed(chunk)
+            if progress:
+                progress(self.pulse_count)
+            started = time.perf_counter()
+        self.elapsed_s += time.perf_counter() - started
+        return pulses
+
+    def feed(self, pdws: np.ndarray) -> int:
+        """Bir PDW_DTYPE parçasını eşleştirip özetlere ekler; parçadaki darbe sayısını döndürür."""
+        if len(pdws) == 0: return 0
+        if self._matcher.index_ids() is not self._radar_ids:
+            raise RuntimeError("Radar kütüphanesi PDW işleme sırasında değişti; özetler tutarsız olur.")
+        started = time.perf_counter()
+        toa = pdws["toa_us"].astype(float)
+        pw = pdws["pw_us"].astype(float)
+        band = frequency_band_codes(pdws["freq_mhz"])
+        pri = self._estimate_pri(toa, pw, band)
+        positions, scores = self._matcher.match_positions(pri, pw, band, top_k=1, pri_tolerance=self.pri_tolerance,
+                                                          pw_tolerance=self.pw_tolerance)
+        positions, scores = positions[:, 0], scores[:, 0]
+        matched = positions >= 0
+        hits, hit_toa = positions[matched], toa[matched]
+        size = len(self._radar_ids)
+        self._counts += np.bincount(hits, minlength=size)
+        self._score_sums += np.bincount(hits, weights=scores[matched], minlength=size)
+        np.minimum.at(self._first_toa, hits, hit_toa)
+        np.maximum.at(self._last_toa, hits, hit_toa)
+        self.pulse_count += len(pdws)
+        self.matched_count += len(hits)
+        self.elapsed_s += time.perf_counter() - started
+        return len(pdws)
+
+    def _estimate_pri(self, toa: np.ndarray, pw: np.ndarray, band: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pw_bucket = np.floor(np.log(pw) / np.log1p(2 * self.pw_tolerance))
+        valid = np.isfinite(pw_bucket)
+        # Bant kodu -1 olabilir, kova negatif olabilir; geçersiz darbeler ayrı bir anahtarda toplanır.
+        keys = np.where(valid, (band.astype(np.int64) + 1) * 100_000 + np.where(valid, pw_bucket, 0).astype(np.int64),
+                        _NO_GROUP)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys, sorted_toa = keys[order], toa[order]
+        pri = np.empty(len(toa))
+        pri[1:] = sorted_toa[1:] - sorted_toa[:-1]
+        group_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        group_ends = np.r_[group_starts[1:], len(toa)] - 1
+        for start, end in zip(group_starts, group_ends):
+            key = int(sorted_keys[start])
+            previous = self._last_toa_by_group.get(key)
+            pri[start] = sorted_toa[start] - previous if previous is not None else np.nan
+            self._last_toa_by_group[key] = sorted_toa[end]
+        result = np.empty(len(toa))
+        result[order] = pri
+        result[~valid] = np.nan
+        return result
+
+    def summaries(self) -> List[PdwMatchSummary]:
+        """Eşleşen radarların özetleri, en çok darbesi olan başta."""
+        rows = np.flatnonzero(self._counts)
+        rows = rows[np.argsort(-self._counts[rows], kind="stable")]
+        return [PdwMatchSummary(self._radar_ids[row], int(self._counts[row]), float(self._first_toa[row]),
+                                float(self._last_toa[row]), float(self._score_sums[row] / self._counts[row]))
+                for row in rows]
+
+
+def write_match_summary(path: str, summaries: List[PdwMatchSummary], radar_map: Mapping[str, Radar]):
+    """Özetleri radar_id'ye bağlı CSV olarak yazar; radar adı ve ELNOT okunabilirlik için eklenir."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["radar_id", "radar_adi", "elnot", "darbe_sayisi", "ilk_toa_us", "son_toa_us", "ortalama_skor"])
+        for summary in summaries:
+            radar = radar_map.get(summary.radar_id)
+            writer.writerow([summary.radar_id, radar.adi if radar else "", radar.elnot if radar else "",
+                             summary.pulse_count, f"{summary.first_toa_us:.3f}", f"{summary.last_toa_us:.3f}",
+                             f"{summary.mean_score:.3f}"])
@@ -0,0 +1,201 @@
+# ew_platformasi/core/radar_catalog.py
+#
+# Radar kütüphanesinin sütunsal (struct-of-arrays) NumPy görünümü. Parametrik tehdit kütüphanesi sorguları
+# ("PRF'i 2-8 kHz arasında, ERP'si 75 dBW üstünde X bandı radarlar") kayıt kayıt Python döngüsü yerine
+# tüm sütun üzerinde tek NumPy karşılaştırmasıyla yanıtlanır.
+
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from PySide6.QtCore import QObject
+
+from core.data_models import (Radar, FREKANS_BANDI_KODLARI, GOREV_TIPI_KODLARI, ANTEN_TIPI_KODLARI,
+                              DARBE_MODULASYONU_KODLARI)
+
+# Sayısal sütunlar (float64; değeri olmayan alanlar NaN, hiçbir aralığa uymaz)
+NUMERIC_FIELDS = ("pw_us", "prf_hz", "pri_us", "erp_dbw")
+# Katalog sütunları: alan -> değer kodları (int16; katalog dışı değerler -1)
+CATEGORY_FIELDS = {
+    "frekans_bandi": FREKANS_BANDI_KODLARI,
+    "gorev_tipi": GOREV_TIPI_KODLARI,
+    "anten_tipi": ANTEN_TIPI_KODLARI,
+    "darbe_modulasyonu": DARBE_MODULASYONU_KODLARI,
+}
+_UNKNOWN_CODE = -1
+_INITIAL_CAPACITY = 1024
+# rebuild'in radar listesini dolaştığı parça boyu
+_REBUILD_CHUNK = 4096
+
+Range = Tuple[Optional[float], Optional[float]]
+
+
+def _as_float(value) -> float:
+    """Sayısal sütun değeri; None ve sayıya çevrilemeyen metinler (ör. XML'deki <PwUs>abc</PwUs>) NaN olur."""
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class RadarCatalog(QObject):
+    """DataManager.radarlar'ın NumPy sütunları; kayıt değiştikçe DataManager'ın satır sinyalleriyle güncel tutulur.
+
+    Satırlar sütunların ilk len(self) elemanıdır. Silinen kaydın yerine son satır taşınır; satır sırası depo
+    sırasıyla aynı değildir, sorgular yalnızca hangi radarların uyduğunu söyler.
+    """
+
+    def __init__(self, data_manager):
+        # DataManager'ın çocuğu olarak yaşar; sinyal bağlantıları onunla birlikte kopar.
+        super().__init__(data_manager)
+        self._data_manager = data_manager
+        self._count = 0
+        # Her değişiklikte artar; katalogdan türetilen yapılar (ör. EmitterMatcher indeksi) bununla eskidiğini anlar.
+        self.revision = 0
+        self._row_of = {}
+        self._ids = np.empty(0, dtype=object)
+        self._columns = {}
+        self.rebuild()
+        data_manager.item_inserted.connect(self._on_item_changed)
+        data_manager.item_updated.connect(self._on_item_changed)
+        data_manager.item_removed.connect(self._on_item_removed)
+        data_manager.items_reset.connect(self._on_items_reset)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def rebuild(self):
+        """Sütunları radar listesinden baştan kurar; liste _REBUILD_CHUNK kayıtlık parçalarla dolaşılır."""
+        radarlar = self._data_manager.get_items(Radar)
+        count = len(radarlar)
+        capacity = max(_INITIAL_CAPACITY, count)
+        self._ids = np.empty(capacity, dtype=object)
+        self._columns = {name: np.full(capacity, np.nan) for name in NUMERIC_FIELDS}
+        self._columns.update((name, np.full(capacity, _UNKNOWN_CODE, dtype=np.int16)) for name in CATEGORY_FIELDS)
+        # Veritabanına bağlıyken liste sayfa sayfa okunur; bellekte aynı anda yalnızca bir parça kayıt tutulur.
+        records, start = iter(radarlar), 0
+        chunk = list(islice(records, _REBUILD_CHUNK))
+        while chunk:
+            end = start + len(chunk)
+            self._ensure_capacity(end, filled=start)
+            self._ids[start:end] = [radar.radar_id for radar in chunk]
+            for name in NUMERIC_FIELDS:
+                self._columns[name][start:end] = np.fromiter((_as_float(getattr(radar, name)) for radar in chunk),
+                                                             dtype=float, count=len(chunk))
+            for name, codes in CATEGORY_FIELDS.items():
+                self._columns[name][start:end] = [codes.get(getattr(radar, name), _UNKNOWN_CODE) for radar in chunk]
+            start = end
+            chunk = list(islice(records, _REBUILD_CHUNK))
+        self._row_of = {radar_id: row for row, radar_id in enumerate(self._ids[:start])}
+        self._count = start
+        self.revision += 1
+
+    # --- Sorgular ---
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Sütunların salt okunur görünümleri (kopya üretilmez); 'radar_id' sütunu da dahildir."""
+        views = {"radar_id": self._ids[:self._count]}
+        views.update((name, column[:self._count]) for name, column in self._columns.items())
+        for view in views.values():
+            view.flags.writeable = False
+        return views
+
+    def mask(self, predicate: Callable[[Dict[str, np.ndarray]], np.ndarray] = None,
+             **criteria: Union[Range, str, Iterable[str]]) -> np.ndarray:
+        """Ölçütlere uyan satırların bool maskesi.
+
+        Sayısal alanlar (alt, üst) aralığıyla verilir; sınırlar dahildir, None o yönde sınır yok demektir.
+        Katalog alanları tek değer ya da değer listesiyle verilir. predicate, columns() sözlüğünü alıp
+        bool dizisi döndüren serbest bir koşuldur (ör. lambda c: c["prf_hz"] * c["pw_us"] < 1e5).
+        """
+        count = self._count
+        result = np.ones(count, dtype=bool)
+        for name, condition in criteria.items():
+            if name in CATEGORY_FIELDS:
+                values = [condition] if isinstance(condition, str) else list(condition)
+                codes = {CATEGORY_FIELDS[name][value] for value in values if value in CATEGORY_FIELDS[name]}
+                column = self._columns[name][:count]
+                # Kataloglar en fazla birkaç değerlidir; eşitliklerin birleşimi np.isin'den çok daha hızlıdır.
+                category_mask = np.zeros(count, dtype=bool)
+                for code in codes:
+                    category_mask |= column == code
+                result &= category_mask
+            elif name in NUMERIC_FIELDS:
+                low, high = condition
+                column = self._columns[name][:count]
+                if low is not None:
+                    result &= column >= low
+                if high is not None:
+                    result &= column <= high
+                if low is None and high is None:
+                    result &= ~np.isnan(column)
+            else:
+                raise ValueError(f"Bilinmeyen radar alanı: {name}")
+        if predicate is not None:
+            result &= np.asarray(predicate(self.columns()), dtype=bool)
+        return result
+
+    def query(self, predicate: Callable[[Dict[str, np.ndarray]], np.ndarray] = None,
+              **criteria: Union[Range, str, Iterable[str]]) -> List[str]:
+        """Ölçütlere uyan radarların id'leri (bkz. mask)."""
+        return self._ids[:self._count][self.mask(predicate, **criteria)].tolist()
+
+    # --- Senkronizasyon ---
+
+    def _ensure_capacity(self, count: int, filled: Optional[int] = None):
+        """Sütunları en az count satıra büyütür; ilk filled (varsayılan len(self)) satır korunur."""
+        capacity = len(self._ids)
+        if count <= capacity: return
+        filled = self._count if filled is None else filled
+        new_capacity = max(count, capacity * 2)
+        ids = np.empty(new_capacity, dtype=object)
+        ids[:filled] = self._ids[:filled]
+        self._ids = ids
+        for name, column in self._columns.items():
+            grown = np.full(new_capacity, np.nan if name in NUMERIC_FIELDS else _UNKNOWN_CODE, dtype=column.dtype)
+            grown[:filled] = column[:filled]
+            self._columns[name] = grown
+
+    def _write_row(self, row: int, radar: Radar):
+        self._ids[row] = radar.radar_id
+        for name in NUMERIC_FIELDS:
+            self._columns[name][row] = _as_float(getattr(radar, name))
+        for name, codes in CATEGORY_FIELDS.items():
+            self._columns[name][row] = codes.get(getattr(radar, name), _UNKNOWN_CODE)
+
+    def _on_item_changed(self, item_type: type, item_id: str, row: int):
+        if item_type is not Radar: return
+        radar = self._data_manager.get_item(item_id, Radar)
+        if radar is None: return
+        catalog_row = self._row_of.get(item_id)
+        if catalog_row is None:
+            # Yeni satır yalnızca yazıldıktan sonra kataloğa dahil edilir.
+            self._ensure_capacity(self._count + 1)
+            self._write_row(self._count, radar)
+            self._row_of[item_id] = self._count
+            self._count += 1
+        else:
+            self._write_row(catalog_row, radar)
+        self.revision += 1
+
+    def _on_item_removed(self, item_type: type, item_id: str, row: int):
+        if item_type is not Radar: return
+        catalog_row = self._row_of.pop(item_id, None)
+        if catalog_row is None: return
+        last_row = self._count - 1
+        if catalog_row != last_row:
+            # Son satır boşalan yere taşınır; silme O(1)'dir.
+            moved_id = self._ids[last_row]
+            self._ids[catalog_row] = moved_id
+            for column in self._columns.values():
+                column[catalog_row] = column[last_row]
+            self._row_of[moved_id] = catalog_row
+        self._ids[last_row] = None
+        self._count = last_row
+        self.revision += 1
+
+    def _on_items_reset(self, item_type: type):
+        if item_type is Radar:
+            self.rebuild()
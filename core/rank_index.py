@@ -0,0 +1,194 @@
+# ew_platformasi/core/rank_index.py
+#
+# Satır numarası hesapları için sıra (rank) yapıları. Silme sonrası tüm id -> satır tablosunu ya da filtre
+# eşleşme listesini baştan saymak yerine önek toplamları Fenwick ağacında tutulur; satır sorgusu ve tek kayıt
+# güncellemesi O(log n)'dir.
+
+from typing import Dict, Hashable, Iterable, List, Optional
+
+# FlagList blok boyu; blok bunun iki katını aşınca ikiye bölünür.
+_BLOCK_SIZE = 512
+
+
+class FenwickTree:
+    """Büyüyebilen Fenwick (ikili indeksli) ağacı: önek toplamı, tek eleman güncellemesi ve sona ekleme O(log n)."""
+
+    def __init__(self, values: Iterable[int] = ()):
+        tree = [0]
+        tree.extend(values)
+        # Doğrusal kurulum: her düğüm kendi toplamını bir üst sorumluluk düğümüne ekler.
+        size = len(tree) - 1
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                tree[parent] += tree[index]
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def prefix_sum(self, end: int) -> int:
+        """values[:end] toplamı."""
+        tree, total = self._tree, 0
+        while end > 0:
+            total += tree[end]
+            end &= end - 1
+        return total
+
+    def add(self, index: int, delta: int):
+        tree, index, size = self._tree, index + 1, len(self._tree) - 1
+        while index <= size:
+            tree[index] += delta
+            index += index & -index
+
+    def append(self, value: int):
+        # Yeni düğüm (i) kendi değerine ek olarak (i - lowbit(i), i - 1] aralığının toplamını taşır.
+        index = len(self._tree)
+        self._tree.append(value + self.prefix_sum(index - 1) - self.prefix_sum(index - (index & -index)))
+
+    def search(self, target: int) -> int:
+        """prefix_sum(i + 1) > target olan en küçük i (değerler negatif olmamalı); yoksa len(self)."""
+        tree, index, step = self._tree, 0, 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = index + step
+            if nxt < len(tree) and tree[nxt] <= target:
+                index = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return index
+
+
+class SlotIndex:
+    """Ekleme sırasındaki anahtarların satır numaraları.
+
+    Her anahtar eklendiğinde sabit bir yuva alır; silinen anahtarın yuvası boş bırakılır (mezar taşı) ve canlı
+    yuvalar Fenwick ağacında sayılır. Satır, yuvadan önceki canlı yuva sayısıdır. Boş yuvalar canlılardan
+    fazlalaşınca dizin sıkıştırılır; sıkıştırmanın maliyeti silmelere yayılır.
+    """
+
+    def __init__(self, keys: Iterable[Hashable] = ()):
+        self._build(list(keys))
+
+    def _build(self, keys: List[Hashable]):
+        self._keys: List[Optional[Hashable]] = keys
+        self._slots: Dict[Hashable, int] = {key: slot for slot, key in enumerate(keys)}
+        self._live = FenwickTree([1] * len(keys))
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def append(self, key: Hashable):
+        self._slots[key] = len(self._keys)
+        self._keys.append(key)
+        self._live.append(1)
+
+    def remove(self, key: Hashable):
+        slot = self._slots.pop(key)
+        self._keys[slot] = None
+        self._live.add(slot, -1)
+        self._dead += 1
+        if self._dead > len(self._slots):
+            self._build([key for key in self._keys if key is not None])
+
+    def row(self, key: Hashable) -> int:
+        return self._live.prefix_sum(self._slots[key])
+
+
+class FlagList:
+    """Ekleme/silme desteği olan bool listesi; rank(i) (i'den önceki True sayısı) O(log n + blok) sürer.
+
+    Liste bloklara bölünür; blok uzunlukları ve True sayıları iki Fenwick ağacında tutulur. Blok bölündüğünde
+    ya da boşaldığında ağaçlar blok sayısı kadar maliyetle yeniden kurulur.
+    """
+
+    def __init__(self, values: Iterable[bool] = ()):
+        values = [bool(value) for value in values]
+        self._blocks: List[List[bool]] = [values[start:start + _BLOCK_SIZE]
+                                          for start in range(0, len(values), _BLOCK_SIZE)] or [[]]
+        self._reindex()
+
+    def _reindex(self):
+        self._lengths = FenwickTree(len(block) for block in self._blocks)
+        self._counts = FenwickTree(sum(block) for block in self._blocks)
+        self._size = self._lengths.prefix_sum(len(self._blocks))
+
+    def _locate(self, position: int):
+        """(blok no, blok içi sıra); position == len(self) için son bloğun sonu."""
+        if position < 0:
+            position += self._size
+        if not 0 <= position <= self._size:
+            raise IndexError("FlagList sırası aralık dışında")
+        if position == self._size:
+            last = len(self._blocks) - 1
+            return last, len(self._blocks[last])
+        block = self._lengths.search(position)
+        return block, position - self._lengths.prefix_sum(block)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, position: int) -> bool:
+        if position >= self._size:
+            raise IndexError("FlagList sırası aralık dışında")
+        block, offset = self._locate(position)
+        return self._blocks[block][offset]
+
+    def __setitem__(self, position: int, value: bool):
+        if position >= self._size:
+            raise IndexError("FlagList sırası aralık dışında")
+        block, offset = self._locate(position)
+        values, value = self._blocks[block], bool(value)
+        if values[offset] != value:
+            self._counts.add(block, 1 if value else -1)
+            values[offset] = value
+
+    def __delitem__(self, position: int):
+        if position >= self._size:
+            raise IndexError("FlagList sırası aralık dışında")
+        block, offset = self._locate(position)
+        values = self._blocks[block]
+        if values.pop(offset):
+            self._counts.add(block, -1)
+        self._lengths.add(block, -1)
+        self._size -= 1
+        if not values and len(self._blocks) > 1:
+            del self._blocks[block]
+            self._reindex()
+
+    def insert(self, position: int, value: bool):
+        block, offset = self._locate(min(position, self._size))
+        values, value = self._blocks[block], bool(value)
+        values.insert(offset, value)
+        if len(values) > 2 * _BLOCK_SIZE:
+            self._blocks[block:block + 1] = [values[:_BLOCK_SIZE], values[_BLOCK_SIZE:]]
+            self._reindex()
+            return
+        self._lengths.add(block, 1)
+        if value:
+            self._counts.add(block, 1)
+        self._size += 1
+
+    def extend(self, values: Iterable[bool]):
+        # Son blok doldurulur, kalanlar yeni bloklar olarak ağaçların sonuna eklenir.
+        values = [bool(value) for value in values]
+        last = len(self._blocks) - 1
+        head = values[:max(0, _BLOCK_SIZE - len(self._blocks[last]))]
+        self._blocks[last].extend(head)
+        self._lengths.add(last, len(head))
+        self._counts.add(last, sum(head))
+        for start in range(len(head), len(values), _BLOCK_SIZE):
+            block = values[start:start + _BLOCK_SIZE]
+            self._blocks.append(block)
+            self._lengths.append(len(block))
+            self._counts.append(sum(block))
+        self._size += len(values)
+
+    def rank(self, position: int) -> int:
+        """İlk `position` elemandaki True sayısı."""
+        block, offset = self._locate(position)
+        return self._counts.prefix_sum(block) + sum(self._blocks[block][:offset])
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
@@ -0,0 +1,308 @@
+# ew_platformasi/core/scenario_analytics.py
+#
+# Senaryo sonuçlarının teknik/radar kırılımında toplanması: hangi teknik hangi radara (ya da hangi teknik kategorisi
+# hangi frekans bandına, görev tipine) karşı ne kadar başarılı? Her senaryo, zincirindeki her farklı teknik için bir
+# gözlemdir. Gözlemler en ince kırılımda, (teknik, radar) hücrelerinde sonuç başına sayılır; kategori, bant gibi
+# kaba kırılımlar sorgu anında hücre kodlarının NumPy ile gruplanmasıyla üretilir. Tek bir senaryo değişince yalnızca
+# onun eski gözlemleri çıkarılıp yenileri eklenir.
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+from core.data_models import (Radar, Senaryo, Teknik, SONUC_NITEL, SONUC_NITEL_KODLARI, TEKNIK_KATEGORILERI,
+                              TEKNIK_KATEGORI_KODLARI, FREKANS_BANDLARI, FREKANS_BANDI_KODLARI, GOREV_TIPLERI,
+                              GOREV_TIPI_KODLARI)
+
+# Kırılım adı -> (kayıt tipi, alan, katalog, katalog kodları); alan None ise kırılım kaydın kendisidir.
+ROW_DIMENSIONS = {
+    "teknik": (Teknik, None, None, None),
+    "kategori": (Teknik, "kategori", TEKNIK_KATEGORILERI, TEKNIK_KATEGORI_KODLARI),
+}
+COLUMN_DIMENSIONS = {
+    "radar": (Radar, None, None, None),
+    "frekans_bandi": (Radar, "frekans_bandi", FREKANS_BANDLARI, FREKANS_BANDI_KODLARI),
+    "gorev_tipi": (Radar, "gorev_tipi", GOREV_TIPLERI, GOREV_TIPI_KODLARI),
+}
+# Başarı oranında sonuçların ağırlıkları (SONUC_NITEL sırasıyla); sonucu bilinmeyenler (NaN) orana katılmaz.
+OUTCOME_WEIGHTS = np.array([np.nan, 1.0, 0.5, 0.0, 0.5])
+_INITIAL_CELLS = 256
+
+
+@dataclass
+class EffectivenessMatrix:
+    row_labels: List[str]
+    column_labels: List[str]
+    # (satır, sütun, sonuç) boyutlu gözlem sayıları; sonuç ekseni SONUC_NITEL sırasındadır.
+    counts: np.ndarray
+
+    @property
+    def observations(self) -> np.ndarray:
+        return self.counts.sum(axis=2)
+
+    @property
+    def evaluated(self) -> np.ndarray:
+        """Sonucu bilinen gözlem sayıları."""
+        return self.counts[:, :, ~np.isnan(OUTCOME_WEIGHTS)].sum(axis=2)
+
+    @property
+    def success_rate(self) -> np.ndarray:
+        """Ağırlıklı başarı oranı (0-1); sonucu bilinen gözlemi olmayan hücreler NaN."""
+        weighted = self.counts @ np.nan_to_num(OUTCOME_WEIGHTS)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.evaluated > 0, weighted / self.evaluated, np.nan)
+
+
+class ScenarioAnalytics(QObject):
+    """Senaryo sonuçlarının (teknik, radar) hücrelerindeki sayıları; kaba kırılımlar sorgu anında gruplanır.
+
+    Sayılar ilk sorguda tüm senaryolardan bir kez kurulur, sonra DataManager'ın satır sinyalleriyle senaryo senaryo
+    güncellenir. Radar/teknik kayıtları değişince sayılar değişmez; kırılım kodları sorguda güncel kayıtlardan okunur.
+    """
+
+    # Sayılar ya da kırılımlar (ör. bir radarın bandı) değişti; matris yeniden sorgulanmalı.
+    matrix_changed = Signal()
+
+    def __init__(self, data_manager):
+        # DataManager'ın çocuğu olarak yaşar; sinyal bağlantıları onunla birlikte kopar.
+        super().__init__(data_manager)
+        self._data_manager = data_manager
+        # Her değişiklikte artar; sayılardan türetilen önbellekler (ör. TechniqueRecommender) bununla eskidiğini anlar.
+        self.revision = 0
+        self._clear()
+        data_manager.item_inserted.connect(self._on_item_changed)
+        data_manager.item_updated.connect(self._on_item_changed)
+        data_manager.item_removed.connect(self._on_item_changed)
+        data_manager.items_reset.connect(self._on_items_reset)
+
+    def _clear(self):
+        self._built = False
+        # Teknik ve radar id'lerinin tamsayı kodları (kod = listedeki sıra)
+        self._teknik_codes: Dict[str, int] = {}
+        self._teknik_ids: List[str] = []
+        self._radar_codes: Dict[Optional[str], int] = {}
+        self._radar_ids: List[Optional[str]] = []
+        # (teknik kodu, radar kodu) -> hücre; hücrelerin kodları ve sonuç başına sayıları
+        self._cell_of: Dict[Tuple[int, int], int] = {}
+        self._cell_teknik = np.empty(_INITIAL_CELLS, dtype=np.int64)
+        self._cell_radar = np.empty(_INITIAL_CELLS, dtype=np.int64)
+        self._counts = np.zeros((_INITIAL_CELLS, len(SONUC_NITEL)), dtype=np.int64)
+        self._cell_count = 0
+        # Senaryonun sayılmış gözlemi (sonuç kodu, hücreler); değişince bunlar geri çıkarılır. Kurulumda sayılanlar
+        # düz dizilerde (senaryo satırı -> sonuç, hücre aralığı) durur; sonradan değişenler _observed'a yazılır
+        # (silinen senaryo için None).
+        self._built_row_of: Dict[str, int] = {}
+        self._built_outcomes = np.empty(0, dtype=np.int64)
+        self._built_ends = np.zeros(1, dtype=np.int64)
+        self._built_cells = np.empty(0, dtype=np.int64)
+        self._observed: Dict[str, Optional[Tuple[int, Tuple[int, ...]]]] = {}
+        self._scenario_count = 0
+
+    # --- Sorgular ---
+
+    def matrix(self, row_dimension: str = "teknik", column_dimension: str = "radar") -> EffectivenessMatrix:
+        """Kırılımların (bkz. ROW_DIMENSIONS, COLUMN_DIMENSIONS) sonuç sayıları; gözlemi olmayan satır/sütunlar atlanır.
+
+        Kütüphanede bulunmayan teknik/radarların ve hedef radarı olmayan senaryoların gözlemleri sayılmaz.
+        """
+        if row_dimension not in ROW_DIMENSIONS or column_dimension not in COLUMN_DIMENSIONS:
+            raise ValueError(f"Bilinmeyen kırılım: {row_dimension} x {column_dimension}")
+        self._ensure_built()
+        row_of_code, row_labels = self._dimension_codes(ROW_DIMENSIONS[row_dimension], self._teknik_ids)
+        column_of_code, column_labels = self._dimension_codes(COLUMN_DIMENSIONS[column_dimension], self._radar_ids)
+
+        cells = self._cell_count
+        rows = row_of_code[self._cell_teknik[:cells]]
+        columns = column_of_code[self._cell_radar[:cells]]
+        known = (rows >= 0) & (columns >= 0)
+        # Grup anahtarı satır * sütun sayısı + sütun; her sonuç için bincount
+        keys = rows[known] * len(column_labels) + columns[known]
+        size = len(row_labels) * len(column_labels)
+        cell_counts = self._counts[:cells][known]
+        counts = np.stack([np.bincount(keys, weights=cell_counts[:, outcome], minlength=size)
+                           for outcome in range(len(SONUC_NITEL))], axis=1)
+        counts = counts.astype(np.int64).reshape(len(row_labels), len(column_labels), len(SONUC_NITEL))
+
+        totals = counts.sum(axis=2)
+        used_rows = np.flatnonzero(totals.sum(axis=1))
+        used_columns = np.flatnonzero(totals.sum(axis=0))
+        return EffectivenessMatrix([row_labels[i] for i in used_rows], [column_labels[i] for i in used_columns],
+                                   counts[np.ix_(used_rows, used_columns)])
+
+    def technique_outcomes(self, radar_weights: Optional[Dict[str, float]] = None) -> Dict[str, np.ndarray]:
+        """Teknik id -> sonuç başına (SONUC_NITEL sırasıyla) gözlem sayıları.
+
+        radar_weights verilirse yalnızca bu radarlara karşı gözlemler, radarın ağırlığıyla çarpılarak toplanır;
+        verilmezse tüm radarlara karşı gözlemler sayılır. Maliyet senaryo sayısına değil hücre sayısına bağlıdır.
+        """
+        self._ensure_built()
+        cells = self._cell_count
+        if radar_weights is None:
+            cell_weights = np.ones(cells)
+        else:
+            weight_of_code = np.zeros(len(self._radar_ids) + 1)
+            for radar_id, weight in radar_weights.items():
+                code = self._radar_codes.get(radar_id)
+                if code is not None:
+                    weight_of_code[code] = weight
+            cell_weights = weight_of_code[self._cell_radar[:cells]]
+        used = np.flatnonzero(cell_weights)
+        if not len(used): return {}
+        teknik_codes = self._cell_teknik[used]
+        weighted = self._counts[used] * cell_weights[used, None]
+        totals = np.stack([np.bincount(teknik_codes, weights=weighted[:, outcome], minlength=len(self._teknik_ids))
+                           for outcome in range(len(SONUC_NITEL))], axis=1)
+        present = np.flatnonzero(totals.any(axis=1))
+        return {self._teknik_ids[code]: totals[code] for code in present}
+
+    def radars_with_history(self) -> List[str]:
+        """En az bir gözlemi olan radarların id'leri."""
+        self._ensure_built()
+        cells = self._cell_count
+        totals = np.bincount(self._cell_radar[:cells], weights=self._counts[:cells].sum(axis=1),
+                             minlength=len(self._radar_ids))
+        return [self._radar_ids[code] for code in np.flatnonzero(totals) if self._radar_ids[code] is not None]
+
+    def scenario_count(self) -> int:
+        self._ensure_built()
+        return self._scenario_count
+
+    def _dimension_codes(self, dimension, ids: List[Optional[str]]) -> Tuple[np.ndarray, List[str]]:
+        """Id kodlarından kırılım satır/sütun indekslerine dizi (bulunamayanlar -1) ve kırılım etiketleri."""
+        item_type, field, catalog, catalog_codes = dimension
+        items = self._data_manager.item_map(item_type)
+        records = [items.get(item_id) if item_id is not None else None for item_id in ids]
+        if field is None:
+            # Kırılım kaydın kendisi: kütüphanedeki her kayıt ada göre sıralı bir satır/sütun
+            present = sorted((code for code, record in enumerate(records) if record is not None),
+                             key=lambda code: records[code].adi)
+            index = np.full(len(ids) + 1, -1, dtype=np.int64)
+            index[present] = np.arange(len(present))
+            return index, [records[code].adi for code in present]
+        index = np.array([-1 if record is None else catalog_codes.get(getattr(record, field), -1)
+                          for record in records] + [-1], dtype=np.int64)
+        return index, list(catalog)
+
+    # --- Sayıların kurulması ve güncellenmesi ---
+
+    def _ensure_built(self):
+        if self._built: return
+        self._built = True
+        senaryolar = self._data_manager.get_items(Senaryo)
+        if not senaryolar: return
+        # Senaryolar bir kez dolaşılıp düz sütunlara açılır; tekilleştirme, hücreler ve sayılar NumPy ile çıkarılır.
+        count = len(senaryolar)
+        chain_lengths = np.fromiter((len(senaryo.uygulanan_teknikler) for senaryo in senaryolar), dtype=np.int64,
+                                    count=count)
+        teknik_codes = self._codes_of([uygulama.teknik_id for senaryo in senaryolar
+                                       for uygulama in senaryo.uygulanan_teknikler],
+                                      self._teknik_codes, self._teknik_ids)
+        radar_codes = self._codes_of([senaryo.radar_id for senaryo in senaryolar], self._radar_codes, self._radar_ids)
+        outcomes = np.fromiter((SONUC_NITEL_KODLARI.get(senaryo.sonuc_nitel, 0) for senaryo in senaryolar),
+                               dtype=np.int64, count=count)
+
+        # Zincirde tekrar eden teknik bir kez sayılır: (senaryo, teknik) anahtarları tekilleştirilir.
+        teknik_count = len(self._teknik_ids)
+        pairs = np.sort(np.repeat(np.arange(count, dtype=np.int64), chain_lengths) * teknik_count + teknik_codes)
+        # Sıralı dizide tekilleştirme; np.unique'in özet tablosu (hash) bu boyutta çok daha yavaştır.
+        pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))] if len(pairs) else pairs
+        scenario_rows, teknik_codes = np.divmod(pairs, teknik_count)
+        lengths = np.bincount(scenario_rows, minlength=count)
+
+        # Gözlem başına (teknik, radar) anahtarı; farklı anahtarlar hücre olur.
+        radar_count = len(self._radar_ids)
+        keys = teknik_codes * radar_count + radar_codes[scenario_rows]
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        cell_of_key = np.fromiter((self._cell(*divmod(int(key), radar_count)) for key in unique_keys),
+                                  dtype=np.int64, count=len(unique_keys))
+        cells = cell_of_key[inverse.ravel()]
+        outcome_count = len(SONUC_NITEL)
+        totals = np.bincount(cells * outcome_count + outcomes[scenario_rows],
+                             minlength=self._cell_count * outcome_count)
+        self._counts[:self._cell_count] += totals.reshape(self._cell_count, outcome_count)
+
+        self._built_row_of = dict(zip([senaryo.senaryo_id for senaryo in senaryolar], range(count)))
+        self._built_outcomes = outcomes
+        self._built_ends = np.concatenate(([0], np.cumsum(lengths)))
+        self._built_cells = cells
+        self._scenario_count = count
+
+    def _previous_observation(self, senaryo_id: str) -> Optional[Tuple[int, Tuple[int, ...]]]:
+        if senaryo_id in self._observed:
+            return self._observed[senaryo_id]
+        row = self._built_row_of.get(senaryo_id)
+        if row is None: return None
+        start, end = self._built_ends[row], self._built_ends[row + 1]
+        return int(self._built_outcomes[row]), tuple(self._built_cells[start:end].tolist())
+
+    def _codes_of(self, item_ids: List, codes: Dict, ids: List) -> np.ndarray:
+        """Id listesinin kodları; ilk kez görülen id'lere yeni kod verilir."""
+        for item_id in set(item_ids).difference(codes):
+            self._code(codes, ids, item_id)
+        return np.fromiter(map(codes.__getitem__, item_ids), dtype=np.int64, count=len(item_ids))
+
+    def _observation(self, senaryo: Senaryo) -> Tuple[int, Tuple[int, ...]]:
+        """Senaryonun sonuç kodu ve gözlem hücreleri; gerekirse yeni kod ve hücreler açılır (sayılar değişmez)."""
+        outcome = SONUC_NITEL_KODLARI.get(senaryo.sonuc_nitel, 0)
+        radar_code = self._code(self._radar_codes, self._radar_ids, senaryo.radar_id)
+        teknik_codes = {self._code(self._teknik_codes, self._teknik_ids, uygulama.teknik_id)
+                        for uygulama in senaryo.uygulanan_teknikler}
+        return outcome, tuple(self._cell(teknik_code, radar_code) for teknik_code in teknik_codes)
+
+    @staticmethod
+    def _code(codes: Dict, ids: List, item_id) -> int:
+        code = codes.get(item_id)
+        if code is None:
+            code = codes[item_id] = len(ids)
+            ids.append(item_id)
+        return code
+
+    def _cell(self, teknik_code: int, radar_code: int) -> int:
+        cell = self._cell_of.get((teknik_code, radar_code))
+        if cell is None:
+            if self._cell_count == len(self._cell_teknik):
+                capacity = 2 * len(self._cell_teknik)
+                self._cell_teknik = np.resize(self._cell_teknik, capacity)
+                self._cell_radar = np.resize(self._cell_radar, capacity)
+                counts = np.zeros((capacity, len(SONUC_NITEL)), dtype=np.int64)
+                counts[:self._cell_count] = self._counts[:self._cell_count]
+                self._counts = counts
+            cell = self._cell_of[(teknik_code, radar_code)] = self._cell_count
+            self._cell_teknik[cell] = teknik_code
+            self._cell_radar[cell] = radar_code
+            self._cell_count += 1
+        return cell
+
+    def _apply(self, observation: Tuple[int, Tuple[int, ...]], sign: int):
+        outcome, cells = observation
+        self._counts[list(cells), outcome] += sign
+
+    def _on_item_changed(self, item_type: type, item_id: str, row: int):
+        if item_type is Senaryo:
+            if not self._built: return
+            # Eski gözlem çıkarılır, kayıt hâlâ varsa yenisi eklenir.
+            old = self._previous_observation(item_id)
+            if old is not None:
+                self._apply(old, -1)
+                self._scenario_count -= 1
+            senaryo = self._data_manager.get_item(item_id, Senaryo)
+            observation = self._observed[item_id] = self._observation(senaryo) if senaryo is not None else None
+            if observation is not None:
+                self._apply(observation, +1)
+                self._scenario_count += 1
+            self.revision += 1
+            self.matrix_changed.emit()
+        elif item_type is Radar or item_type is Teknik:
+            # Ad, bant, kategori gibi kırılım değerleri değişmiş olabilir.
+            self.revision += 1
+            self.matrix_changed.emit()
+
+    def _on_items_reset(self, item_type: type):
+        if item_type is Senaryo:
+            self._clear()
+        elif item_type is not Radar and item_type is not Teknik:
+            return
+        self.revision += 1
+        self.matrix_changed.emit()
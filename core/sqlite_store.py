@@ -0,0 +1,495 @@
+# ew_platformasi/core/sqlite_store.py
+#
+# SQLite tabanlı kalıcı veri seti deposu (.ewdb). Açılan veri seti belleğe yüklenmez: DataManager kayıtları
+# gerektikçe (tek tek ya da sayfa sayfa) okur, her kaydetme/silme tek satırlık bir işlem (transaction) olarak yazılır.
+
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Sequence
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Union, get_args, get_origin
+
+from core.data_models import ETPlatformu, Teknik, Radar, Senaryo, Gorev, TeknikUygulama, BaseTeknikParametreleri
+from core.xml_codec import PARAM_CLASS_MAP, id_field_name
+
+SQLITE_EXTENSION = ".ewdb"
+_SQLITE_MAGIC = b"SQLite format 3\0"
+
+# Ana tablolar ve liste alanları için alt tablolar
+_TABLOLAR = {
+    ETPlatformu: "platformlar",
+    Radar: "radarlar",
+    Teknik: "teknikler",
+    Senaryo: "senaryolar",
+    Gorev: "gorevler"
+}
+_ALT_TABLOLAR = {
+    # (sınıf, alan): (tablo, eleman sınıfı ya da tek sütunun adı)
+    (Senaryo, "uygulanan_teknikler"): ("senaryo_teknikleri", TeknikUygulama),
+    (Gorev, "senaryo_id_list"): ("gorev_senaryolari", "senaryo_id")
+}
+# Teknik.parametreler alt sınıfları tek tabloda tutulur: 'sinif' sütunu alt sınıfı, diğer sütunlar
+# tüm alt sınıfların alanlarının birleşimini taşır.
+_PARAMETRE_TABLOSU = "teknik_parametreleri"
+
+# Sayfa okumalarında kullanılan, son erişilen kayıtları tutan önbelleğin boyutu
+_CACHE_SIZE = 4096
+# Tüm tabloyu dolaşan okumalar (values, SQLiteRecordList) ve toplu yazma bu kadar kayıtlık sayfalarla ilerler.
+_PAGE_SIZE = 1000
+# SQLiteRecordList'in bellekte tuttuğu son okunan sayfa sayısı
+_CACHED_PAGES = 4
+
+
+def is_sqlite_workspace(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(_SQLITE_MAGIC)) == _SQLITE_MAGIC
+
+
+def _sql_type(annotation) -> str:
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if annotation is float:
+        return "REAL"
+    if annotation in (int, bool):
+        return "INTEGER"
+    return "TEXT"
+
+
+def _is_bool(annotation) -> bool:
+    if get_origin(annotation) is Union:
+        return bool in get_args(annotation)
+    return annotation is bool
+
+
+def _scalar_fields(cls, skip=()):
+    """Doğrudan sütun olarak saklanan (liste/parametre olmayan) alanlar: [(ad, SQL tipi, bool mu)]."""
+    result = []
+    for field_info in fields(cls):
+        if field_info.name in skip or get_origin(field_info.type) is list or field_info.name == "parametreler":
+            continue
+        result.append((field_info.name, _sql_type(field_info.type), _is_bool(field_info.type)))
+    return result
+
+
+def _parameter_columns():
+    columns = {}
+    for param_cls in PARAM_CLASS_MAP.values():
+        for name, sql_type, is_bool in _scalar_fields(param_cls):
+            columns.setdefault(name, (sql_type, is_bool))
+    return columns
+
+
+def _to_python(value, is_bool: bool):
+    return bool(value) if is_bool and value is not None else value
+
+
+class SQLiteStore:
+    """Bir .ewdb dosyasına bağlantı. Kayıt tipi başına bir SQLiteTable (DataManager deposu) sağlar.
+
+    Şema ve WAL günlük kipi yalnızca yeni (boş) veritabanında kurulur; var olan dosya açılırken dosyaya yazılmaz.
+    read_only=True bağlantı salt okunur açılır (ör. arka planda kaydedilen bölümlerin okunması).
+    """
+
+    def __init__(self, path: str, read_only: bool = False):
+        self.path = path
+        # isolation_level=None: işlemler BEGIN/COMMIT ile açıkça yönetilir.
+        if read_only:
+            # Ayrı iş parçacığında açılır ve yalnızca orada kullanılır.
+            self._conn = sqlite3.connect(f"{Path(path).absolute().as_uri()}?mode=ro", uri=True, isolation_level=None)
+        else:
+            self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._transaction_depth = 0
+        self.tables = {}
+        if not read_only and self._conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone() is None:
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._create_schema()
+        self.tables = {cls: SQLiteTable(self, cls) for cls in _TABLOLAR}
+
+    def close(self):
+        self._conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """İç içe kullanılabilen işlem bloğu; yalnızca en dıştaki blok COMMIT/ROLLBACK yapar."""
+        if self._transaction_depth == 0:
+            self._conn.execute("BEGIN")
+        self._transaction_depth += 1
+        try:
+            yield self._conn
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self._conn.execute("ROLLBACK")
+                for table in self.tables.values():
+                    table.invalidate()
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self._conn.execute("COMMIT")
+
+    def _create_schema(self):
+        statements = []
+        for cls, table in _TABLOLAR.items():
+            columns = ", ".join(f"{name} {sql_type}" for name, sql_type, _ in _scalar_fields(cls, {id_field_name(cls)}))
+            statements.append(f"CREATE TABLE IF NOT EXISTS {table} "
+                              f"(id TEXT PRIMARY KEY, sira_no INTEGER NOT NULL, {columns})")
+            statements.append(f"CREATE UNIQUE INDEX IF NOT EXISTS {table}_sira_no ON {table} (sira_no)")
+
+        for (cls, _), (table, item) in _ALT_TABLOLAR.items():
+            if is_dataclass(item):
+                columns = ", ".join(f"{name} {sql_type}" for name, sql_type, _ in _scalar_fields(item))
+            else:
+                columns = f"{item} TEXT"
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS {table} (sahip_id TEXT NOT NULL "
+                f"REFERENCES {_TABLOLAR[cls]} (id) ON DELETE CASCADE, konum INTEGER NOT NULL, {columns}, "
+                f"PRIMARY KEY (sahip_id, konum))")
+
+        param_columns = ", ".join(f"{name} {sql_type}" for name, (sql_type, _) in _parameter_columns().items())
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS {_PARAMETRE_TABLOSU} (teknik_id TEXT PRIMARY KEY "
+            f"REFERENCES {_TABLOLAR[Teknik]} (id) ON DELETE CASCADE, sinif TEXT, {param_columns})")
+
+        with self.transaction() as conn:
+            for statement in statements:
+                conn.execute(statement)
+
+    def write_all(self, sections, progress=None):
+        """(sınıf, kayıt listesi) bölümlerini boş bir veritabanına tek işlemde toplu olarak yazar.
+
+        progress(sınıf, kayıt sayısı) her bölümden sonra çağrılır; fırlattığı hata işlemi geri alır.
+        """
+        with self.transaction():
+            for cls, items in sections:
+                # Bölüm sayfa sayfa eklenir; SQLiteSection gibi tembel bölümler bir kez dolaşılır.
+                records = iter(items)
+                page = list(islice(records, _PAGE_SIZE))
+                while page:
+                    self.tables[cls].insert_many(page)
+                    page = list(islice(records, _PAGE_SIZE))
+                if progress:
+                    progress(cls, len(items))
+
+
+class SQLiteTable:
+    """Bir kayıt tipinin tablosunu DataManager'ın sıralı id -> kayıt deposu gibi sunar.
+
+    Okumalar gerektiğinde yapılır ve son erişilen kayıtlar önbellekte tutulur; atama ve silme hemen
+    veritabanına yazılır. Sıra, 'sira_no' sütunuyla korunur: güncellenen kayıt yerinde kalır, yeni kayıt sona eklenir.
+    """
+
+    def __init__(self, store: SQLiteStore, cls):
+        self._store = store
+        self._conn = store._conn
+        self.cls = cls
+        self.table = _TABLOLAR[cls]
+        self.id_field = id_field_name(cls)
+        self._fields = _scalar_fields(cls, {self.id_field})
+        self._lists = [(field_name, table, item) for (owner, field_name), (table, item) in _ALT_TABLOLAR.items()
+                       if owner is cls]
+        self._has_parameters = cls is Teknik
+
+        column_names = [name for name, _, _ in self._fields]
+        self._select_sql = f"SELECT id, {', '.join(column_names)} FROM {self.table}"
+        self._insert_sql = (f"INSERT INTO {self.table} (id, sira_no, {', '.join(column_names)}) "
+                            f"VALUES ({', '.join('?' * (len(column_names) + 2))})")
+        self._update_sql = (f"UPDATE {self.table} SET {', '.join(f'{name} = ?' for name in column_names)} "
+                            f"WHERE id = ?")
+
+        self._cache = OrderedDict()
+        self.invalidate()
+
+    def invalidate(self):
+        """Önbelleği ve sayaçları veritabanından yeniden başlatır (ör. geri alınan bir işlemden sonra)."""
+        self._cache.clear()
+        self._length, self._last_sira_no = self._conn.execute(
+            f"SELECT COUNT(*), IFNULL(MAX(sira_no), 0) FROM {self.table}").fetchone()
+
+    # --- Sözlük arayüzü (DataManager depoları bunu kullanır) ---
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, item_id) -> bool:
+        if item_id in self._cache:
+            return True
+        return self._conn.execute(f"SELECT 1 FROM {self.table} WHERE id = ?", (item_id,)).fetchone() is not None
+
+    def __iter__(self):
+        return (row[0] for row in self._conn.execute(f"SELECT id FROM {self.table} ORDER BY sira_no").fetchall())
+
+    def __getitem__(self, item_id):
+        item = self.get(item_id)
+        if item is None:
+            raise KeyError(item_id)
+        return item
+
+    def get(self, item_id, default=None):
+        item = self._cache.get(item_id)
+        if item is not None:
+            self._cache.move_to_end(item_id)
+            return item
+        items = self._read("WHERE id = ?", (item_id,))
+        return items[0] if items else default
+
+    def __setitem__(self, item_id, item):
+        with self._store.transaction():
+            if item_id in self:
+                self._conn.execute(self._update_sql, (*self._row_values(item), item_id))
+                self._delete_children([item_id])
+            else:
+                self._last_sira_no += 1
+                self._conn.execute(self._insert_sql, (item_id, self._last_sira_no, *self._row_values(item)))
+                self._length += 1
+            self._insert_children([item])
+        self._remember(item_id, item)
+
+    def __delitem__(self, item_id):
+        with self._store.transaction():
+            cursor = self._conn.execute(f"DELETE FROM {self.table} WHERE id = ?", (item_id,))
+        if cursor.rowcount == 0:
+            raise KeyError(item_id)
+        self._length -= 1
+        self._cache.pop(item_id, None)
+
+    def pop(self, item_id, default=None):
+        item = self.get(item_id)
+        if item is None:
+            return default
+        del self[item_id]
+        return item
+
+    def clear(self):
+        with self._store.transaction():
+            self._conn.execute(f"DELETE FROM {self.table}")
+        self.invalidate()
+
+    def values(self):
+        """Kayıtları sırayla üretir; tablo _PAGE_SIZE kayıtlık sayfalarla okunur, bir kerede belleğe alınmaz."""
+        last_sira_no = 0
+        while True:
+            # Sayfanın son sira_no'su: sonraki sayfa oradan devam eder (OFFSET'in baştan sayması olmadan).
+            page_end = self._conn.execute(
+                f"SELECT MAX(sira_no) FROM (SELECT sira_no FROM {self.table} WHERE sira_no > ? "
+                f"ORDER BY sira_no LIMIT ?)", (last_sira_no, _PAGE_SIZE)).fetchone()[0]
+            if page_end is None:
+                return
+            yield from self._read("WHERE sira_no > ? AND sira_no <= ? ORDER BY sira_no", (last_sira_no, page_end))
+            last_sira_no = page_end
+
+    def records(self) -> "SQLiteRecordList":
+        """Tablonun DataManager listesi (get_items) olarak kullanılan, sayfa sayfa okunan görünümü."""
+        return SQLiteRecordList(self)
+
+    def section(self) -> "SQLiteSection":
+        """Tablonun kaydetme bölümü olarak kullanılan görünümü (bkz. SQLiteSection)."""
+        return SQLiteSection(self._store.path, self.cls, len(self))
+
+    def names(self) -> dict:
+        """id -> ad tablosu; kayıtlar okunmadan yalnızca iki sütun sorgulanır."""
+        return dict(self._conn.execute(f"SELECT id, adi FROM {self.table} ORDER BY sira_no"))
+
+    def position(self, item_id) -> int:
+        """Kaydın sıradaki konumu (0'dan başlar)."""
+        row = self._conn.execute(
+            f"SELECT COUNT(*) FROM {self.table} WHERE sira_no < (SELECT sira_no FROM {self.table} WHERE id = ?)",
+            (item_id,)).fetchone()
+        if row is None or item_id not in self:
+            raise KeyError(item_id)
+        return row[0]
+
+    def page(self, offset: int, limit: int):
+        """Sıradaki [offset, offset + limit) aralığındaki kayıtlar."""
+        return self._read("ORDER BY sira_no LIMIT ? OFFSET ?", (limit, offset))
+
+    # --- Yazma ---
+
+    def insert_many(self, items):
+        """Kayıtları tek seferde sona ekler (toplu kayıt); var olan id'ler için hata verir."""
+        first = self._last_sira_no + 1
+        with self._store.transaction():
+            self._conn.executemany(self._insert_sql, (
+                (getattr(item, self.id_field), first + index, *self._row_values(item))
+                for index, item in enumerate(items)))
+            self._insert_children(items)
+        self._last_sira_no += len(items)
+        self._length += len(items)
+
+    def _row_values(self, item):
+        return [getattr(item, name) for name, _, _ in self._fields]
+
+    def _delete_children(self, item_ids):
+        for _, table, _ in self._lists:
+            self._conn.executemany(f"DELETE FROM {table} WHERE sahip_id = ?", ((item_id,) for item_id in item_ids))
+        if self._has_parameters:
+            self._conn.executemany(f"DELETE FROM {_PARAMETRE_TABLOSU} WHERE teknik_id = ?",
+                                   ((item_id,) for item_id in item_ids))
+
+    def _insert_children(self, items):
+        for field_name, table, item in self._lists:
+            if is_dataclass(item):
+                child_fields = [name for name, _, _ in _scalar_fields(item)]
+                rows = ((getattr(owner, self.id_field), position, *(getattr(child, name) for name in child_fields))
+                        for owner in items for position, child in enumerate(getattr(owner, field_name) or []))
+            else:
+                child_fields = [item]
+                rows = ((getattr(owner, self.id_field), position, value)
+                        for owner in items for position, value in enumerate(getattr(owner, field_name) or []))
+            self._conn.executemany(
+                f"INSERT INTO {table} (sahip_id, konum, {', '.join(child_fields)}) "
+                f"VALUES ({', '.join('?' * (len(child_fields) + 2))})", rows)
+
+        if self._has_parameters:
+            columns = list(_parameter_columns())
+            rows = []
+            for owner in items:
+                parameters = owner.parametreler
+                values = dict.fromkeys(columns)
+                if is_dataclass(parameters):
+                    values.update((name, getattr(parameters, name)) for name, _, _ in _scalar_fields(type(parameters)))
+                    class_name = type(parameters).__name__
+                else:
+                    class_name = None
+                rows.append((getattr(owner, self.id_field), class_name, *values.values()))
+            self._conn.executemany(
+                f"INSERT INTO {_PARAMETRE_TABLOSU} (teknik_id, sinif, {', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * (len(columns) + 2))})", rows)
+
+    # --- Okuma ---
+
+    def _read(self, scope: str, params=()):
+        """'SELECT ... FROM tablo {scope}' ile seçilen kayıtları alt tablolarıyla birlikte okur."""
+        rows = self._conn.execute(f"{self._select_sql} {scope}", params).fetchall()
+        if not rows:
+            return []
+        children = self._read_children(scope, params)
+
+        items = []
+        for row in rows:
+            item_id = row[0]
+            cached = self._cache.get(item_id)
+            if cached is not None:
+                # Aynı kaydın tek bir nesnesi olsun: arayüzde tutulan nesne ile listedeki aynıdır.
+                items.append(cached)
+                continue
+            data = {self.id_field: item_id}
+            for (name, _, is_bool), value in zip(self._fields, row[1:]):
+                if value is not None:
+                    data[name] = _to_python(value, is_bool)
+            for field_name, values_by_owner, default_factory in children:
+                data[field_name] = values_by_owner[item_id] if item_id in values_by_owner else default_factory()
+            item = self.cls(**data)
+            items.append(item)
+            self._remember(item_id, item)
+        return items
+
+    def _read_children(self, scope: str, params):
+        """Seçilen kayıtların liste ve parametre alanlarını [(alan, sahip id -> değer, varsayılan)] olarak okur."""
+        owners = f"IN (SELECT id FROM {self.table} {scope})"
+        children = []
+        for field_name, table, item in self._lists:
+            values_by_owner = {}
+            if is_dataclass(item):
+                child_fields = _scalar_fields(item)
+                columns = ", ".join(name for name, _, _ in child_fields)
+            else:
+                child_fields = None
+                columns = item
+            for owner_id, *values in self._conn.execute(
+                    f"SELECT sahip_id, {columns} FROM {table} WHERE sahip_id {owners} ORDER BY sahip_id, konum",
+                    params):
+                if child_fields is None:
+                    value = values[0]
+                else:
+                    value = item(**{name: _to_python(v, is_bool) for (name, _, is_bool), v in zip(child_fields, values)
+                                    if v is not None})
+                values_by_owner.setdefault(owner_id, []).append(value)
+            children.append((field_name, values_by_owner, list))
+
+        if self._has_parameters:
+            param_columns = list(_parameter_columns())
+            parameters_by_owner = {}
+            for owner_id, class_name, *values in self._conn.execute(
+                    f"SELECT teknik_id, sinif, {', '.join(param_columns)} FROM {_PARAMETRE_TABLOSU} "
+                    f"WHERE teknik_id {owners}", params):
+                if class_name is None:
+                    parameters_by_owner[owner_id] = None
+                    continue
+                param_cls = PARAM_CLASS_MAP.get(class_name, BaseTeknikParametreleri)
+                row = dict(zip(param_columns, values))
+                parameters_by_owner[owner_id] = param_cls(**{
+                    name: _to_python(row[name], is_bool) for name, _, is_bool in _scalar_fields(param_cls)
+                    if row[name] is not None})
+            children.append(("parametreler", parameters_by_owner, BaseTeknikParametreleri))
+        return children
+
+    def _remember(self, item_id, item):
+        self._cache[item_id] = item
+        self._cache.move_to_end(item_id)
+        if len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+
+class SQLiteRecordList(Sequence):
+    """Bir tablonun sıralı kayıt listesi gibi kullanılan salt okunur görünümü.
+
+    Dolaşma values() ile sayfa sayfa ilerler; sıra ile erişimde kaydın sayfası okunur ve son birkaç sayfa
+    bellekte tutulur. Görünüm canlıdır: tablo değişince DataManager yenisini verir, eskisi güncel tabloyu okur.
+    """
+
+    def __init__(self, table: SQLiteTable):
+        self._table = table
+        self._pages = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __iter__(self):
+        return self._table.values()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._table.page(start, max(0, stop - start))
+            return [self[position] for position in range(start, stop, step)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("kayıt sırası aralık dışında")
+        page_number, offset = divmod(index, _PAGE_SIZE)
+        page = self._pages.get(page_number)
+        if page is None:
+            page = self._pages[page_number] = self._table.page(page_number * _PAGE_SIZE, _PAGE_SIZE)
+            if len(self._pages) > _CACHED_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_number)
+        return page[offset]
+
+
+class SQLiteSection:
+    """Kaydedilecek bir tablonun bölüm görünümü (bkz. DataManager.workspace_sections).
+
+    Kayıtlar yazıcı onları dolaşırken okunur: her dolaşma, yazıcının iş parçacığında kendi salt okunur bağlantısını
+    açar ve tabloyu sayfa sayfa okur. Uzunluk görünümün alındığı andaki kayıt sayısıdır.
+    """
+
+    def __init__(self, path: str, cls, length: int):
+        self._path = path
+        self._cls = cls
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        store = SQLiteStore(self._path, read_only=True)
+        try:
+            yield from store.tables[self._cls].values()
+        finally:
+            store.close()
@@ -0,0 +1,155 @@
+# ew_platformasi/core/technique_recommender.py
+#
+# Hedef radara karşı hangi tekniğin denenmesi gerektiğini geçmiş senaryo sonuçlarından sıralar. Bir tekniğin bu
+# radara karşı sonucu bilinen gözlemi varsa puanı bunlardan; yoksa parametreleri (PRI, PW, ERP, bant, görev tipi) en
+# yakın, geçmişi olan radarlara karşı gözlemlerinden (yakınlıkla ağırlıklı) hesaplanır. Puan, gözlem az olduğunda
+# tekniğin tüm radarlara karşı genel başarısına çekilen ağırlıklı başarı oranıdır:
+#
+#   puan = (ağırlıklı başarı + K · genel oran) / (sonucu bilinen gözlem + K)
+#
+# İstatistikler ScenarioAnalytics'in artımlı güncellenen (teknik, radar) sayılarından okunur; sorgu maliyeti senaryo
+# sayısına bağlı değildir. Sonuçlar radar başına, sayılar ve radar kütüphanesi değişene kadar önbellekte tutulur.
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.data_models import Teknik
+from core.radar_catalog import RadarCatalog
+from core.scenario_analytics import OUTCOME_WEIGHTS, ScenarioAnalytics
+
+# Benzer radar olarak kullanılacak en çok komşu ve bu uzaklığın ötesindeki radarlar benzer sayılmaz.
+DEFAULT_NEIGHBOURS = 5
+MAX_SIMILAR_DISTANCE = 3.0
+# Genel orana çekme gücü (K): bu kadar gözlem genel oranla eşit ağırlıktadır.
+PRIOR_STRENGTH = 2.0
+# Hiç geçmişi olmayan tekniğin genel oranı
+DEFAULT_PRIOR_RATE = 0.5
+# Uzaklık ölçekleri: PRI ve PW'de on kat, ERP'de 10 dB bir birimdir; bant ve görev tipi farkı birer birimdir.
+_LOG_NUMERIC_FIELDS = ("pri_us", "pw_us")
+_ERP_SCALE_DB = 10.0
+_CATEGORY_MISMATCH = 1.0
+_UNKNOWN_PENALTY = 0.5
+
+# Önerinin dayanağı
+BASIS_DIRECT = "Doğrudan"
+BASIS_SIMILAR = "Benzer radarlar"
+BASIS_GENERAL = "Genel"
+BASIS_NONE = "Geçmiş yok"
+
+
+@dataclass
+class TechniqueRecommendation:
+    teknik: Teknik
+    # 0-1 arası sıralama puanı (bkz. modül açıklaması)
+    score: float
+    basis: str
+    # Puana giren sonucu bilinen gözlem sayısı (benzer radarlarda yakınlıkla ağırlıklı)
+    evidence: float
+    # Dayanağın ham başarı oranı; gözlem yoksa None
+    success_rate: Optional[float]
+
+
+class TechniqueRecommender:
+    """Hedef radar ve platform için teknikleri geçmiş senaryo sonuçlarına göre sıralar (bkz. recommend)."""
+
+    def __init__(self, analytics: ScenarioAnalytics, catalog: RadarCatalog, neighbours: int = DEFAULT_NEIGHBOURS):
+        self._analytics = analytics
+        self._catalog = catalog
+        self.neighbours = neighbours
+        # Radar id -> (teknik id -> (dayanak, ağırlıklı sayılar)); sayılar ya da katalog değişince boşaltılır.
+        self._cache: Dict[Optional[str], Dict[str, Tuple[str, np.ndarray]]] = {}
+        self._general: Dict[str, np.ndarray] = {}
+        self._cache_key = None
+
+    def recommend(self, radar_id: Optional[str], teknikler: List[Teknik]) -> List[TechniqueRecommendation]:
+        """Teknikleri puana göre (eşitlikte gözlem sayısı, sonra ada göre) sıralı öneriler olarak döndürür."""
+        evidence = self._evidence_for(radar_id)
+        recommendations = []
+        for teknik in teknikler:
+            general = self._general.get(teknik.teknik_id)
+            prior = _rate(general)
+            if prior is None:
+                prior = DEFAULT_PRIOR_RATE
+            basis, counts = evidence.get(teknik.teknik_id, (None, None))
+            if basis is None and general is not None:
+                basis, counts = BASIS_GENERAL, general
+            evaluated, successes = _evaluated_and_successes(counts)
+            recommendations.append(TechniqueRecommendation(
+                teknik=teknik,
+                score=(successes + PRIOR_STRENGTH * prior) / (evaluated + PRIOR_STRENGTH),
+                basis=basis if evaluated else BASIS_NONE,
+                evidence=evaluated,
+                success_rate=successes / evaluated if evaluated else None))
+        recommendations.sort(key=lambda r: (-r.score, -r.evidence, r.teknik.adi))
+        return recommendations
+
+    def similar_radars(self, radar_id: str) -> List[Tuple[str, float]]:
+        """Geçmişi olan radarlardan parametreleri en yakın olanlar: (radar id, uzaklık), yakından uzağa."""
+        columns = self._catalog.columns()
+        ids = columns["radar_id"]
+        rows = {radar_id: row for row, radar_id in enumerate(ids.tolist())}
+        target = rows.get(radar_id)
+        if target is None: return []
+        candidates = np.array([rows[other] for other in self._analytics.radars_with_history()
+                               if other != radar_id and other in rows], dtype=np.int64)
+        if not len(candidates): return []
+
+        distance = np.zeros(len(candidates))
+        for name in _LOG_NUMERIC_FIELDS + ("erp_dbw",):
+            column = columns[name]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if name == "erp_dbw":
+                    difference = (column[candidates] - column[target]) / _ERP_SCALE_DB
+                else:
+                    difference = np.log10(column[candidates] / column[target])
+            # Değeri bilinmeyen (ya da sıfır) alanlar sabit bir cezayla sayılır.
+            distance += np.where(np.isfinite(difference), difference ** 2, _UNKNOWN_PENALTY ** 2)
+        for name in ("frekans_bandi", "gorev_tipi"):
+            column = columns[name]
+            # Kod 0 katalogda "Bilinmiyor"dur.
+            unknown = (column[candidates] <= 0) | (column[target] <= 0)
+            mismatch = np.where(unknown, _UNKNOWN_PENALTY, (column[candidates] != column[target]) * _CATEGORY_MISMATCH)
+            distance += mismatch ** 2
+        distance = np.sqrt(distance)
+
+        nearest = np.argsort(distance, kind="stable")[:self.neighbours]
+        nearest = nearest[distance[nearest] <= MAX_SIMILAR_DISTANCE]
+        return [(ids[candidates[i]], float(distance[i])) for i in nearest]
+
+    def _evidence_for(self, radar_id: Optional[str]) -> Dict[str, Tuple[str, np.ndarray]]:
+        key = (self._analytics.revision, self._catalog.revision)
+        if key != self._cache_key:
+            self._cache.clear()
+            self._general = self._analytics.technique_outcomes()
+            self._cache_key = key
+        evidence = self._cache.get(radar_id)
+        if evidence is None:
+            evidence = self._cache[radar_id] = self._compute_evidence(radar_id)
+        return evidence
+
+    def _compute_evidence(self, radar_id: Optional[str]) -> Dict[str, Tuple[str, np.ndarray]]:
+        if radar_id is None: return {}
+        evidence = {teknik_id: (BASIS_DIRECT, counts)
+                    for teknik_id, counts in self._analytics.technique_outcomes({radar_id: 1.0}).items()
+                    if _evaluated_and_successes(counts)[0]}
+        # Doğrudan geçmişi olmayan teknikler için benzer radarlar, yakınlıkla ağırlıklandırılır.
+        weights = {other: 1.0 / (1.0 + distance) for other, distance in self.similar_radars(radar_id)}
+        if weights:
+            for teknik_id, counts in self._analytics.technique_outcomes(weights).items():
+                if teknik_id not in evidence:
+                    evidence[teknik_id] = (BASIS_SIMILAR, counts)
+        return evidence
+
+
+def _evaluated_and_successes(counts: Optional[np.ndarray]) -> Tuple[float, float]:
+    """Sonucu bilinen gözlem sayısı ve ağırlıklı başarı sayısı."""
+    if counts is None: return 0.0, 0.0
+    known = ~np.isnan(OUTCOME_WEIGHTS)
+    return float(counts[known].sum()), float(counts[known] @ OUTCOME_WEIGHTS[known])
+
+
+def _rate(counts: Optional[np.ndarray]) -> Optional[float]:
+    evaluated, successes = _evaluated_and_successes(counts)
+    return successes / evaluated if evaluated else None
@@ -0,0 +1,243 @@
+# ew_platformasi/core/timeline_simulator.py
+#
+# Senaryonun teknik zincirinin (uygulanan_teknikler: sıra, teknik, süre) zaman ekseninde örneklenmesi: her örnekte
+# etkin teknik, karıştırıcı gücü, kapladığı bant ve anlık frekans. Adımlar sıraya göre art arda uygulanır; senaryo
+# t = 0'da başlar. Güç gürültü karıştırmada ERP'den, alıcı/gönderici ayarlarında gönderici gücünden; bant ve tarama
+# kaynak üreteç ayarlarından (başlangıç -> bitiş frekansı, tarama süresiyle testere dişi) okunur. Bilinmeyen değerler
+# NaN'dır.
+#
+# Bir toplu işteki tüm senaryolar tek seferde örneklenir: her adımın örnek sayısı, başlangıç ve bitişinin örnekleme
+# ızgarasındaki yerinden bulunur; örnek sütunları adım tablosundan np.repeat ile açılır. Aynı grupta (ör. aynı
+# görevde) eşzamanlı başlayan senaryoların çakışmaları find_conflicts ile çıkarılır.
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from core.data_models import (AlmacGondermecAyarParametreleri, GurultuKaristirmaParams, KaynakUretecAyarParametreleri,
+                              Senaryo, Teknik)
+
+DEFAULT_STEP_S = 0.1
+# Bir toplu işte üretilecek en çok örnek; aşılırsa örnekleme aralığı hata verilir (bellek koruması).
+MAX_SAMPLES = 50_000_000
+_NO_TEKNIK = -1
+
+
+@dataclass
+class ChainSteps:
+    """Zincir adımları (senaryo sırasıyla, senaryo içinde sıra numarasıyla)."""
+    scenario: np.ndarray
+    start_s: np.ndarray
+    end_s: np.ndarray
+    # teknik_ids listesindeki kod; kütüphanede bulunmayan teknik -1
+    teknik: np.ndarray
+
+
+@dataclass
+class Timeline:
+    """Örnek başına sütunlar; örnekler senaryo senaryo, zaman sırasıyla art arda dizilidir."""
+    step_s: float
+    scenario_ids: List[str]
+    teknik_ids: List[str]
+    # Senaryonun toplam süresi (s)
+    durations_s: np.ndarray
+    steps: ChainSteps
+    # Örnek sütunları
+    scenario: np.ndarray
+    time_s: np.ndarray
+    step: np.ndarray
+    teknik: np.ndarray
+    power_dbw: np.ndarray
+    band_low_mhz: np.ndarray
+    band_high_mhz: np.ndarray
+    bandwidth_mhz: np.ndarray
+    frequency_mhz: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.time_s)
+
+    def samples_of(self, scenario_index: int) -> slice:
+        """Bir senaryonun örneklerinin aralığı."""
+        start, end = np.searchsorted(self.scenario, [scenario_index, scenario_index + 1])
+        return slice(int(start), int(end))
+
+
+@dataclass
+class ConflictReport:
+    """Aynı grupta en az iki senaryonun etkin olduğu zaman dilimleri (grup ve zamana göre sıralı)."""
+    group: np.ndarray
+    time_s: np.ndarray
+    active: np.ndarray
+    # Aynı platformdan eşzamanlı iki teknik
+    platform_conflict: np.ndarray
+    # Kapladıkları bantlar kesişen iki teknik
+    frequency_conflict: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.time_s)
+
+
+def technique_state(teknik: Optional[Teknik]):
+    """Tekniğin (güç dBW, bant alt MHz, bant üst MHz, bant genişliği MHz, tarama süresi ms); bilinmeyenler NaN."""
+    nan = float("nan")
+    power, low, high, bandwidth, sweep = nan, nan, nan, nan, nan
+    params = teknik.parametreler if teknik is not None else None
+    if isinstance(params, GurultuKaristirmaParams):
+        power = _value(params.guc_erp_dbw)
+        bandwidth = _value(params.bant_genisligi_mhz)
+    elif isinstance(params, KaynakUretecAyarParametreleri):
+        start, end = _value(params.baslangic_frekansi_mhz), _value(params.bitis_frekansi_mhz)
+        if start != start: start = end
+        if end != end: end = start
+        low, high = min(start, end), max(start, end)
+        bandwidth = high - low
+        sweep = _value(params.tarama_suresi_ms)
+    elif isinstance(params, AlmacGondermecAyarParametreleri):
+        power = _value(params.gonderici_guc_dbm) - 30.0
+    return power, low, high, bandwidth, sweep
+
+
+def _value(value) -> float:
+    return float("nan") if value is None else float(value)
+
+
+def chain_steps(senaryolar: List[Senaryo], teknik_codes: Dict[str, int]) -> ChainSteps:
+    """Zincirleri düz adım tablosuna açar; negatif süreler 0 sayılır."""
+    chains = [sorted(senaryo.uygulanan_teknikler, key=lambda u: u.sira) for senaryo in senaryolar]
+    lengths = np.fromiter(map(len, chains), dtype=np.int64, count=len(chains))
+    total = int(lengths.sum())
+    durations = np.fromiter((uygulama.sure_sn or 0.0 for chain in chains for uygulama in chain), dtype=float,
+                            count=total)
+    teknik = np.fromiter((teknik_codes.get(uygulama.teknik_id, _NO_TEKNIK) for chain in chains for uygulama in chain),
+                         dtype=np.int64, count=total)
+    return steps_from_chains(lengths, durations, teknik)
+
+
+def steps_from_chains(lengths: np.ndarray, durations: np.ndarray, teknik: np.ndarray) -> ChainSteps:
+    """Düz zincir dizilerinden (senaryo başına adım sayısı; sıraya dizili adım süreleri ve teknik kodları) adım
+    tablosu."""
+    lengths = np.asarray(lengths, dtype=np.int64)
+    durations = np.maximum(np.asarray(durations, dtype=float), 0.0)
+    teknik = np.asarray(teknik, dtype=np.int64)
+    scenario = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+    # Senaryo içindeki birikimli süre: global birikimli toplamdan senaryonun başlangıcı çıkarılır.
+    ends = np.cumsum(durations)
+    first_step = np.concatenate(([0], np.cumsum(lengths)[:-1])) if len(lengths) else np.zeros(0, dtype=np.int64)
+    scenario_start = np.concatenate(([0.0], ends))[first_step]
+    end_s = ends - np.repeat(scenario_start, lengths)
+    # Adım başlangıcı bir önceki adımın bitişinin kendisidir; ızgara hesabında adımlar arasında boşluk kalmaz.
+    start_s = np.concatenate(([0.0], end_s[:-1]))
+    start_s[first_step[lengths > 0]] = 0.0
+    return ChainSteps(scenario, start_s, end_s, teknik)
+
+
+def simulate(senaryolar: List[Senaryo], teknik_map: Dict[str, Teknik], step_s: float = DEFAULT_STEP_S) -> Timeline:
+    """Senaryoları step_s aralıklarla örnekler (bkz. modül açıklaması)."""
+    used = sorted({uygulama.teknik_id for senaryo in senaryolar for uygulama in senaryo.uygulanan_teknikler
+                   if uygulama.teknik_id in teknik_map})
+    teknik_codes = {teknik_id: code for code, teknik_id in enumerate(used)}
+    steps = chain_steps(senaryolar, teknik_codes)
+    timeline = simulate_steps(steps, technique_states([teknik_map[teknik_id] for teknik_id in used]),
+                              len(senaryolar), step_s)
+    timeline.scenario_ids = [senaryo.senaryo_id for senaryo in senaryolar]
+    timeline.teknik_ids = used
+    return timeline
+
+
+def technique_states(teknikler: List[Teknik]) -> np.ndarray:
+    """Teknik kodu başına technique_state satırları; son satır (-1 kodu) bilinmeyen teknik içindir."""
+    return np.array([technique_state(teknik) for teknik in teknikler] + [technique_state(None)],
+                    dtype=float).reshape(len(teknikler) + 1, 5)
+
+
+def simulate_steps(steps: ChainSteps, states: np.ndarray, count: int, step_s: float = DEFAULT_STEP_S) -> Timeline:
+    """Adım tablosunu step_s aralıklarla örnekler; states teknik kodlarına göre technique_states tablosudur.
+
+    Senaryo ve teknik id listeleri boş döner; kodlar çağıranın tablolarına göredir.
+    """
+    if step_s <= 0:
+        raise ValueError("Örnekleme aralığı pozitif olmalı")
+    power, low, high, bandwidth, sweep_ms = states.T
+    # Örnekler t = k · step_s anlarıdır; adım [başlangıç, bitiş) aralığındaki k'ları alır. Kayan nokta artığı
+    # fazladan örnek üretmesin diye sınırlarda küçük bir pay bırakılır.
+    first_k = np.ceil(steps.start_s / step_s - 1e-9).astype(np.int64)
+    step_counts = np.maximum(np.ceil(steps.end_s / step_s - 1e-9).astype(np.int64) - first_k, 0)
+    total = int(step_counts.sum())
+    if total > MAX_SAMPLES:
+        raise ValueError(f"{total} örnek çok fazla; örnekleme aralığını büyütün")
+
+    step = np.repeat(np.arange(len(step_counts), dtype=np.int64), step_counts)
+    first_sample = np.cumsum(step_counts) - step_counts
+    time_s = (first_k[step] + np.arange(total, dtype=np.int64) - first_sample[step]) * step_s
+    scenario = steps.scenario[step]
+    durations = np.bincount(steps.scenario, weights=steps.end_s - steps.start_s, minlength=count)
+
+    teknik = steps.teknik[step]
+    sample_low, sample_high = low[teknik], high[teknik]
+    # Tarama süresi olan bantta testere dişi; yoksa bant ortası. Faz yalnızca taranan örneklerde hesaplanır
+    # (np.mod, NaN bölenlerle çok yavaştır).
+    phase = np.full(total, 0.5)
+    swept = np.flatnonzero((sweep_ms > 0)[teknik])
+    if len(swept):
+        cycles = (time_s[swept] - steps.start_s[step[swept]]) * 1000.0 / sweep_ms[teknik[swept]]
+        phase[swept] = cycles - np.floor(cycles)
+    frequency = sample_low + (sample_high - sample_low) * phase
+
+    return Timeline(step_s=step_s, scenario_ids=[], teknik_ids=[], durations_s=durations, steps=steps,
+                    scenario=scenario, time_s=time_s, step=step, teknik=teknik, power_dbw=power[teknik], band_low_mhz=sample_low, band_high_mhz=sample_high,
+                    bandwidth_mhz=bandwidth[teknik], frequency_mhz=frequency)
+
+
+def find_conflicts(timeline: Timeline, group_of_scenario: np.ndarray,
+                   platform_of_scenario: Optional[np.ndarray] = None) -> ConflictReport:
+    """Aynı gruptaki (grup -1: hiçbir grupta değil) senaryoların eşzamanlı örneklerini zaman dilimlerinde karşılaştırır.
+
+    Gruptaki senaryolar aynı anda (t = 0) başlar. platform_of_scenario verilirse aynı platformun iki senaryosu aynı
+    dilimde etkinse platform çakışması sayılır; bilinen bantları kesişen iki etkin teknik frekans çakışmasıdır.
+    """
+    group_of_scenario = np.asarray(group_of_scenario, dtype=np.int64)
+    sample_group = group_of_scenario[timeline.scenario]
+    valid = np.flatnonzero(sample_group >= 0)
+    empty = np.zeros(0, dtype=np.int64)
+    if not len(valid):
+        return ConflictReport(empty, np.zeros(0), empty, np.zeros(0, dtype=bool), np.zeros(0, dtype=bool))
+
+    bins = np.rint(timeline.time_s[valid] / timeline.step_s).astype(np.int64)
+    bin_count = int(bins.max()) + 1
+    keys = sample_group[valid] * bin_count + bins
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    samples = valid[order]
+    # Dilim (grup, zaman) segmentleri
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    active = np.diff(np.append(starts, len(keys)))
+    segment = np.repeat(np.arange(len(starts)), active)
+
+    platform_conflict = np.zeros(len(starts), dtype=bool)
+    if platform_of_scenario is not None:
+        platforms = np.asarray(platform_of_scenario, dtype=np.int64)[timeline.scenario[samples]]
+        # Segment içinde platforma göre sıralanır; ardışık eşit (bilinen) platformlar çakışmadır.
+        by_platform = np.lexsort((platforms, segment))
+        same = ((platforms[by_platform][1:] == platforms[by_platform][:-1])
+                & (segment[by_platform][1:] == segment[by_platform][:-1]) & (platforms[by_platform][1:] >= 0))
+        platform_conflict[segment[by_platform][1:][same]] = True
+
+    frequency_conflict = np.zeros(len(starts), dtype=bool)
+    low, high = timeline.band_low_mhz[samples], timeline.band_high_mhz[samples]
+    known = np.flatnonzero(~np.isnan(low) & (active[segment] > 1))
+    if len(known) > 1:
+        by_low = known[np.lexsort((low[known], segment[known]))]
+        seg, seg_low, seg_high = segment[by_low], low[by_low], high[by_low]
+        # Segment içi birikimli en yüksek üst sınır: segmentler büyük bir kaydırmayla ayrılıp tek accumulate yapılır.
+        span = float(np.nanmax(high[known]) - np.nanmin(low[known])) + 1.0
+        shift = np.cumsum(np.concatenate(([0], seg[1:] != seg[:-1]))) * span
+        running_high = np.maximum.accumulate(seg_high - np.nanmin(low[known]) + shift)
+        overlaps = (seg[1:] == seg[:-1]) & (seg_low[1:] - np.nanmin(low[known]) + shift[1:] < running_high[:-1])
+        frequency_conflict[seg[1:][overlaps]] = True
+
+    overlap = np.flatnonzero(active > 1)
+    first = keys[starts[overlap]]
+    return ConflictReport(group=first // bin_count, time_s=(first % bin_count) * timeline.step_s,
+                          active=active[overlap], platform_conflict=platform_conflict[overlap],
+                          frequency_conflict=frequency_conflict[overlap])
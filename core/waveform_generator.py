@@ -0,0 +1,269 @@
+# ew_platformasi/core/waveform_generator.py
+#
+# Kaynak üreteç ayar parametrelerinden (KaynakUretecAyarParametreleri) sentetik IQ örnekleri üretir. Örnekler yerel
+# osilatöre (LO; verilmezse başlangıç/bitiş frekanslarının ortası) göre karmaşık taban bant (complex64) olarak, sabit
+# boyutlu parçalar halinde hesaplanır; uzun taramalar için tüm tampon bellekte tutulmaz, dosyaya yazarken parçalar
+# doğrudan bellek eşlemeli (.npy ya da ham) dosyanın ilgili dilimine yazılır.
+#
+# Faz her örnek için mutlak örnek indeksinden analitik olarak hesaplanır (tarama periyodu başına tam çevrimler atılır):
+#
+#   f(τ) = f0 + k·τ,   çevrim(n) = frac(p · frac(f0·P + ½·k·P²) + f0·τ + ½·k·τ²),   p = ⌊t/P⌋, τ = t - p·P
+#
+# bu yüzden çıktı parça boyutundan bağımsızdır ve parça sınırlarında faz sürekliliği kendiliğinden korunur. Faz
+# gürültüsü tohumlanmış tek bir rastgele akıştan sırayla çekilir; aynı tohumla çıktı yine parça boyutundan bağımsızdır.
+#
+# Tarama: tarama_suresi_ms verilmişse frekans bu sürede başlangıçtan bitişe doğrusal gider ve tekrarlar (testere
+# dişi tarama). Verilmemişse ve darbe genişliği varsa tarama her darbenin içinde yapılır (darbe içi LFM, PRI ile
+# tekrarlar); ikisi de yoksa sinyal başlangıç frekansında sabittir.
+#
+# Harmonikler: n. harmonik RF'de n·f_RF'dedir, taban bantta n·f_RF - LO'ya düşer; fazı mutlak taşıyıcıdan
+# n·θ + 2π·(n - 1)·f_LO·t olarak hesaplanır. Yalnızca taramanın tamamında bu frekans örnekleme bandında (±fs/2)
+# kalan harmonikler eklenir; diğerleri (ör. 1 GHz taşıyıcının 2 GHz harmoniği, birkaç MHz'lik bantta) kayıtta
+# görünmez ve atlanır.
+
+import os
+from typing import Iterator, Optional
+
+import numpy as np
+
+from core.data_models import KaynakUretecAyarParametreleri
+
+DALGA_FORMLARI = ("Sinus", "Kare", "Testere Dişi", "Darbe")
+DEFAULT_CHUNK_SAMPLES = 1 << 20
+# Örnekleme hızı verilmezse en büyük taban bant frekans kaymasının bu katı alınır (karmaşık örneklemede Nyquist 1x).
+_OVERSAMPLING = 2.5
+MIN_SAMPLE_RATE_HZ = 1e6
+# Bir darbeye en az bu kadar örnek düşecek şekilde örnekleme hızı artırılır.
+_SAMPLES_PER_PULSE = 10
+# Harmonik bastırma sinüs taşıyıcılı dalgalara bu harmonikler olarak eklenir (örnekleme bandına düşenler).
+HARMONICS = (2, 3)
+
+# Ham dosya biçimleri: cf32 = karmaşık float32 (I, Q art arda), sc16 = int16 I/Q çiftleri
+RAW_FORMATS = ("cf32", "sc16")
+# sc16'da tam ölçek; Kare ve harmonikli dalgaların tepe değerleri taşmasın diye 1.0 genlik tam ölçeğin yarısıdır.
+_SC16_SCALE = 16383.0
+
+
+class WaveformGenerator:
+    """KaynakUretecAyarParametreleri için parça parça IQ örnekleri üretir (bkz. modül açıklaması)."""
+
+    def __init__(self, params: KaynakUretecAyarParametreleri, sample_rate_hz: Optional[float] = None,
+                 center_mhz: Optional[float] = None, seed: int = 0):
+        if params.dalga_formu_tipi not in DALGA_FORMLARI:
+            raise ValueError(f"Desteklenmeyen dalga formu: {params.dalga_formu_tipi}")
+        self.waveform = params.dalga_formu_tipi
+        self.seed = seed
+
+        start, end = params.baslangic_frekansi_mhz, params.bitis_frekansi_mhz
+        if start is None: start = end
+        if end is None: end = start
+        if center_mhz is None:
+            center_mhz = (start + end) / 2 if start is not None else None
+        self.center_mhz = center_mhz
+        # Taban bant kaymaları (Hz); frekans hiç verilmemişse sinyal LO'dadır.
+        self.start_hz = (start - center_mhz) * 1e6 if start is not None else 0.0
+        self.end_hz = (end - center_mhz) * 1e6 if end is not None else 0.0
+
+        pulse_width = _positive(params.darbe_genisligi_us, 1e-6)
+        pri = _positive(params.darbe_tekrarlama_araligi_us, 1e-6)
+        if self.waveform == "Darbe" and (pulse_width is None or pri is None):
+            raise ValueError("Darbe dalga formu için darbe genişliği ve darbe tekrarlama aralığı gerekli.")
+        # Darbe kapısı yalnız ikisi de verilmişse ve darbe PRI'dan kısaysa uygulanır.
+        self.pulse_width_s = pulse_width if pri is not None and pulse_width is not None and pulse_width < pri else None
+        self.pri_s = pri if self.pulse_width_s is not None else None
+
+        # Tarama rampası (süre, tekrar periyodu)
+        sweep = _positive(params.tarama_suresi_ms, 1e-3)
+        if sweep is not None:
+            self.ramp_s, self.period_s = sweep, sweep
+        elif pulse_width is not None and self.start_hz != self.end_hz:
+            self.ramp_s, self.period_s = pulse_width, pri or pulse_width
+        else:
+            self.ramp_s, self.period_s = None, None
+
+        if sample_rate_hz is None:
+            sample_rate_hz = max(_OVERSAMPLING * max(abs(self.start_hz), abs(self.end_hz)), MIN_SAMPLE_RATE_HZ)
+            if self.pulse_width_s is not None:
+                sample_rate_hz = max(sample_rate_hz, _SAMPLES_PER_PULSE / self.pulse_width_s)
+        if not sample_rate_hz > 0:
+            raise ValueError("Örnekleme hızı pozitif olmalı.")
+        self.sample_rate_hz = float(sample_rate_hz)
+
+        # Faz gürültüsü: düz L dBc/Hz spektrumun örnekleme bandındaki toplam faz varyansı 10^(L/10)·fs (rad²).
+        noise = params.faz_gurultusu_dbc_hz
+        self.phase_noise_std_rad = float(np.sqrt(10 ** (noise / 10) * self.sample_rate_hz)) if noise else 0.0
+        suppression = params.harmonik_baski_db
+        self.harmonic_amplitude = (10 ** (-suppression / 20)
+                                   if suppression and self.waveform in ("Sinus", "Darbe") else 0.0)
+        # Örnekleme bandına düşen harmonikler ve LO teriminin örnek başına kesirli çevrimi: frac((n - 1)·f_LO / fs).
+        # LO bilinmiyorsa (frekans verilmemiş) harmoniklerin yeri de bilinmez.
+        self.harmonics = ()
+        if self.harmonic_amplitude and center_mhz is not None:
+            lo_hz, nyquist = center_mhz * 1e6, self.sample_rate_hz / 2
+            self.harmonics = tuple(
+                (harmonic, ((harmonic - 1) * lo_hz / self.sample_rate_hz) % 1.0) for harmonic in HARMONICS
+                if all(abs(harmonic * (lo_hz + offset) - lo_hz) <= nyquist for offset in (self.start_hz, self.end_hz)))
+        self._sample_index = None
+        self._scratch = None
+
+    def samples_for(self, duration_s: float) -> int:
+        return int(round(duration_s * self.sample_rate_hz))
+
+    def iter_chunks(self, total_samples: int, chunk_samples: int = DEFAULT_CHUNK_SAMPLES) -> Iterator[np.ndarray]:
+        """Baştan total_samples örneği en çok chunk_samples'lık complex64 diziler halinde üretir."""
+        rng = np.random.default_rng(self.seed)
+        for start in range(0, total_samples, chunk_samples):
+            chunk = np.empty(min(chunk_samples, total_samples - start), dtype=np.complex64)
+            self._fill(chunk, start, rng)
+            yield chunk
+
+    def _fill(self, out: np.ndarray, start: int, rng: np.random.Generator):
+        """out'u start örneğinden başlayarak doldurur; rng faz gürültüsü akışının kaldığı yerdir.
+
+        Ara sonuçlar parçalar arasında yeniden kullanılan tamponlara yerinde yazılır; her parçada yeni büyük dizi
+        ayrılmaz.
+        """
+        count = len(out)
+        t, work, cycles, theta, scratch, gate = self._buffers(count)
+        np.add(self._sample_index[:count], start, out=t)
+        t *= 1.0 / self.sample_rate_hz
+        if self.pulse_width_s is not None:
+            # Darbe kapısı: PRI içindeki konum darbe genişliğinden önceyse açık.
+            np.multiply(t, 1.0 / self.pri_s, out=work)
+            np.floor(work, out=cycles)
+            work -= cycles
+            np.less(work, self.pulse_width_s / self.pri_s, out=gate)
+
+        self._cycles(t, work, cycles)
+        np.multiply(cycles, 2 * np.pi, out=theta, casting="same_kind")
+        if self.phase_noise_std_rad:
+            rng.standard_normal(count, dtype=np.float32, out=scratch)
+            scratch *= np.float32(self.phase_noise_std_rad)
+            theta += scratch
+
+        real, imag = out.real, out.imag
+        if self.waveform == "Kare":
+            np.cos(theta, out=scratch)
+            np.copysign(np.float32(np.sqrt(0.5)), scratch, out=real)
+            np.sin(theta, out=scratch)
+            np.copysign(np.float32(np.sqrt(0.5)), scratch, out=imag)
+        elif self.waveform == "Testere Dişi":
+            # I ve Q çeyrek çevrim kaymalı testere dişleridir; genlik, güç sinüsle aynı olacak şekilde ölçeklenir.
+            scale = np.float32(np.sqrt(1.5))
+            theta *= np.float32(1 / (2 * np.pi))
+            for target in (real, imag):
+                np.floor(theta, out=scratch)
+                np.subtract(theta, scratch, out=scratch)
+                np.multiply(scratch, 2 * scale, out=target)
+                target -= scale
+                theta -= np.float32(0.25)
+        else:
+            np.cos(theta, out=real)
+            np.sin(theta, out=imag)
+            amplitude = np.float32(self.harmonic_amplitude)
+            for harmonic, lo_cycles in self.harmonics:
+                # work = 2π·frac((n - 1)·f_LO·t) + n·θ; LO terimi mutlak örnek indeksinden hesaplanır.
+                np.add(self._sample_index[:count], start, out=work)
+                work *= lo_cycles
+                np.floor(work, out=cycles)
+                work -= cycles
+                work *= 2 * np.pi
+                np.multiply(theta, np.float32(harmonic), out=scratch)
+                work += scratch
+                for function, target in ((np.cos, real), (np.sin, imag)):
+                    function(work, out=scratch, casting="same_kind")
+                    scratch *= amplitude
+                    target += scratch
+
+        if self.pulse_width_s is not None:
+            real *= gate
+            imag *= gate
+
+    def _cycles(self, t: np.ndarray, work: np.ndarray, cycles: np.ndarray):
+        """Her zamandaki fazın kesirli çevrimini (0-1) cycles'a yazar; t ve work ara tampon olarak bozulur."""
+        if self.ramp_s is None:
+            np.multiply(t, self.start_hz, out=cycles)
+        else:
+            period = self.period_s
+            slope = (self.end_hz - self.start_hz) / self.ramp_s
+            cycles_per_period = self.start_hz * period + 0.5 * slope * period * period
+            # work = periyot içindeki süre (τ), cycles = geçen periyot sayısı
+            np.multiply(t, 1.0 / period, out=work)
+            np.floor(work, out=cycles)
+            work -= cycles
+            work *= period
+            # Tam çevrimler her adımda atılır; uzun kayıtlarda hassasiyet korunur.
+            cycles *= cycles_per_period - np.floor(cycles_per_period)
+            np.floor(cycles, out=t)
+            cycles -= t
+            np.multiply(work, 0.5 * slope, out=t)
+            t += self.start_hz
+            t *= work
+            cycles += t
+        np.floor(cycles, out=t)
+        cycles -= t
+
+    def _buffers(self, count: int):
+        """En az count örneklik ara tamponlar (t, iş, çevrim: float64; faz, iş: float32; darbe kapısı: bool)."""
+        if self._scratch is None or len(self._sample_index) < count:
+            self._sample_index = np.arange(count, dtype=np.float64)
+            self._scratch = (np.empty(count), np.empty(count), np.empty(count), np.empty(count, dtype=np.float32),
+                             np.empty(count, dtype=np.float32), np.empty(count, dtype=bool))
+        return tuple(buffer[:count] for buffer in self._scratch)
+
+
+def generate(generator: WaveformGenerator, total_samples: int,
+             chunk_samples: int = DEFAULT_CHUNK_SAMPLES) -> np.ndarray:
+    """Tüm örnekleri tek dizide döndürür; kısa kayıtlar içindir."""
+    out = np.empty(total_samples, dtype=np.complex64)
+    rng = np.random.default_rng(generator.seed)
+    for start in range(0, total_samples, chunk_samples):
+        generator._fill(out[start:start + chunk_samples], start, rng)
+    return out
+
+
+def write_waveform(path: str, generator: WaveformGenerator, total_samples: int,
+                   chunk_samples: int = DEFAULT_CHUNK_SAMPLES, raw_format: str = "cf32") -> int:
+    """Örnekleri bellek eşlemeli dosyaya parça parça yazar; yazılan bayt sayısını döndürür.
+
+    .npy uzantılı yollar complex64 NumPy dizisi olarak, diğerleri başlıksız ham IQ (raw_format: cf32 ya da sc16)
+    olarak yazılır.
+    """
+    if raw_format not in RAW_FORMATS:
+        raise ValueError(f"Desteklenmeyen ham IQ biçimi: {raw_format}")
+    npy = os.path.splitext(path)[1].lower() == ".npy"
+    if not total_samples:
+        # Boş bellek eşlemesi açılamaz; boş dizi (ya da boş ham dosya) yazılır.
+        if npy:
+            np.save(path, np.empty(0, dtype=np.complex64))
+        else:
+            open(path, "wb").close()
+        return os.path.getsize(path)
+    if npy:
+        target = np.lib.format.open_memmap(path, mode="w+", dtype=np.complex64, shape=(total_samples,))
+    elif raw_format == "cf32":
+        target = np.memmap(path, mode="w+", dtype=np.complex64, shape=(total_samples,))
+    else:
+        target = np.memmap(path, mode="w+", dtype=np.int16, shape=(total_samples, 2))
+
+    rng = np.random.default_rng(generator.seed)
+    buffer = None if npy or raw_format == "cf32" else np.empty(chunk_samples, dtype=np.complex64)
+    try:
+        for start in range(0, total_samples, chunk_samples):
+            count = min(chunk_samples, total_samples - start)
+            if buffer is None:
+                generator._fill(target[start:start + count], start, rng)
+            else:
+                chunk = buffer[:count]
+                generator._fill(chunk, start, rng)
+                np.rint(chunk.real * _SC16_SCALE, out=target[start:start + count, 0], casting="unsafe")
+                np.rint(chunk.imag * _SC16_SCALE, out=target[start:start + count, 1], casting="unsafe")
+        target.flush()
+    finally:
+        del target
+    return os.path.getsize(path)
+
+
+def _positive(value: Optional[float], scale: float) -> Optional[float]:
+    """Pozitif değeri SI birimine çevirir; boş ya da pozitif olmayan değerler yok sayılır."""
+    return value * scale if value is not None and value > 0 else None
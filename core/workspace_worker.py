@@ -0,0 +1,51 @@
+# ew_platformasi/core/workspace_worker.py
+
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from core.data_manager import OperationCancelledError
+
+
+class WorkspaceTaskSignals(QObject):
+    # QRunnable bir QObject olmadığından sinyaller ayrı bir nesnede tutulur.
+    progress = Signal(str, int, int)  # bölüm, işlenen kayıt sayısı, yüzde
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+
+class WorkspaceTask(QRunnable):
+    """DataManager.load_workspace_items / write_workspace gibi bir işlevi QThreadPool üzerinde çalıştırır.
+
+    İşleve progress ve is_cancelled geri çağrıları eklenir. Sonuç finished sinyaliyle GUI iş parçacığına
+    tek parça olarak iletilir; veri modeline uygulanması orada yapılır.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        # Nesnenin ömrünü Python tarafı yönetir; havuz iş bitince C++ nesnesini silmez.
+        self.setAutoDelete(False)
+        self.signals = WorkspaceTaskSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self):
+        try:
+            result = self._fn(*self._args, progress=self.signals.progress.emit,
+                              is_cancelled=self.is_cancelled, **self._kwargs)
+        except OperationCancelledError:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
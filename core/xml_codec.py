@@ -0,0 +1,234 @@
+# ew_platformasi/core/xml_codec.py
+
+import xml.etree.ElementTree as ET
+# ElementTree'nin kendi kaçış fonksiyonları: doğrudan metin üretimi tostring ile aynı çıktıyı verir.
+from xml.etree.ElementTree import _escape_attrib, _escape_cdata
+from dataclasses import fields, is_dataclass
+from typing import Dict, Literal, Optional, Type, TypeVar, Union, get_args, get_origin
+
+from core.data_models import (
+    BaseTeknikParametreleri, GurultuKaristirmaParams, MenzilAldatmaParams,
+    AlmacGondermecAyarParametreleri, KaynakUretecAyarParametreleri, TeknikUygulama
+)
+
+T = TypeVar('T')
+
+PARAM_CLASS_MAP = {
+    "GurultuKaristirmaParams": GurultuKaristirmaParams,
+    "MenzilAldatmaParams": MenzilAldatmaParams,
+    "AlmacGondermecAyarParametreleri": AlmacGondermecAyarParametreleri,
+    "KaynakUretecAyarParametreleri": KaynakUretecAyarParametreleri,
+    "BaseTeknikParametreleri": BaseTeknikParametreleri
+}
+
+# Adım türleri: alanın XML'e nasıl yazılıp okunacağını belirler.
+_SCALAR, _PARAMS, _ID_LIST, _UYGULAMA_LIST = range(4)
+
+
+def pascal_case(field_name: str) -> str:
+    return field_name.replace('_', ' ').title().replace(' ', '')
+
+
+def id_field_name(cls: type) -> Optional[str]:
+    """Sınıfın kimlik alanının adını döndürür (ETPlatformu için 'platform_id'); yoksa None."""
+    name = f"{cls.__name__.lower().replace('et', 'et_')}_id"
+    if name == "et_platformu_id": name = "platform_id"
+    return name if name in {f.name for f in fields(cls)} else None
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+def _to_bool(text: str) -> bool:
+    return text.lower() in ('true', '1')
+
+
+def _compile_converter(field_type):
+    """Bir alan tipi için metin -> değer dönüştürücüsünü bir kez çözer."""
+    origin_type = get_origin(field_type)
+    type_args = get_args(field_type)
+    if origin_type is Union and type(None) in type_args:
+        target = next(t for t in type_args if t is not type(None))
+    elif field_type is bool:
+        return _to_bool
+    else:
+        target = field_type
+
+    # str(metin) ve çağrılamayan Literal tipleri metni olduğu gibi bırakır.
+    if target is str or get_origin(target) is Literal:
+        return _identity
+
+    def convert(text: str):
+        try:
+            return target(text)
+        except (ValueError, TypeError):
+            return text
+    return convert
+
+
+class DataclassCodec:
+    """Bir dataclass için (etiket, alan, dönüştürücü) adımlarını bir kez derleyip tekrar kullanır."""
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self.tag = cls.__name__
+        self.id_field = id_field_name(cls)
+
+        self._steps = []
+        for field_info in fields(cls):
+            if field_info.name == self.id_field: continue
+            if field_info.name == "parametreler":
+                kind, converter = _PARAMS, None
+            elif field_info.name == "senaryo_id_list":
+                kind, converter = _ID_LIST, None
+            elif field_info.name == "uygulanan_teknikler":
+                kind, converter = _UYGULAMA_LIST, None
+            else:
+                kind, converter = _SCALAR, _compile_converter(field_info.type)
+            self._steps.append((pascal_case(field_info.name), field_info.name, kind, converter))
+        self._steps_by_tag = {step[0]: step for step in self._steps}
+
+    def decode(self, element: ET.Element):
+        data = {}
+        steps_by_tag = self._steps_by_tag
+        for child_element in element:
+            step = steps_by_tag.get(child_element.tag)
+            if step is None: continue
+            _, name, kind, converter = step
+            if name in data: continue  # find() gibi yalnızca ilk eşleşen eleman dikkate alınır
+
+            if kind is _SCALAR:
+                text_val = child_element.text
+                if text_val is not None and text_val != 'None':
+                    data[name] = converter(text_val)
+            elif kind is _PARAMS:
+                if len(child_element) > 0:
+                    param_element = child_element[0]
+                    param_cls = PARAM_CLASS_MAP.get(param_element.tag, BaseTeknikParametreleri)
+                    data[name] = get_codec(param_cls).decode(param_element)
+            elif kind is _ID_LIST:
+                data[name] = [item.text for item in child_element if item.tag == "SenaryoID"]
+            else:
+                uygulama_codec = get_codec(TeknikUygulama)
+                data[name] = [uygulama_codec.decode(item) for item in child_element
+                              if item.tag == "TeknikUygulama"]
+
+        if self.id_field:
+            id_attr = element.get("id")
+            if id_attr:
+                data[self.id_field] = id_attr
+
+        try:
+            return self.cls(**data)
+        except TypeError:
+            return None
+
+    def encode(self, instance) -> ET.Element:
+        attribs = {}
+        if self.id_field:
+            item_id = getattr(instance, self.id_field)
+            if item_id:
+                attribs["id"] = item_id
+
+        element = ET.Element(self.tag, attrib=attribs)
+        sub_element = ET.SubElement
+        for tag, name, kind, _ in self._steps:
+            child_element = sub_element(element, tag)
+            value = getattr(instance, name)
+            if value is None: continue
+
+            if kind is _SCALAR:
+                child_element.text = str(value)
+            elif kind is _PARAMS:
+                if is_dataclass(value):
+                    child_element.append(get_codec(type(value)).encode(value))
+                else:
+                    child_element.text = str(value)
+            elif kind is _ID_LIST:
+                for item in value: sub_element(child_element, "SenaryoID").text = str(item)
+            else:
+                for item in value:
+                    child_element.append(get_codec(type(item)).encode(item))
+        return element
+
+    def serialize(self, instance, level: int = 0, pretty: bool = True) -> str:
+        """Kaydı ara Element ağacı kurmadan doğrudan XML metnine çevirir.
+
+        Çıktı, encode() sonucunun ET.indent(level=level) + ET.tostring ile serileştirilmiş hali ile aynıdır.
+        """
+        parts = []
+        self._serialize_into(parts, instance, level, pretty)
+        return "".join(parts)
+
+    def _serialize_into(self, parts: list, instance, level: int, pretty: bool):
+        tag = self.tag
+        open_tag = f"<{tag}"
+        if self.id_field:
+            item_id = getattr(instance, self.id_field)
+            if item_id:
+                open_tag = f'<{tag} id="{_escape_attrib(item_id)}"'
+        if not self._steps:
+            parts.append(open_tag + " />")
+            return
+
+        indent = _indentation(level, pretty)
+        child_indent = _indentation(level + 1, pretty)
+        grandchild_indent = _indentation(level + 2, pretty)
+        append = parts.append
+        append(open_tag + ">")
+        for child_tag, name, kind, _ in self._steps:
+            append(child_indent)
+            value = getattr(instance, name)
+            if value is None:
+                append(f"<{child_tag} />")
+            elif kind is _SCALAR or (kind is _PARAMS and not is_dataclass(value)):
+                _append_text_element(parts, child_tag, str(value))
+            elif not value and kind is not _PARAMS:
+                append(f"<{child_tag} />")
+            else:
+                append(f"<{child_tag}>")
+                if kind is _PARAMS:
+                    append(grandchild_indent)
+                    get_codec(type(value))._serialize_into(parts, value, level + 2, pretty)
+                elif kind is _ID_LIST:
+                    for item in value:
+                        append(grandchild_indent)
+                        _append_text_element(parts, "SenaryoID", str(item))
+                else:
+                    for item in value:
+                        append(grandchild_indent)
+                        get_codec(type(item))._serialize_into(parts, item, level + 2, pretty)
+                append(child_indent)
+                append(f"</{child_tag}>")
+        append(indent)
+        append(f"</{tag}>")
+
+
+_INDENTATIONS: Dict[int, str] = {}
+
+
+def _indentation(level: int, pretty: bool) -> str:
+    if not pretty:
+        return ""
+    indentation = _INDENTATIONS.get(level)
+    if indentation is None:
+        indentation = _INDENTATIONS[level] = "\n" + "  " * level
+    return indentation
+
+
+def _append_text_element(parts: list, tag: str, text: str):
+    if text:
+        parts.append(f"<{tag}>{_escape_cdata(text)}</{tag}>")
+    else:
+        parts.append(f"<{tag} />")
+
+
+_CODECS: Dict[type, DataclassCodec] = {}
+
+
+def get_codec(cls: Type[T]) -> DataclassCodec:
+    codec = _CODECS.get(cls)
+    if codec is None:
+        codec = _CODECS[cls] = DataclassCodec(cls)
+    return codec
@@ -0,0 +1,55 @@
+# ew_platformasi/pdw_eslestir.py
+#
+# PDW kayıt dosyalarını (ikili .pdw ya da CSV) bir veri setinin radar kütüphanesiyle eşleştirir ve radar başına
+# özeti CSV olarak yazar. Projenin kök dizininden çalıştırın:
+#   python pdw_eslestir.py veri_seti.ewb kayit1.pdw kayit2.csv -o pdw_ozet.csv
+
+import argparse
+import os
+import sys
+
+from core.data_manager import DataManager
+from core.data_models import Radar
+from core.emitter_matcher import DEFAULT_PRI_TOLERANCE, DEFAULT_PW_TOLERANCE
+from core.pdw_ingest import DEFAULT_CHUNK_PULSES, PdwIngestor, write_match_summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PDW dosyalarını radar kütüphanesiyle eşleştirir.")
+    parser.add_argument("veri_seti", help="Radar kütüphanesini içeren veri seti (.xml, .ewb, .ewdb)")
+    parser.add_argument("pdw_dosyalari", nargs="+", help="İkili (.pdw) ya da CSV PDW dosyaları")
+    parser.add_argument("-o", "--cikti", default="pdw_ozet.csv", help="Radar başına özetin yazılacağı CSV dosyası")
+    parser.add_argument("--parca", type=int, default=DEFAULT_CHUNK_PULSES, help="Bir seferde işlenen darbe sayısı")
+    parser.add_argument("--pri-tolerans", type=float, default=DEFAULT_PRI_TOLERANCE * 100, help="PRI toleransı (%%)")
+    parser.add_argument("--pw-tolerans", type=float, default=DEFAULT_PW_TOLERANCE * 100, help="PW toleransı (%%)")
+    args = parser.parse_args()
+
+    data_manager = DataManager()
+    data_manager.status_updated.connect(print)
+    data_manager.open_workspace(args.veri_seti)
+    if not data_manager.get_items(Radar):
+        print("Hata: Veri setinde eşleştirilecek radar yok.")
+        return 1
+
+    try:
+        ingestor = PdwIngestor(data_manager.emitter_matcher(), pri_tolerance=args.pri_tolerans / 100,
+                               pw_tolerance=args.pw_tolerans / 100)
+        for path in args.pdw_dosyalari:
+            pulses = ingestor.ingest_file(path, args.parca,
+                                          progress=lambda total: print(f"\r{total} darbe işlendi...", end="", flush=True))
+            print(f"\r'{os.path.basename(path)}': {pulses} darbe")
+        summaries = ingestor.summaries()
+        write_match_summary(args.cikti, summaries, data_manager.item_map(Radar))
+    except (OSError, ValueError) as e:
+        print(f"\nHata: PDW dosyaları işlenemedi - {e}")
+        return 1
+
+    matched_ratio = ingestor.matched_count * 100 / max(ingestor.pulse_count, 1)
+    print(f"Toplam {ingestor.pulse_count} darbe, {ingestor.elapsed_s:.2f} s ({ingestor.pulses_per_second:,.0f} darbe/s); "
+          f"%{matched_ratio:.1f} eşleşti, {len(summaries)} radar.")
+    print(f"Özet '{args.cikti}' dosyasına yazıldı.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# ew_platformasi/senaryo_degerlendir.py
+#
+# Bir veri setindeki senaryoları toplu olarak değerlendirir (J/S, yanma menzili, zaman çizelgesi ölçüleri, sonuç
+# puanı) ve senaryo başına sonuçları CSV olarak yazar. Senaryolar parçalar halinde işlem havuzunda değerlendirilir.
+# Projenin kök dizininden çalıştırın:
+#   python senaryo_degerlendir.py veri_seti.ewb -o degerlendirme.csv --isci 8
+
+import argparse
+import sys
+
+from core.batch_evaluator import DEFAULT_CHUNK_SCENARIOS, DEFAULT_STEP_S, evaluate_scenarios, write_evaluation_csv
+from core.data_manager import DataManager
+from core.data_models import Radar, Senaryo, Teknik
+from core.jamming_calculator import DEFAULT_RCS_M2, DEFAULT_REQUIRED_JS_DB
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Senaryoları toplu olarak değerlendirir.")
+    parser.add_argument("veri_seti", help="Senaryoları içeren veri seti (.xml, .ewb, .ewdb)")
+    parser.add_argument("-o", "--cikti", default="senaryo_degerlendirme.csv", help="Sonuçların yazılacağı CSV dosyası")
+    parser.add_argument("--isci", type=int, default=None, help="İşçi süreç sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument("--parca", type=int, default=DEFAULT_CHUNK_SCENARIOS, help="Parça başına senaryo sayısı")
+    parser.add_argument("--aralik", type=float, default=DEFAULT_STEP_S, help="Zaman çizelgesi örnekleme aralığı (s)")
+    parser.add_argument("--rcs", type=float, default=DEFAULT_RCS_M2, help="Hedefin radar kesit alanı (m²)")
+    parser.add_argument("--gereken-js", type=float, default=DEFAULT_REQUIRED_JS_DB,
+                        help="Yanma menzili için gereken J/S (dB)")
+    args = parser.parse_args()
+
+    data_manager = DataManager()
+    data_manager.status_updated.connect(print)
+    data_manager.open_workspace(args.veri_seti)
+    senaryolar = data_manager.get_items(Senaryo)
+    if not senaryolar:
+        print("Hata: Veri setinde değerlendirilecek senaryo yok.")
+        return 1
+
+    try:
+        results = evaluate_scenarios(senaryolar, data_manager.get_items(Radar), data_manager.get_items(Teknik),
+                                     workers=args.isci, chunk_scenarios=args.parca, step_s=args.aralik,
+                                     rcs_m2=args.rcs, required_js_db=args.gereken_js,
+                                     progress=lambda done: print(f"\r{done}/{len(senaryolar)} senaryo değerlendirildi...",
+                                                                 end="", flush=True))
+        print()
+        write_evaluation_csv(args.cikti, results, data_manager.item_map(Senaryo), data_manager.item_map(Teknik))
+    except (OSError, ValueError) as e:
+        print(f"\nHata: Senaryolar değerlendirilemedi - {e}")
+        return 1
+
+    print(f"Toplam {len(results)} senaryo, {results.elapsed_s:.2f} s ({results.scenarios_per_second:,.0f} senaryo/s).")
+    print(f"Sonuçlar '{args.cikti}' dosyasına yazıldı.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
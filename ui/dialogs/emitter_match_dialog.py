@@ -0,0 +1,107 @@
+# ew_platformasi/ui/dialogs/emitter_match_dialog.py
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QDoubleValidator
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QComboBox, QLineEdit, QPushButton,
+                               QGroupBox, QDoubleSpinBox, QTableWidget, QTableWidgetItem, QHeaderView,
+                               QAbstractItemView, QMessageBox)
+from core.data_models import Radar, FREKANS_BANDLARI
+from core.emitter_matcher import DEFAULT_PRI_TOLERANCE, DEFAULT_PW_TOLERANCE
+from typing import Callable, Optional
+
+_BILINMIYOR = "Bilinmiyor"
+_SUTUNLAR = ["Radar", "ELNOT", "Bant", "PRI (µs)", "PW (µs)", "PRI Sapma (%)", "PW Sapma (%)", "Skor"]
+
+
+def _format(value: Optional[float], precision: int) -> str:
+    return "-" if value is None else f"{value:.{precision}f}"
+
+
+class EmitterMatchDialog(QDialog):
+    """Ölçülen PRI/PW/bant değerlerini radar kütüphanesiyle eşleştirir; seçilen aday selected_radar'da döner."""
+
+    def __init__(self, match_function: Callable, radar: Optional[Radar] = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Yakalanan Yayını Tanımla")
+        self.setMinimumSize(800, 500)
+        self._match_function = match_function
+        self._matches = []
+        self.selected_radar = None
+
+        layout = QVBoxLayout(self)
+        olcum_group = QGroupBox("Ölçülen Parametreler")
+        olcum_form = QFormLayout(olcum_group)
+        validator = QDoubleValidator(bottom=0.0)
+        validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        self.in_pri = QLineEdit(validator=validator, placeholderText="zorunlu")
+        self.in_pw = QLineEdit(validator=validator, placeholderText="ölçülmediyse boş bırakın")
+        self.dd_bant = QComboBox()
+        self.dd_bant.addItems(FREKANS_BANDLARI)
+        self.in_pri_tol = QDoubleSpinBox(suffix=" %", minimum=0.1, maximum=50.0, value=DEFAULT_PRI_TOLERANCE * 100)
+        self.in_pw_tol = QDoubleSpinBox(suffix=" %", minimum=0.1, maximum=100.0, value=DEFAULT_PW_TOLERANCE * 100)
+        olcum_form.addRow("PRI (µs):", self.in_pri)
+        olcum_form.addRow("PW (µs):", self.in_pw)
+        olcum_form.addRow("Frekans Bandı:", self.dd_bant)
+        olcum_form.addRow("PRI Toleransı:", self.in_pri_tol)
+        olcum_form.addRow("PW Toleransı:", self.in_pw_tol)
+
+        self.btn_eslestir = QPushButton("Eşleştir")
+        self.table = QTableWidget(0, len(_SUTUNLAR))
+        self.table.setHorizontalHeaderLabels(_SUTUNLAR)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+
+        self.btn_goster = QPushButton("Kütüphanede Göster")
+        btn_kapat = QPushButton("Kapat")
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        btn_layout.addWidget(self.btn_goster)
+        btn_layout.addWidget(btn_kapat)
+
+        layout.addWidget(olcum_group)
+        layout.addWidget(self.btn_eslestir, 0, Qt.AlignmentFlag.AlignRight)
+        layout.addWidget(self.table)
+        layout.addLayout(btn_layout)
+
+        self.btn_eslestir.clicked.connect(self._run_match)
+        self.btn_goster.clicked.connect(self._show_selected)
+        self.table.doubleClicked.connect(self._show_selected)
+        btn_kapat.clicked.connect(self.reject)
+
+        if radar is not None:
+            # Seçili radarın parametreleriyle açılır; benzer radarları bulmak için de kullanılır.
+            pri = radar.pri_us if radar.pri_us else (1_000_000 / radar.prf_hz if radar.prf_hz else None)
+            self.in_pri.setText("" if pri is None else f"{pri:g}")
+            self.in_pw.setText("" if radar.pw_us is None else f"{radar.pw_us:g}")
+            self.dd_bant.setCurrentText(radar.frekans_bandi)
+
+    def _run_match(self):
+        def get_float(widget: QLineEdit):
+            text = widget.text().strip().replace(',', '.')
+            return float(text) if text else None
+
+        pri = get_float(self.in_pri)
+        if not pri:
+            QMessageBox.warning(self, "Eksik Bilgi", "Eşleştirme için sıfırdan büyük bir PRI değeri girin.")
+            return
+        bant = self.dd_bant.currentText()
+        self._matches = self._match_function(pri, get_float(self.in_pw), None if bant == _BILINMIYOR else bant,
+                                             self.in_pri_tol.value() / 100, self.in_pw_tol.value() / 100)
+        self.table.setRowCount(len(self._matches))
+        for row, (candidate, radar) in enumerate(self._matches):
+            pri_us = radar.pri_us if radar.pri_us else (1_000_000 / radar.prf_hz if radar.prf_hz else None)
+            values = [radar.adi, radar.elnot, radar.frekans_bandi, _format(pri_us, 3), _format(radar.pw_us, 2),
+                      _format(candidate.pri_deviation, 2), _format(candidate.pw_deviation, 2),
+                      _format(candidate.score, 3)]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        if not self._matches:
+            QMessageBox.information(self, "Sonuç", "Toleranslar içinde eşleşen radar bulunamadı.")
+
+    def _show_selected(self):
+        rows = self.table.selectionModel().selectedRows()
+        if not rows: return
+        self.selected_radar = self._matches[rows[0].row()][1]
+        self.accept()
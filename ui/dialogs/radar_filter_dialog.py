@@ -0,0 +1,94 @@
+# ew_platformasi/ui/dialogs/radar_filter_dialog.py
+
+from PySide6.QtGui import QDoubleValidator
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QComboBox, QLineEdit, QPushButton,
+                               QGroupBox)
+from core.data_models import FREKANS_BANDLARI, GOREV_TIPLERI, ANTEN_TIPLERI
+from typing import Dict, Optional
+
+_TUMU = "Tümü"
+
+
+class RadarFilterDialog(QDialog):
+    """Radar kütüphanesi için parametrik filtre: katalog alanları ve sayısal aralıklar (boş kutu = sınır yok)."""
+
+    def __init__(self, criteria: Optional[Dict] = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Gelişmiş Radar Filtresi")
+        self.criteria = criteria
+        criteria = criteria or {}
+
+        layout = QVBoxLayout(self)
+        katalog_group = QGroupBox("Sınıflandırma")
+        katalog_form = QFormLayout(katalog_group)
+        self.dd_bant = self._create_combo(FREKANS_BANDLARI, criteria.get("frekans_bandi"))
+        self.dd_gorev = self._create_combo(GOREV_TIPLERI, criteria.get("gorev_tipi"))
+        self.dd_anten = self._create_combo(ANTEN_TIPLERI, criteria.get("anten_tipi"))
+        katalog_form.addRow("Frekans Bandı:", self.dd_bant)
+        katalog_form.addRow("Görev Tipi:", self.dd_gorev)
+        katalog_form.addRow("Anten Tipi:", self.dd_anten)
+
+        aralik_group = QGroupBox("Parametre Aralıkları (en az - en çok)")
+        aralik_form = QFormLayout(aralik_group)
+        self.range_inputs = {}
+        for field_name, label, unit in (("prf_hz", "PRF:", "Hz"), ("pri_us", "PRI:", "µs"),
+                                        ("pw_us", "PW:", "µs"), ("erp_dbw", "ERP:", "dBW")):
+            aralik_form.addRow(label, self._create_range(field_name, unit, criteria.get(field_name)))
+
+        btn_uygula = QPushButton("Uygula")
+        btn_temizle = QPushButton("Filtreyi Kaldır")
+        btn_iptal = QPushButton("İptal")
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        btn_layout.addWidget(btn_uygula)
+        btn_layout.addWidget(btn_temizle)
+        btn_layout.addWidget(btn_iptal)
+
+        layout.addWidget(katalog_group)
+        layout.addWidget(aralik_group)
+        layout.addLayout(btn_layout)
+
+        btn_uygula.clicked.connect(self._apply)
+        btn_temizle.clicked.connect(self._clear)
+        btn_iptal.clicked.connect(self.reject)
+
+    def _create_combo(self, values, current: Optional[str]) -> QComboBox:
+        combo = QComboBox()
+        combo.addItems([_TUMU] + values)
+        combo.setCurrentText(current or _TUMU)
+        return combo
+
+    def _create_range(self, field_name: str, unit: str, current) -> QHBoxLayout:
+        validator = QDoubleValidator()
+        validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        low, high = current or (None, None)
+        in_low = QLineEdit(validator=validator, placeholderText=f"en az ({unit})")
+        in_high = QLineEdit(validator=validator, placeholderText=f"en çok ({unit})")
+        in_low.setText("" if low is None else str(low))
+        in_high.setText("" if high is None else str(high))
+        self.range_inputs[field_name] = (in_low, in_high)
+        row = QHBoxLayout()
+        row.addWidget(in_low)
+        row.addWidget(in_high)
+        return row
+
+    def _apply(self):
+        def get_float(widget: QLineEdit):
+            text = widget.text().strip().replace(',', '.')
+            return float(text) if text else None
+
+        criteria = {}
+        for field_name, combo in (("frekans_bandi", self.dd_bant), ("gorev_tipi", self.dd_gorev),
+                                  ("anten_tipi", self.dd_anten)):
+            if combo.currentText() != _TUMU:
+                criteria[field_name] = combo.currentText()
+        for field_name, (in_low, in_high) in self.range_inputs.items():
+            low, high = get_float(in_low), get_float(in_high)
+            if low is not None or high is not None:
+                criteria[field_name] = (low, high)
+        self.criteria = criteria or None
+        self.accept()
+
+    def _clear(self):
+        self.criteria = None
+        self.accept()
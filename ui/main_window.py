@@ -1,20 +1,30 @@
 # ew_platformasi/ui/main_window.py
 
-from PySide6.QtWidgets import QMainWindow, QTabWidget, QMessageBox, QFileDialog
+from PySide6.QtWidgets import QMainWindow, QTabWidget, QMessageBox, QFileDialog, QProgressDialog
 from PySide6.QtGui import QAction
+from PySide6.QtCore import Qt, QThreadPool
 import qtawesome as qta
 import os
 
 from core.data_manager import DataManager
+from core.workspace_worker import WorkspaceTask
+from core.binary_format import BINARY_EXTENSION
+from core.sqlite_store import SQLITE_EXTENSION
 from viewmodels.library_vm import LibraryViewModel
 from viewmodels.scenario_vm import ScenarioViewModel
 from viewmodels.gorev_vm import GorevViewModel
+from viewmodels.analytics_vm import AnalyticsViewModel
 from ui.views.library_view import LibraryView
 # ScenarioCenterView artık kullanılmayacak
 from ui.views.scenario_entry_view import ScenarioEntryView
 from ui.views.gorev_center_view import GorevCenterView
+from ui.views.analytics_view import AnalyticsView
 from core.data_models import Senaryo
 
+XML_FILTER = "EH Veri Seti Dosyaları (*.xml)"
+BINARY_FILTER = "EH İkili Veri Seti Dosyaları (*.ewb)"
+SQLITE_FILTER = "EH Veritabanı Dosyaları (*.ewdb)"
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -23,11 +33,13 @@ class MainWindow(QMainWindow):
         self.resize(1600, 900)
 
         self.current_workspace_path = None
+        self._workspace_task = None
 
         self.data_manager = DataManager()
         self.library_vm = LibraryViewModel(self.data_manager)
         self.scenario_vm = ScenarioViewModel(self.data_manager)
         self.gorev_vm = GorevViewModel(self.data_manager)
+        self.analytics_vm = AnalyticsViewModel(self.data_manager)
 
         self._build_ui()
         self._connect_signals()
@@ -39,9 +51,11 @@ class MainWindow(QMainWindow):
         # Görev Merkezi artık Senaryo VM'i de kullanacak
         self.gorev_center_view = GorevCenterView(self.gorev_vm, self.scenario_vm)
         self.library_view = LibraryView(self.library_vm)
+        self.analytics_view = AnalyticsView(self.analytics_vm)
 
         self.tabs.addTab(self.gorev_center_view, qta.icon('fa5s.bullseye'), "Görev ve Senaryo Merkezi")
         self.tabs.addTab(self.library_view, qta.icon('fa5s.book'), "Kütüphane Yönetimi")
+        self.tabs.addTab(self.analytics_view, qta.icon('fa5s.chart-bar'), "Analiz")
 
         self.setCentralWidget(self.tabs)
         self._create_menu()
@@ -50,6 +64,7 @@ class MainWindow(QMainWindow):
         self.library_vm.status_updated.connect(self.statusBar().showMessage)
         self.scenario_vm.status_updated.connect(self.statusBar().showMessage)
         self.gorev_vm.status_updated.connect(self.statusBar().showMessage)
+        self.analytics_vm.status_updated.connect(self.statusBar().showMessage)
         self.data_manager.status_updated.connect(self.statusBar().showMessage)
 
         # Düzenleme sinyali artık doğrudan GorevCenterView içinde yönetilecek.
@@ -93,24 +108,103 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("İsimsiz Veri Seti - EH Analiz Platformu")
 
     def _open_workspace(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Veri Seti Aç", "", "EH Veri Seti Dosyaları (*.xml)")
-        if path:
+        path, _ = QFileDialog.getOpenFileName(self, "Veri Seti Aç", "", "EH Veri Seti Dosyaları (*.xml *.ewb *.ewdb)")
+        if path and path.lower().endswith(SQLITE_EXTENSION):
+            # Veritabanı okunmadan bağlanır; kayıtlar görünümler istedikçe sayfa sayfa gelir.
             self.data_manager.open_workspace(path)
-            self.current_workspace_path = path
-            self.setWindowTitle(f"{os.path.basename(path)} - EH Analiz Platformu")
+            if self.data_manager.database_path == path:
+                self._set_workspace_path(path)
+        elif path:
+            # Dosya arka planda okunur; kayıtlar hazır olunca tek seferde veri modeline uygulanır.
+            task = WorkspaceTask(self.data_manager.load_workspace_items, path)
+
+            def on_loaded(items_by_type):
+                self.data_manager.apply_workspace(items_by_type, path)
+                self._set_workspace_path(path)
+
+            self._start_workspace_task(task, f"'{os.path.basename(path)}' açılıyor...", on_loaded,
+                                       "Hata: Veri seti yüklenemedi")
 
     def _save_workspace(self):
-        if self.current_workspace_path:
-            self.data_manager.save_workspace(self.current_workspace_path)
+        if self.current_workspace_path and self.current_workspace_path == self.data_manager.database_path:
+            # Açık veritabanındaki her değişiklik yapıldığı anda yazıldı.
+            self.data_manager.status_updated.emit("Tüm değişiklikler veritabanına kaydedildi.")
+        elif self.current_workspace_path:
+            self._start_save_task(self.current_workspace_path)
         else:
             self._save_workspace_as()
 
     def _save_workspace_as(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Veri Setini Farklı Kaydet", "", "EH Veri Seti Dosyaları (*.xml)")
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Veri Setini Farklı Kaydet", "", f"{XML_FILTER};;{BINARY_FILTER};;{SQLITE_FILTER}")
         if path:
-            self.data_manager.save_workspace(path)
-            self.current_workspace_path = path
-            self.setWindowTitle(f"{os.path.basename(path)} - EH Analiz Platformu")
+            # Biçim uzantıdan seçilir; uzantı yazılmadıysa seçili filtreninki eklenir.
+            if not os.path.splitext(path)[1]:
+                path += {BINARY_FILTER: BINARY_EXTENSION, SQLITE_FILTER: SQLITE_EXTENSION}.get(selected_filter, ".xml")
+            self._start_save_task(path)
+
+    def _start_save_task(self, path: str):
+        # Bölüm listeleri anlık görüntüdür; yazma sürerken yapılan değişiklikler dosyayı etkilemez.
+        task = WorkspaceTask(self.data_manager.write_workspace, path, self.data_manager.workspace_sections())
+
+        def on_saved(_):
+            if path.lower().endswith(SQLITE_EXTENSION) and self.data_manager.database_path != path:
+                # Yeni veritabanı bağlanır; bundan sonraki değişiklikler doğrudan ona yazılır.
+                self.data_manager.attach_workspace_database(path)
+            self._set_workspace_path(path)
+            self.data_manager.status_updated.emit(
+                f"Veri seti başarıyla '{os.path.basename(path)}' dosyasına kaydedildi.")
+
+        self._start_workspace_task(task, f"'{os.path.basename(path)}' kaydediliyor...", on_saved,
+                                   "Hata: Veri seti kaydedilemedi")
+
+    def _set_workspace_path(self, path: str):
+        self.current_workspace_path = path
+        self.setWindowTitle(f"{os.path.basename(path)} - EH Analiz Platformu")
+
+    def _start_workspace_task(self, task: WorkspaceTask, label: str, on_finished, error_prefix: str):
+        """Açma/kaydetme işini iş parçacığı havuzunda başlatır ve iptal edilebilir bir ilerleme penceresi gösterir."""
+        if self._workspace_task is not None:
+            self.statusBar().showMessage("Devam eden bir veri seti işlemi var, lütfen bekleyin.")
+            return
+
+        progress_dialog = QProgressDialog(label, "İptal", 0, 100, self)
+        progress_dialog.setWindowTitle("Veri Seti")
+        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        progress_dialog.setMinimumDuration(300)
+        progress_dialog.setAutoReset(False)
+        progress_dialog.setAutoClose(False)
+        progress_dialog.setValue(0)
+
+        def on_progress(section: str, count: int, percent: int):
+            progress_dialog.setLabelText(f"{label}\n{section}: {count} kayıt")
+            progress_dialog.setValue(min(percent, 99))
+
+        def on_done():
+            self._workspace_task = None
+            progress_dialog.close()
+            progress_dialog.deleteLater()
+
+        def on_success(result):
+            on_done()
+            on_finished(result)
+
+        def on_failed(message: str):
+            on_done()
+            self.data_manager.status_updated.emit(f"{error_prefix} - {message}")
+
+        def on_cancelled():
+            on_done()
+            self.data_manager.status_updated.emit("İşlem iptal edildi. Mevcut veri seti değiştirilmedi.")
+
+        task.signals.progress.connect(on_progress)
+        task.signals.finished.connect(on_success)
+        task.signals.failed.connect(on_failed)
+        task.signals.cancelled.connect(on_cancelled)
+        progress_dialog.canceled.connect(task.cancel)
+
+        self._workspace_task = task
+        QThreadPool.globalInstance().start(task)
 
     def _import_gorev_package(self):
         path, _ = QFileDialog.getOpenFileName(self, "Görev Paketi İçe Aktar", "", "XML Paket Dosyaları (*.xml)")
@@ -124,6 +218,9 @@ class MainWindow(QMainWindow):
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                                      QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
+            if self._workspace_task is not None:
+                self._workspace_task.cancel()
+                QThreadPool.globalInstance().waitForDone()
             event.accept()
         else:
             event.ignore()
\ No newline at end of file
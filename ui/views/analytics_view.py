@@ -0,0 +1,76 @@
+# ew_platformasi/ui/views/analytics_view.py
+
+from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QTableView, QLabel, QComboBox, QHeaderView,
+                               QGroupBox, QAbstractItemView)
+
+from viewmodels.analytics_vm import AnalyticsViewModel
+
+
+class AnalyticsView(QWidget):
+    """Senaryo sonuçlarından tekniklerin radarlara karşı başarı matrisi."""
+
+    def __init__(self, vm: AnalyticsViewModel, parent=None):
+        super().__init__(parent)
+        self.vm = vm
+        self._build_ui()
+        self.vm.summary_changed.connect(self._on_summary_changed)
+
+    def _build_ui(self):
+        layout = QVBoxLayout(self)
+
+        controls_group = QGroupBox("Kırılım")
+        controls = QHBoxLayout(controls_group)
+        self.row_combo = QComboBox()
+        for key, label in AnalyticsViewModel.ROW_DIMENSIONS.items():
+            self.row_combo.addItem(label, key)
+        self.column_combo = QComboBox()
+        for key, label in AnalyticsViewModel.COLUMN_DIMENSIONS.items():
+            self.column_combo.addItem(label, key)
+        self.display_combo = QComboBox()
+        self.display_combo.addItem("Başarı Oranı", True)
+        self.display_combo.addItem("Gözlem Sayısı", False)
+        controls.addWidget(QLabel("Satırlar:"))
+        controls.addWidget(self.row_combo)
+        controls.addWidget(QLabel("Sütunlar:"))
+        controls.addWidget(self.column_combo)
+        controls.addWidget(QLabel("Gösterim:"))
+        controls.addWidget(self.display_combo)
+        controls.addStretch()
+        layout.addWidget(controls_group)
+
+        self.summary_label = QLabel("Henüz senaryo sonucu yok.")
+        layout.addWidget(self.summary_label)
+
+        self.matrix_table = QTableView()
+        self.matrix_table.setModel(self.vm.matrix_model)
+        self.matrix_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.matrix_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.matrix_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        layout.addWidget(self.matrix_table)
+
+        legend = QLabel("Oran: Başarılı = 1, Kısmen Başarılı ve Değişken = 0,5, Başarısız = 0; sonucu bilinmeyen "
+                        "senaryolar orana katılmaz. Parantez içi gözlem sayısıdır; ayrıntı için hücrenin üzerine gelin.")
+        legend.setWordWrap(True)
+        layout.addWidget(legend)
+
+        self.row_combo.currentIndexChanged.connect(self._on_dimensions_changed)
+        self.column_combo.currentIndexChanged.connect(self._on_dimensions_changed)
+        self.display_combo.currentIndexChanged.connect(self._on_dimensions_changed)
+
+    def _on_dimensions_changed(self):
+        self.vm.set_dimensions(self.row_combo.currentData(), self.column_combo.currentData(),
+                               self.display_combo.currentData())
+
+    def _on_summary_changed(self, scenario_count: int, observation_count: int, mean_rate):
+        rate_text = f"%{mean_rate * 100:.1f}" if mean_rate is not None else "-"
+        self.summary_label.setText(f"{scenario_count} senaryo, {observation_count} teknik-radar gözlemi; "
+                                   f"ortalama başarı oranı {rate_text}")
+
+    # Matris yalnızca sekme görünürken hesaplanır.
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.vm.set_visible(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.vm.set_visible(False)
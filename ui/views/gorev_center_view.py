@@ -12,6 +12,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QGr
 from viewmodels.gorev_vm import GorevViewModel
 from viewmodels.scenario_vm import ScenarioViewModel
 from ui.views.scenario_entry_view import ScenarioEntryView
+from ui.views.timeline_view import ScenarioTimelineWidget
 from core.data_models import Gorev, Senaryo
 
 
@@ -160,6 +161,14 @@ class GorevCenterView(QWidget):
         senaryo_layout.addLayout(btn_layout)
         layout.addWidget(senaryo_group)
 
+        timeline_group = QGroupBox("Teknik Zinciri Zaman Çizelgesi")
+        timeline_layout = QVBoxLayout(timeline_group)
+        self.timeline_summary = QLabel()
+        self.timeline_widget = ScenarioTimelineWidget()
+        timeline_layout.addWidget(self.timeline_summary)
+        timeline_layout.addWidget(self.timeline_widget)
+        layout.addWidget(timeline_group)
+
         op_btn_layout = QHBoxLayout()
         self.btn_yeni_gorev = QPushButton("Yeni Görev", icon=qta.icon('fa5s.plus-circle'))
         self.btn_kaydet_gorev = QPushButton("Görevi Kaydet", icon=qta.icon('fa5s.save'))
@@ -214,6 +223,8 @@ class GorevCenterView(QWidget):
         self.btn_manage_senaryos.clicked.connect(self._manage_senaryos)
         # GÜNCELLEME: Yeni butonun sinyali bağlandı
         self.btn_yeni_senaryo_ata.clicked.connect(self._add_and_assign_new_scenario)
+        self.vm.timeline_updated.connect(self._on_timeline_updated)
+        self.senaryo_table.selectionModel().selectionChanged.connect(self._on_detail_senaryo_selection_changed)
 
         # Senaryo Sinyalleri
         self.senaryo_search_box.textChanged.connect(self.scenario_vm.set_filter)
@@ -265,6 +276,24 @@ class GorevCenterView(QWidget):
         self.btn_manage_senaryos.setEnabled(False)
         self.btn_yeni_senaryo_ata.setEnabled(False) # GÜNCELLEME
 
+    def _on_timeline_updated(self, timeline, conflicts):
+        if timeline is None:
+            self.timeline_widget.set_timeline(None, None, [], {})
+            self.timeline_summary.clear()
+            return
+        names = self.vm.get_senaryo_names(timeline.scenario_ids)
+        self.timeline_widget.set_timeline(timeline, conflicts, names, self.vm.get_teknik_map())
+        step = timeline.step_s
+        self.timeline_summary.setText(
+            f"Görev süresi {timeline.durations_s.max():.1f} s (senaryolar aynı anda başlar); "
+            f"eşzamanlı {len(conflicts) * step:.1f} s, frekans çakışması "
+            f"{conflicts.frequency_conflict.sum() * step:.1f} s, platform çakışması "
+            f"{conflicts.platform_conflict.sum() * step:.1f} s")
+
+    def _on_detail_senaryo_selection_changed(self, selected, deselected):
+        indexes = self.senaryo_table.selectionModel().selectedRows()
+        self.timeline_widget.set_highlighted(indexes[0].row() if indexes else -1)
+
     def _new_gorev(self):
         self._clear_details()
         self.current_gorev = Gorev()
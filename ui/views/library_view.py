@@ -9,6 +9,8 @@ from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QListWidget, Q
                                QMenu, QFileDialog, QAbstractItemView)
 
 from ..dialogs.radar_history_dialog import RadarHistoryDialog
+from ..dialogs.radar_filter_dialog import RadarFilterDialog
+from ..dialogs.emitter_match_dialog import EmitterMatchDialog
 from core.data_models import (ETPlatformu, Radar, Teknik, GurultuKaristirmaParams, MenzilAldatmaParams,
                               BaseTeknikParametreleri,
                               AlmacGondermecAyarParametreleri, KaynakUretecAyarParametreleri,
@@ -262,11 +264,13 @@ class LibraryView(QWidget):
         top_bar_layout = QHBoxLayout()
         self.search_box = QLineEdit(placeholderText="Listede ara...")
 
+        self.btn_radar_filtre = QPushButton("Gelişmiş Filtre", icon=qta.icon('fa5s.filter'))
         self.btn_yeni = QPushButton("Yeni Ekle", icon=qta.icon('fa5s.plus-circle'))
         self.btn_import = QPushButton("İçeri Aktar", icon=qta.icon('fa5s.file-import'))
         self.btn_export = QPushButton("Dışarı Aktar", icon=qta.icon('fa5s.file-export'))
 
         top_bar_layout.addWidget(self.search_box)
+        top_bar_layout.addWidget(self.btn_radar_filtre)
         top_bar_layout.addWidget(self.btn_yeni)
         top_bar_layout.addWidget(self.btn_import)
         top_bar_layout.addWidget(self.btn_export)
@@ -308,6 +312,7 @@ class LibraryView(QWidget):
     def _connect_signals(self):
         self.category_list.currentRowChanged.connect(self._on_category_changed)
         self.search_box.textChanged.connect(self._on_search_changed)
+        self.btn_radar_filtre.clicked.connect(self._open_radar_filter)
         self.btn_yeni.clicked.connect(self._on_new_item_clicked)
         self.btn_import.clicked.connect(self._import_teknikler)
         self.btn_export.clicked.connect(self._export_teknikler)
@@ -355,7 +360,15 @@ class LibraryView(QWidget):
         if path:
             self.vm.export_teknikler(teknik_ids, path)
 
+    def _open_radar_filter(self):
+        dialog = RadarFilterDialog(self.vm.radar_criteria, self)
+        if dialog.exec():
+            self.vm.set_radar_criteria(dialog.criteria)
+            self._update_button_states()
+
     def _update_button_states(self):
+        self.btn_radar_filtre.setVisible(self.category_list.currentRow() == 1)
+        self.btn_radar_filtre.setText("Gelişmiş Filtre (Etkin)" if self.vm.radar_criteria else "Gelişmiş Filtre")
         is_teknik_category = self.category_list.currentRow() == 2
         self.btn_import.setVisible(is_teknik_category)
         self.btn_export.setVisible(is_teknik_category)
@@ -452,15 +465,23 @@ class LibraryView(QWidget):
 
     def _show_radar_context_menu(self, position):
         indexes = self.radars_table().selectionModel().selectedRows()
-        if not indexes: return
+        radar_item = self.vm.get_item_from_proxy_index(indexes[0], self.vm.radars_proxy_model) if indexes else None
         menu = QMenu()
         history_action = menu.addAction(qta.icon('fa5s.history'), "Faaliyet Geçmişini Göster")
+        history_action.setEnabled(radar_item is not None)
+        match_action = menu.addAction(qta.icon('fa5s.crosshairs'), "Yakalanan Yayını Tanımla...")
         action = menu.exec(self.radars_table().viewport().mapToGlobal(position))
-        if action == history_action:
-            proxy_index = indexes[0]
-            radar_item = self.vm.get_item_from_proxy_index(proxy_index, self.vm.radars_proxy_model)
-            if radar_item:
-                self._show_radar_history(radar_item)
+        if action == history_action and radar_item:
+            self._show_radar_history(radar_item)
+        elif action == match_action:
+            self._open_emitter_match(radar_item)
+
+    def _open_emitter_match(self, radar=None):
+        dialog = EmitterMatchDialog(self.vm.match_emitter, radar, self)
+        if dialog.exec() and dialog.selected_radar is not None:
+            self.current_item = dialog.selected_radar
+            self.form_stack.setCurrentWidget(self.radar_form)
+            self._populate_radar_form(self.current_item)
 
     def _show_radar_history(self, radar):
         related_senaryos = self.vm.get_senaryos_for_radar(radar.radar_id)
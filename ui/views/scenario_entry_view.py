@@ -47,15 +47,19 @@ class TeknikEntryDialog(QDialog):
 
 
 class TeknikSecimDialog(QDialog):
-    def __init__(self, vm: ScenarioViewModel, platform_id: str, parent=None):
+    def __init__(self, vm: ScenarioViewModel, platform_id: str, radar_id: str | None = None, parent=None):
         super().__init__(parent)
         self.vm = vm
         self.platform_id = platform_id
+        self.radar_id = radar_id
         self.setWindowTitle("Teknik Seç")
         self.secilen_teknik = None
 
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("Eklemek için bir teknik seçin veya yeni bir tane oluşturun:"))
+        if radar_id:
+            layout.addWidget(QLabel("Teknikler, hedef radara karşı geçmiş senaryo sonuçlarına göre önerilen "
+                                    "sıradadır."))
         self.list_widget = QListWidget()
         layout.addWidget(self.list_widget)
         self.refresh_teknik_list()
@@ -74,13 +78,27 @@ class TeknikSecimDialog(QDialog):
 
     def refresh_teknik_list(self, select_id: str | None = None):
         self.list_widget.clear()
-        teknikler = self.vm.get_teknikler_for_platform(self.platform_id)
-        for t in sorted(teknikler, key=lambda x: x.adi):
-            item = QListWidgetItem(f"{t.adi} [{t.kategori}]")
-            item.setData(Qt.ItemDataRole.UserRole, t)
-            self.list_widget.addItem(item)
-            if t.teknik_id == select_id:
-                self.list_widget.setCurrentItem(item)
+        if not self.radar_id:
+            teknikler = self.vm.get_teknikler_for_platform(self.platform_id)
+            for t in sorted(teknikler, key=lambda x: x.adi):
+                self._add_teknik_item(QListWidgetItem(f"{t.adi} [{t.kategori}]"), t, select_id)
+            return
+        # Hedef radar seçiliyse teknikler öneri sırasıyla, dayanaklarıyla birlikte listelenir.
+        for oneri in self.vm.recommend_teknikler(self.platform_id, self.radar_id):
+            t = oneri.teknik
+            if oneri.success_rate is None:
+                detay = oneri.basis
+            else:
+                detay = f"%{oneri.success_rate * 100:.0f} başarı, {oneri.evidence:.0f} senaryo ({oneri.basis})"
+            item = QListWidgetItem(f"{t.adi} [{t.kategori}] — {detay}")
+            item.setToolTip(f"Öneri puanı: {oneri.score:.2f}")
+            self._add_teknik_item(item, t, select_id)
+
+    def _add_teknik_item(self, item: QListWidgetItem, teknik: Teknik, select_id: str | None):
+        item.setData(Qt.ItemDataRole.UserRole, teknik)
+        self.list_widget.addItem(item)
+        if teknik.teknik_id == select_id:
+            self.list_widget.setCurrentItem(item)
 
     def create_new_teknik(self):
         dialog = TeknikEntryDialog(self.vm, self)
@@ -224,7 +242,7 @@ class ScenarioEntryView(QWidget):
             QMessageBox.warning(self, "Eksik Bilgi", "Lütfen önce bir ET Platformu seçin.")
             return
 
-        dialog = TeknikSecimDialog(self.vm, platform_id, self)
+        dialog = TeknikSecimDialog(self.vm, platform_id, self.dd_radar.currentData(), self)
         if dialog.exec() and dialog.secilen_teknik:
             secilen_teknik = dialog.secilen_teknik
             row_pos = self.teknik_table.rowCount()
@@ -334,11 +352,9 @@ class ScenarioEntryView(QWidget):
         self.dd_radar.setCurrentIndex(radar_index if radar_index != -1 else 0)
 
         self.teknik_table.setRowCount(0)
-        teknikler_list = self.vm.get_teknikler_for_platform(scenario.et_platformu_id)
-        teknik_map = {t.teknik_id: t for t in teknikler_list}
         for uygulama in sorted(scenario.uygulanan_teknikler, key=lambda x: x.sira):
-            teknik = teknik_map.get(uygulama.teknik_id)
-            if teknik:
+            teknik = self.vm.get_teknik(uygulama.teknik_id)
+            if teknik and teknik.platform_id == scenario.et_platformu_id:
                 row_pos = self.teknik_table.rowCount()
                 self.teknik_table.insertRow(row_pos)
                 sira_item = QTableWidgetItem(str(uygulama.sira))
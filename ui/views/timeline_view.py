@@ -0,0 +1,214 @@
+# ew_platformasi/ui/views/timeline_view.py
+
+import math
+
+import numpy as np
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import QWidget, QToolTip
+
+from core.data_models import TEKNIK_KATEGORI_KODLARI
+
+
+class ScenarioTimelineWidget(QWidget):
+    """Görevdeki senaryoların teknik zincirleri: senaryo başına bir şerit, adımlar teknik kategorisinin rengiyle.
+
+    Şerit içindeki çizgi karıştırıcının anlık frekansıdır (tüm şeritlerde aynı ölçek); üstteki çakışma şeridi
+    eşzamanlı senaryoları (gri), frekans (turuncu) ve platform (kırmızı) çakışmalarını gösterir.
+    """
+
+    LABEL_WIDTH = 150
+    LANE_HEIGHT = 30
+    CONFLICT_HEIGHT = 12
+    AXIS_HEIGHT = 20
+    MARGIN = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMouseTracking(True)
+        self._timeline = None
+        self._conflicts = None
+        self._scenario_names = []
+        self._teknik_map = {}
+        self._highlighted = -1
+        self._update_height()
+
+    def set_timeline(self, timeline, conflicts, scenario_names, teknik_map):
+        self._timeline = timeline
+        self._conflicts = conflicts
+        self._scenario_names = scenario_names
+        self._teknik_map = teknik_map
+        self._highlighted = -1
+        self._update_height()
+        self.update()
+
+    def set_highlighted(self, scenario_index: int):
+        self._highlighted = scenario_index
+        self.update()
+
+    def _update_height(self):
+        lanes = len(self._scenario_names) if self._timeline is not None else 0
+        self.setMinimumHeight(2 * self.MARGIN + self.CONFLICT_HEIGHT + self.AXIS_HEIGHT + max(lanes, 1) *
+                              self.LANE_HEIGHT)
+
+    # --- Ölçekler ---
+
+    def _duration(self) -> float:
+        durations = self._timeline.durations_s
+        return float(durations.max()) if len(durations) and durations.max() > 0 else 1.0
+
+    def _plot_rect(self) -> QRectF:
+        top = self.MARGIN + self.CONFLICT_HEIGHT
+        return QRectF(self.LABEL_WIDTH, top, max(self.width() - self.LABEL_WIDTH - self.MARGIN, 1),
+                      len(self._scenario_names) * self.LANE_HEIGHT)
+
+    def _x(self, time_s: float, plot: QRectF) -> float:
+        return plot.left() + time_s / self._duration() * plot.width()
+
+    # --- Çizim ---
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().base())
+        if self._timeline is None or not self._scenario_names:
+            painter.setPen(self.palette().text().color())
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Zaman çizelgesi için senaryo yok.")
+            return
+        plot = self._plot_rect()
+        self._paint_lanes(painter, plot)
+        self._paint_frequency(painter, plot)
+        self._paint_conflicts(painter, plot)
+        self._paint_axis(painter, plot)
+
+    def _paint_lanes(self, painter: QPainter, plot: QRectF):
+        steps = self._timeline.steps
+        text_color = self.palette().text().color()
+        for lane, name in enumerate(self._scenario_names):
+            top = plot.top() + lane * self.LANE_HEIGHT
+            if lane == self._highlighted:
+                painter.fillRect(QRectF(0, top, self.width(), self.LANE_HEIGHT), self.palette().highlight().color()
+                                 .lighter(170))
+            painter.setPen(text_color)
+            painter.drawText(QRectF(self.MARGIN, top, self.LABEL_WIDTH - 2 * self.MARGIN, self.LANE_HEIGHT),
+                             Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, name)
+
+        for index in range(len(steps.scenario)):
+            start, end = steps.start_s[index], steps.end_s[index]
+            if end <= start: continue
+            teknik = self._teknik_of_code(int(steps.teknik[index]))
+            top = plot.top() + int(steps.scenario[index]) * self.LANE_HEIGHT + 3
+            rect = QRectF(self._x(start, plot), top, self._x(end, plot) - self._x(start, plot),
+                          self.LANE_HEIGHT - 6)
+            painter.fillRect(rect, _category_color(teknik))
+            painter.setPen(QColor(90, 90, 90))
+            painter.drawRect(rect)
+            if teknik is not None and rect.width() > 40:
+                # Ad adımın içine sığdığı kadar yazılır.
+                painter.save()
+                painter.setClipRect(rect.adjusted(3, 0, -3, 0))
+                painter.setPen(Qt.GlobalColor.black)
+                painter.drawText(rect.adjusted(3, 0, -3, 0), Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                                 teknik.adi)
+                painter.restore()
+
+    def _paint_frequency(self, painter: QPainter, plot: QRectF):
+        timeline = self._timeline
+        frequency = timeline.frequency_mhz
+        known = ~np.isnan(frequency)
+        if not known.any(): return
+        low, high = float(frequency[known].min()), float(frequency[known].max())
+        span = high - low or 1.0
+        painter.setPen(QPen(QColor(20, 60, 160), 1))
+        # Piksel başına en çok iki örnek çizilir.
+        stride = max(1, int(len(frequency) / max(plot.width(), 1) / 2))
+        for lane in range(len(self._scenario_names)):
+            samples = timeline.samples_of(lane)
+            times = timeline.time_s[samples][::stride]
+            values = frequency[samples][::stride]
+            top = plot.top() + lane * self.LANE_HEIGHT + 5
+            height = self.LANE_HEIGHT - 10
+            points = []
+            for time_s, value in zip(times.tolist(), values.tolist()):
+                if math.isnan(value):
+                    self._draw_polyline(painter, points)
+                    points = []
+                    continue
+                points.append(QPointF(self._x(time_s, plot), top + height * (1 - (value - low) / span)))
+            self._draw_polyline(painter, points)
+
+    @staticmethod
+    def _draw_polyline(painter: QPainter, points):
+        if len(points) > 1:
+            painter.drawPolyline(QPolygonF(points))
+
+    def _paint_conflicts(self, painter: QPainter, plot: QRectF):
+        conflicts = self._conflicts
+        if conflicts is None or not len(conflicts): return
+        top = self.MARGIN
+        step = self._timeline.step_s
+        width = max(plot.width() * step / self._duration(), 1.0)
+        for time_s, platform, frequency in zip(conflicts.time_s.tolist(), conflicts.platform_conflict.tolist(),
+                                               conflicts.frequency_conflict.tolist()):
+            color = QColor(210, 40, 40) if platform else QColor(240, 150, 30) if frequency else QColor(170, 170, 170)
+            painter.fillRect(QRectF(self._x(time_s, plot), top, width, self.CONFLICT_HEIGHT - 2), color)
+
+    def _paint_axis(self, painter: QPainter, plot: QRectF):
+        duration = self._duration()
+        painter.setPen(self.palette().text().color())
+        y = plot.bottom() + 2
+        painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+        # Yaklaşık 100 pikselde bir 1-2-5 adımlı işaret
+        raw = duration / max(plot.width() / 100, 1)
+        magnitude = 10 ** math.floor(math.log10(raw))
+        tick = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+        value = 0.0
+        while value <= duration + 1e-9:
+            x = self._x(value, plot)
+            painter.drawLine(QPointF(x, y), QPointF(x, y + 4))
+            painter.drawText(QRectF(x - 40, y + 4, 80, self.AXIS_HEIGHT - 4), Qt.AlignmentFlag.AlignHCenter,
+                             f"{value:g} s")
+            value += tick
+
+    # --- Etkileşim ---
+
+    def mouseMoveEvent(self, event):
+        if self._timeline is None or not self._scenario_names: return
+        plot = self._plot_rect()
+        position = event.position()
+        lane = int((position.y() - plot.top()) // self.LANE_HEIGHT)
+        if not (0 <= lane < len(self._scenario_names)) or position.x() < plot.left():
+            QToolTip.hideText()
+            return
+        time_s = (position.x() - plot.left()) / plot.width() * self._duration()
+        samples = self._timeline.samples_of(lane)
+        index = samples.start + int(time_s / self._timeline.step_s)
+        if index >= samples.stop:
+            QToolTip.hideText()
+            return
+        QToolTip.showText(event.globalPosition().toPoint(), self._sample_text(lane, index), self)
+
+    def _sample_text(self, lane: int, index: int) -> str:
+        timeline = self._timeline
+        teknik = self._teknik_of_code(int(timeline.teknik[index]))
+        lines = [f"{self._scenario_names[lane]} — t = {timeline.time_s[index]:.1f} s",
+                 f"Teknik: {teknik.adi if teknik is not None else 'Bilinmeyen Teknik'}"]
+        power = timeline.power_dbw[index]
+        if not math.isnan(power):
+            lines.append(f"Güç: {power:.1f} dBW")
+        if not math.isnan(timeline.band_low_mhz[index]):
+            lines.append(f"Bant: {timeline.band_low_mhz[index]:.1f} - {timeline.band_high_mhz[index]:.1f} MHz")
+            lines.append(f"Anlık frekans: {timeline.frequency_mhz[index]:.1f} MHz")
+        elif not math.isnan(timeline.bandwidth_mhz[index]):
+            lines.append(f"Bant genişliği: {timeline.bandwidth_mhz[index]:.1f} MHz")
+        return "\n".join(lines)
+
+    def _teknik_of_code(self, code: int):
+        if code < 0: return None
+        return self._teknik_map.get(self._timeline.teknik_ids[code])
+
+
+def _category_color(teknik) -> QColor:
+    if teknik is None:
+        return QColor(200, 200, 200)
+    code = TEKNIK_KATEGORI_KODLARI.get(teknik.kategori, 0)
+    return QColor.fromHsvF((code * 0.13) % 1.0, 0.35, 0.97)
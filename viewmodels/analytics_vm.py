@@ -0,0 +1,62 @@
+# ew_platformasi/viewmodels/analytics_vm.py
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, Signal
+from core.data_manager import DataManager
+from core.models import EffectivenessMatrixModel
+
+
+class AnalyticsViewModel(QObject):
+    status_updated = Signal(str)
+    # Matris yenilendi: (senaryo sayısı, gözlem sayısı, ortalama başarı oranı ya da None)
+    summary_changed = Signal(int, int, object)
+
+    # Arayüzde seçilebilen kırılımlar (bkz. ScenarioAnalytics.matrix)
+    ROW_DIMENSIONS = {"teknik": "Teknik", "kategori": "Teknik Kategorisi"}
+    COLUMN_DIMENSIONS = {"radar": "Radar", "frekans_bandi": "Frekans Bandı", "gorev_tipi": "Radar Görev Tipi"}
+
+    def __init__(self, data_manager: DataManager):
+        super().__init__()
+        self._data_manager = data_manager
+        self.matrix_model = EffectivenessMatrixModel()
+        self._row_dimension = "teknik"
+        self._column_dimension = "radar"
+        self._show_rates = True
+
+        # Matris yalnızca sekme görünürken yeniden hesaplanır; görünmezken gelen değişiklikler işaretlenip bekletilir.
+        self._visible = False
+        self._stale = True
+        self._data_manager.scenario_analytics().matrix_changed.connect(self._on_matrix_changed)
+
+    def set_dimensions(self, row_dimension: str, column_dimension: str, show_rates: bool = True):
+        self._row_dimension = row_dimension
+        self._column_dimension = column_dimension
+        self._show_rates = show_rates
+        self._stale = True
+        self._refresh_if_visible()
+
+    def set_visible(self, visible: bool):
+        self._visible = visible
+        self._refresh_if_visible()
+
+    def _on_matrix_changed(self):
+        self._stale = True
+        self._refresh_if_visible()
+
+    def _refresh_if_visible(self):
+        if not (self._visible and self._stale): return
+        self._stale = False
+        try:
+            analytics = self._data_manager.scenario_analytics()
+            matrix = analytics.matrix(self._row_dimension, self._column_dimension)
+        except Exception as e:
+            self.status_updated.emit(f"Hata: Başarı matrisi hesaplanamadı: {e}")
+            return
+        self.matrix_model.set_matrix(matrix, self._show_rates)
+
+        evaluated = matrix.evaluated
+        rates = matrix.success_rate
+        # Ortalama oran, sonucu bilinen gözlem sayısıyla ağırlıklandırılır.
+        mean_rate = float((rates[evaluated > 0] * evaluated[evaluated > 0]).sum() / evaluated.sum()) \
+            if evaluated.sum() else None
+        self.summary_changed.emit(analytics.scenario_count(), int(matrix.observations.sum()), mean_rate)
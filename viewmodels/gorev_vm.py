@@ -1,14 +1,17 @@
 # ew_platformasi/viewmodels/gorev_vm.py
 from __future__ import annotations
 
-from PySide6.QtCore import QObject, Signal, QSortFilterProxyModel, Qt
+from PySide6.QtCore import QObject, Signal
 from core.data_manager import DataManager
-from core.models import GorevTableModel, GorevSenaryoTableModel
-from core.data_models import Gorev, Senaryo
+from core.models import GorevTableModel, LazySortFilterProxyModel, GorevSenaryoTableModel
+from core.data_models import Gorev, Radar, Senaryo, Teknik
+from core.timeline_simulator import find_conflicts, simulate
 
 
 class GorevViewModel(QObject):
     status_updated = Signal(str)
+    # Seçili görevin senaryolarının zaman çizelgesi yenilendi: (Timeline ya da None, ConflictReport ya da None)
+    timeline_updated = Signal(object, object)
 
     def __init__(self, data_manager: DataManager):
         super().__init__()
@@ -17,30 +20,33 @@ class GorevViewModel(QObject):
 
         # Görev listesi (sol panel) için model
         self._source_model = GorevTableModel()
-        self.proxy_model = QSortFilterProxyModel()
+        self.proxy_model = LazySortFilterProxyModel()
         self.proxy_model.setSourceModel(self._source_model)
-        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.proxy_model.setFilterKeyColumn(-1)
 
         # Seçili görevin senaryolarını (sağ panel) göstermek için yeni model
         self.senaryo_details_model = GorevSenaryoTableModel()
-
-        # Ana veri listeleri değiştiğinde ilgili modelleri güncelle
-        self._data_manager.gorevler_changed.connect(self._update_model)
-        self._data_manager.senaryolar_changed.connect(
-            self._update_model)  # Senaryolar değişince de güncelleme gerekebilir
-        self._data_manager.radarlar_changed.connect(self._update_model)  # Radar isimleri için
-        self._data_manager.teknikler_changed.connect(self._update_model)  # Teknik isimleri için
-
-        self._update_model()
-
-    def _update_model(self):
-        """Ana görev listesini günceller."""
-        self._source_model.refresh_data(self._data_manager.gorevler)
-        # YENİ EKLENEN SATIR:
-        # Ana model sıfırlandığında, detay modeli de temizle.
+        self._details_gorev = None
+
+        # Görev tablosu satır sinyallerini doğrudan uygular; seçim korunduğu için detay paneli de güncel tutulur.
+        self._source_model.bind(self._data_manager, Gorev)
+        self._data_manager.items_reset.connect(self._on_items_reset)
+        self._data_manager.gorevler_changed.connect(self._refresh_senaryo_details)
+        self._data_manager.senaryolar_changed.connect(self._refresh_senaryo_details)
+        self._data_manager.radarlar_changed.connect(self._refresh_senaryo_details)  # Radar isimleri için
+        self._data_manager.teknikler_changed.connect(self._refresh_senaryo_details)  # Teknik isimleri için
+
+    def _on_items_reset(self, item_type: type):
+        # Görev listesi baştan kurulduğunda seçim kaybolur; detay modeli de temizlenir.
         # Bu, arayüzün tutarlı kalmasını ve eski verileri göstermemesini sağlar.
-        self.update_senaryo_details_for_gorev(None)
+        if item_type is Gorev:
+            self.update_senaryo_details_for_gorev(None)
+
+    def _refresh_senaryo_details(self):
+        # Görev yeniden kaydedilmiş ya da silinmiş olabilir: güncel kayıt id ile okunur, yoksa panel temizlenir.
+        gorev = self._details_gorev
+        if gorev is not None:
+            gorev = self._data_manager.get_item(gorev.gorev_id, Gorev)
+        self.update_senaryo_details_for_gorev(gorev)
 
     def set_filter(self, text: str):
         self.proxy_model.setFilterFixedString(text)
@@ -51,15 +57,46 @@ class GorevViewModel(QObject):
 
     def update_senaryo_details_for_gorev(self, gorev: Gorev | None):
         """Arayüzden gelen istekle seçilen göreve ait senaryolarla detay tablosunu günceller."""
+        self._details_gorev = gorev
         senaryos_in_gorev = []
         if gorev:
-            senaryo_map = {s.senaryo_id: s for s in self._data_manager.senaryolar}
-            senaryos_in_gorev = [senaryo_map[sid] for sid in gorev.senaryo_id_list if sid in senaryo_map]
-
-        radar_map = {r.radar_id: r.adi for r in self._data_manager.radarlar}
-        teknik_map = {t.teknik_id: t.adi for t in self._data_manager.teknikler}
-
-        self.senaryo_details_model.refresh_data(senaryos_in_gorev, radar_map, teknik_map)
+            # Yalnızca görevdeki senaryolar id ile okunur; tüm senaryo listesi yüklenmez.
+            senaryo_map = self._data_manager.item_map(Senaryo)
+            senaryos_in_gorev = [senaryo for senaryo in (senaryo_map.get(sid) for sid in gorev.senaryo_id_list)
+                                 if senaryo is not None]
+
+        # Ad tabloları DataManager'da hazır tutulur; seçim maliyeti yalnızca görevdeki senaryo sayısına bağlıdır.
+        radar_map = self._data_manager.name_map(Radar)
+        teknik_map = self._data_manager.name_map(Teknik)
+
+        self.senaryo_details_model.refresh_data(senaryos_in_gorev, radar_map, teknik_map,
+                                                self._data_manager.jamming_calculator())
+        self._update_timeline(senaryos_in_gorev)
+
+    def _update_timeline(self, senaryolar: list[Senaryo]):
+        """Görevin senaryolarını aynı anda başlamış sayıp teknik zincirlerini örnekler ve çakışmaları çıkarır."""
+        if not senaryolar:
+            self.timeline_updated.emit(None, None)
+            return
+        try:
+            timeline = simulate(senaryolar, self._data_manager.item_map(Teknik))
+            # Platform kodları yalnızca karşılaştırma içindir; platformu olmayan senaryo (-1) çakışmaya girmez.
+            platform_codes = {}
+            platforms = [platform_codes.setdefault(senaryo.et_platformu_id, len(platform_codes))
+                         if senaryo.et_platformu_id else -1 for senaryo in senaryolar]
+            conflicts = find_conflicts(timeline, [0] * len(senaryolar), platforms)
+        except Exception as e:
+            self.status_updated.emit(f"Hata: Zaman çizelgesi oluşturulamadı: {e}")
+            self.timeline_updated.emit(None, None)
+            return
+        self.timeline_updated.emit(timeline, conflicts)
+
+    def get_teknik_map(self):
+        return self._data_manager.item_map(Teknik)
+
+    def get_senaryo_names(self, senaryo_ids: list[str]) -> list[str]:
+        senaryo_map = self._data_manager.item_map(Senaryo)
+        return [senaryo_map[sid].adi if sid in senaryo_map else "Bilinmiyor" for sid in senaryo_ids]
 
     def get_available_senaryos(self) -> list[Senaryo]:
         return self._data_manager.senaryolar
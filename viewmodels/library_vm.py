@@ -1,10 +1,11 @@
 # ew_platformasi/viewmodels/library_vm.py
 
-from PySide6.QtCore import QObject, Signal, QSortFilterProxyModel, Qt
+from PySide6.QtCore import QObject, Signal
 from core.data_manager import DataManager
-from core.models import PlatformTableModel, RadarTableModel, TeknikTableModel
+from core.models import PlatformTableModel, RadarTableModel, TeknikTableModel, LazySortFilterProxyModel
 from core.data_models import ETPlatformu, Radar, Teknik, Senaryo
-from typing import List
+from core.emitter_matcher import MatchCandidate
+from typing import Dict, List, Optional, Tuple
 
 
 class LibraryViewModel(QObject):
@@ -17,46 +18,35 @@ class LibraryViewModel(QObject):
 
         # Platformlar için model
         self._platformlar_source_model = PlatformTableModel()
-        self.platformlar_proxy_model = QSortFilterProxyModel()
+        self.platformlar_proxy_model = LazySortFilterProxyModel()
         self.platformlar_proxy_model.setSourceModel(self._platformlar_source_model)
-        self.platformlar_proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.platformlar_proxy_model.setFilterKeyColumn(-1)
 
         # Radarlar için model
         self._radars_source_model = RadarTableModel()
-        self.radars_proxy_model = QSortFilterProxyModel()
+        self.radars_proxy_model = LazySortFilterProxyModel()
         self.radars_proxy_model.setSourceModel(self._radars_source_model)
-        self.radars_proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.radars_proxy_model.setFilterKeyColumn(-1)
 
         # Teknikler için model
         self._teknikler_source_model = TeknikTableModel()
-        self.teknikler_proxy_model = QSortFilterProxyModel()
+        self.teknikler_proxy_model = LazySortFilterProxyModel()
         self.teknikler_proxy_model.setSourceModel(self._teknikler_source_model)
-        self.teknikler_proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.teknikler_proxy_model.setFilterKeyColumn(-1)
 
-        # Sinyal bağlantıları
-        self._data_manager.platformlar_changed.connect(self._update_platformlar_model)
-        self._data_manager.radarlar_changed.connect(self._update_radars_model)
-        self._data_manager.teknikler_changed.connect(self._update_teknikler_model)
+        # Sinyal bağlantıları: tablolar kendi tiplerinin satır sinyallerini doğrudan uygular.
+        self._update_platform_names()
+        self._platformlar_source_model.bind(self._data_manager, ETPlatformu)
+        self._radars_source_model.bind(self._data_manager, Radar)
+        self._teknikler_source_model.bind(self._data_manager, Teknik)
+        self._data_manager.platformlar_changed.connect(self._update_platform_names)
         self._data_manager.senaryolar_changed.connect(self._on_senaryolar_changed)
 
-        # Modelleri başlangıçta doldur
-        self._update_platformlar_model()
-        self._update_radars_model()
-        self._update_teknikler_model()
+        # Radar tablosunun gelişmiş (parametrik) filtresi; None ise kapalı.
+        self._radar_criteria = None
+        self._data_manager.radarlar_changed.connect(self._apply_radar_criteria)
 
-    def _update_platformlar_model(self):
-        self._platformlar_source_model.refresh_data(self._data_manager.et_platformlar)
-        self._update_teknikler_model() # Teknikler tablosu platform isimlerini gösterdiği için güncellenmeli
-
-    def _update_radars_model(self):
-        self._radars_source_model.refresh_data(self._data_manager.radarlar)
-
-    def _update_teknikler_model(self):
-        platform_map = {p.platform_id: p.adi for p in self._data_manager.et_platformlar}
-        self._teknikler_source_model.refresh_data(self._data_manager.teknikler, platform_map=platform_map)
+    def _update_platform_names(self):
+        # Teknikler tablosu platform isimlerini gösterdiği için yalnızca o sütun güncellenir.
+        platform_map = self._data_manager.name_map(ETPlatformu)
+        self._teknikler_source_model.update_extra_args([2], platform_map=platform_map)
 
     def _on_senaryolar_changed(self):
         pass
@@ -69,6 +59,50 @@ class LibraryViewModel(QObject):
         elif model_type == "teknik":
             self.teknikler_proxy_model.setFilterFixedString(text)
 
+    @property
+    def radar_criteria(self) -> Optional[Dict]:
+        return self._radar_criteria
+
+    def set_radar_criteria(self, criteria: Optional[Dict]):
+        """Radar tablosunu radar kataloğu sorgusuyla süzer (ör. {"frekans_bandi": "X", "prf_hz": (2000, 8000)}).
+
+        None filtreyi kaldırır. Radarlar değiştikçe sorgu yeniden çalıştırılır; arama kutusu filtresiyle birlikte uygulanır.
+        """
+        self._radar_criteria = criteria or None
+        match_count = self._apply_radar_criteria()
+        if match_count is not None:
+            self.status_updated.emit(f"Gelişmiş filtre: {match_count} radar eşleşti.")
+
+    def _apply_radar_criteria(self) -> Optional[int]:
+        if self._radar_criteria is None:
+            self._radars_source_model.set_row_filter(None)
+            return None
+        try:
+            radar_ids = self._data_manager.radar_catalog().query(**self._radar_criteria)
+        except ValueError as e:
+            self._radar_criteria = None
+            self._radars_source_model.set_row_filter(None)
+            self.status_updated.emit(f"Hata: Gelişmiş filtre uygulanamadı - {e}")
+            return None
+        self._radars_source_model.set_row_filter(set(radar_ids))
+        return len(radar_ids)
+
+    def match_emitter(self, pri_us: float, pw_us: Optional[float], frekans_bandi: Optional[str],
+                      pri_tolerance: float, pw_tolerance: float) -> List[Tuple[MatchCandidate, Radar]]:
+        """Yakalanan yayının aday radarları (en iyi eşleşme başta); toleranslar göreli (0.05 = ±%5)."""
+        try:
+            candidates = self._data_manager.emitter_matcher().match(pri_us, pw_us, frekans_bandi, top_k=20,
+                                                                     pri_tolerance=pri_tolerance,
+                                                                     pw_tolerance=pw_tolerance)
+        except ValueError as e:
+            self.status_updated.emit(f"Hata: Yayın eşleştirilemedi - {e}")
+            return []
+        radar_map = self._data_manager.item_map(Radar)
+        matches = [(candidate, radar_map[candidate.radar_id]) for candidate in candidates
+                   if candidate.radar_id in radar_map]
+        self.status_updated.emit(f"Yayın eşleştirme: {len(matches)} aday radar bulundu.")
+        return matches
+
     def get_item_from_proxy_index(self, proxy_index, proxy_model):
         source_index = proxy_model.mapToSource(proxy_index)
         return proxy_model.sourceModel().get_item_by_index(source_index)
@@ -96,7 +130,8 @@ class LibraryViewModel(QObject):
         return self._data_manager.et_platformlar
 
     def export_teknikler(self, teknik_ids: List[str], path: str):
-        teknikler_to_export = [t for t in self._data_manager.teknikler if t.teknik_id in teknik_ids]
+        teknik_map = self._data_manager.item_map(Teknik)
+        teknikler_to_export = [teknik_map[teknik_id] for teknik_id in dict.fromkeys(teknik_ids) if teknik_id in teknik_map]
         if teknikler_to_export:
             self._data_manager.export_teknikler_to_xml(teknikler_to_export, path)
         else:
@@ -105,6 +140,8 @@ class LibraryViewModel(QObject):
     def import_teknikler(self, paths: List[str]):
         if not paths:
             return
-        total_imported = sum(len(self._data_manager.import_teknikler_from_xml(path)) for path in paths)
+        # Birden çok dosya tek batch'te içe aktarılır; tablolar yalnızca sonda bir kez yenilenir.
+        with self._data_manager.batch():
+            total_imported = sum(len(self._data_manager.import_teknikler_from_xml(path)) for path in paths)
         if total_imported > 0:
             self.status_updated.emit(f"Toplam {len(paths)} dosyadan içe aktarma işlemi tamamlandı.")
\ No newline at end of file
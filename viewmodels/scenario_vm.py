@@ -1,10 +1,11 @@
 # ew_platformasi/viewmodels/scenario_vm.py
 
-from PySide6.QtCore import QObject, Signal, QSortFilterProxyModel, Qt
+from PySide6.QtCore import QObject, Signal
 from core.data_manager import DataManager
-from core.models import SenaryoTableModel
-from core.data_models import Senaryo, Teknik
-from typing import List
+from core.models import SenaryoTableModel, LazySortFilterProxyModel
+from core.data_models import ETPlatformu, Radar, Senaryo, Teknik
+from core.technique_recommender import BASIS_NONE, TechniqueRecommendation
+from typing import List, Optional
 
 class ScenarioViewModel(QObject):
     status_updated = Signal(str)
@@ -15,26 +16,31 @@ class ScenarioViewModel(QObject):
         self._data_manager = data_manager
 
         self._source_model = SenaryoTableModel()
-        self.proxy_model = QSortFilterProxyModel()
+        self.proxy_model = LazySortFilterProxyModel()
         self.proxy_model.setSourceModel(self._source_model)
-        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.proxy_model.setFilterKeyColumn(-1)
 
-        self._data_manager.platformlar_changed.connect(self._update_model)
-        self._data_manager.radarlar_changed.connect(self._update_model)
-        self._data_manager.senaryolar_changed.connect(self._update_model)
-        self._data_manager.teknikler_changed.connect(self._update_model)
+        self._update_platform_names()
+        self._update_radar_names()
+        # Hesaplayıcı modelden önce DataManager'a bağlanır: değişen senaryonun eski sonucu satır yeniden çizilmeden düşer.
+        self._jamming_calculator = self._data_manager.jamming_calculator()
+        self._source_model.update_extra_args([], jamming_calculator=self._jamming_calculator)
+        self._jamming_calculator.results_invalidated.connect(self._update_jamming_columns)
+        self._source_model.bind(self._data_manager, Senaryo)
+        self._data_manager.platformlar_changed.connect(self._update_platform_names)
+        self._data_manager.radarlar_changed.connect(self._update_radar_names)
         self._data_manager.status_updated.connect(self.status_updated)
-        self._update_model()
 
-    def _update_model(self):
-        platform_map = {p.platform_id: p.adi for p in self._data_manager.et_platformlar}
-        radar_map = {r.radar_id: r.adi for r in self._data_manager.radarlar}
-        self._source_model.refresh_data(
-            self._data_manager.senaryolar,
-            platform_map=platform_map,
-            radar_map=radar_map
-        )
+    def _update_platform_names(self):
+        # Eşleme tabloları DataManager'da tutulur ve tüm görünüm modelleri aynı sözlüğü paylaşır.
+        platform_map = self._data_manager.name_map(ETPlatformu)
+        self._source_model.update_extra_args([2], platform_map=platform_map)
+
+    def _update_radar_names(self):
+        radar_map = self._data_manager.name_map(Radar)
+        self._source_model.update_extra_args([3], radar_map=radar_map)
+
+    def _update_jamming_columns(self):
+        self._source_model.update_extra_args(SenaryoTableModel.JAMMING_COLUMNS)
 
     def get_available_data(self):
         """Formları doldurmak için gerekli tüm veriyi döndürür."""
@@ -46,6 +52,19 @@ class ScenarioViewModel(QObject):
             return []
         return [t for t in self._data_manager.teknikler if t.platform_id == platform_id]
 
+    def recommend_teknikler(self, platform_id: str, radar_id: Optional[str]) -> List[TechniqueRecommendation]:
+        """Platformun tekniklerini hedef radara karşı geçmiş senaryo sonuçlarına göre sıralı döndürür."""
+        teknikler = self.get_teknikler_for_platform(platform_id)
+        try:
+            return self._data_manager.technique_recommender().recommend(radar_id, teknikler)
+        except Exception as e:
+            self.status_updated.emit(f"Hata: Teknik önerileri hesaplanamadı: {e}")
+            return [TechniqueRecommendation(teknik, 0.0, BASIS_NONE, 0.0, None)
+                    for teknik in sorted(teknikler, key=lambda t: t.adi)]
+
+    def get_teknik(self, teknik_id: str) -> Optional[Teknik]:
+        return self._data_manager.item_map(Teknik).get(teknik_id)
+
     def set_filter(self, text: str):
         self.proxy_model.setFilterFixedString(text)
 